@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 import datetime
 from logging.config import dictConfig
 import logging
@@ -7,7 +8,8 @@ import json
 import os
 import re
 import subprocess
-from typing import Optional, Dict, Any, List, cast
+import zlib
+from typing import Optional, Dict, Any, List
 from uuid import UUID
 
 from fastapi import (
@@ -21,15 +23,24 @@ from fastapi import (
     WebSocket,
     WebSocketDisconnect,
 )
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from starlette.middleware.cors import CORSMiddleware
 
-from osism.tasks import reconciler, openstack
-from osism import utils
+from osism.tasks import conductor, reconciler, openstack
+from osism import settings, utils
+from osism.utils.facts import load_facts
+from osism.utils.facts_search import (
+    count_fact_values,
+    search_facts,
+    search_index_outdated,
+    update_search_index,
+)
 from osism.utils.inventory import get_hosts_from_inventory, get_inventory_path
 from osism.services.listener import BaremetalEvents
-from osism.services.websocket_manager import websocket_manager
+from osism.services.websocket_manager import EventStream, websocket_manager
 from osism.services.event_bridge import event_bridge
+from osism.tasks.conductor.sonic.changes import SONIC_CHANGE_MODELS
 from osism.tasks.conductor.utils import _is_secret_key
 
 
@@ -69,6 +80,20 @@ class NotificationBaremetal(BaseModel):
     payload: Dict[str, Any] = Field(..., description="Event payload data")
 
 
+class NotificationBaremetalFailure(BaseModel):
+    index: int = Field(..., description="Position of the notification in the batch")
+    message_id: UUID = Field(..., description="Unique message identifier")
+    event_type: str = Field(..., description="Type of the event")
+    error: str = Field(..., description="Error raised while processing it")
+
+
+class NotificationBaremetalBatchResult(BaseModel):
+    processed: int = Field(..., description="Number of processed notifications")
+    failed: List[NotificationBaremetalFailure] = Field(
+        ..., description="Notifications that failed to process"
+    )
+
+
 class WebhookNetboxResponse(BaseModel):
     result: str = Field(..., description="Operation result status")
 
@@ -144,6 +169,7 @@ app.add_middleware(
         "Sec-WebSocket-Key",
         "Sec-WebSocket-Version",
         "Sec-WebSocket-Extensions",
+        "Last-Event-ID",
     ],
 )
 
@@ -316,7 +342,8 @@ async def events_info() -> Dict[str, str]:
     return {
         "result": "ok",
         "websocket_endpoint": "/v1/events/openstack",
-        "description": "Real-time OpenStack events via WebSocket",
+        "sse_endpoint": "/v1/events/openstack/sse",
+        "description": "Real-time OpenStack events via WebSocket or Server-Sent Events",
     }
 
 
@@ -383,6 +410,21 @@ class SearchResponse(BaseModel):
     query: Dict[str, Any] = Field(..., description="Query parameters used")
 
 
+class FactSearchResponse(BaseModel):
+    path: str = Field(..., description="Fact path")
+    value: str = Field(..., description="Fact value")
+    hosts: List[str] = Field(..., description="Hosts with the value")
+    count: int = Field(..., description="Number of hosts")
+
+
+class FactValuesResponse(BaseModel):
+    path: str = Field(..., description="Fact path")
+    values: Dict[str, int] = Field(
+        ..., description="Values of the fact path and their number of hosts"
+    )
+    count: int = Field(..., description="Number of values")
+
+
 @app.post("/v1/meters/sink", response_model=SinkResponse, tags=["telemetry"])
 async def write_sink_meters(request: Request) -> SinkResponse:
     """Write telemetry meters to sink."""
@@ -550,6 +592,52 @@ async def notifications_baremetal(notification: NotificationBaremetal) -> None:
         )
 
 
+@app.post(
+    "/v1/notifications/baremetal/batch",
+    status_code=204,
+    response_model=None,
+    responses={207: {"model": NotificationBaremetalBatchResult}},
+    tags=["notifications"],
+)
+async def notifications_baremetal_batch(
+    notifications: List[NotificationBaremetal],
+) -> Optional[JSONResponse]:
+    """Handle a batch of baremetal notifications in order.
+
+    Returns 207 with the failed notifications if some of them failed. The
+    others were processed, so the batch must not be sent again.
+    """
+    failed = []
+    for index, notification in enumerate(notifications):
+        try:
+            handler = baremetal_events.get_handler(notification.event_type)
+            handler(notification.payload)
+        except Exception as e:
+            logger.error(f"Error processing baremetal notification: {str(e)}")
+            failed.append(
+                NotificationBaremetalFailure(
+                    index=index,
+                    message_id=notification.message_id,
+                    event_type=notification.event_type,
+                    error=str(e),
+                )
+            )
+
+    logger.info(
+        f"Processed batch of {len(notifications)} baremetal notifications "
+        f"({len(failed)} failed)"
+    )
+    if failed:
+        result = NotificationBaremetalBatchResult(
+            processed=len(notifications), failed=failed
+        )
+        return JSONResponse(
+            status_code=status.HTTP_207_MULTI_STATUS,
+            content=result.model_dump(mode="json"),
+        )
+    return None
+
+
 @app.post(
     "/v1/sonic/{identifier}/ztp/complete",
     response_model=DeviceSearchResult,
@@ -598,7 +686,20 @@ def process_netbox_webhook(webhook_input: WebhookNetboxData) -> None:
     """Process NetBox webhook data."""
     data = webhook_input.data
     url = data["url"]
-    name = data["name"]
+
+    # Changes that can affect generated SONiC configurations are mapped to
+    # the affected switches by the conductor, which runs a debounced sync
+    # restricted to them
+    sonic_change = (
+        settings.SONIC_WEBHOOK_SYNC and webhook_input.model in SONIC_CHANGE_MODELS
+    )
+    if sonic_change:
+        logger.info(
+            f"Scheduling incremental SONiC sync for {webhook_input.event} {webhook_input.model} change"
+        )
+        conductor.handle_sonic_netbox_change.delay(
+            webhook_input.model, data, webhook_input.snapshots.get("prechange")
+        )
 
     if "devices" in url:
         tags = [x["name"] for x in data["tags"]]
@@ -611,10 +712,14 @@ def process_netbox_webhook(webhook_input: WebhookNetboxData) -> None:
         device = utils.nb.dcim.devices.get(id=device_id)
         tags = [str(x) for x in device.tags]
         custom_fields = device.custom_fields
+    elif sonic_change:
+        return
     else:
         logger.warning(f"Unknown webhook URL type: {url}")
         return
 
+    name = data["name"]
+
     if "Managed by OSISM" in tags:
         if device_type == "server":
             logger.info(
@@ -622,23 +727,26 @@ def process_netbox_webhook(webhook_input: WebhookNetboxData) -> None:
             )
             reconciler.run.delay()
         elif device_type == "switch":
+            # Switch configurations are regenerated by the incremental SONiC
+            # sync above when SONIC_WEBHOOK_SYNC is enabled
             logger.info(
                 f"Handling change for managed device {name} of type {device_type}"
             )
-            # TODO: Implement switch configuration generation
-            # netbox.generate.delay(name, custom_fields['configuration_template'])
         elif device_type == "interface":
             logger.info(
                 f"Handling change for interface {name} on managed device {device.name} of type {custom_fields['device_type']}"
             )
-            # TODO: Implement interface configuration generation
-            # netbox.generate.delay(device.name, custom_fields['configuration_template'])
     else:
         logger.info(f"Ignoring change for unmanaged device {name}")
 
 
 @app.websocket("/v1/events/openstack")
-async def websocket_openstack_events(websocket: WebSocket):
+async def websocket_openstack_events(
+    websocket: WebSocket,
+    replay: int = Query(
+        0, ge=0, description="Number of recent events to send after connecting"
+    ),
+):
     """WebSocket endpoint for streaming all OpenStack events in real-time.
 
     Supports events from all OpenStack services: Ironic, Nova, Neutron, Cinder, Glance, Keystone
@@ -650,9 +758,20 @@ async def websocket_openstack_events(websocket: WebSocket):
         "node_filters": ["server-01", "server-02"],
         "service_filters": ["baremetal", "compute", "network"]
     }
+
+    With the stream transport of the event bridge, recent events can be
+    requested with the ``replay`` query parameter or, after setting filters,
+    with {"action": "replay", "count": 100}. Replayed events keep the ID and
+    timestamp of the stream entry.
     """
     await websocket_manager.connect(websocket)
     try:
+        if replay:
+            await websocket_manager.send_recent_events(
+                websocket,
+                await asyncio.to_thread(event_bridge.get_recent_events, replay),
+            )
+
         # Keep the connection alive and listen for client messages
         while True:
             try:
@@ -682,7 +801,18 @@ async def websocket_openstack_events(websocket: WebSocket):
                             "node_filters": node_filters,
                             "service_filters": service_filters,
                         }
-                        await websocket.send_text(json.dumps(response))
+                        await websocket_manager.send_message(
+                            websocket, json.dumps(response)
+                        )
+
+                    elif message.get("action") == "replay":
+                        count = int(message.get("count", 0))
+                        await websocket_manager.send_recent_events(
+                            websocket,
+                            await asyncio.to_thread(
+                                event_bridge.get_recent_events, count
+                            ),
+                        )
 
                 except json.JSONDecodeError:
                     logger.warning(
@@ -704,6 +834,107 @@ async def websocket_openstack_events(websocket: WebSocket):
         await websocket_manager.disconnect(websocket)
 
 
+def _split_filter(values: Optional[List[str]]) -> Optional[List[str]]:
+    """Accept repeated and comma-separated filter query parameters."""
+    if values is None:
+        return None
+    return [
+        item.strip() for value in values for item in value.split(",") if item.strip()
+    ]
+
+
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() != "gzip":
+            continue
+        quality = params.strip().replace(" ", "")
+        try:
+            return not quality.startswith("q=") or float(quality[2:]) > 0
+        except ValueError:
+            return False
+    return False
+
+
+def _compress(compressor, frame: str) -> bytes:
+    """Compress a frame and flush it, so it reaches the client right away."""
+    data = frame.encode()
+    if compressor is None:
+        return data
+    return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+@app.get("/v1/events/openstack/sse", tags=["events"])
+async def sse_openstack_events(
+    event_filters: Optional[List[str]] = Query(None, description="Event types"),
+    node_filters: Optional[List[str]] = Query(None, description="Node names"),
+    service_filters: Optional[List[str]] = Query(None, description="Service types"),
+    replay: int = Query(
+        0, ge=0, description="Number of recent events to send after connecting"
+    ),
+    last_event_id: Optional[str] = Query(
+        None, description="Resume after this event, like the Last-Event-ID header"
+    ),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+    accept_encoding: Optional[str] = Header(None),
+) -> StreamingResponse:
+    """Server-Sent Events endpoint for streaming OpenStack events.
+
+    A read-only alternative to the websocket at /v1/events/openstack for
+    dashboards and scripts. The filters are query parameters, repeated or
+    comma-separated, e.g. ``?service_filters=baremetal,compute``. Every
+    event is sent as ``data`` with its ID as the SSE event ID.
+
+    With the stream transport of the event bridge, a client reconnecting
+    with ``Last-Event-ID`` gets the events it has missed first. The
+    response is gzip compressed if the client accepts it.
+    """
+    resume_after = last_event_id_header or last_event_id
+    compressor = zlib.compressobj(wbits=31) if _accepts_gzip(accept_encoding) else None
+
+    async def body():
+        stream = EventStream()
+        await websocket_manager.connect(stream, message_format="sse")
+        try:
+            await websocket_manager.update_filters(
+                stream,
+                event_filters=_split_filter(event_filters),
+                node_filters=_split_filter(node_filters),
+                service_filters=_split_filter(service_filters),
+            )
+            if resume_after:
+                events = await asyncio.to_thread(
+                    event_bridge.get_events_after,
+                    resume_after,
+                    websocket_manager.send_queue_size,
+                )
+            elif replay:
+                events = await asyncio.to_thread(event_bridge.get_recent_events, replay)
+            else:
+                events = []
+            if events:
+                await websocket_manager.send_recent_events(stream, events)
+
+            # Tell EventSource clients how long to wait before reconnecting
+            yield _compress(compressor, "retry: 5000\n\n")
+            async for frame in stream.frames():
+                yield _compress(compressor, frame)
+            if compressor:
+                # The stream was closed, end the gzip member
+                yield compressor.flush()
+        finally:
+            await websocket_manager.disconnect(stream)
+
+    headers = {
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",
+        "Vary": "Accept-Encoding",
+    }
+    if compressor:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body(), media_type="text/event-stream", headers=headers)
+
+
 @app.post(
     "/v1/webhook/netbox",
     response_model=WebhookNetboxResponse,
@@ -941,15 +1172,14 @@ async def get_host_hostvar(host: str, variable: str) -> HostvarSingleResponse:
 async def get_host_facts(host: str) -> FactsResponse:
     """Get all cached Ansible facts for a specific host."""
     try:
-        data = cast(bytes | None, utils.redis.get(f"ansible_facts{host}"))
+        facts_data = load_facts(utils.redis, host)
 
-        if not data:
+        if facts_data is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"No facts found in cache for host '{host}'",
             )
 
-        facts_data = json.loads(data)
         facts = [
             FactEntry(name=name, value=value)
             for name, value in sorted(facts_data.items())
@@ -980,16 +1210,14 @@ async def get_host_facts(host: str) -> FactsResponse:
 async def get_host_fact(host: str, fact: str) -> FactSingleResponse:
     """Get a specific cached Ansible fact for a host."""
     try:
-        data = cast(bytes | None, utils.redis.get(f"ansible_facts{host}"))
+        facts_data = load_facts(utils.redis, host, [fact])
 
-        if not data:
+        if facts_data is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"No facts found in cache for host '{host}'",
             )
 
-        facts_data = json.loads(data)
-
         if fact not in facts_data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -1015,6 +1243,59 @@ async def get_host_fact(host: str, fact: str) -> FactSingleResponse:
         )
 
 
+# Serializes the catch-up of the fact search index of this worker
+_fact_search_lock = asyncio.Lock()
+
+
+async def _fact_search(query):
+    """Run a query on the up to date fact search index.
+
+    The index is updated after the facts were gathered. Only if the facts
+    changed since, e.g. by a playbook gathering them, it is brought up to
+    date first, in a thread to not block the event loop.
+    """
+    try:
+        async with _fact_search_lock:
+            if search_index_outdated(utils.redis):
+                await asyncio.to_thread(update_search_index, utils.redis)
+        return query()
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error searching facts: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to search facts: {str(e)}",
+        )
+
+
+@app.get(
+    "/v1/inventory/facts/search",
+    response_model=FactSearchResponse,
+    tags=["inventory"],
+)
+async def search_fact_values(path: str, value: str) -> FactSearchResponse:
+    """Get the hosts with a value under an indexed fact path.
+
+    Args:
+        path: Fact path from FACTS_SEARCH_PATHS (e.g., 'ansible_kernel')
+        value: Value to look for (e.g., '6.8.0-45-generic')
+    """
+    hosts = await _fact_search(lambda: search_facts(utils.redis, path, value))
+    return FactSearchResponse(path=path, value=value, hosts=hosts, count=len(hosts))
+
+
+@app.get(
+    "/v1/inventory/facts/values",
+    response_model=FactValuesResponse,
+    tags=["inventory"],
+)
+async def get_fact_values(path: str) -> FactValuesResponse:
+    """Get the values of an indexed fact path with their number of hosts."""
+    values = await _fact_search(lambda: count_fact_values(utils.redis, path))
+    return FactValuesResponse(path=path, values=values, count=len(values))
+
+
 @app.get("/v1/inventory/search", response_model=SearchResponse, tags=["inventory"])
 async def search_inventory(
     name_pattern: str,
@@ -3,18 +3,44 @@
 from cliff.command import Command
 from argparse import BooleanOptionalAction
 
+from dataclasses import dataclass
 import tempfile
 import os
-import subprocess
-import threading
+import time
+from typing import Any, Dict, List, Optional
 from loguru import logger
 from tabulate import tabulate
 import json
 import yaml
 from osism import settings, utils
 from osism.tasks.conductor.ironic import _get_metalbox_primary_ip4
+from osism.utils.actions import FAILED, RateLimiter, run_actions
+from osism.utils.ping import (
+    DEFAULT_CONCURRENCY as DEFAULT_PING_CONCURRENCY,
+    PingResult,
+    ping_hosts,
+)
 from osism.utils.ssh import cleanup_ssh_known_hosts_for_node
 
+# Nodes handled at the same time by the bulk node actions
+DEFAULT_PARALLEL = 10
+
+# Nodes submitted per second by the bulk node actions, to protect ironic-api
+DEFAULT_RATE = 5
+
+# Outcome of the node actions for nodes in an unsupported state
+SKIPPED = "skipped"
+
+# Nodes booting the burn-in ramdisk over PXE/TFTP at the same time
+DEFAULT_BURNIN_WAVE = 10
+
+# Seconds between the listings of the nodes during a burn-in
+DEFAULT_BURNIN_INTERVAL = 10
+
+# Seconds after which a node without a heartbeat of its agent no longer
+# counts as booting
+DEFAULT_BURNIN_BOOT_TIMEOUT = 1800
+
 
 def _apply_metalbox_vars(play_vars, device):
     metalbox_ip = _get_metalbox_primary_ip4(device)
@@ -23,6 +49,66 @@ def _apply_metalbox_vars(play_vars, device):
         play_vars["docker_insecure_registries"] = ["metalbox:5001"]
 
 
+def _add_bulk_arguments(parser):
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=DEFAULT_PARALLEL,
+        help=f"Number of nodes handled at the same time (default: {DEFAULT_PARALLEL})",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_RATE,
+        help=f"Nodes submitted per second, 0 for no limit (default: {DEFAULT_RATE})",
+    )
+
+
+def _select_nodes(conn, names, all_nodes, details=True):
+    """Return the nodes to act on, None if a named node does not exist.
+
+    All nodes and several named nodes are taken from one listing instead
+    of looking up every node on its own.
+    """
+    if all_nodes:
+        if details:
+            return list(conn.baremetal.nodes(details=True))
+        return list(conn.baremetal.nodes())
+
+    if len(names) == 1:
+        node = conn.baremetal.find_node(names[0], ignore_missing=True, details=details)
+        if not node:
+            logger.warning(f"Could not find node {names[0]}")
+            return None
+        return [node]
+
+    listed = {}
+    for node in conn.baremetal.nodes(details=details):
+        listed[node.id] = node
+        if node.name:
+            listed[node.name] = node
+    missing = [name for name in names if name not in listed]
+    if missing:
+        logger.warning(f"Could not find node(s) {', '.join(missing)}")
+        return None
+    # A node may be given by name and by ID
+    return list({listed[name].id: listed[name] for name in names}.values())
+
+
+def _run_node_actions(nodes, action, parsed_args):
+    """Run action for the nodes with --parallel and --rate, 1 if any failed."""
+    nodes = [node for node in nodes if node]
+    results = run_actions(
+        {node.id: node for node in nodes},
+        action,
+        names={node.id: node.name for node in nodes},
+        concurrency=parsed_args.parallel,
+        rate=parsed_args.rate,
+    )
+    if any(not result.ok for result in results):
+        return 1
+
+
 class BaremetalList(Command):
     def get_parser(self, prog_name):
         parser = super(BaremetalList, self).get_parser(prog_name)
@@ -132,9 +218,9 @@ class BaremetalDeploy(Command):
         )
         parser.add_argument(
             "name",
-            nargs="?",
+            nargs="*",
             type=str,
-            help="Deploy given baremetal node when in provision state available",
+            help="Deploy given baremetal nodes when in provision state available",
         )
         parser.add_argument(
             "--all",
@@ -154,16 +240,17 @@ class BaremetalDeploy(Command):
             help="Specify this in connection with '--rebuild --all' to actually rebuild all nodes",
             action="store_true",
         )
+        _add_bulk_arguments(parser)
         return parser
 
     def take_action(self, parsed_args):
         cloud = parsed_args.cloud
         all_nodes = parsed_args.all
-        name = parsed_args.name
+        names = parsed_args.name
         rebuild = parsed_args.rebuild
         yes_i_really_really_mean_it = parsed_args.yes_i_really_really_mean_it
 
-        if not all_nodes and not name:
+        if not all_nodes and not names:
             logger.error("Please specify a node name or use --all")
             return 1
 
@@ -188,20 +275,16 @@ class BaremetalDeploy(Command):
         try:
             conn = get_openstack_connection(cloud, password)
 
-            if all_nodes:
-                deploy_nodes = list(conn.baremetal.nodes(details=True))
-            else:
-                node = conn.baremetal.find_node(name, ignore_missing=True, details=True)
-                if not node:
-                    logger.warning(f"Could not find node {name}")
-                    return 1
-                deploy_nodes = [node]
+            deploy_nodes = _select_nodes(conn, names, all_nodes)
+            if deploy_nodes is None:
+                return 1
 
-            failed = False
-            for node in deploy_nodes:
-                if not node:
-                    continue
+            # The vault is read once for all nodes with FRR parameters
+            vault = None
+            if any(node and node.extra.get("frr_parameters") for node in deploy_nodes):
+                vault = get_vault()
 
+            def deploy(node):
                 if (
                     node.provision_state in ["available", "deploy failed"]
                     and not node["maintenance"]
@@ -218,7 +301,7 @@ class BaremetalDeploy(Command):
                     logger.warning(
                         f"Node {node.name} ({node.id}) not in supported state! Provision state: {node.provision_state}, maintenance mode: {node['maintenance']}"
                     )
-                    continue
+                    return SKIPPED
 
                 # NOTE: Ironic removes "instance_info" on undeploy. It was saved to "extra" during sync and needs to be refreshed here.
                 if (
@@ -239,8 +322,7 @@ class BaremetalDeploy(Command):
                     logger.warning(
                         f"Node {node.name} ({node.id}) could not be validated"
                     )
-                    failed = True
-                    continue
+                    return FAILED
                 # NOTE: Prepare osism config drive
                 try:
                     # Get default vars from NetBox local_context_data if available
@@ -324,7 +406,6 @@ class BaremetalDeploy(Command):
                         play["roles"].append("osism.commons.network")
                     if "frr_parameters" in node.extra and node.extra["frr_parameters"]:
                         frr_params = json.loads(node.extra["frr_parameters"])
-                        vault = get_vault()
                         deep_decrypt(frr_params, vault)
                         play["vars"].update(
                             {
@@ -354,8 +435,7 @@ class BaremetalDeploy(Command):
                     logger.warning(
                         f"Failed to build config drive for {node.name} ({node.id}): {exc}"
                     )
-                    failed = True
-                    continue
+                    return FAILED
                 node_vendor = node.properties.get("vendor", "").strip().lower()
                 if node_vendor == "supermicro":
                     try:
@@ -402,11 +482,10 @@ class BaremetalDeploy(Command):
                     logger.warning(
                         f"Node {node.name} ({node.id}) could not be moved to active state: {exc}"
                     )
-                    failed = True
-                    continue
+                    return FAILED
+                return provision_state
 
-            if failed:
-                return 1
+            return _run_node_actions(deploy_nodes, deploy, parsed_args)
         finally:
             cleanup_cloud_environment(temp_files, original_cwd)
 
@@ -699,9 +778,9 @@ class BaremetalUndeploy(Command):
         )
         parser.add_argument(
             "name",
-            nargs="?",
+            nargs="*",
             type=str,
-            help="Undeploy given baremetal node",
+            help="Undeploy given baremetal nodes",
         )
         parser.add_argument(
             "--all",
@@ -715,15 +794,16 @@ class BaremetalUndeploy(Command):
             help="Specify this to actually undeploy all nodes",
             action="store_true",
         )
+        _add_bulk_arguments(parser)
         return parser
 
     def take_action(self, parsed_args):
         cloud = parsed_args.cloud
         all_nodes = parsed_args.all
-        name = parsed_args.name
+        names = parsed_args.name
         yes_i_really_really_mean_it = parsed_args.yes_i_really_really_mean_it
 
-        if not all_nodes and not name:
+        if not all_nodes and not names:
             logger.error("Please specify a node name or use --all")
             return 1
 
@@ -746,67 +826,69 @@ class BaremetalUndeploy(Command):
         try:
             conn = get_openstack_connection(cloud, password)
 
-            if all_nodes:
-                deploy_nodes = list(conn.baremetal.nodes())
-            else:
-                node = conn.baremetal.find_node(
-                    name, ignore_missing=True, details=False
-                )
-                if not node:
-                    logger.warning(f"Could not find node {name}")
-                    return 1
-                deploy_nodes = [node]
-
-            failed = False
-            for node in deploy_nodes:
-                if not node:
-                    continue
+            deploy_nodes = _select_nodes(conn, names, all_nodes, details=False)
+            if deploy_nodes is None:
+                return 1
 
-                if node.provision_state in [
+            def undeploy(node):
+                if node.provision_state not in [
                     "active",
                     "wait call-back",
                     "deploy failed",
                     "error",
                 ]:
-                    try:
-                        node = conn.baremetal.set_node_provision_state(
-                            node.id, "undeploy"
-                        )
-                        logger.info(
-                            f"Successfully initiated undeploy for node {node.name} ({node.id})"
-                        )
+                    logger.warning(
+                        f"Node {node.name} ({node.id}) not in supported provision state"
+                    )
+                    return SKIPPED
 
-                        # Clean up SSH known_hosts entries for the undeployed node
+                try:
+                    node = conn.baremetal.set_node_provision_state(node.id, "undeploy")
+                    logger.info(
+                        f"Successfully initiated undeploy for node {node.name} ({node.id})"
+                    )
+
+                    # Clean up SSH known_hosts entries for the undeployed node
+                    logger.info(f"Cleaning up SSH known_hosts entries for {node.name}")
+                    result = cleanup_ssh_known_hosts_for_node(node.name)
+                    if result:
                         logger.info(
-                            f"Cleaning up SSH known_hosts entries for {node.name}"
+                            f"SSH known_hosts cleanup completed successfully for {node.name}"
                         )
-                        result = cleanup_ssh_known_hosts_for_node(node.name)
-                        if result:
-                            logger.info(
-                                f"SSH known_hosts cleanup completed successfully for {node.name}"
-                            )
-                        else:
-                            logger.warning(
-                                f"SSH known_hosts cleanup completed with warnings for {node.name}"
-                            )
-
-                    except Exception as exc:
+                    else:
                         logger.warning(
-                            f"Node {node.name} ({node.id}) could not be moved to available state: {exc}"
+                            f"SSH known_hosts cleanup completed with warnings for {node.name}"
                         )
-                        failed = True
-                        continue
-                else:
+
+                except Exception as exc:
                     logger.warning(
-                        f"Node {node.name} ({node.id}) not in supported provision state"
+                        f"Node {node.name} ({node.id}) could not be moved to available state: {exc}"
                     )
+                    return FAILED
+                return "undeploy"
 
-            if failed:
-                return 1
+            return _run_node_actions(deploy_nodes, undeploy, parsed_args)
         finally:
             cleanup_cloud_environment(temp_files, original_cwd)
 
 
+def _ping_status(result: PingResult) -> str:
+    if result.error:
+        return f"ERROR ({result.error[:50]})"
+    if not result.received:
+        return "FAILED"
+    if result.loss:
+        return f"PARTIAL ({result.loss:.0f}% packet loss)"
+    return "SUCCESS"
+
+
+def _ping_rtt(result: PingResult) -> str:
+    if result.rtt_avg is None:
+        return "N/A"
+    rtts = [result.rtt_min, result.rtt_avg, result.rtt_max, result.rtt_mdev]
+    return "/".join("-" if rtt is None else f"{rtt:.3f}" for rtt in rtts)
+
+
 class BaremetalPing(Command):
     def get_parser(self, prog_name):
         parser = super(BaremetalPing, self).get_parser(prog_name)
@@ -822,57 +904,27 @@ class BaremetalPing(Command):
             type=str,
             help="Ping specific baremetal node by name",
         )
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=3,
+            help="Echo requests sent to every node",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=5.0,
+            help="Seconds to wait for the replies after the last echo requests",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=DEFAULT_PING_CONCURRENCY,
+            help="Ping commands running at the same time where ICMP sockets "
+            "are not allowed",
+        )
         return parser
 
-    def _ping_host(self, host, results, host_name):
-        """Ping a host 3 times and store results."""
-        try:
-            result = subprocess.run(
-                ["ping", "-c", "3", "-W", "5", host],
-                capture_output=True,
-                text=True,
-                timeout=20,
-            )
-
-            if result.returncode == 0:
-                output_lines = result.stdout.strip().split("\n")
-                stats_line = [line for line in output_lines if "packet loss" in line]
-                if stats_line:
-                    loss_info = stats_line[0]
-                    if "0% packet loss" in loss_info:
-                        status = "SUCCESS"
-                    else:
-                        status = f"PARTIAL ({loss_info.split(',')[2].strip()})"
-                else:
-                    status = "SUCCESS"
-
-                time_lines = [
-                    line
-                    for line in output_lines
-                    if "round-trip" in line or "rtt" in line
-                ]
-                if time_lines:
-                    time_info = (
-                        time_lines[0].split("=")[-1].strip()
-                        if "=" in time_lines[0]
-                        else "N/A"
-                    )
-                else:
-                    time_info = "N/A"
-            else:
-                status = "FAILED"
-                time_info = "N/A"
-
-        except (
-            subprocess.TimeoutExpired,
-            subprocess.CalledProcessError,
-            Exception,
-        ) as e:
-            status = "ERROR"
-            time_info = str(e)[:50]
-
-        results[host_name] = {"host": host, "status": status, "time_info": time_info}
-
     def take_action(self, parsed_args):
         from osism.tasks.conductor.netbox import get_nb_device_query_list_ironic
         from osism.tasks import netbox
@@ -927,43 +979,49 @@ class BaremetalPing(Command):
                 logger.info("No devices found with primary IPv4 addresses")
                 return
 
-            logger.info(f"Pinging {len(ping_candidates)} nodes (3 pings each)...")
-
-            results = {}
-            threads = []
-
-            for candidate in ping_candidates:
-                thread = threading.Thread(
-                    target=self._ping_host,
-                    args=(candidate["ip"], results, candidate["name"]),
-                )
-                threads.append(thread)
-                thread.start()
-
-            for thread in threads:
-                thread.join()
+            logger.info(
+                f"Pinging {len(ping_candidates)} nodes "
+                f"({parsed_args.count} pings each)..."
+            )
+            results = ping_hosts(
+                [candidate["ip"] for candidate in ping_candidates],
+                count=parsed_args.count,
+                timeout=parsed_args.timeout,
+                concurrency=parsed_args.concurrency,
+            )
 
             table_data = []
             success_count = 0
             failed_count = 0
 
-            for device_name in sorted(results.keys()):
-                result = results[device_name]
+            for candidate in sorted(ping_candidates, key=lambda c: c["name"]):
+                result = results[candidate["ip"]]
+                status = _ping_status(result)
                 table_data.append(
-                    [device_name, result["host"], result["status"], result["time_info"]]
+                    [
+                        candidate["name"],
+                        candidate["ip"],
+                        status,
+                        f"{result.loss:.0f}%" if result.loss is not None else "N/A",
+                        _ping_rtt(result),
+                    ]
                 )
 
-                if result["status"] == "SUCCESS":
+                if status == "SUCCESS":
                     success_count += 1
-                elif result["status"].startswith("PARTIAL"):
-                    failed_count += 1
                 else:
                     failed_count += 1
 
             print(
                 tabulate(
                     table_data,
-                    headers=["Name", "IP Address", "Status", "Time Info"],
+                    headers=[
+                        "Name",
+                        "IP Address",
+                        "Status",
+                        "Loss",
+                        "RTT min/avg/max/mdev (ms)",
+                    ],
                     tablefmt="psql",
                 )
             )
@@ -977,6 +1035,181 @@ class BaremetalPing(Command):
             return 1
 
 
+# Phases of the nodes of a burn-in
+BURNIN_MANAGE = "manage"
+BURNIN_WAITING = "waiting"
+BURNIN_BOOTING = "booting"
+BURNIN_RUNNING = "running"
+BURNIN_DONE = "done"
+BURNIN_FAILED = "failed"
+BURNIN_PHASES = [
+    BURNIN_MANAGE,
+    BURNIN_WAITING,
+    BURNIN_BOOTING,
+    BURNIN_RUNNING,
+    BURNIN_DONE,
+    BURNIN_FAILED,
+]
+
+# Fields of the node listing all nodes of a burn-in are tracked with
+BURNIN_FIELDS = [
+    "id",
+    "name",
+    "provision_state",
+    "target_provision_state",
+    "last_error",
+    "driver_internal_info",
+]
+
+
+@dataclass
+class _BurnIn:
+    node: Any
+    # Provision state change running the burn-in steps, clean or service
+    action: str
+    steps: List[dict]
+    phase: str = BURNIN_WAITING
+    # Last heartbeat of the agent before the launch
+    heartbeat: Any = None
+    launched: float = 0.0
+    state: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def stable_state(self) -> str:
+        return "manageable" if self.action == "clean" else "active"
+
+
+def _agent_heartbeat(node):
+    return (node.driver_internal_info or {}).get("agent_last_heartbeat")
+
+
+def _format_elapsed(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m{seconds:02d}s"
+    return f"{minutes}m{seconds:02d}s"
+
+
+def _burn_in_progress(burn_ins: List[_BurnIn]) -> str:
+    """Return the number of nodes per phase and per provision state."""
+    phases: Dict[str, int] = {}
+    states: Dict[str, int] = {}
+    for burn_in in burn_ins:
+        phases[burn_in.phase] = phases.get(burn_in.phase, 0) + 1
+        state = burn_in.state or burn_in.node.provision_state
+        states[state] = states.get(state, 0) + 1
+    per_phase = ", ".join(
+        f"{phases[phase]} {phase}" for phase in BURNIN_PHASES if phase in phases
+    )
+    per_state = ", ".join(
+        f"{state}: {count}" for state, count in sorted(states.items())
+    )
+    return f"{per_phase} ({per_state})"
+
+
+def _update_burn_in(burn_in: _BurnIn, node, now: float, parsed_args) -> None:
+    """Advance the phase of a burn-in from the listed node."""
+    name = burn_in.node.name or burn_in.node.id
+    if node is None:
+        burn_in.phase = BURNIN_FAILED
+        burn_in.error = "node not found"
+        logger.error(f"{name}: {burn_in.error}")
+        return
+    burn_in.state = node.provision_state
+
+    if burn_in.phase == BURNIN_MANAGE:
+        if node.provision_state == "manageable" and not node.target_provision_state:
+            burn_in.phase = BURNIN_WAITING
+        elif node.provision_state == "enroll":
+            burn_in.phase = BURNIN_FAILED
+            burn_in.error = node.last_error or "could not be moved to manageable state"
+            logger.error(f"{name}: {burn_in.error}")
+        return
+
+    if node.provision_state == f"{burn_in.action} failed":
+        burn_in.phase = BURNIN_FAILED
+        burn_in.error = node.last_error or node.provision_state
+        logger.error(f"{name}: {burn_in.error}")
+    elif (
+        node.provision_state == burn_in.stable_state and not node.target_provision_state
+    ):
+        burn_in.phase = BURNIN_DONE
+        logger.info(f"{name}: burn-in done")
+    elif parsed_args.timeout and now - burn_in.launched > parsed_args.timeout:
+        burn_in.phase = BURNIN_FAILED
+        burn_in.error = f"burn-in timed out after {parsed_args.timeout:.0f}s"
+        logger.error(f"{name}: {burn_in.error}")
+    elif burn_in.phase == BURNIN_BOOTING:
+        heartbeat = _agent_heartbeat(node)
+        if heartbeat and heartbeat != burn_in.heartbeat:
+            burn_in.phase = BURNIN_RUNNING
+        elif now - burn_in.launched > parsed_args.boot_timeout:
+            # Free the slot of the wave, Ironic fails the node itself if
+            # the agent never shows up
+            burn_in.phase = BURNIN_RUNNING
+            logger.warning(
+                f"{name}: no heartbeat of the agent after "
+                f"{parsed_args.boot_timeout:.0f}s, no longer counted as booting"
+            )
+
+
+def _run_burn_ins(conn, burn_ins: List[_BurnIn], launch, parsed_args) -> None:
+    """Launch the burn-ins in waves and track them until they are finished.
+
+    At most --wave nodes boot the ramdisk over PXE/TFTP at the same time, a
+    node has booted once its agent sends a heartbeat. All nodes are
+    tracked with one listing of the nodes every --interval seconds, which
+    is also when the progress is logged. With --no-wait the tracking ends
+    once the last node has booted.
+    """
+    limiter = RateLimiter(parsed_args.rate)
+    started = time.monotonic()
+    while True:
+        booting = sum(1 for burn_in in burn_ins if burn_in.phase == BURNIN_BOOTING)
+        for burn_in in burn_ins:
+            if booting >= max(1, parsed_args.wave):
+                break
+            if burn_in.phase != BURNIN_WAITING:
+                continue
+            limiter.wait()
+            burn_in.launched = time.monotonic()
+            if launch(burn_in):
+                burn_in.phase = BURNIN_BOOTING
+                booting += 1
+            else:
+                burn_in.phase = BURNIN_FAILED
+
+        unfinished = [BURNIN_MANAGE, BURNIN_WAITING, BURNIN_BOOTING]
+        if not parsed_args.no_wait:
+            unfinished.append(BURNIN_RUNNING)
+        if not any(burn_in.phase in unfinished for burn_in in burn_ins):
+            break
+
+        time.sleep(parsed_args.interval)
+        try:
+            listed = {
+                node.id: node for node in conn.baremetal.nodes(fields=BURNIN_FIELDS)
+            }
+        except Exception as exc:
+            logger.warning(f"Listing the nodes failed, retrying: {exc}")
+            continue
+        now = time.monotonic()
+        for burn_in in burn_ins:
+            if burn_in.phase in (BURNIN_MANAGE, BURNIN_BOOTING, BURNIN_RUNNING):
+                _update_burn_in(burn_in, listed.get(burn_in.node.id), now, parsed_args)
+        logger.info(
+            f"Burn-in {_format_elapsed(now - started)}: {_burn_in_progress(burn_ins)}"
+        )
+
+    elapsed = _format_elapsed(time.monotonic() - started)
+    if parsed_args.no_wait:
+        logger.info(f"All nodes booted after {elapsed}: {_burn_in_progress(burn_ins)}")
+    else:
+        logger.info(f"Burn-in finished after {elapsed}: {_burn_in_progress(burn_ins)}")
+
+
 class BaremetalBurnIn(Command):
     def get_parser(self, prog_name):
         parser = super(BaremetalBurnIn, self).get_parser(prog_name)
@@ -989,9 +1222,9 @@ class BaremetalBurnIn(Command):
         )
         parser.add_argument(
             "name",
-            nargs="?",
+            nargs="*",
             type=str,
-            help="Run burn-in on given baremetal node",
+            help="Run burn-in on given baremetal nodes",
         )
         parser.add_argument(
             "--all",
@@ -1023,12 +1256,53 @@ class BaremetalBurnIn(Command):
             help="Specify this to actually burn-in active nodes",
             action="store_true",
         )
+        parser.add_argument(
+            "--wave",
+            type=int,
+            default=DEFAULT_BURNIN_WAVE,
+            help="Number of nodes booting over PXE/TFTP at the same time "
+            f"(default: {DEFAULT_BURNIN_WAVE})",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=DEFAULT_RATE,
+            help=f"Nodes submitted per second, 0 for no limit (default: {DEFAULT_RATE})",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=DEFAULT_BURNIN_INTERVAL,
+            help="Seconds between the listings of the nodes "
+            f"(default: {DEFAULT_BURNIN_INTERVAL})",
+        )
+        parser.add_argument(
+            "--boot-timeout",
+            type=float,
+            default=DEFAULT_BURNIN_BOOT_TIMEOUT,
+            help="Seconds after which a node without a heartbeat of the agent "
+            f"no longer counts as booting (default: {DEFAULT_BURNIN_BOOT_TIMEOUT})",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=0,
+            help="Seconds after which an unfinished burn-in counts as failed, "
+            "0 for no limit (default: 0)",
+        )
+        parser.add_argument(
+            "--no-wait",
+            default=False,
+            help="Return once the last node has booted instead of waiting for "
+            "the end of the burn-in",
+            action="store_true",
+        )
         return parser
 
     def take_action(self, parsed_args):
         cloud = parsed_args.cloud
         all_nodes = parsed_args.all
-        name = parsed_args.name
+        names = parsed_args.name
 
         stressor = {}
         stressor["cpu"] = parsed_args.cpu
@@ -1037,7 +1311,7 @@ class BaremetalBurnIn(Command):
 
         yes_i_really_really_mean_it = parsed_args.yes_i_really_really_mean_it
 
-        if not all_nodes and not name:
+        if not all_nodes and not names:
             logger.error("Please specify a node name or use --all")
             return 1
 
@@ -1051,6 +1325,9 @@ class BaremetalBurnIn(Command):
             )
             return 1
 
+        # NOTE: Skip disk burn-in on active nodes, so that we do not accidentaly overwrite the root disk or any state
+        service_steps = [step for step in clean_steps if step["step"] != "burnin_disk"]
+
         from osism.tasks.openstack import get_cloud_helpers
 
         setup_cloud_environment, get_openstack_connection, cleanup_cloud_environment = (
@@ -1064,104 +1341,129 @@ class BaremetalBurnIn(Command):
         try:
             conn = get_openstack_connection(cloud, password)
 
-            if all_nodes:
-                burn_in_nodes = list(conn.baremetal.nodes(details=True))
-            else:
-                node = conn.baremetal.find_node(name, ignore_missing=True, details=True)
-                if not node:
-                    logger.warning(f"Could not find node {name}")
-                    return 1
-                burn_in_nodes = [node]
+            burn_in_nodes = _select_nodes(conn, names, all_nodes)
+            if burn_in_nodes is None:
+                return 1
 
-            failed = False
+            burn_ins = []
             for node in burn_in_nodes:
                 if not node:
                     continue
 
+                if node.provision_state in ["available", "manageable"]:
+                    burn_in = _BurnIn(node, "clean", clean_steps)
+                elif node.provision_state in ["active"]:
+                    # NOTE: Use service step to run burn-in
+                    if not yes_i_really_really_mean_it:
+                        logger.error(
+                            "Please confirm that you wish to burn-in an active node by specifying '--yes-i-really-really-mean-it'"
+                        )
+                        continue
+                    if len(service_steps) < len(clean_steps):
+                        logger.warning(
+                            f"Request to burn-in active node {node.name}. Skipping disk burn-in to prevent accidental dataloss"
+                        )
+                    if not service_steps:
+                        continue
+                    burn_in = _BurnIn(node, "service", service_steps)
+                else:
+                    logger.warning(
+                        f"Node {node.name} ({node.id}) not in supported state! Provision state: {node.provision_state}, maintenance mode: {node['maintenance']}"
+                    )
+                    continue
+
                 if node.provision_state in ["available"]:
                     # NOTE: Burn-In is available in the "manageable" provision state, so we move the node into this state
                     try:
-                        node = conn.baremetal.set_node_provision_state(
-                            node.id, "manage"
-                        )
-                        node = conn.baremetal.wait_for_nodes_provision_state(
-                            [node.id], "manageable"
-                        )[0]
+                        conn.baremetal.set_node_provision_state(node.id, "manage")
+                        burn_in.phase = BURNIN_MANAGE
                     except Exception as exc:
                         logger.warning(
                             f"Node {node.name} ({node.id}) could not be moved to manageable state: {exc}"
                         )
-                        failed = True
-                        continue
-
-                if node.provision_state in ["manageable"]:
-                    # NOTE: Ironic removes "instance_info" on undeploy. It was saved to "extra" during sync and needs to be refreshed here.
-                    if (
-                        "instance_info" in node
-                        and not node["instance_info"]
-                        and "instance_info" in node["extra"]
-                        and node["extra"]["instance_info"]
-                    ):
-                        node = conn.baremetal.update_node(
-                            node,
-                            instance_info=json.loads(node.extra["instance_info"]),
-                        )
-
-                    node_vendor = node.properties.get("vendor", "").strip().lower()
-                    if node_vendor == "supermicro":
-                        try:
-                            conn.baremetal.set_node_boot_device(
-                                node.id, "cdrom", persistent=False
-                            )
-                        except Exception as exc:
-                            logger.warning(
-                                f"Node {node.name} ({node.id}) could not set boot device to cdrom: {exc}"
-                            )
-
+                        burn_in.phase = BURNIN_FAILED
+                        burn_in.error = str(exc)
+                burn_in.heartbeat = _agent_heartbeat(node)
+                burn_ins.append(burn_in)
+
+            def launch(burn_in):
+                node = burn_in.node
+                if burn_in.action == "service":
                     try:
-                        conn.baremetal.set_node_provision_state(
-                            node.id, "clean", clean_steps=clean_steps
+                        node.set_provision_state(
+                            conn.baremetal, "service", service_steps=burn_in.steps
                         )
                     except Exception as exc:
                         logger.warning(
                             f"Burn-In of node {node.name} ({node.id}) failed: {exc}"
                         )
-                        failed = True
-                        continue
-                elif node.provision_state in ["active"]:
-                    # NOTE: Use service step to run burn-in
-                    if not yes_i_really_really_mean_it:
-                        logger.error(
-                            "Please confirm that you wish to burn-in an active node by specifying '--yes-i-really-really-mean-it'"
-                        )
-                        continue
+                        burn_in.error = str(exc)
+                        return False
+                    return True
 
-                    # NOTE: Skip disk burn-in, so that we do not accidentaly overwrite the root disk or any state
-                    service_steps = [
-                        step for step in clean_steps if step["step"] != "burnin_disk"
-                    ]
-                    if len(service_steps) < len(clean_steps):
-                        logger.warning(
-                            "Request to burn-in an active node. Skipping disk burn-in to prevent accidental dataloss"
-                        )
+                # NOTE: Ironic removes "instance_info" on undeploy. It was saved to "extra" during sync and needs to be refreshed here.
+                if (
+                    "instance_info" in node
+                    and not node["instance_info"]
+                    and "instance_info" in node["extra"]
+                    and node["extra"]["instance_info"]
+                ):
+                    node = conn.baremetal.update_node(
+                        node,
+                        instance_info=json.loads(node.extra["instance_info"]),
+                    )
+
+                node_vendor = node.properties.get("vendor", "").strip().lower()
+                if node_vendor == "supermicro":
                     try:
-                        node.set_provision_state(
-                            conn.baremetal, "service", service_steps=service_steps
+                        conn.baremetal.set_node_boot_device(
+                            node.id, "cdrom", persistent=False
                         )
                     except Exception as exc:
                         logger.warning(
-                            f"Burn-In of node {node.name} ({node.id}) failed: {exc}"
+                            f"Node {node.name} ({node.id}) could not set boot device to cdrom: {exc}"
                         )
-                        failed = True
-                        continue
 
-                else:
+                try:
+                    conn.baremetal.set_node_provision_state(
+                        node.id, "clean", clean_steps=burn_in.steps
+                    )
+                except Exception as exc:
                     logger.warning(
-                        f"Node {node.name} ({node.id}) not in supported state! Provision state: {node.provision_state}, maintenance mode: {node['maintenance']}"
+                        f"Burn-In of node {node.name} ({node.id}) failed: {exc}"
                     )
-                    continue
+                    burn_in.error = str(exc)
+                    return False
+                return True
+
+            if not burn_ins:
+                return
+
+            logger.info(
+                f"Starting burn-in of {len(burn_ins)} nodes, "
+                f"{parsed_args.wave} booting at a time"
+            )
+            _run_burn_ins(conn, burn_ins, launch, parsed_args)
 
+            failed = [burn_in for burn_in in burn_ins if burn_in.phase == BURNIN_FAILED]
             if failed:
+                print(
+                    tabulate(
+                        [
+                            [
+                                burn_in.node.name,
+                                burn_in.node.id,
+                                burn_in.state or burn_in.node.provision_state,
+                                burn_in.error,
+                            ]
+                            for burn_in in sorted(
+                                failed, key=lambda burn_in: burn_in.node.name or ""
+                            )
+                        ],
+                        headers=["Name", "ID", "Provision State", "Error"],
+                        tablefmt="psql",
+                    )
+                )
                 return 1
         finally:
             cleanup_cloud_environment(temp_files, original_cwd)
@@ -1179,9 +1481,9 @@ class BaremetalClean(Command):
         )
         parser.add_argument(
             "name",
-            nargs="?",
+            nargs="*",
             type=str,
-            help="Clean given baremetal node when in provision state available",
+            help="Clean given baremetal nodes when in provision state available",
         )
         parser.add_argument(
             "--metadata-only",
@@ -1201,16 +1503,17 @@ class BaremetalClean(Command):
             help="Specify this to actually clean all nodes",
             action="store_true",
         )
+        _add_bulk_arguments(parser)
         return parser
 
     def take_action(self, parsed_args):
         cloud = parsed_args.cloud
         all_nodes = parsed_args.all
-        name = parsed_args.name
+        names = parsed_args.name
         metadata_only = parsed_args.metadata_only
         yes_i_really_really_mean_it = parsed_args.yes_i_really_really_mean_it
 
-        if not all_nodes and not name:
+        if not all_nodes and not names:
             logger.error("Please specify a node name or use --all")
             return 1
 
@@ -1238,26 +1541,18 @@ class BaremetalClean(Command):
         try:
             conn = get_openstack_connection(cloud, password)
 
-            if all_nodes:
-                clean_nodes = list(conn.baremetal.nodes(details=True))
-            else:
-                node = conn.baremetal.find_node(name, ignore_missing=True, details=True)
-                if not node:
-                    logger.warning(f"Could not find node {name}")
-                    return 1
-                clean_nodes = [node]
-
-            failed = False
-            for node in clean_nodes:
-                if not node:
-                    continue
+            clean_nodes = _select_nodes(conn, names, all_nodes)
+            if clean_nodes is None:
+                return 1
 
+            def clean(node):
+                node_clean_steps = clean_steps
                 # NOTE: If the node has an agent raid interface, include step to delete the raid configuration
                 if (
                     not metadata_only
                     and node.get("raid_interface", "no-raid") != "no-raid"
                 ):
-                    clean_steps = [
+                    node_clean_steps = [
                         {"interface": "raid", "step": "delete_configuration"}
                     ] + clean_steps
 
@@ -1274,53 +1569,52 @@ class BaremetalClean(Command):
                         logger.warning(
                             f"Node {node.name} ({node.id}) could not be moved to manageable state: {exc}"
                         )
-                        failed = True
-                        continue
+                        return FAILED
 
-                if node.provision_state in ["manageable"]:
-                    # NOTE: Ironic removes "instance_info" on undeploy. It was saved to "extra" during sync and needs to be refreshed here.
-                    if (
-                        "instance_info" in node
-                        and not node["instance_info"]
-                        and "instance_info" in node["extra"]
-                        and node["extra"]["instance_info"]
-                    ):
-                        node = conn.baremetal.update_node(
-                            node,
-                            instance_info=json.loads(node.extra["instance_info"]),
-                        )
+                if node.provision_state not in ["manageable"]:
+                    logger.warning(
+                        f"Node {node.name} ({node.id}) not in supported state! Provision state: {node.provision_state}, maintenance mode: {node['maintenance']}"
+                    )
+                    return SKIPPED
 
-                    node_vendor = node.properties.get("vendor", "").strip().lower()
-                    if node_vendor == "supermicro":
-                        try:
-                            conn.baremetal.set_node_boot_device(
-                                node.id, "cdrom", persistent=False
-                            )
-                        except Exception as exc:
-                            logger.warning(
-                                f"Node {node.name} ({node.id}) could not set boot device to cdrom: {exc}"
-                            )
+                # NOTE: Ironic removes "instance_info" on undeploy. It was saved to "extra" during sync and needs to be refreshed here.
+                if (
+                    "instance_info" in node
+                    and not node["instance_info"]
+                    and "instance_info" in node["extra"]
+                    and node["extra"]["instance_info"]
+                ):
+                    node = conn.baremetal.update_node(
+                        node,
+                        instance_info=json.loads(node.extra["instance_info"]),
+                    )
 
+                node_vendor = node.properties.get("vendor", "").strip().lower()
+                if node_vendor == "supermicro":
                     try:
-                        conn.baremetal.set_node_provision_state(
-                            node.id, "clean", clean_steps=clean_steps
-                        )
-                        logger.info(
-                            f"Successfully initiated clean for node {node.name} ({node.id})"
+                        conn.baremetal.set_node_boot_device(
+                            node.id, "cdrom", persistent=False
                         )
                     except Exception as exc:
                         logger.warning(
-                            f"Clean of node {node.name} ({node.id}) failed: {exc}"
+                            f"Node {node.name} ({node.id}) could not set boot device to cdrom: {exc}"
                         )
-                        failed = True
-                        continue
-                else:
+
+                try:
+                    conn.baremetal.set_node_provision_state(
+                        node.id, "clean", clean_steps=node_clean_steps
+                    )
+                    logger.info(
+                        f"Successfully initiated clean for node {node.name} ({node.id})"
+                    )
+                except Exception as exc:
                     logger.warning(
-                        f"Node {node.name} ({node.id}) not in supported state! Provision state: {node.provision_state}, maintenance mode: {node['maintenance']}"
+                        f"Clean of node {node.name} ({node.id}) failed: {exc}"
                     )
+                    return FAILED
+                return "clean"
 
-            if failed:
-                return 1
+            return _run_node_actions(clean_nodes, clean, parsed_args)
         finally:
             cleanup_cloud_environment(temp_files, original_cwd)
 
@@ -1337,9 +1631,9 @@ class BaremetalProvide(Command):
         )
         parser.add_argument(
             "name",
-            nargs="?",
+            nargs="*",
             type=str,
-            help="Provide given baremetal node when in provision state manageable",
+            help="Provide given baremetal nodes when in provision state manageable",
         )
         parser.add_argument(
             "--all",
@@ -1347,14 +1641,15 @@ class BaremetalProvide(Command):
             help="Provide all baremetal nodes in provision state manageable",
             action="store_true",
         )
+        _add_bulk_arguments(parser)
         return parser
 
     def take_action(self, parsed_args):
         cloud = parsed_args.cloud
         all_nodes = parsed_args.all
-        name = parsed_args.name
+        names = parsed_args.name
 
-        if not all_nodes and not name:
+        if not all_nodes and not names:
             logger.error("Please specify a node name or use --all")
             return 1
 
@@ -1371,39 +1666,30 @@ class BaremetalProvide(Command):
         try:
             conn = get_openstack_connection(cloud, password)
 
-            if all_nodes:
-                provide_nodes = list(conn.baremetal.nodes(details=True))
-            else:
-                node = conn.baremetal.find_node(name, ignore_missing=True, details=True)
-                if not node:
-                    logger.warning(f"Could not find node {name}")
-                    return 1
-                provide_nodes = [node]
-
-            failed = False
-            for node in provide_nodes:
-                if not node:
-                    continue
+            provide_nodes = _select_nodes(conn, names, all_nodes)
+            if provide_nodes is None:
+                return 1
 
-                if node.provision_state == "manageable" and not node["maintenance"]:
-                    try:
-                        conn.baremetal.set_node_provision_state(node.id, "provide")
-                        logger.info(
-                            f"Successfully initiated provide for node {node.name} ({node.id})"
-                        )
-                    except Exception as exc:
-                        logger.warning(
-                            f"Node {node.name} ({node.id}) could not be moved to available state: {exc}"
-                        )
-                        failed = True
-                        continue
-                else:
+            def provide(node):
+                if node.provision_state != "manageable" or node["maintenance"]:
                     logger.warning(
                         f"Node {node.name} ({node.id}) not in supported state! Provision state: {node.provision_state}, maintenance mode: {node['maintenance']}"
                     )
+                    return SKIPPED
 
-            if failed:
-                return 1
+                try:
+                    conn.baremetal.set_node_provision_state(node.id, "provide")
+                    logger.info(
+                        f"Successfully initiated provide for node {node.name} ({node.id})"
+                    )
+                except Exception as exc:
+                    logger.warning(
+                        f"Node {node.name} ({node.id}) could not be moved to available state: {exc}"
+                    )
+                    return FAILED
+                return "provide"
+
+            return _run_node_actions(provide_nodes, provide, parsed_args)
         finally:
             cleanup_cloud_environment(temp_files, original_cwd)
 
@@ -1420,9 +1706,9 @@ class BaremetalMaintenanceSet(Command):
         )
         parser.add_argument(
             "name",
-            nargs="?",
+            nargs="*",
             type=str,
-            help="Set maintenance on given baremetal node",
+            help="Set maintenance on given baremetal nodes",
         )
         parser.add_argument(
             "--reason",
@@ -1430,13 +1716,18 @@ class BaremetalMaintenanceSet(Command):
             type=str,
             help="Reason for maintenance",
         )
+        _add_bulk_arguments(parser)
         return parser
 
     def take_action(self, parsed_args):
         cloud = parsed_args.cloud
-        name = parsed_args.name
+        names = parsed_args.name
         reason = parsed_args.reason
 
+        if not names:
+            logger.error("Please specify a node name")
+            return 1
+
         from osism.tasks.openstack import get_cloud_helpers
 
         setup_cloud_environment, get_openstack_connection, cleanup_cloud_environment = (
@@ -1449,17 +1740,21 @@ class BaremetalMaintenanceSet(Command):
 
         try:
             conn = get_openstack_connection(cloud, password)
-            node = conn.baremetal.find_node(name, ignore_missing=True, details=True)
-            if not node:
-                logger.warning(f"Could not find node {name}")
-                return 1
-            try:
-                conn.baremetal.set_node_maintenance(node, reason=reason)
-            except Exception as exc:
-                logger.error(
-                    f"Setting maintenance mode on node {node.name} ({node.id}) failed: {exc}"
-                )
+            nodes = _select_nodes(conn, names, False)
+            if nodes is None:
                 return 1
+
+            def set_maintenance(node):
+                try:
+                    conn.baremetal.set_node_maintenance(node, reason=reason)
+                except Exception as exc:
+                    logger.error(
+                        f"Setting maintenance mode on node {node.name} ({node.id}) failed: {exc}"
+                    )
+                    return FAILED
+                return "maintenance"
+
+            return _run_node_actions(nodes, set_maintenance, parsed_args)
         finally:
             cleanup_cloud_environment(temp_files, original_cwd)
 
@@ -1476,15 +1771,20 @@ class BaremetalMaintenanceUnset(Command):
         )
         parser.add_argument(
             "name",
-            nargs="?",
+            nargs="*",
             type=str,
-            help="Unset maintenance on given baremetal node",
+            help="Unset maintenance on given baremetal nodes",
         )
+        _add_bulk_arguments(parser)
         return parser
 
     def take_action(self, parsed_args):
         cloud = parsed_args.cloud
-        name = parsed_args.name
+        names = parsed_args.name
+
+        if not names:
+            logger.error("Please specify a node name")
+            return 1
 
         from osism.tasks.openstack import get_cloud_helpers
 
@@ -1498,17 +1798,21 @@ class BaremetalMaintenanceUnset(Command):
 
         try:
             conn = get_openstack_connection(cloud, password)
-            node = conn.baremetal.find_node(name, ignore_missing=True, details=True)
-            if not node:
-                logger.warning(f"Could not find node {name}")
-                return 1
-            try:
-                conn.baremetal.unset_node_maintenance(node)
-            except Exception as exc:
-                logger.error(
-                    f"Unsetting maintenance mode on node {node.name} ({node.id}) failed: {exc}"
-                )
+            nodes = _select_nodes(conn, names, False)
+            if nodes is None:
                 return 1
+
+            def unset_maintenance(node):
+                try:
+                    conn.baremetal.unset_node_maintenance(node)
+                except Exception as exc:
+                    logger.error(
+                        f"Unsetting maintenance mode on node {node.name} ({node.id}) failed: {exc}"
+                    )
+                    return FAILED
+                return "no maintenance"
+
+            return _run_node_actions(nodes, unset_maintenance, parsed_args)
         finally:
             cleanup_cloud_environment(temp_files, original_cwd)
 
@@ -1525,17 +1829,18 @@ class BaremetalPowerOn(Command):
         )
         parser.add_argument(
             "name",
-            nargs="?",
+            nargs="*",
             type=str,
-            help="Power on given baremetal node",
+            help="Power on given baremetal nodes",
         )
+        _add_bulk_arguments(parser)
         return parser
 
     def take_action(self, parsed_args):
         cloud = parsed_args.cloud
-        name = parsed_args.name
+        names = parsed_args.name
 
-        if not name:
+        if not names:
             logger.error("Please specify a node name")
             return 1
 
@@ -1551,17 +1856,22 @@ class BaremetalPowerOn(Command):
 
         try:
             conn = get_openstack_connection(cloud, password)
-            node = conn.baremetal.find_node(name, ignore_missing=True, details=True)
-            if not node:
-                logger.warning(f"Could not find node {name}")
+            nodes = _select_nodes(conn, names, False)
+            if nodes is None:
                 return 1
 
-            try:
-                conn.baremetal.set_node_power_state(node.id, "power on")
-                logger.info(f"Successfully powered on node {node.name} ({node.id})")
-            except Exception as exc:
-                logger.error(f"Failed to power on node {node.name} ({node.id}): {exc}")
-                return 1
+            def power_on(node):
+                try:
+                    conn.baremetal.set_node_power_state(node.id, "power on")
+                    logger.info(f"Successfully powered on node {node.name} ({node.id})")
+                except Exception as exc:
+                    logger.error(
+                        f"Failed to power on node {node.name} ({node.id}): {exc}"
+                    )
+                    return FAILED
+                return "power on"
+
+            return _run_node_actions(nodes, power_on, parsed_args)
         finally:
             cleanup_cloud_environment(temp_files, original_cwd)
 
@@ -1578,9 +1888,9 @@ class BaremetalPowerOff(Command):
         )
         parser.add_argument(
             "name",
-            nargs="?",
+            nargs="*",
             type=str,
-            help="Power off given baremetal node",
+            help="Power off given baremetal nodes",
         )
         parser.add_argument(
             "--soft",
@@ -1588,14 +1898,15 @@ class BaremetalPowerOff(Command):
             action="store_true",
             help="Request graceful power-off",
         )
+        _add_bulk_arguments(parser)
         return parser
 
     def take_action(self, parsed_args):
         cloud = parsed_args.cloud
-        name = parsed_args.name
+        names = parsed_args.name
         soft = parsed_args.soft
 
-        if not name:
+        if not names:
             logger.error("Please specify a node name")
             return 1
 
@@ -1611,20 +1922,25 @@ class BaremetalPowerOff(Command):
 
         try:
             conn = get_openstack_connection(cloud, password)
-            node = conn.baremetal.find_node(name, ignore_missing=True, details=True)
-            if not node:
-                logger.warning(f"Could not find node {name}")
+            nodes = _select_nodes(conn, names, False)
+            if nodes is None:
                 return 1
 
             target = "soft power off" if soft else "power off"
 
-            try:
-                conn.baremetal.set_node_power_state(node.id, target)
-                action = "soft powered off" if soft else "powered off"
-                logger.info(f"Successfully {action} node {node.name} ({node.id})")
-            except Exception as exc:
-                logger.error(f"Failed to power off node {node.name} ({node.id}): {exc}")
-                return 1
+            def power_off(node):
+                try:
+                    conn.baremetal.set_node_power_state(node.id, target)
+                    action = "soft powered off" if soft else "powered off"
+                    logger.info(f"Successfully {action} node {node.name} ({node.id})")
+                except Exception as exc:
+                    logger.error(
+                        f"Failed to power off node {node.name} ({node.id}): {exc}"
+                    )
+                    return FAILED
+                return target
+
+            return _run_node_actions(nodes, power_off, parsed_args)
         finally:
             cleanup_cloud_environment(temp_files, original_cwd)
 
@@ -1641,9 +1957,9 @@ class BaremetalDelete(Command):
         )
         parser.add_argument(
             "name",
-            nargs="?",
+            nargs="*",
             type=str,
-            help="Delete given baremetal node",
+            help="Delete given baremetal nodes",
         )
         parser.add_argument(
             "--all",
@@ -1657,15 +1973,16 @@ class BaremetalDelete(Command):
             help="Specify this to actually delete all nodes",
             action="store_true",
         )
+        _add_bulk_arguments(parser)
         return parser
 
     def take_action(self, parsed_args):
         cloud = parsed_args.cloud
         all_nodes = parsed_args.all
-        name = parsed_args.name
+        names = parsed_args.name
         yes_i_really_really_mean_it = parsed_args.yes_i_really_really_mean_it
 
-        if not all_nodes and not name:
+        if not all_nodes and not names:
             logger.error("Please specify a node name or use --all")
             return 1
 
@@ -1688,22 +2005,11 @@ class BaremetalDelete(Command):
         try:
             conn = get_openstack_connection(cloud, password)
 
-            if all_nodes:
-                delete_nodes = list(conn.baremetal.nodes())
-            else:
-                node = conn.baremetal.find_node(
-                    name, ignore_missing=True, details=False
-                )
-                if not node:
-                    logger.warning(f"Could not find node {name}")
-                    return 1
-                delete_nodes = [node]
-
-            failed = False
-            for node in delete_nodes:
-                if not node:
-                    continue
+            delete_nodes = _select_nodes(conn, names, all_nodes, details=False)
+            if delete_nodes is None:
+                return 1
 
+            def delete(node):
                 try:
                     # Delete ports first (safe deletion pattern)
                     logger.info(f"Deleting ports for node {node.name} ({node.id})")
@@ -1776,10 +2082,9 @@ class BaremetalDelete(Command):
                     logger.error(
                         f"Failed to delete node {node.name} ({node.id}): {exc}"
                     )
-                    failed = True
-                    continue
+                    return FAILED
+                return "deleted"
 
-            if failed:
-                return 1
+            return _run_node_actions(delete_nodes, delete, parsed_args)
         finally:
             cleanup_cloud_environment(temp_files, original_cwd)
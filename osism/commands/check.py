@@ -3,9 +3,16 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import os
+import queue
 import random
 import stat
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
 
 from cliff.command import Command
 from loguru import logger
@@ -56,37 +63,201 @@ def get_file_info(filepath: str) -> dict[str, object]:
         return {"error": str(e)}
 
 
+# Files smaller than this are hashed for the content comparison
+HASH_SIZE_LIMIT = 1024 * 1024
+
+# Directories skipped when collecting file info, like in the fresh container
+SKIPPED_DIRECTORIES = (".git", "venv", "__pycache__")
+
+# Number of files hashed by one task of the hashing thread pool
+HASH_BATCH_SIZE = 256
+
+# Number of threads listing directories for check inode --usage
+DEFAULT_SCAN_WORKERS = 8
+
+
+def _hash_file(filepath: str) -> str | None:
+    # hashlib releases the GIL while hashing, the files are hashed in threads
+    try:
+        with open(filepath, "rb") as f:
+            return hashlib.md5(f.read()).hexdigest()
+    except (IOError, OSError):
+        return None
+
+
+def _hash_files(filepaths: list[str]) -> list[str | None]:
+    return [_hash_file(filepath) for filepath in filepaths]
+
+
+def _manifest_key(st: os.stat_result) -> str:
+    return f"{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def manifest_file(manifest_dir: str, base_path: str) -> str:
+    """Return the path of the manifest for base_path in manifest_dir."""
+    name = hashlib.sha256(os.path.abspath(base_path).encode()).hexdigest()[:16]
+    return os.path.join(manifest_dir, f"{name}.json")
+
+
+def load_manifest(manifest_path: str, base_path: str) -> dict[str, str]:
+    """Return the content hashes of the manifest keyed on inode, size and mtime.
+
+    Returns an empty dict if the manifest is missing, unreadable, was
+    written for another base path, or others than the user could have
+    written it: planted hashes would hide content differences.
+    """
+    try:
+        with open(manifest_path, "r") as f:
+            st = os.fstat(f.fileno())
+            if st.st_uid != os.getuid() or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+                logger.warning(
+                    f"Ignoring manifest {manifest_path}, it is not private to the user"
+                )
+                return {}
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable manifest {manifest_path}: {e}")
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("base_path") != base_path:
+        return {}
+    hashes = manifest.get("hashes")
+    return hashes if isinstance(hashes, dict) else {}
+
+
+def save_manifest(manifest_path: str, base_path: str, hashes: dict[str, str]) -> None:
+    """Replace the manifest with the given content hashes."""
+    directory = os.path.dirname(manifest_path) or "."
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".manifest-")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"base_path": base_path, "hashes": hashes}, f)
+        os.replace(tmp_path, manifest_path)
+    except OSError as e:
+        logger.warning(f"Could not write manifest {manifest_path}: {e}")
+
+
+def _stat_info(st: os.stat_result) -> dict[str, object]:
+    return {
+        "inode": st.st_ino,
+        "mtime": st.st_mtime,
+        "size": st.st_size,
+        "mode": st.st_mode,
+        "uid": st.st_uid,
+        "gid": st.st_gid,
+        "is_link": False,
+        "hash": None,
+    }
+
+
 def collect_file_info(
-    base_path: str, max_files: int = 100000
+    base_path: str,
+    max_files: int = 100000,
+    check_content: bool = True,
+    manifest_path: str | None = None,
 ) -> dict[str, dict[str, object]]:
-    """Collect file information for all files under base_path."""
+    """Collect file information for all files under base_path.
+
+    The entries are listed with os.scandir, in the order of os.walk, and
+    stat'ed once. Symlinks are skipped. With check_content the regular files
+    smaller than HASH_SIZE_LIMIT get the MD5 hash of their content, the same
+    hash md5sum computes in the fresh container. The hashes are computed in
+    a thread pool and, with a manifest_path, taken from the manifest of the
+    previous run for the files whose inode, size and mtime did not change.
+    """
     file_info: dict[str, dict[str, object]] = {}
+    to_hash: dict[str, tuple[str, str]] = {}
+    known = load_manifest(manifest_path, base_path) if manifest_path else {}
+    hashes: dict[str, str] = {}
     count = 0
+    reused = 0
 
-    for root, dirs, files in os.walk(base_path, followlinks=False):
-        # Skip .git, venv, __pycache__ directories
-        for skip in [".git", "venv", "__pycache__"]:
-            if skip in dirs:
-                dirs.remove(skip)
+    # Directories to list with their path relative to base_path
+    pending = [(base_path, "")]
+    while pending:
+        directory, reldir = pending.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        files, dirs = [], []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir and entry.name in SKIPPED_DIRECTORIES:
+                continue
+            (dirs if is_dir else files).append(entry)
 
-        for name in files + dirs:
+        for entry in files + dirs:
             if count >= max_files:
                 logger.warning(f"Reached max file limit ({max_files}), stopping scan")
-                return file_info
+                pending = []
+                break
 
-            filepath = os.path.join(root, name)
-            # Skip symlinks
-            if os.path.islink(filepath):
+            if entry.is_symlink():
                 continue
-            relpath = os.path.relpath(filepath, base_path)
-            file_info[relpath] = get_file_info(filepath)
+            relpath = f"{reldir}{entry.name}"
             count += 1
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError as e:
+                file_info[relpath] = {"error": str(e)}
+                continue
+
+            file_info[relpath] = _stat_info(st)
+            if (
+                check_content
+                and st.st_size < HASH_SIZE_LIMIT
+                and stat.S_ISREG(st.st_mode)
+            ):
+                key = _manifest_key(st)
+                if key in known:
+                    hashes[key] = file_info[relpath]["hash"] = known[key]
+                    reused += 1
+                else:
+                    to_hash[relpath] = (entry.path, key)
+        else:
+            # Walk the subdirectories in the order of os.walk
+            pending.extend(
+                (entry.path, f"{reldir}{entry.name}/")
+                for entry in reversed(dirs)
+                if not entry.is_symlink()
+            )
 
+    if to_hash:
+        paths = [path for path, _ in to_hash.values()]
+        batches = [
+            paths[start : start + HASH_BATCH_SIZE]
+            for start in range(0, len(paths), HASH_BATCH_SIZE)
+        ]
+        with ThreadPoolExecutor() as executor:
+            file_hashes = [
+                file_hash
+                for batch in executor.map(_hash_files, batches)
+                for file_hash in batch
+            ]
+        for (relpath, (_, key)), file_hash in zip(to_hash.items(), file_hashes):
+            file_info[relpath]["hash"] = file_hash
+            if file_hash is not None:
+                hashes[key] = file_hash
+    logger.debug(f"Hashed {len(to_hash)} file(s), {reused} hash(es) from the manifest")
+
+    if manifest_path and check_content:
+        save_manifest(manifest_path, base_path, hashes)
     return file_info
 
 
 def parse_stat_output(output: str) -> dict[str, dict[str, object]]:
-    """Parse stat output from container into a dict of file info."""
+    """Parse stat output from container into a dict of file info.
+
+    A file may have several FILE records, their fields are merged.
+    """
     file_info: dict[str, dict[str, object]] = {}
     current_file = None
 
@@ -97,7 +268,8 @@ def parse_stat_output(output: str) -> dict[str, dict[str, object]]:
 
         if line.startswith("FILE:"):
             current_file = line[5:].strip()
-            file_info[current_file] = {}
+            # Later records of a file add to the earlier ones
+            file_info.setdefault(current_file, {})
         elif current_file and ":" in line:
             key, value = line.split(":", 1)
             key = key.strip().lower()
@@ -117,6 +289,63 @@ def parse_stat_output(output: str) -> dict[str, dict[str, object]]:
     return file_info
 
 
+def build_scan_script(mount_path: str, max_files: int, check_content: bool) -> str:
+    """Return a shell script printing the file info records of mount_path.
+
+    The records are the ones parse_stat_output reads. The script only uses
+    find, stat, md5sum and awk as found in busybox, and runs a fixed number
+    of processes however many files there are: xargs hands the files to stat
+    and md5sum in batches instead of forking per file. Files that cannot be
+    stat'ed get an ERROR record, the hashes of the regular files smaller than
+    1 MiB follow the stat records as a second FILE record per file.
+    """
+    script = f"""cd "{mount_path}" || exit 1
+tmp=$(mktemp -d) || exit 1
+find . -maxdepth 10 \\( -name .git -o -name venv -o -name __pycache__ \\) -prune -o \\( -type f -o -type d \\) -print 2>/dev/null | head -n {max_files} > "$tmp/files"
+: > "$tmp/hash"
+tr '\\n' '\\0' < "$tmp/files" | xargs -0 -r stat -c '%i %s %Y %n' 2>"$tmp/errors" | awk -v hash={int(check_content)} -v out="$tmp/hash" '
+{{
+    name = $0
+    sub(/^[^ ]+ [^ ]+ [^ ]+ /, "", name)
+    if (name == ".") next
+    sub(/^\\.\\//, "", name)
+    print "FILE:" name
+    print "INODE:" $1
+    print "SIZE:" $2
+    print "MTIME:" $3
+    if (hash && $2 < 1048576) print "./" name > out
+}}'
+awk -v q="\\047" '
+{{
+    # The names start with ./ and are quoted, the message may hold quotes too
+    start = index($0, q "./")
+    if (!start) next
+    rest = substr($0, start + 3)
+    end = index(rest, q ": ")
+    if (!end) next
+    name = substr(rest, 1, end - 1)
+    print "FILE:" name
+    print "ERROR:" substr(rest, end + 3)
+}}' "$tmp/errors"
+"""
+    if check_content:
+        # md5sum skips the directories in the list with an error
+        script += """tr '\\n' '\\0' < "$tmp/hash" | xargs -0 -r md5sum 2>/dev/null | awk '
+{
+    # Names with a backslash or a newline are escaped, skip them
+    if (substr($0, 1, 1) == "\\\\") next
+    hash = $1
+    name = $0
+    sub(/^[^ ]+  /, "", name)
+    sub(/^\\.\\//, "", name)
+    print "FILE:" name
+    print "HASH:" hash
+}'
+"""
+    script += 'rm -rf "$tmp"\n'
+    return script
+
+
 class Mount(Command):
     """Check bind mount integrity for /opt/configuration.
 
@@ -175,6 +404,13 @@ class Mount(Command):
             default=False,
             help="Also verify file content hashes (slower but more thorough)",
         )
+        parser.add_argument(
+            "--manifest-dir",
+            default=settings.CHECK_MOUNT_MANIFEST_DIR,
+            help="Directory keeping the local content hashes between runs, "
+            "empty to hash all files again "
+            f"(default: {settings.CHECK_MOUNT_MANIFEST_DIR or 'none'})",
+        )
         return parser
 
     def _get_container_id(self) -> str | None:
@@ -272,48 +508,15 @@ class Mount(Command):
         max_files: int,
     ) -> str:
         """Run a fresh container to collect file info from the mount."""
-        # Script to collect file info - create operator user (UID/GID 45000) first
-        # Write inner script to file to avoid quote escaping issues
+        # Create the operator user (UID/GID 45000) first and write the scan
+        # script to a file to avoid quote escaping issues
         operator_user = settings.OPERATOR_USER
         script = f"""#!/bin/sh
 addgroup -g 45000 {operator_user} 2>/dev/null
 adduser -D -u 45000 -G {operator_user} {operator_user} 2>/dev/null
 
 cat > /tmp/scan.sh << 'SCANEOF'
-cd "{mount_path}"
-find . -maxdepth 10 \\( -name .git -o -name venv -o -name __pycache__ \\) -prune -o \\( -type f -o -type d \\) -print 2>/dev/null | head -{max_files} | while read file; do
-    [ "$file" = "." ] && continue
-    relpath="${{file#./}}"
-    [ -z "$relpath" ] && continue
-    echo "FILE:$relpath"
-    if [ -e "$file" ]; then
-        inode=$(stat -c "%i" "$file" 2>&1)
-        if [ $? -eq 0 ]; then
-            echo "INODE:$inode"
-            echo "SIZE:$(stat -c "%s" "$file")"
-            echo "MTIME:$(stat -c "%Y" "$file")"
-"""
-        if check_content:
-            script += """
-            if [ -f "$file" ] && [ $(stat -c %s "$file" 2>/dev/null || echo 9999999) -lt 1048576 ]; then
-                hash=$(md5sum "$file" 2>/dev/null | cut -d' ' -f1)
-                echo "HASH:${hash:-NONE}"
-            else
-                echo "HASH:NONE"
-            fi
-"""
-        else:
-            script += '            echo "HASH:NONE"\n'
-
-        script += f"""
-        else
-            echo "ERROR:$inode"
-        fi
-    else
-        echo "ERROR:File not found"
-    fi
-done
-SCANEOF
+{build_scan_script(mount_path, max_files, check_content)}SCANEOF
 
 chmod +x /tmp/scan.sh
 su {operator_user} -c "/bin/sh /tmp/scan.sh"
@@ -479,9 +682,18 @@ su {operator_user} -c "/bin/sh /tmp/scan.sh"
             logger.info(f"Collecting file info from local view of {path}...")
 
         # Collect local file info
-        local_info = collect_file_info(path, max_files)
+        started = time.monotonic()
+        manifest = (
+            manifest_file(parsed_args.manifest_dir, path)
+            if parsed_args.manifest_dir
+            else None
+        )
+        local_info = collect_file_info(path, max_files, check_content, manifest)
         if format == "log":
-            logger.info(f"Found {len(local_info)} files/directories locally")
+            logger.info(
+                f"Found {len(local_info)} files/directories locally "
+                f"in {time.monotonic() - started:.1f}s"
+            )
 
         # Pull image if needed
         if format == "log":
@@ -629,11 +841,116 @@ su {operator_user} -c "/bin/sh /tmp/scan.sh"
         return 1 if has_issues else 0
 
 
+def count_entries(
+    path: str,
+    workers: int = DEFAULT_SCAN_WORKERS,
+    max_depth: int | None = None,
+    time_budget: float | None = None,
+    on_complete: Callable[[str, int], None] | None = None,
+) -> tuple[dict[str, int], bool]:
+    """Count the directory entries, i.e. the inodes used, below path.
+
+    Returns the number of entries per top-level directory of path, the
+    directory included, with the other top-level entries counted for path
+    itself, and whether all directories were listed.
+
+    The directories are listed with os.scandir by workers threads sharing
+    one stack of directories to list, a thread done with its directory
+    takes the next one of any subtree, so one large subtree does not keep
+    the other threads idle. Symlinks are not followed and directories on
+    other filesystems are counted but not listed, like ``du -x``. Nothing
+    below max_depth is listed and nothing is listed once time_budget
+    seconds have passed. on_complete is called with each top-level
+    directory and its count as soon as its subtree is done.
+    """
+    device = os.stat(path).st_dev
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    counts = {path: 0}
+    # Directories of each subtree that are still to be listed
+    pending: dict[str, int] = {}
+    lock = threading.Lock()
+    complete = True
+    work: queue.LifoQueue = queue.LifoQueue()
+
+    def subdirectories(entries, depth):
+        if max_depth is not None and depth >= max_depth:
+            return []
+        found = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False) and (
+                    entry.stat(follow_symlinks=False).st_dev == device
+                ):
+                    found.append(entry.path)
+            except OSError:
+                pass
+        return found
+
+    def list_directory(directory, owner, depth):
+        nonlocal complete
+        if deadline is not None and time.monotonic() > deadline:
+            entries, found, listed = [], [], False
+        else:
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                entries = []
+            found = subdirectories(entries, depth)
+            listed = True
+
+        with lock:
+            complete = complete and listed
+            counts[owner] += len(entries)
+            pending[owner] += len(found) - 1
+            done = pending[owner] == 0
+        for subdirectory in found:
+            work.put((subdirectory, owner, depth + 1))
+        if done and on_complete is not None:
+            on_complete(owner, counts[owner])
+
+    def worker():
+        while True:
+            item = work.get()
+            try:
+                if item is None:
+                    return
+                list_directory(*item)
+            finally:
+                work.task_done()
+
+    with os.scandir(path) as it:
+        top_level = list(it)
+    top_dirs = subdirectories(top_level, 0)
+    counts[path] = len(top_level) - len(top_dirs)
+    for directory in top_dirs:
+        counts[directory] = 1
+        pending[directory] = 1
+        work.put((directory, directory, 1))
+
+    threads = [
+        threading.Thread(target=worker, daemon=True) for _ in range(max(1, workers))
+    ]
+    for thread in threads:
+        thread.start()
+    work.join()
+    for _ in threads:
+        work.put(None)
+    for thread in threads:
+        thread.join()
+
+    return counts, complete
+
+
 class Inode(Command):
     """Quick inode check for specific files in /opt/configuration.
 
     This is a lightweight alternative to 'check mount' that only checks
     specific files without spawning a fresh container.
+
+    With --usage it instead counts the inodes used below the given paths
+    per top-level directory, to find what exhausts the inodes of a
+    filesystem, e.g. below /var/lib/docker.
     """
 
     def get_parser(self, prog_name):
@@ -657,9 +974,105 @@ class Inode(Command):
             nargs="?",
             choices=["script", "log", "table"],
         )
+        parser.add_argument(
+            "--usage",
+            action="append",
+            default=[],
+            metavar="PATH",
+            help="Count the inodes used below PATH per top-level directory "
+            "instead, biggest first (can be repeated)",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=20,
+            help="Number of directories shown per --usage path (default: 20)",
+        )
+        parser.add_argument(
+            "--max-depth",
+            type=int,
+            default=None,
+            help="Do not list directories deeper than this below a --usage path",
+        )
+        parser.add_argument(
+            "--time-budget",
+            type=float,
+            default=None,
+            help="Stop listing directories of a --usage path after this many "
+            "seconds, the counts are lower bounds then",
+        )
+        parser.add_argument(
+            "--parallel",
+            type=int,
+            default=DEFAULT_SCAN_WORKERS,
+            help="Number of threads listing directories for --usage "
+            f"(default: {DEFAULT_SCAN_WORKERS})",
+        )
         return parser
 
+    def _usage(self, parsed_args) -> int:
+        format = parsed_args.format
+
+        def on_complete(directory, count):
+            logger.info(f"Counted {count} entries below {directory}")
+
+        for path in parsed_args.usage:
+            try:
+                vfs = os.statvfs(path)
+                started = time.monotonic()
+                counts, complete = count_entries(
+                    path,
+                    parsed_args.parallel,
+                    parsed_args.max_depth,
+                    parsed_args.time_budget,
+                    on_complete if format == "log" else None,
+                )
+            except OSError as e:
+                if format == "log":
+                    logger.error(f"Could not count the inodes below {path}: {e}")
+                elif format == "script":
+                    print(f"FAILED: {e}")
+                return 1
+            duration = time.monotonic() - started
+            biggest = sorted(counts.items(), key=lambda item: -item[1])[
+                : parsed_args.top
+            ]
+            used = vfs.f_files - vfs.f_ffree
+            percent = used * 100 / vfs.f_files if vfs.f_files else 0
+
+            if format == "log":
+                logger.info(
+                    f"Inodes used on the filesystem of {path}: "
+                    f"{used}/{vfs.f_files} ({percent:.1f}%)"
+                )
+                for directory, count in biggest:
+                    logger.info(f"{directory}: {count} entries")
+                if not complete:
+                    logger.warning(
+                        f"Time budget exceeded, the counts below {path} are "
+                        "lower bounds"
+                    )
+            elif format == "table":
+                print(
+                    f"Inodes used on the filesystem of {path}: "
+                    f"{used}/{vfs.f_files} ({percent:.1f}%), "
+                    f"{sum(counts.values())} entries below {path} "
+                    f"counted in {duration:.1f}s"
+                    + ("" if complete else " (time budget exceeded)")
+                )
+                print(tabulate(biggest, headers=["Path", "Entries"], tablefmt="psql"))
+            elif format == "script":
+                for directory, count in biggest:
+                    print(f"USAGE:{directory}:{count}")
+                if not complete:
+                    print(f"INCOMPLETE:{path}")
+
+        return 0
+
     def take_action(self, parsed_args):
+        if parsed_args.usage:
+            return self._usage(parsed_args)
+
         path = parsed_args.path
         files = parsed_args.files
         format = parsed_args.format
@@ -1,7 +1,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
-import time
 import datetime
+import time
 
 from cliff.command import Command
 from jc import parse
@@ -9,6 +9,182 @@ from loguru import logger
 from tabulate import tabulate
 from prompt_toolkit import prompt
 
+from osism.utils.actions import RateLimiter, Step, run_workflows, status_failed
+
+# Servers handled at the same time by the bulk server actions
+DEFAULT_PARALLEL = 10
+
+# Seconds a single step of a server, e.g. stopping it, may take
+DEFAULT_STEP_TIMEOUT = 600
+
+# Migrations off one compute node at the same time, they share its network
+DEFAULT_PARALLEL_PER_HOST = 2
+
+# Retries of a failed migration and the seconds before the first one
+DEFAULT_RETRIES = 2
+DEFAULT_RETRY_DELAY = 30
+
+# API calls per second of the bulk server actions, to protect nova-api
+DEFAULT_RATE = 10
+
+# Margin for clock differences between the manager and Nova when polling
+# the servers changed since an action started
+CHANGES_SINCE_MARGIN = 60
+
+
+def _server_poller(conn):
+    """Return a poll function for run_workflows.
+
+    All servers changed since shortly before the poller was created are
+    listed with one call, instead of one GET per server.
+    """
+    since = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
+        seconds=CHANGES_SINCE_MARGIN
+    )
+    changes_since = since.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def poll(server_ids):
+        wanted = set(server_ids)
+        return {
+            server.id: server
+            for server in conn.compute.servers(
+                all_projects=True, changes_since=changes_since
+            )
+            if server.id in wanted
+        }
+
+    return poll
+
+
+def _server_step(action, conn, status):
+    """Return the step calling <action>_server, done once the server has status."""
+    return Step(
+        action,
+        getattr(conn.compute, f"{action}_server"),
+        lambda server: server.status == status and not server.task_state,
+        status_failed("ERROR", "DELETED"),
+    )
+
+
+def _server_ram(server):
+    """Return the RAM of the flavor of a server in MB, 0 if unknown."""
+    flavor = getattr(server, "flavor", None)
+    if isinstance(flavor, dict):
+        ram = flavor.get("ram")
+    else:
+        ram = getattr(flavor, "ram", None)
+    try:
+        return int(ram or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _migrated(source):
+    """Return a Step.done for a server that left the source host."""
+    return lambda server: (
+        server.compute_host != source
+        and not server.task_state
+        and server.status in ["ACTIVE", "PAUSED", "SHUTOFF"]
+    )
+
+
+def _live_migration_failed(source):
+    """Return a Step.failed for a live migration.
+
+    Nova sets the task state before it accepts a live migration, a server
+    back on the source host without one was rolled back.
+    """
+
+    def failed(server):
+        if server.status in ["ERROR", "DELETED"]:
+            return f"status {server.status}"
+        if server.compute_host == source and not server.task_state:
+            return "migration was rolled back"
+        return None
+
+    return failed
+
+
+def _seconds(duration):
+    return "-" if duration is None else f"{duration:.1f}s"
+
+
+def _add_bulk_arguments(parser, verb):
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=DEFAULT_PARALLEL,
+        help=f"Number of servers {verb} at the same time (default: {DEFAULT_PARALLEL})",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_RATE,
+        help=f"API calls per second, 0 for no limit (default: {DEFAULT_RATE})",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=DEFAULT_STEP_TIMEOUT,
+        help=f"Seconds a server may take (default: {DEFAULT_STEP_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--no-wait",
+        default=False,
+        help="Do not wait until the servers reached their status",
+        action="store_true",
+    )
+
+
+def _run_server_action(conn, servers, action, status, parsed_args):
+    """Run <action>_server on the servers and wait until they have status.
+
+    servers maps the server IDs to their names. Logs a summary and prints
+    the servers that failed, returns 1 if any did.
+    """
+    started = time.monotonic()
+    if parsed_args.no_wait:
+        limiter = RateLimiter(parsed_args.rate)
+        errors = {}
+        for server_id in servers:
+            limiter.wait()
+            try:
+                getattr(conn.compute, f"{action}_server")(server_id)
+            except Exception as exc:
+                errors[server_id] = f"{action} failed: {exc}"
+    else:
+        results = run_workflows(
+            {server_id: [_server_step(action, conn, status)] for server_id in servers},
+            _server_poller(conn),
+            names=servers,
+            concurrency=parsed_args.parallel,
+            timeout=parsed_args.timeout,
+            rate=parsed_args.rate,
+        )
+        errors = {r.id: r.error for r in results if not r.ok}
+    elapsed = time.monotonic() - started
+
+    done = f"{len(servers) - len(errors)} of {len(servers)} server(s)"
+    if parsed_args.no_wait:
+        summary = f"Requested {action} of {done}"
+    else:
+        summary = f"{done} reached {status}"
+    summary += f" in {elapsed:.1f}s, {len(errors)} failed"
+    if errors:
+        print(
+            tabulate(
+                [
+                    [server_id, servers[server_id], error]
+                    for server_id, error in errors.items()
+                ],
+                headers=["ID", "Name", "Error"],
+                tablefmt="psql",
+            )
+        )
+        logger.error(summary)
+        return 1
+    logger.info(summary)
+
 
 class ComputeEnable(Command):
     def get_parser(self, prog_name):
@@ -294,6 +470,19 @@ class ComputeEvacuate(Command):
             type=str,
             help="Host to which all running instances are to be migrated",
         )
+        parser.add_argument(
+            "--parallel",
+            type=int,
+            default=DEFAULT_PARALLEL,
+            help=f"Number of servers handled at the same time (default: {DEFAULT_PARALLEL})",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=int,
+            default=DEFAULT_STEP_TIMEOUT,
+            help="Seconds stopping, evacuating or starting a server may take "
+            f"(default: {DEFAULT_STEP_TIMEOUT})",
+        )
         parser.add_argument(
             "host",
             nargs=1,
@@ -307,6 +496,8 @@ class ComputeEvacuate(Command):
         host = parsed_args.host[0]
         target = parsed_args.target
         yes = parsed_args.yes
+        parallel = parsed_args.parallel
+        timeout = parsed_args.timeout
 
         from osism.tasks.openstack import get_cloud_helpers
 
@@ -330,70 +521,101 @@ class ComputeEvacuate(Command):
             else:
                 answer = prompt(f"Evacuate all servers on host {host} [yes/no]: ")
 
-            start = []
-            if answer in ["yes", "y"]:
-                for server in result:
-                    if server[2] not in ["ACTIVE", "SHUTOFF"]:
-                        logger.info(
-                            f"{server[0]} ({server[1]}) in status {server[2]} cannot be evacuated"
-                        )
-                        continue
-                    if server[2] in ["ACTIVE"]:
-                        logger.info(f"Stopping server {server[0]}")
-                        start.append(str(server[0]))
-                        conn.compute.stop_server(server[0])
-                        inner_wait = True
-                        while inner_wait:
-                            time.sleep(2)
-                            s = conn.compute.get_server(server[0])
-                            if s.status not in ["SHUTOFF"]:
-                                logger.info(
-                                    f"Stopping of {server[0]} ({server[1]}) is still in progress"
-                                )
-                                inner_wait = True
-                            else:
-                                inner_wait = False
-
-                services = conn.compute.services(
-                    **{"host": host, "binary": "nova-compute"}
-                )
-                service = next(services)
-                logger.info(f"Forcing down nova-compute binary @ {host} ({service.id})")
-                conn.compute.update_service_forced_down(
-                    service=service.id, host=host, binary="nova-compute", forced=True
-                )
+            if answer not in ["yes", "y"]:
+                return
 
-                for server in result:
-                    if server[2] in ["ACTIVE", "SHUTOFF"]:
-                        logger.info(f"Evacuating server {server[0]}")
-                        conn.compute.evacuate_server(server[0], host=target)
-
-                if result:
-                    logger.info("Waiting 30 seconds")
-                    time.sleep(30)
-
-                for server in start:
-                    logger.info(f"Starting server {server}")
-                    conn.compute.start_server(server)
-                    inner_wait = True
-                    while inner_wait:
-                        time.sleep(2)
-                        s = conn.compute.get_server(server)
-                        if s.status not in ["ACTIVE"]:
-                            logger.info(
-                                f"Starting of {s.id} ({s.name}) is still in progress"
-                            )
-                            inner_wait = True
-                        else:
-                            inner_wait = False
-
-                logger.info(f"Disabling nova-compute binary @ {host} ({service.id})")
-                conn.compute.disable_service(
-                    service=service.id,
-                    host=host,
-                    binary="nova-compute",
-                    disabled_reason="EVACUATE",
+            evacuate = []
+            for server in result:
+                if server[2] not in ["ACTIVE", "SHUTOFF"]:
+                    logger.info(
+                        f"{server[0]} ({server[1]}) in status {server[2]} cannot be evacuated"
+                    )
+                    continue
+                evacuate.append(server)
+            names = {server[0]: server[1] for server in evacuate}
+            start = [server[0] for server in evacuate if server[2] == "ACTIVE"]
+            poll = _server_poller(conn)
+            options = {"names": names, "concurrency": parallel, "timeout": timeout}
+
+            # Stop the running servers first, they are started again once
+            # they were evacuated
+            stopped = {}
+            if start:
+                logger.info(f"Stopping {len(start)} server(s)")
+                stopped = {
+                    r.id: r
+                    for r in run_workflows(
+                        {
+                            server_id: [_server_step("stop", conn, "SHUTOFF")]
+                            for server_id in start
+                        },
+                        poll,
+                        **options,
+                    )
+                }
+
+            services = conn.compute.services(**{"host": host, "binary": "nova-compute"})
+            service = next(services)
+            logger.info(f"Forcing down nova-compute binary @ {host} ({service.id})")
+            conn.compute.update_service_forced_down(
+                service=service.id, host=host, binary="nova-compute", forced=True
+            )
+
+            workflows = {}
+            for server_id in names:
+                if server_id in stopped and not stopped[server_id].ok:
+                    continue
+                steps = [
+                    Step(
+                        "evacuate",
+                        lambda server_id: conn.compute.evacuate_server(
+                            server_id, host=target
+                        ),
+                        _migrated(host),
+                        status_failed("ERROR"),
+                    )
+                ]
+                if server_id in stopped:
+                    steps.append(_server_step("start", conn, "ACTIVE"))
+                workflows[server_id] = steps
+            if workflows:
+                logger.info(f"Evacuating {len(workflows)} server(s)")
+            evacuated = {r.id: r for r in run_workflows(workflows, poll, **options)}
+
+            logger.info(f"Disabling nova-compute binary @ {host} ({service.id})")
+            conn.compute.disable_service(
+                service=service.id,
+                host=host,
+                binary="nova-compute",
+                disabled_reason="EVACUATE",
+            )
+
+            table = []
+            for server_id, name in names.items():
+                durations = {}
+                error = None
+                for results in (stopped, evacuated):
+                    if server_id in results:
+                        durations.update(results[server_id].durations)
+                        error = error or results[server_id].error
+                table.append(
+                    [server_id, name]
+                    + [
+                        _seconds(durations.get(step))
+                        for step in ("stop", "evacuate", "start")
+                    ]
+                    + [error or "OK"]
+                )
+            if table:
+                print(
+                    tabulate(
+                        table,
+                        headers=["ID", "Name", "Stop", "Evacuate", "Start", "Result"],
+                        tablefmt="psql",
+                    )
                 )
+            if any(row[-1] != "OK" for row in table):
+                return 1
         finally:
             cleanup_cloud_environment(temp_files, original_cwd)
 
@@ -455,17 +677,56 @@ class ComputeMigrate(Command):
             type=str,
             help="Filter by string",
         )
+        parser.add_argument(
+            "--parallel",
+            type=int,
+            default=DEFAULT_PARALLEL,
+            help=f"Number of migrations at the same time (default: {DEFAULT_PARALLEL})",
+        )
+        parser.add_argument(
+            "--parallel-per-host",
+            type=int,
+            default=DEFAULT_PARALLEL_PER_HOST,
+            help="Number of migrations at the same time off one host "
+            f"(default: {DEFAULT_PARALLEL_PER_HOST})",
+        )
+        parser.add_argument(
+            "--order",
+            default="small-first",
+            choices=["small-first", "large-first"],
+            help="Migrate the instances with the least or the most RAM first "
+            "(default: small-first)",
+        )
+        parser.add_argument(
+            "--retries",
+            type=int,
+            default=DEFAULT_RETRIES,
+            help=f"Retries of a failed migration (default: {DEFAULT_RETRIES})",
+        )
+        parser.add_argument(
+            "--retry-delay",
+            type=int,
+            default=DEFAULT_RETRY_DELAY,
+            help="Seconds before the first retry of a failed migration, doubled "
+            f"for every further retry (default: {DEFAULT_RETRY_DELAY})",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=int,
+            default=DEFAULT_STEP_TIMEOUT,
+            help=f"Seconds a migration may take (default: {DEFAULT_STEP_TIMEOUT})",
+        )
         parser.add_argument(
             "host",
-            nargs=1,
+            nargs="+",
             type=str,
-            help="Host on that all running instances are to be migrated",
+            help="Hosts on that all running instances are to be migrated",
         )
         return parser
 
     def take_action(self, parsed_args):
         cloud = parsed_args.cloud
-        host = parsed_args.host[0]
+        hosts = parsed_args.host
         target = parsed_args.target
         force = parsed_args.force
         no_wait = parsed_args.no_wait
@@ -489,22 +750,34 @@ class ComputeMigrate(Command):
             conn = get_openstack_connection(cloud, password)
 
             result = []
-            for server in conn.compute.servers(all_projects=True, node=host):
-                if project and server.project_id == project:
-                    result.append([server.id, server.name, server.status])
-                elif domain:
-                    server_project = conn.identity.get_project(server.project_id)
-                    if server_project.domain_id == domain:
-                        result.append([server.id, server.name, server.status])
-                elif xfilter:
-                    if xfilter in server.name:
-                        result.append([server.id, server.name, server.status])
-                else:
-                    result.append([server.id, server.name, server.status])
-
-            if not result:
-                logger.info(f"No migratable instances found on node {host}")
+            for host in hosts:
+                found = False
+                for server in conn.compute.servers(all_projects=True, node=host):
+                    if project and server.project_id == project:
+                        matched = True
+                    elif domain:
+                        server_project = conn.identity.get_project(server.project_id)
+                        matched = server_project.domain_id == domain
+                    elif xfilter:
+                        matched = xfilter in server.name
+                    else:
+                        matched = True
+                    if not matched:
+                        continue
+                    found = True
+                    result.append(
+                        [
+                            server.id,
+                            server.name,
+                            server.status,
+                            host,
+                            _server_ram(server),
+                        ]
+                    )
+                if not found:
+                    logger.info(f"No migratable instances found on node {host}")
 
+            migrations = []
             for server in result:
                 if server[2] in ["ACTIVE", "PAUSED"]:
                     migration_type = "live"
@@ -524,51 +797,103 @@ class ComputeMigrate(Command):
                     )
 
                 if answer in ["yes", "y"]:
-                    logger.info(
-                        f"{migration_type.capitalize()} migrating server {server[0]}"
+                    migrations.append(server + [migration_type])
+
+            # sorted is stable, instances of the same size keep their order
+            migrations.sort(
+                key=lambda server: server[4],
+                reverse=parsed_args.order == "large-first",
+            )
+
+            def migrate(server_id):
+                server = servers[server_id]
+                logger.info(
+                    f"{server[5].capitalize()} migrating server {server[0]} ({server[1]})"
+                )
+                if server[5] == "live":
+                    conn.compute.live_migrate_server(
+                        server_id, host=target, block_migration="auto", force=force
                     )
-                    if migration_type == "live":
-                        conn.compute.live_migrate_server(
-                            server[0], host=target, block_migration="auto", force=force
+                else:
+                    conn.compute.migrate_server(server_id, host=target)
+
+            servers = {server[0]: server for server in migrations}
+            if no_wait:
+                for server_id in servers:
+                    migrate(server_id)
+                return
+
+            workflows = {}
+            for server in migrations:
+                if server[5] == "live":
+                    workflows[server[0]] = [
+                        Step(
+                            "live",
+                            migrate,
+                            _migrated(server[3]),
+                            _live_migration_failed(server[3]),
                         )
-                    elif migration_type == "cold":
-                        conn.compute.migrate_server(server[0], host=target)
-
-                    if not no_wait:
-                        while True:
-                            time.sleep(2)
-                            s = conn.compute.get_server(server[0])
-                            if (
-                                migration_type == "live"
-                                and s.status in ["MIGRATING"]
-                                or migration_type == "cold"
-                                and s.status in ["RESIZE"]
-                            ):
-                                logger.info(
-                                    f"{migration_type.capitalize()} migration of {server[0]} ({server[1]}) is still in progress"
-                                )
-                            elif migration_type == "cold" and s.status in [
-                                "VERIFY_RESIZE"
-                            ]:
-                                try:
-                                    conn.compute.confirm_server_resize(s)
-                                    logger.info(
-                                        f"{migration_type.capitalize()} migration of {server[0]} ({server[1]}) confirmed"
-                                    )
-                                except Exception as exc:
-                                    logger.error(
-                                        f"{migration_type.capitalize()} migration of {server[0]} ({server[1]}) could not be confirmed"
-                                    )
-                                    raise exc
-                                # NOTE: There seems to be no simple way to check whether the resize
-                                # has been confirmed. The state is still "VERIFY_RESIZE" afterwards.
-                                # Therefore we drop out without waiting for the "SHUTOFF" state
-                                break
-                            else:
-                                logger.info(
-                                    f"{migration_type.capitalize()} migration of {server[0]} ({server[1]}) completed with status {s.status}"
-                                )
-                                break
+                    ]
+                else:
+                    workflows[server[0]] = [
+                        Step(
+                            "cold",
+                            migrate,
+                            lambda s: s.status == "VERIFY_RESIZE" and not s.task_state,
+                            status_failed("ERROR", "DELETED"),
+                        ),
+                        Step(
+                            "confirm",
+                            conn.compute.confirm_server_resize,
+                            lambda s: s.status == "SHUTOFF" and not s.task_state,
+                            status_failed("ERROR", "DELETED"),
+                        ),
+                    ]
+
+            results = run_workflows(
+                workflows,
+                _server_poller(conn),
+                names={server[0]: server[1] for server in migrations},
+                concurrency=parsed_args.parallel,
+                timeout=parsed_args.timeout,
+                groups={server[0]: server[3] for server in migrations},
+                group_concurrency=parsed_args.parallel_per_host,
+                retries=parsed_args.retries,
+                retry_delay=parsed_args.retry_delay,
+            )
+
+            table = [
+                [
+                    r.id,
+                    r.name,
+                    servers[r.id][3],
+                    servers[r.id][4] or "-",
+                    servers[r.id][5],
+                    _seconds(sum(r.durations.values()) if r.ok else None),
+                    r.retries,
+                    r.error or "OK",
+                ]
+                for r in results
+            ]
+            if table:
+                print(
+                    tabulate(
+                        table,
+                        headers=[
+                            "ID",
+                            "Name",
+                            "Host",
+                            "RAM (MB)",
+                            "Type",
+                            "Duration",
+                            "Retries",
+                            "Result",
+                        ],
+                        tablefmt="psql",
+                    )
+                )
+            if any(not r.ok for r in results):
+                return 1
         finally:
             cleanup_cloud_environment(temp_files, original_cwd)
 
@@ -804,18 +1129,19 @@ class ComputeStart(Command):
             help="Always say yes",
             action="store_true",
         )
+        _add_bulk_arguments(parser, "started")
         parser.add_argument(
             "host",
-            nargs=1,
+            nargs="+",
             type=str,
-            help="Host on that all running instances are to be started",
+            help="Hosts on that all stopped instances are to be started",
         )
         return parser
 
     def take_action(self, parsed_args):
         cloud = parsed_args.cloud
         yes = parsed_args.yes
-        host = parsed_args.host[0]
+        hosts = parsed_args.host
 
         from osism.tasks.openstack import get_cloud_helpers
 
@@ -831,9 +1157,11 @@ class ComputeStart(Command):
             conn = get_openstack_connection(cloud, password)
 
             result = []
-            for server in conn.compute.servers(all_projects=True, node=host):
-                result.append([server.id, server.name, server.status])
+            for host in hosts:
+                for server in conn.compute.servers(all_projects=True, node=host):
+                    result.append([server.id, server.name, server.status])
 
+            servers = {}
             for server in result:
                 if server[2] not in ["SHUTOFF"]:
                     logger.info(
@@ -849,8 +1177,11 @@ class ComputeStart(Command):
                     )
 
                 if answer in ["yes", "y"]:
-                    logger.info(f"Starting server {server[0]}")
-                    conn.compute.start_server(server[0])
+                    servers[server[0]] = server[1]
+
+            if servers:
+                logger.info(f"Starting {len(servers)} server(s)")
+                return _run_server_action(conn, servers, "start", "ACTIVE", parsed_args)
         finally:
             cleanup_cloud_environment(temp_files, original_cwd)
 
@@ -870,18 +1201,19 @@ class ComputeStop(Command):
             help="Always say yes",
             action="store_true",
         )
+        _add_bulk_arguments(parser, "stopped")
         parser.add_argument(
             "host",
-            nargs=1,
+            nargs="+",
             type=str,
-            help="Host on that all running instances are to be stopped",
+            help="Hosts on that all running instances are to be stopped",
         )
         return parser
 
     def take_action(self, parsed_args):
         cloud = parsed_args.cloud
         yes = parsed_args.yes
-        host = parsed_args.host[0]
+        hosts = parsed_args.host
 
         from osism.tasks.openstack import get_cloud_helpers
 
@@ -897,9 +1229,11 @@ class ComputeStop(Command):
             conn = get_openstack_connection(cloud, password)
 
             result = []
-            for server in conn.compute.servers(all_projects=True, node=host):
-                result.append([server.id, server.name, server.status])
+            for host in hosts:
+                for server in conn.compute.servers(all_projects=True, node=host):
+                    result.append([server.id, server.name, server.status])
 
+            servers = {}
             for server in result:
                 if server[2] not in ["ACTIVE", "PAUSED"]:
                     logger.info(
@@ -913,7 +1247,10 @@ class ComputeStop(Command):
                     answer = prompt(f"Stop server {server[0]} ({server[1]}) [yes/no]: ")
 
                 if answer in ["yes", "y"]:
-                    logger.info(f"Stopping server {server[0]}")
-                    conn.compute.stop_server(server[0])
+                    servers[server[0]] = server[1]
+
+            if servers:
+                logger.info(f"Stopping {len(servers)} server(s)")
+                return _run_server_action(conn, servers, "stop", "SHUTOFF", parsed_args)
         finally:
             cleanup_cloud_environment(temp_files, original_cwd)
@@ -10,6 +10,7 @@ from loguru import logger
 from tabulate import tabulate
 
 from osism import utils
+from osism.utils.facts import load_facts
 from osism.utils.inventory import get_hosts_from_inventory, get_inventory_path
 
 
@@ -191,9 +192,8 @@ class Facts(Command):
         fact = parsed_args.fact
         cache = not parsed_args.no_cache
 
-        data = utils.redis.get(f"ansible_facts{host}")
-        if data:
-            data = json.loads(data)
+        data = load_facts(utils.redis, host, [fact] if fact else None)
+        if data is not None:
             table = []
 
             if fact:
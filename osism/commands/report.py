@@ -4,6 +4,7 @@ import configparser
 from datetime import datetime
 import json
 import subprocess
+import time
 
 from cliff.command import Command
 from loguru import logger
@@ -12,7 +13,39 @@ from tabulate import tabulate
 from osism import settings
 from osism.commands.console import resolve_host_with_fallback
 from osism.utils.inventory import get_hosts_from_inventory, get_inventory_path
-from osism.utils.ssh import ensure_known_hosts_file, KNOWN_HOSTS_PATH
+from osism.utils.ssh import (
+    ensure_known_hosts_file,
+    KNOWN_HOSTS_PATH,
+    run_on_hosts,
+    run_remote,
+)
+
+
+def _query_hosts(hosts, query, parallel, what, parse_errors=(ValueError,)):
+    """Run query(host) on all hosts in parallel.
+
+    query returns the table rows of a host, or None if the host failed.
+    Returns the rows per host as they arrived and the failed hosts in
+    inventory order.
+    """
+    results = {}
+    failed = set()
+    for host, future in run_on_hosts(hosts, query, parallel):
+        try:
+            rows = future.result()
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Timeout connecting to {host}.")
+            failed.add(host)
+            continue
+        except parse_errors:
+            logger.warning(f"Could not parse {what} from {host}.")
+            failed.add(host)
+            continue
+        if rows is None:
+            failed.add(host)
+        else:
+            results[host] = rows
+    return results, [host for host in hosts if host in failed]
 
 
 class Memory(Command):
@@ -24,6 +57,12 @@ class Memory(Command):
             type=str,
             help="Limit selected hosts to an additional pattern",
         )
+        parser.add_argument(
+            "--parallel",
+            type=int,
+            default=settings.REPORT_SSH_CONCURRENCY,
+            help="Number of hosts to query at the same time",
+        )
         return parser
 
     def take_action(self, parsed_args):
@@ -63,75 +102,37 @@ class Memory(Command):
             logger.error("No hosts found in inventory.")
             return
 
-        ssh_base = [
-            "/usr/bin/ssh",
-            "-i",
-            "/ansible/secrets/id_rsa.operator",
-            "-o",
-            "StrictHostKeyChecking=no",
-            "-o",
-            "LogLevel=ERROR",
-            "-o",
-            f"UserKnownHostsFile={KNOWN_HOSTS_PATH}",
-            "-o",
-            "ConnectTimeout=10",
-        ]
         dmidecode_command = (
             "sudo dmidecode -t memory | grep 'Size:' | grep -v 'No Module'"
             " | awk '{if($3==\"MB\") s+=$2/1024; else s+=$2} END {print s}'"
         )
         uuid_command = "sudo cat /sys/class/dmi/id/product_uuid"
 
-        table = []
-        total_memory_gb = 0
-        failed_hosts = []
-
-        for host in hosts:
+        def query(host):
             resolved_host = resolve_host_with_fallback(host)
-
-            try:
-                memory_result = subprocess.run(
-                    [
-                        *ssh_base,
-                        f"{settings.OPERATOR_USER}@{resolved_host}",
-                        dmidecode_command,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
+            memory_result = run_remote(resolved_host, dmidecode_command)
+            if memory_result.returncode != 0:
+                logger.warning(
+                    f"Failed to get memory info from {host}: {memory_result.stderr.strip()}"
                 )
+                return None
 
-                if memory_result.returncode != 0:
-                    logger.warning(
-                        f"Failed to get memory info from {host}: {memory_result.stderr.strip()}"
-                    )
-                    failed_hosts.append(host)
-                    continue
-
-                uuid_result = subprocess.run(
-                    [
-                        *ssh_base,
-                        f"{settings.OPERATOR_USER}@{resolved_host}",
-                        uuid_command,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
-
-                product_uuid = (
-                    uuid_result.stdout.strip() if uuid_result.returncode == 0 else "n/a"
-                )
-                memory_gb = int(memory_result.stdout.strip())
-                total_memory_gb += memory_gb
-                table.append([host, product_uuid, memory_gb])
-
-            except subprocess.TimeoutExpired:
-                logger.warning(f"Timeout connecting to {host}.")
-                failed_hosts.append(host)
-            except (ValueError, AttributeError):
-                logger.warning(f"Could not parse memory info from {host}.")
-                failed_hosts.append(host)
+            uuid_result = run_remote(resolved_host, uuid_command)
+            product_uuid = (
+                uuid_result.stdout.strip() if uuid_result.returncode == 0 else "n/a"
+            )
+            return [[host, product_uuid, int(memory_result.stdout.strip())]]
+
+        started = time.monotonic()
+        results, failed_hosts = _query_hosts(
+            hosts,
+            query,
+            parsed_args.parallel,
+            "memory info",
+            parse_errors=(ValueError, AttributeError),
+        )
+        table = [row for host in hosts for row in results.get(host, [])]
+        total_memory_gb = sum(row[2] for row in table)
 
         if table:
             print(
@@ -145,6 +146,7 @@ class Memory(Command):
             print(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             print(f"Hosts: {len(table)}")
             print(f"Memory: {total_memory_gb} GB")
+            print(f"Duration: {time.monotonic() - started:.1f}s")
 
         if failed_hosts:
             print()
@@ -162,6 +164,12 @@ class Lldp(Command):
             type=str,
             help="Limit selected hosts to an additional pattern",
         )
+        parser.add_argument(
+            "--parallel",
+            type=int,
+            default=settings.REPORT_SSH_CONCURRENCY,
+            help="Number of hosts to query at the same time",
+        )
         return parser
 
     def take_action(self, parsed_args):
@@ -201,82 +209,54 @@ class Lldp(Command):
             logger.error("No hosts found in inventory.")
             return
 
-        ssh_base = [
-            "/usr/bin/ssh",
-            "-i",
-            "/ansible/secrets/id_rsa.operator",
-            "-o",
-            "StrictHostKeyChecking=no",
-            "-o",
-            "LogLevel=ERROR",
-            "-o",
-            f"UserKnownHostsFile={KNOWN_HOSTS_PATH}",
-            "-o",
-            "ConnectTimeout=10",
-        ]
         lldp_command = "lldpctl -f json"
 
-        table = []
-        failed_hosts = []
-
-        for host in hosts:
+        def query(host):
             resolved_host = resolve_host_with_fallback(host)
-
-            try:
-                lldp_result = subprocess.run(
-                    [
-                        *ssh_base,
-                        f"{settings.OPERATOR_USER}@{resolved_host}",
-                        lldp_command,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
+            lldp_result = run_remote(resolved_host, lldp_command)
+            if lldp_result.returncode != 0:
+                logger.warning(
+                    f"Failed to get LLDP info from {host}: {lldp_result.stderr.strip()}"
                 )
-
-                if lldp_result.returncode != 0:
-                    logger.warning(
-                        f"Failed to get LLDP info from {host}: {lldp_result.stderr.strip()}"
+                return None
+
+            lldp_data = json.loads(lldp_result.stdout)
+            interfaces = lldp_data.get("lldp", {}).get("interface", {})
+
+            # lldpctl returns a list of dicts for multiple interfaces,
+            # but a single dict for one interface. Normalize to list.
+            if isinstance(interfaces, dict):
+                interfaces = [{k: v} for k, v in interfaces.items()]
+
+            rows = []
+            for iface_entry in interfaces:
+                for local_iface, iface_data in iface_entry.items():
+                    chassis = iface_data.get("chassis", {})
+                    remote_switch = next(iter(chassis), "n/a")
+
+                    port = iface_data.get("port", {})
+                    remote_port = port.get("id", {}).get("value", "n/a")
+                    port_descr = port.get("descr", "")
+
+                    age = iface_data.get("age", "n/a")
+
+                    rows.append(
+                        [
+                            host,
+                            local_iface,
+                            remote_switch,
+                            remote_port,
+                            port_descr,
+                            age,
+                        ]
                     )
-                    failed_hosts.append(host)
-                    continue
+            return rows
 
-                lldp_data = json.loads(lldp_result.stdout)
-                interfaces = lldp_data.get("lldp", {}).get("interface", {})
-
-                # lldpctl returns a list of dicts for multiple interfaces,
-                # but a single dict for one interface. Normalize to list.
-                if isinstance(interfaces, dict):
-                    interfaces = [{k: v} for k, v in interfaces.items()]
-
-                for iface_entry in interfaces:
-                    for local_iface, iface_data in iface_entry.items():
-                        chassis = iface_data.get("chassis", {})
-                        remote_switch = next(iter(chassis), "n/a")
-
-                        port = iface_data.get("port", {})
-                        remote_port = port.get("id", {}).get("value", "n/a")
-                        port_descr = port.get("descr", "")
-
-                        age = iface_data.get("age", "n/a")
-
-                        table.append(
-                            [
-                                host,
-                                local_iface,
-                                remote_switch,
-                                remote_port,
-                                port_descr,
-                                age,
-                            ]
-                        )
-
-            except subprocess.TimeoutExpired:
-                logger.warning(f"Timeout connecting to {host}.")
-                failed_hosts.append(host)
-            except (ValueError, json.JSONDecodeError):
-                logger.warning(f"Could not parse LLDP info from {host}.")
-                failed_hosts.append(host)
+        started = time.monotonic()
+        results, failed_hosts = _query_hosts(
+            hosts, query, parsed_args.parallel, "LLDP info"
+        )
+        table = [row for host in hosts for row in results.get(host, [])]
 
         if table:
             print(
@@ -297,6 +277,7 @@ class Lldp(Command):
             print(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             print(f"Hosts: {len(set(row[0] for row in table))}")
             print(f"Neighbors: {len(table)}")
+            print(f"Duration: {time.monotonic() - started:.1f}s")
 
         if failed_hosts:
             print()
@@ -314,6 +295,12 @@ class Bgp(Command):
             type=str,
             help="Limit selected hosts to an additional pattern",
         )
+        parser.add_argument(
+            "--parallel",
+            type=int,
+            default=settings.REPORT_SSH_CONCURRENCY,
+            help="Number of hosts to query at the same time",
+        )
         parser.add_argument(
             "--afi",
             type=str,
@@ -370,83 +357,55 @@ class Bgp(Command):
             logger.error("No hosts found in inventory.")
             return
 
-        ssh_base = [
-            "/usr/bin/ssh",
-            "-i",
-            "/ansible/secrets/id_rsa.operator",
-            "-o",
-            "StrictHostKeyChecking=no",
-            "-o",
-            "LogLevel=ERROR",
-            "-o",
-            f"UserKnownHostsFile={KNOWN_HOSTS_PATH}",
-            "-o",
-            "ConnectTimeout=10",
-        ]
         bgp_command = 'sudo vtysh -c "show bgp summary json"'
 
-        table = []
-        failed_hosts = []
+        afi_filter = None
+        if parsed_args.afi:
+            afi_filter = {a.lower() for a in parsed_args.afi}
 
-        for host in hosts:
+        def query(host):
             resolved_host = resolve_host_with_fallback(host)
-
-            try:
-                bgp_result = subprocess.run(
-                    [
-                        *ssh_base,
-                        f"{settings.OPERATOR_USER}@{resolved_host}",
-                        bgp_command,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
+            bgp_result = run_remote(resolved_host, bgp_command)
+            if bgp_result.returncode != 0:
+                logger.warning(
+                    f"Failed to get BGP info from {host}: {bgp_result.stderr.strip()}"
                 )
+                return None
 
-                if bgp_result.returncode != 0:
-                    logger.warning(
-                        f"Failed to get BGP info from {host}: {bgp_result.stderr.strip()}"
-                    )
-                    failed_hosts.append(host)
+            bgp_data = json.loads(bgp_result.stdout)
+
+            rows = []
+            for afi, afi_data in bgp_data.items():
+                if afi_filter is not None and afi.lower() not in afi_filter:
                     continue
+                peers = afi_data.get("peers", {})
+                for peer_name, peer_data in peers.items():
+                    rows.append(
+                        [
+                            host,
+                            afi,
+                            peer_name,
+                            peer_data.get("hostname", "n/a"),
+                            peer_data.get("remoteAs", "n/a"),
+                            peer_data.get("localAs", "n/a"),
+                            peer_data.get("state", "n/a"),
+                            peer_data.get("peerState", "n/a"),
+                            peer_data.get("peerUptime", "n/a"),
+                            peer_data.get("msgRcvd", 0),
+                            peer_data.get("msgSent", 0),
+                            peer_data.get("pfxRcd", 0),
+                            peer_data.get("pfxSnt", 0),
+                            peer_data.get("connectionsEstablished", 0),
+                            peer_data.get("connectionsDropped", 0),
+                        ]
+                    )
+            return rows
 
-                bgp_data = json.loads(bgp_result.stdout)
-
-                afi_filter = None
-                if parsed_args.afi:
-                    afi_filter = {a.lower() for a in parsed_args.afi}
-
-                for afi, afi_data in bgp_data.items():
-                    if afi_filter is not None and afi.lower() not in afi_filter:
-                        continue
-                    peers = afi_data.get("peers", {})
-                    for peer_name, peer_data in peers.items():
-                        table.append(
-                            [
-                                host,
-                                afi,
-                                peer_name,
-                                peer_data.get("hostname", "n/a"),
-                                peer_data.get("remoteAs", "n/a"),
-                                peer_data.get("localAs", "n/a"),
-                                peer_data.get("state", "n/a"),
-                                peer_data.get("peerState", "n/a"),
-                                peer_data.get("peerUptime", "n/a"),
-                                peer_data.get("msgRcvd", 0),
-                                peer_data.get("msgSent", 0),
-                                peer_data.get("pfxRcd", 0),
-                                peer_data.get("pfxSnt", 0),
-                                peer_data.get("connectionsEstablished", 0),
-                                peer_data.get("connectionsDropped", 0),
-                            ]
-                        )
-
-            except subprocess.TimeoutExpired:
-                logger.warning(f"Timeout connecting to {host}.")
-                failed_hosts.append(host)
-            except (ValueError, json.JSONDecodeError):
-                logger.warning(f"Could not parse BGP info from {host}.")
-                failed_hosts.append(host)
+        started = time.monotonic()
+        results, failed_hosts = _query_hosts(
+            hosts, query, parsed_args.parallel, "BGP info"
+        )
+        table = [row for host in hosts for row in results.get(host, [])]
 
         if table:
             print(
@@ -478,6 +437,7 @@ class Bgp(Command):
             print(f"Sessions: {len(table)}")
             established = sum(1 for row in table if row[6] == "Established")
             print(f"Established: {established}/{len(table)}")
+            print(f"Duration: {time.monotonic() - started:.1f}s")
 
         if failed_hosts:
             print()
@@ -501,6 +461,12 @@ class Status(Command):
             type=str,
             help="Limit selected hosts to an additional pattern",
         )
+        parser.add_argument(
+            "--parallel",
+            type=int,
+            default=settings.REPORT_SSH_CONCURRENCY,
+            help="Number of hosts to query at the same time",
+        )
         parser.add_argument(
             "--status",
             type=str,
@@ -547,64 +513,38 @@ class Status(Command):
             logger.error("No hosts found in inventory.")
             return
 
-        ssh_base = [
-            "/usr/bin/ssh",
-            "-i",
-            "/ansible/secrets/id_rsa.operator",
-            "-o",
-            "StrictHostKeyChecking=no",
-            "-o",
-            "LogLevel=ERROR",
-            "-o",
-            f"UserKnownHostsFile={KNOWN_HOSTS_PATH}",
-            "-o",
-            "ConnectTimeout=10",
-        ]
         fact_command = "cat /etc/ansible/facts.d/osism.fact"
 
         section = parsed_args.type
 
         filter_status = parsed_args.status
 
-        table = []
-        failed_hosts = []
-
-        for host in hosts:
+        def query(host):
             resolved_host = resolve_host_with_fallback(host)
-
-            try:
-                fact_result = subprocess.run(
-                    [
-                        *ssh_base,
-                        f"{settings.OPERATOR_USER}@{resolved_host}",
-                        fact_command,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
-
-                if fact_result.returncode != 0:
-                    status = "False"
-                    timestamp = "n/a"
-                else:
-                    config = configparser.ConfigParser()
-                    config.read_string(fact_result.stdout)
-
-                    status = config.get(section, "status", fallback="False")
-                    timestamp = config.get(section, "timestamp", fallback="n/a")
-
-                if filter_status and status != filter_status:
-                    continue
-
-                table.append([host, status, timestamp])
-
-            except subprocess.TimeoutExpired:
-                logger.warning(f"Timeout connecting to {host}.")
-                failed_hosts.append(host)
-            except (ValueError, configparser.Error):
-                logger.warning(f"Could not parse {section} info from {host}.")
-                failed_hosts.append(host)
+            fact_result = run_remote(resolved_host, fact_command)
+            if fact_result.returncode != 0:
+                status = "False"
+                timestamp = "n/a"
+            else:
+                config = configparser.ConfigParser()
+                config.read_string(fact_result.stdout)
+
+                status = config.get(section, "status", fallback="False")
+                timestamp = config.get(section, "timestamp", fallback="n/a")
+
+            if filter_status and status != filter_status:
+                return []
+            return [[host, status, timestamp]]
+
+        started = time.monotonic()
+        results, failed_hosts = _query_hosts(
+            hosts,
+            query,
+            parsed_args.parallel,
+            f"{section} info",
+            parse_errors=(ValueError, configparser.Error),
+        )
+        table = [row for host in hosts for row in results.get(host, [])]
 
         if table:
             print(
@@ -617,6 +557,7 @@ class Status(Command):
             print()
             print(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             print(f"Hosts: {len(table)}")
+            print(f"Duration: {time.monotonic() - started:.1f}s")
 
         if failed_hosts:
             print()
@@ -8,6 +8,7 @@ from loguru import logger
 from redis.exceptions import RedisError
 
 from osism import utils
+from osism.utils.facts import clear_index, remove_from_index
 from osism.utils.inventory import get_hosts_from_inventory, get_inventory_path
 
 
@@ -51,6 +52,7 @@ class Facts(Command):
                     removed += len(batch)
                 if cursor == 0:
                     break
+            clear_index(utils.redis)
         except RedisError as exc:
             logger.error(f"Failed to reset Ansible fact cache: {exc}")
             return 1
@@ -99,6 +101,7 @@ class Facts(Command):
         keys = [f"ansible_facts{host}" for host in hosts]
         try:
             deleted = utils.redis.delete(*keys)
+            remove_from_index(utils.redis, hosts)
         except RedisError as exc:
             logger.error(f"Failed to reset Ansible fact cache: {exc}")
             return 1
@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from cliff.command import Command
+from loguru import logger
+from redis.exceptions import RedisError
+from tabulate import tabulate
+
+from osism import settings, utils
+from osism.utils.facts_search import (
+    count_fact_values,
+    search_facts,
+    search_index_outdated,
+    update_search_index,
+)
+
+
+class Facts(Command):
+    """Search the cached Ansible facts of all hosts by value.
+
+    Lists the hosts with the given value under an indexed fact path
+    (FACTS_SEARCH_PATHS). Without a value the values of the fact path are
+    listed with the number of hosts having them.
+    """
+
+    def get_parser(self, prog_name):
+        parser = super(Facts, self).get_parser(prog_name)
+        parser.add_argument(
+            "path",
+            nargs=1,
+            type=str,
+            help="Indexed fact path, e.g. ansible_kernel or ansible_*.module",
+        )
+        parser.add_argument(
+            "value",
+            nargs="?",
+            type=str,
+            help="Value to search for",
+        )
+        return parser
+
+    def take_action(self, parsed_args):
+        path = parsed_args.path[0]
+        value = parsed_args.value
+
+        try:
+            if search_index_outdated(utils.redis):
+                update_search_index(utils.redis)
+            if value is None:
+                values = count_fact_values(utils.redis, path)
+            else:
+                hosts = search_facts(utils.redis, path, value)
+        except ValueError as exc:
+            logger.error(
+                f"{exc}. Indexed fact paths: {', '.join(settings.FACTS_SEARCH_PATHS)}"
+            )
+            return 1
+        except RedisError as exc:
+            logger.error(f"Failed to search the Ansible fact cache: {exc}")
+            return 1
+
+        if value is None:
+            if not values:
+                logger.info(f"No values found for {path}")
+                return 0
+            print(
+                tabulate(
+                    sorted(values.items()),
+                    headers=["Value", "Hosts"],
+                    tablefmt="psql",
+                )
+            )
+        else:
+            if not hosts:
+                logger.info(f"No hosts found with {path} {value}")
+                return 0
+            print(
+                tabulate([[host] for host in hosts], headers=["Host"], tablefmt="psql")
+            )
+        return 0
@@ -1185,6 +1185,10 @@ class Validate(SonicCommandBase):
     models in files/sonic/yang_models/ via tools/sonic_yang_to_pydantic.py.
     Configurations can be sourced from a local file, NetBox local context,
     the on-disk export directory, or generated on-the-fly from NetBox.
+
+    With --fabric all SONiC devices of NETBOX_FILTER_CONDUCTOR_SONIC are
+    validated in parallel and checked against each other (BGP sessions,
+    MTU of cabled ports).
     """
 
     def get_parser(self, prog_name):
@@ -1236,6 +1240,23 @@ class Validate(SonicCommandBase):
             default="text",
             help="Output format (default: text).",
         )
+        parser.add_argument(
+            "--fabric",
+            dest="fabric",
+            action="store_true",
+            help=(
+                "Validate all SONiC devices of the fabric and check BGP sessions "
+                "and link MTUs across devices. Requires --from-netbox or "
+                "--from-export-dir; hostnames restrict the fabric."
+            ),
+        )
+        parser.add_argument(
+            "--parallel",
+            dest="parallel",
+            type=int,
+            default=4,
+            help="Configurations validated in parallel with --fabric (default: %(default)s).",
+        )
         return parser
 
     def take_action(self, parsed_args):
@@ -1245,6 +1266,9 @@ class Validate(SonicCommandBase):
             logger.error(f"Validator module unavailable: {exc}")
             return 2
 
+        if parsed_args.fabric:
+            return self._validate_fabric(parsed_args)
+
         try:
             sources = self._collect_sources(parsed_args)
         except ValueError as exc:
@@ -1285,6 +1309,66 @@ class Validate(SonicCommandBase):
 
         return worst_rc
 
+    def _validate_fabric(self, parsed_args):
+        from osism import settings
+        from osism.tasks.conductor.sonic.fabric import (
+            get_fabric_devices,
+            get_fabric_links,
+            validate_fabric,
+        )
+
+        if not (parsed_args.from_netbox or parsed_args.from_export_dir is not None):
+            logger.error("--fabric requires --from-netbox or --from-export-dir.")
+            return 2
+
+        export_dir = None
+        if parsed_args.from_export_dir is not None:
+            export_dir = parsed_args.from_export_dir or settings.SONIC_EXPORT_DIR
+            if not os.path.isdir(export_dir):
+                logger.error(f"Export directory not found: {export_dir}")
+                return 2
+
+        devices = get_fabric_devices(parsed_args.hostname)
+        if not devices:
+            logger.error("No SONiC devices found to validate.")
+            return 2
+
+        configs = {}
+        for device in devices:
+            if export_dir is not None:
+                configs[device.name] = self._fabric_config_from_export_dir(
+                    device, export_dir
+                )
+            else:
+                configs[device.name] = self._sonic_config_of(device, device.name)
+
+        report = validate_fabric(
+            configs, get_fabric_links(devices), max_workers=parsed_args.parallel
+        )
+
+        if parsed_args.output_format == "json":
+            print(json.dumps(report.to_dict(), indent=2))
+        else:
+            self._print_text_report(list(report.results.items()))
+            for issue in report.issues:
+                print(f"[FAIL]  fabric ({issue.check}): {issue.message}")
+            print(f"Fabric: {len(report.issues)} cross-device error(s)")
+
+        if any(result is None for result in report.results.values()):
+            return 2
+        return 0 if report.valid else 1
+
+    def _fabric_config_from_export_dir(self, device, export_dir):
+        from osism.tasks.conductor.sonic.exporter import get_export_filepath
+
+        path = os.path.join(export_dir, os.path.basename(get_export_filepath(device)))
+        try:
+            with open(path, "r") as fh:
+                return json.load(fh)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.error(f"Could not read {path}: {exc}")
+            return None
+
     def _collect_sources(self, parsed_args):
         """Return a list of (label, config_dict_or_None) tuples to validate."""
         if parsed_args.file:
@@ -1319,6 +1403,9 @@ class Validate(SonicCommandBase):
         device = self._get_device_from_netbox(hostname)
         if not device:
             return None
+        return self._sonic_config_of(device, hostname)
+
+    def _sonic_config_of(self, device, hostname):
         ctx = self._get_config_context(device, hostname)
         if not ctx:
             return None
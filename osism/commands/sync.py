@@ -85,6 +85,12 @@ class Sonic(Command):
             help="Do not show configuration diff",
             action="store_false",
         )
+        parser.add_argument(
+            "--force",
+            default=False,
+            help="Regenerate the configuration of devices whose NetBox inputs are unchanged",
+            action="store_true",
+        )
         return parser
 
     def take_action(self, parsed_args):
@@ -94,10 +100,11 @@ class Sonic(Command):
         wait = not parsed_args.no_wait
         device_name = parsed_args.device
         show_diff = parsed_args.diff
+        force = parsed_args.force
 
         from osism.tasks import conductor, handle_task
 
-        task = conductor.sync_sonic.delay(device_name, show_diff)
+        task = conductor.sync_sonic.delay(device_name, show_diff, force)
 
         if device_name:
             logger.info(
@@ -6,6 +6,63 @@ from cliff.command import Command
 from loguru import logger
 from osism import utils
 
+# Seconds after which all tasks are checked again while waiting for pushed
+# state changes, in case a change got lost
+RECHECK_INTERVAL = 30
+
+
+class StateChanges:
+    """Task state changes pushed by the Redis result backend.
+
+    The Redis result backend of Celery publishes every state it stores on
+    a channel named like the key of the result. Subscribing to the channels
+    of the tasks lets wait block until one of them changes, instead of
+    reading the states of all tasks every delay seconds.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.pubsub = backend.client.pubsub(ignore_subscribe_messages=True)
+        self.channels = {}
+
+    @classmethod
+    def create(cls, app):
+        """Return the state changes of app, None without a Redis backend."""
+        from celery.backends.redis import RedisBackend
+
+        if not isinstance(app.backend, RedisBackend):
+            return None
+        return cls(app.backend)
+
+    def subscribe(self, task_ids):
+        channels = {
+            self.backend.get_key_for_task(task_id): task_id for task_id in task_ids
+        }
+        channels = {
+            channel: task_id
+            for channel, task_id in channels.items()
+            if channel not in self.channels
+        }
+        if channels:
+            self.pubsub.subscribe(*channels)
+            self.channels.update(channels)
+
+    def wait(self, timeout):
+        """Return the IDs of the tasks that changed, empty after timeout seconds."""
+        changed = set()
+        deadline = time.monotonic() + timeout
+        while not changed and time.monotonic() < deadline:
+            message = self.pubsub.get_message(timeout=deadline - time.monotonic())
+            # Take the changes that arrived together at once
+            while message:
+                if message["channel"] in self.channels:
+                    changed.add(self.channels[message["channel"]])
+                message = self.pubsub.get_message(timeout=0)
+        return changed
+
+    def close(self):
+        self.pubsub.close()
+
 
 class Run(Command):
     def get_parser(self, prog_name):
@@ -42,6 +99,13 @@ class Run(Command):
             help="Show output from a finished task",
             action="store_true",
         )
+        parser.add_argument(
+            "--poll",
+            default=False,
+            help="Check the tasks every delay second(s) instead of waiting for "
+            "state changes pushed by Redis",
+            action="store_true",
+        )
         parser.add_argument(
             "task_id", nargs="*", type=str, help="ID of tasks to wait for"
         )
@@ -61,14 +125,8 @@ class Run(Command):
 
     def take_action(self, parsed_args):
         from celery import Celery
-        from celery.result import AsyncResult
         from osism.tasks import Config
 
-        delay = parsed_args.delay
-        format = parsed_args.format
-        live = parsed_args.live
-        output = parsed_args.output
-        refresh = parsed_args.refresh
         task_ids = sorted(parsed_args.task_id)
 
         do_refresh = False
@@ -82,14 +140,67 @@ class Run(Command):
             task_ids = self.get_all_task_ids(i)
             do_refresh = True
 
+        self.changes = None if parsed_args.poll else StateChanges.create(app)
+        try:
+            # Subscribe before the first check, so no change gets lost
+            self._subscribe(task_ids)
+            return self._wait(app, i, task_ids, do_refresh, parsed_args)
+        finally:
+            if self.changes:
+                self.changes.close()
+
+    def _subscribe(self, task_ids):
+        if not self.changes:
+            return
+        try:
+            self.changes.subscribe(task_ids)
+        except Exception as exc:
+            logger.warning(f"Subscribing to state changes failed, polling: {exc}")
+            self.changes.close()
+            self.changes = None
+
+    def _next_check(self, task_ids, delay):
+        """Wait for the next check, returns the IDs of the tasks to check."""
+        if self.changes:
+            logger.info(f"Wait for a state change of {len(task_ids)} task(s)")
+            try:
+                while True:
+                    changed = self.changes.wait(max(delay, RECHECK_INTERVAL))
+                    if not changed:
+                        return task_ids
+                    # Changes of tasks that were checked since are skipped
+                    checked = [task_id for task_id in task_ids if task_id in changed]
+                    if checked:
+                        return checked
+            except Exception as exc:
+                logger.warning(f"Waiting for state changes failed, polling: {exc}")
+                self.changes.close()
+                self.changes = None
+
+        logger.info(f"Wait {delay} second(s) until the next check")
+        time.sleep(delay)
+        return task_ids
+
+    def _wait(self, app, i, task_ids, do_refresh, parsed_args):
+        from celery.result import AsyncResult
+
+        delay = parsed_args.delay
+        format = parsed_args.format
+        live = parsed_args.live
+        output = parsed_args.output
+        refresh = parsed_args.refresh
+
         tmp_task_ids = []
         rc = 0
         while task_ids or do_refresh:
             if task_ids:
                 task_id = task_ids.pop()
                 result = AsyncResult(f"{task_id}", app=app)
+                # Every access of the state of an unfinished task reads it
+                # from the result backend again
+                state = result.state
 
-                if result.state == "PENDING":
+                if state == "PENDING":
                     q = i.query_task(f"{task_id}")
                     if not len([x for x in q.values() if len(x)]):
                         if format == "log":
@@ -104,7 +215,7 @@ class Run(Command):
 
                         tmp_task_ids.insert(0, task_id)
 
-                elif result.state == "SUCCESS":
+                elif state == "SUCCESS":
                     if format == "log":
                         logger.info(f"Task {task_id} is in state SUCCESS")
                     elif format == "script":
@@ -113,7 +224,7 @@ class Run(Command):
                     if output:
                         print(result.get())
 
-                elif result.state == "STARTED":
+                elif state == "STARTED":
                     if format == "log":
                         logger.info(f"Task {task_id} is in state STARTED")
                     elif format == "script":
@@ -134,16 +245,22 @@ class Run(Command):
                         tmp_task_ids.insert(0, task_id)
 
                 if not task_ids and tmp_task_ids:
-                    logger.info(f"Wait {delay} second(s) until the next check")
-                    time.sleep(delay)
+                    checked = self._next_check(tmp_task_ids, delay)
 
                     if do_refresh:
                         task_ids = sorted(
                             list(set(self.get_all_task_ids(i) + tmp_task_ids))
                         )
                         tmp_task_ids = []
+                        self._subscribe(task_ids)
                     else:
-                        task_ids = tmp_task_ids
+                        # Unchanged tasks keep waiting without a check
+                        task_ids = checked
+                        tmp_task_ids = [
+                            task_id
+                            for task_id in tmp_task_ids
+                            if task_id not in checked
+                        ]
             else:
                 if refresh > 0:
                     refresh = refresh - 1
@@ -153,6 +270,7 @@ class Run(Command):
                     time.sleep(delay)
                     task_ids = self.get_all_task_ids(i)
                     tmp_task_ids = []
+                    self._subscribe(task_ids)
                 else:
                     do_refresh = False
 
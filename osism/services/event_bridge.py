@@ -4,14 +4,27 @@
 Event bridge for sharing events between RabbitMQ listener and WebSocket manager.
 This module provides a Redis-based way to forward events from the listener service
 to the WebSocket manager across different containers.
+
+Two transports are available (``EVENTS_TRANSPORT``). ``pubsub`` publishes every
+event to a Redis pub/sub channel and only reaches API processes subscribed at
+that moment. ``stream`` appends the events in pipelined batches to a capped
+Redis stream of the same name. Every API process stores the ID of the last
+event it has handled, so it resumes where it left off after a restart, and
+recent events can be replayed to newly connected websocket clients or to
+Server-Sent Events clients resuming after the last event they have seen.
 """
 
+import datetime
 import threading
 import queue
 import logging
 import json
 import os
-from typing import Dict, Any, Optional
+import re
+import socket
+from typing import Dict, Any, List, Optional
+
+from osism import settings
 
 try:
     import redis
@@ -22,20 +35,56 @@ except ImportError:
 
 logger = logging.getLogger("osism.event_bridge")
 
-# Default pub/sub channel carrying events between containers.
+# Default pub/sub channel (or stream key) carrying events between containers.
 EVENTS_CHANNEL = "osism:events"
 
+TRANSPORTS = ("pubsub", "stream")
+
+# Maximum number of events written with one pipeline / read with one XREAD
+STREAM_BATCH_SIZE = 100
+
+# Redis stream entry ID, "<milliseconds>-<sequence>"
+STREAM_ID_PATTERN = re.compile(r"^\d+-\d+$")
+
+# Stored stream offsets expire after a day without reads, the default consumer
+# names of stopped API processes are not used again
+STREAM_OFFSET_TTL = 86400
+
 
 class EventBridge:
     """Redis-based bridge for forwarding events between RabbitMQ listener and WebSocket manager across containers."""
 
-    def __init__(self, channel: str = EVENTS_CHANNEL):
-        """Publish to and subscribe on ``channel``; both ends must agree on it."""
+    def __init__(
+        self,
+        channel: str = EVENTS_CHANNEL,
+        transport: Optional[str] = None,
+        consumer: Optional[str] = None,
+        stream_maxlen: Optional[int] = None,
+    ):
+        """Publish to and subscribe on ``channel``; both ends must agree on it.
+
+        ``transport``, ``consumer`` and ``stream_maxlen`` default to the
+        EVENTS_TRANSPORT, EVENTS_STREAM_CONSUMER and EVENTS_STREAM_MAXLEN
+        settings. ``consumer`` names the stored stream offset and has to be
+        unique per API process, without one "<hostname>-<pid>" of the process
+        reading the stream is used.
+        """
         self._channel = channel
+        self._transport = transport or settings.EVENTS_TRANSPORT
+        if self._transport not in TRANSPORTS:
+            logger.warning(
+                f"Unknown event bridge transport {self._transport}, using pubsub"
+            )
+            self._transport = "pubsub"
+        self._consumer = consumer or settings.EVENTS_STREAM_CONSUMER
+        self._stream_maxlen = stream_maxlen or settings.EVENTS_STREAM_MAXLEN
         self._event_queue: queue.Queue[Dict[str, Any]] = queue.Queue()
+        self._publish_queue: queue.Queue[Dict[str, Any]] = queue.Queue()
         self._websocket_manager: Optional[Any] = None
         self._processor_thread: Optional[threading.Thread] = None
         self._subscriber_thread: Optional[threading.Thread] = None
+        self._publisher_thread: Optional[threading.Thread] = None
+        self._publisher_lock = threading.Lock()
         self._shutdown_event = threading.Event()
         self._redis_client: Optional["redis.Redis"] = None
         self._redis_subscriber: Optional[Any] = None
@@ -71,7 +120,8 @@ class EventBridge:
             logger.info(f"Connected to Redis at {redis_host}:{redis_port}")
 
             # Create subscriber for WebSocket manager (API container)
-            self._redis_subscriber = self._redis_client.pubsub()
+            if self._transport == "pubsub":
+                self._redis_subscriber = self._redis_client.pubsub()
 
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
@@ -85,7 +135,10 @@ class EventBridge:
 
         # Start Redis subscriber thread if Redis is available
         if self._redis_client and not self._subscriber_thread:
-            self._start_redis_subscriber()
+            if self._transport == "stream":
+                self._start_redis_stream_reader()
+            else:
+                self._start_redis_subscriber()
 
         # Start local processor thread if not already running
         if not self._processor_thread or not self._processor_thread.is_alive():
@@ -96,7 +149,11 @@ class EventBridge:
         try:
             event_data = {"event_type": event_type, "payload": payload}
 
-            if self._redis_client:
+            if self._redis_client and self._transport == "stream":
+                # Written to the stream in batches by the publisher thread
+                self._publish_queue.put_nowait(event_data)
+                self._start_stream_publisher()
+            elif self._redis_client:
                 # Publish to Redis for cross-container communication
                 try:
                     message = json.dumps(event_data)
@@ -140,6 +197,222 @@ class EventBridge:
         except Exception as e:
             logger.error(f"Error adding event to bridge: {e}")
 
+    def get_recent_events(self, count: int) -> List[Dict[str, Any]]:
+        """Return up to ``count`` of the most recent events, oldest first.
+
+        Only the stream transport keeps events, with pubsub the result is
+        always empty. Every event carries the ``id`` and ``timestamp`` of its
+        stream entry.
+        """
+        if self._transport != "stream" or not self._redis_client or count <= 0:
+            return []
+
+        return self._read_newest_entries(count)
+
+    def get_events_after(self, event_id: str, count: int) -> List[Dict[str, Any]]:
+        """Return the events following the stream entry ``event_id``, oldest first.
+
+        If more than ``count`` events follow, the newest ``count`` are
+        returned, so they are followed seamlessly by live events. IDs that
+        are no stream entry IDs, like the UUIDs of events delivered with
+        pubsub, give an empty result.
+        """
+        if self._transport != "stream" or not self._redis_client or count <= 0:
+            return []
+        if not STREAM_ID_PATTERN.match(event_id or ""):
+            return []
+        return self._read_newest_entries(count, after=event_id)
+
+    def _read_newest_entries(
+        self, count: int, after: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        try:
+            entries = self._redis_client.xrevrange(
+                self._channel, min=f"({after}" if after else "-", count=count
+            )
+        except Exception as e:
+            logger.error(f"Failed to read recent events from Redis: {e}")
+            return []
+
+        events = []
+        for entry_id, fields in reversed(entries):
+            event_data = self._decode_stream_entry(entry_id, fields)
+            if event_data is not None:
+                events.append(event_data)
+        return events
+
+    @staticmethod
+    def _decode_stream_entry(
+        entry_id: str, fields: Dict[str, str]
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            event_data = json.loads(fields["data"])
+        except (KeyError, TypeError, json.JSONDecodeError) as e:
+            logger.error(f"Failed to decode Redis stream entry {entry_id}: {e}")
+            return None
+        # Stream entry IDs start with the milliseconds since the epoch
+        milliseconds = int(entry_id.split("-")[0])
+        event_data["id"] = entry_id
+        event_data["timestamp"] = (
+            datetime.datetime.fromtimestamp(
+                milliseconds / 1000, tz=datetime.timezone.utc
+            )
+            .isoformat()
+            .replace("+00:00", "Z")
+        )
+        return event_data
+
+    def _start_stream_publisher(self):
+        """Start the stream publisher thread unless it is already running."""
+        with self._publisher_lock:
+            if self._publisher_thread and self._publisher_thread.is_alive():
+                return
+            self._publisher_thread = threading.Thread(
+                target=self._stream_publisher_loop,
+                name="RedisEventStreamPublisher",
+                daemon=True,
+            )
+            self._publisher_thread.start()
+
+    def _stream_publisher_loop(self):
+        """Write queued events to the Redis stream, one pipeline per batch."""
+        while not (self._shutdown_event.is_set() and self._publish_queue.empty()):
+            try:
+                batch = [self._publish_queue.get(timeout=1.0)]
+            except queue.Empty:
+                continue
+            while len(batch) < STREAM_BATCH_SIZE:
+                try:
+                    batch.append(self._publish_queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._publish_stream_batch(batch)
+
+    def _publish_stream_batch(self, batch: List[Dict[str, Any]]):
+        """Append events to the capped stream, reconnecting once on failure."""
+        for attempt in range(2):
+            try:
+                if not self._redis_client:
+                    raise Exception("Redis not available")
+                pipe = self._redis_client.pipeline(transaction=False)
+                for event_data in batch:
+                    pipe.xadd(
+                        self._channel,
+                        {"data": json.dumps(event_data)},
+                        maxlen=self._stream_maxlen,
+                        approximate=True,
+                    )
+                pipe.execute()
+                logger.info(
+                    f"Published {len(batch)} event(s) to Redis stream {self._channel}"
+                )
+                return
+            except Exception as e:
+                logger.error(f"Failed to publish events to Redis stream: {e}")
+                if attempt == 0:
+                    self._init_redis()
+
+        # Fallback to local queue
+        for event_data in batch:
+            self._event_queue.put_nowait(event_data)
+        logger.debug(f"Added {len(batch)} event(s) to local fallback queue")
+
+    def _start_redis_stream_reader(self):
+        """Start the thread reading events from the Redis stream."""
+        self._subscriber_thread = threading.Thread(
+            target=self._redis_stream_loop,
+            name="RedisEventStreamReader",
+            daemon=True,
+        )
+        self._subscriber_thread.start()
+        logger.info("Started Redis event stream reader thread")
+
+    @property
+    def _offset_key(self) -> str:
+        # Resolved on use, API workers forked after the import of this module
+        # get their own default consumer name
+        if not self._consumer:
+            self._consumer = f"{socket.gethostname()}-{os.getpid()}"
+        return f"{self._channel}:offset:{self._consumer}"
+
+    def _stream_start_id(self) -> str:
+        """Return the stored offset, or the newest entry for a new consumer."""
+        offset = self._redis_client.get(self._offset_key)
+        if offset:
+            return offset
+        # Resolve "$" once, a later XREAD with "$" would miss events published
+        # in between two reads
+        newest = self._redis_client.xrevrange(self._channel, count=1)
+        return newest[0][0] if newest else "0-0"
+
+    def _redis_stream_loop(self):
+        """Read events from the Redis stream from the stored offset with auto-reconnect."""
+        retry_count = 0
+        max_retries = 5
+        retry_delay = 5  # seconds
+
+        while not self._shutdown_event.is_set() and retry_count < max_retries:
+            try:
+                if not self._redis_client:
+                    logger.error("Redis client not available")
+                    return
+
+                last_id = self._stream_start_id()
+                logger.info(
+                    f"Reading Redis event stream {self._channel} after {last_id} "
+                    f"(consumer: {self._consumer})"
+                )
+                retry_count = 0  # Reset retry count on successful connection
+
+                while not self._shutdown_event.is_set():
+                    response = self._redis_client.xread(
+                        {self._channel: last_id}, count=STREAM_BATCH_SIZE, block=10000
+                    )
+                    if not response:
+                        continue  # Timeout, check shutdown and continue
+
+                    for _, entries in response:
+                        for entry_id, fields in entries:
+                            last_id = entry_id
+                            event_data = self._decode_stream_entry(entry_id, fields)
+                            if event_data is None:
+                                continue
+                            logger.info(
+                                f"Received event from Redis stream: {event_data.get('event_type')}"
+                            )
+                            try:
+                                if self._websocket_manager:
+                                    self._process_single_event(event_data)
+                                else:
+                                    self._event_queue.put_nowait(event_data)
+                            except Exception as e:
+                                logger.error(f"Error processing Redis event: {e}")
+
+                    self._redis_client.set(
+                        self._offset_key, last_id, ex=STREAM_OFFSET_TTL
+                    )
+
+            except Exception as e:
+                retry_count += 1
+                logger.error(
+                    f"Redis stream reader error (attempt {retry_count}/{max_retries}): {e}"
+                )
+
+                if retry_count < max_retries:
+                    logger.info(f"Retrying Redis stream in {retry_delay} seconds...")
+                    self._shutdown_event.wait(retry_delay)
+
+                    # Recreate Redis connection
+                    try:
+                        self._init_redis()
+                    except Exception as init_error:
+                        logger.error(f"Failed to reinitialize Redis: {init_error}")
+
+        if retry_count >= max_retries:
+            logger.error("Max Redis reconnection attempts reached, giving up")
+        else:
+            logger.info("Redis stream reader stopped")
+
     def _start_redis_subscriber(self):
         """Start Redis subscriber thread for receiving events from other containers."""
         self._subscriber_thread = threading.Thread(
@@ -258,8 +531,16 @@ class EventBridge:
         try:
             import asyncio
 
+            # Events read from the stream keep the ID and timestamp of their
+            # entry, clients resume after that ID
+            stream_entry = {}
+            if "id" in event_data:
+                stream_entry = {
+                    "event_id": event_data["id"],
+                    "timestamp": event_data.get("timestamp"),
+                }
             coro = self._websocket_manager.broadcast_event_from_notification(
-                event_data["event_type"], event_data["payload"]
+                event_data["event_type"], event_data["payload"], **stream_entry
             )
 
             loop = getattr(self._websocket_manager, "loop", None)
@@ -317,6 +598,9 @@ class EventBridge:
                 logger.error(f"Error closing Redis subscriber: {e}")
 
         # Wait for threads to finish
+        if self._publisher_thread and self._publisher_thread.is_alive():
+            self._publisher_thread.join(timeout=5.0)
+
         if self._processor_thread and self._processor_thread.is_alive():
             self._processor_thread.join(timeout=5.0)
 
@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import collections
 import os
 import threading
 import time
@@ -8,9 +9,11 @@ from typing import Any
 
 from kombu import Connection, Exchange, Queue
 from kombu.mixins import ConsumerMixin
+from kombu.transport import virtual
 from loguru import logger
 import json
 import requests
+from requests.adapters import HTTPAdapter
 
 from osism.tasks import netbox
 from osism import settings
@@ -21,6 +24,10 @@ EXCHANGE_RETRY_INTERVAL = 60
 # Interval for checking for new exchanges after initial connection (in seconds)
 EXCHANGE_DISCOVERY_INTERVAL = 60
 
+# Maximum time (in seconds) a handled message waits for its acknowledgement
+# when fewer than a full ack batch arrive
+ACK_FLUSH_INTERVAL = 1
+
 # Multiple exchanges for different OpenStack services
 EXCHANGES_CONFIG = {
     "ironic": {
@@ -174,24 +181,237 @@ class BaremetalEvents:
         netbox.set_power_state.delay(name, object_data["power_state"])
 
 
+class NotificationSender:
+    """Deliver notifications to the OSISM API from a background thread.
+
+    ``submit`` only appends the notification to a bounded in-memory buffer,
+    so a slow or unavailable OSISM API never blocks the RabbitMQ consumer.
+    A single sender thread drains the buffer in batches over one pooled HTTP
+    session. When the buffer is full the oldest notification is dropped,
+    when a batch cannot be delivered after ``max_tries`` attempts it is
+    dropped as well. Both cases are counted in ``stats``.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        session: requests.Session | None = None,
+        buffer_size: int = 10000,
+        batch_size: int = 50,
+        max_tries: int = 3,
+        timeout: int = 5,
+    ) -> None:
+        self.url = url
+        self.batch_url = url.rstrip("/") + "/batch"
+        self.session = session if session is not None else requests.Session()
+        # One sender thread, so one kept-alive connection per host is enough
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        self.batch_size = max(1, batch_size)
+        self.max_tries = max_tries
+        self.timeout = timeout
+        self.stats = {
+            "submitted": 0,
+            "delivered": 0,
+            "dropped_overflow": 0,
+            "dropped_failed": 0,
+            "batches": 0,
+        }
+        self._buffer: collections.deque[dict[str, Any]] = collections.deque(
+            maxlen=max(1, buffer_size)
+        )
+        self._ready = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        # Older OSISM APIs do not provide the batch endpoint
+        self._batch_supported = True
+
+    def start(self) -> None:
+        """Start the sender thread unless it is already running."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="notification-sender", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5) -> None:
+        """Stop the sender thread, flushing the buffer within ``timeout``."""
+        self._stop.set()
+        with self._ready:
+            self._ready.notify_all()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+        logger.info(f"Notification sender stopped: {self.stats}")
+
+    def submit(self, notification: dict[str, Any]) -> None:
+        """Queue a notification for delivery without blocking."""
+        with self._ready:
+            if len(self._buffer) == self._buffer.maxlen:
+                if not self.stats["dropped_overflow"]:
+                    logger.warning(
+                        f"Notification buffer full ({self._buffer.maxlen}), "
+                        "dropping the oldest notifications"
+                    )
+                self.stats["dropped_overflow"] += 1
+            self._buffer.append(notification)
+            self.stats["submitted"] += 1
+            self._ready.notify()
+
+    def pending(self) -> int:
+        """Return the number of buffered notifications."""
+        with self._ready:
+            return len(self._buffer)
+
+    def _next_batch(self) -> list[dict[str, Any]]:
+        with self._ready:
+            while not self._buffer and not self._stop.is_set():
+                self._ready.wait()
+            return [
+                self._buffer.popleft()
+                for _ in range(min(self.batch_size, len(self._buffer)))
+            ]
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                # Only returned empty once stop was requested
+                break
+            self._deliver(batch)
+
+    def _post(self, batch: list[dict[str, Any]]) -> requests.Response:
+        if len(batch) == 1:
+            return self.session.post(self.url, timeout=self.timeout, json=batch[0])
+        return self.session.post(self.batch_url, timeout=self.timeout, json=batch)
+
+    def _log_batch_failures(
+        self, batch: list[dict[str, Any]], response: requests.Response
+    ) -> None:
+        try:
+            failed = response.json()["failed"]
+        except (ValueError, KeyError, TypeError):
+            failed = []
+        for failure in failed:
+            logger.error(
+                f"Failed to process notification {failure.get('message_id')} "
+                f"({failure.get('event_type')}) at {self.url}: "
+                f"{failure.get('error')}"
+            )
+        logger.warning(
+            f"Delivered {len(batch)} notification(s) to {self.url}, "
+            f"{len(failed)} of them failed to process"
+        )
+        self.stats["delivered"] += len(batch) - len(failed)
+        self.stats["dropped_failed"] += len(failed)
+        self.stats["batches"] += 1
+
+    def _deliver(self, batch: list[dict[str, Any]]) -> None:
+        if len(batch) > 1 and not self._batch_supported:
+            for notification in batch:
+                self._deliver([notification])
+            return
+
+        tries = 1
+        while tries <= self.max_tries:
+            logger.debug(
+                f"Trying to deliver {len(batch)} notification(s) to {self.url} "
+                f"(Try: {tries}/{self.max_tries})"
+            )
+            try:
+                response = self._post(batch)
+                if len(batch) > 1 and response.status_code in (404, 405):
+                    logger.warning(
+                        f"{self.batch_url} is not available, delivering "
+                        "notifications one by one"
+                    )
+                    self._batch_supported = False
+                    self._deliver(batch)
+                    return
+                if response.status_code == 204:
+                    logger.info(
+                        f"Successfully delivered {len(batch)} notification(s) to "
+                        f"{self.url} (Try: {tries}/{self.max_tries})"
+                    )
+                    self.stats["delivered"] += len(batch)
+                    self.stats["batches"] += 1
+                    return
+                if len(batch) > 1 and response.status_code == 207:
+                    # Partially processed, sending the batch again would
+                    # process the successful notifications twice
+                    self._log_batch_failures(batch, response)
+                    return
+                else:
+                    response.raise_for_status()
+            except requests.ConnectionError:
+                logger.error(f"Error connecting to {self.url}")
+            except requests.Timeout:
+                logger.error(f"Timeout reached while connecting to {self.url}")
+            except requests.HTTPError as e:
+                logger.error(
+                    f"Received HTTP status code {e.response.status_code} while connecting to {self.url}"
+                )
+                if e.response.status_code <= 500:
+                    logger.error(
+                        f"Received HTTP status code {e.response.status_code} indicates a client side error, giving up early"
+                    )
+                    break
+
+            logger.error(
+                f"Failed to deliver {len(batch)} notification(s) to {self.url} "
+                f"({tries}/{self.max_tries})"
+            )
+            tries += 1
+            if tries <= self.max_tries:
+                # Returns early on stop, so shutdown is not delayed by backoff
+                self._stop.wait(pow(3, tries - 1))
+
+        self.stats["dropped_failed"] += len(batch)
+        logger.error(
+            f"Giving up delivering {len(batch)} notification(s) to {self.url} with data:\n"
+            + json.dumps(batch)
+        )
+
+
+def create_notification_sender() -> NotificationSender | None:
+    """Return the sender of the notifications to the OSISM API, if enabled."""
+    if not settings.OSISM_API_URL:
+        return None
+    logger.info("Setting up OSISM API")
+    return NotificationSender(
+        settings.OSISM_API_URL.rstrip("/") + "/notifications/baremetal",
+        session=requests.Session(),
+        buffer_size=settings.LISTENER_BUFFER_SIZE,
+        batch_size=settings.LISTENER_BATCH_SIZE,
+    )
+
+
 class NotificationsDump(ConsumerMixin):
-    def __init__(self, connection):
+    def __init__(self, connection, notification_sender=None):
         self.connection = connection
         self.baremetal_events = BaremetalEvents()
         self.osism_api_session: None | requests.Session = None
         self.osism_baremetal_api_url: None | str = None
+        self.notification_sender: None | NotificationSender = None
         self.websocket_manager = None
+        self.prefetch_count = settings.LISTENER_PREFETCH_COUNT
+        self.ack_batch_size = settings.LISTENER_ACK_BATCH_SIZE
+        self._unacked: list[Any] = []
+        self._unacked_since = 0.0
         self._available_exchanges: dict[str, dict] = {}
         self._discovery_thread: threading.Thread | None = None
         self._stop_discovery = threading.Event()
         self._new_exchanges_found = threading.Event()
 
-        if settings.OSISM_API_URL:
-            logger.info("Setting up OSISM API")
-            self.osism_api_session = requests.Session()
-            self.osism_baremetal_api_url = (
-                settings.OSISM_API_URL.rstrip("/") + "/notifications/baremetal"
-            )
+        # main() passes the sender it keeps across reconnects, its thread and
+        # buffer outlive the consumer
+        if notification_sender is None:
+            notification_sender = create_notification_sender()
+        if notification_sender is not None:
+            self.notification_sender = notification_sender
+            self.osism_api_session = notification_sender.session
+            self.osism_baremetal_api_url = notification_sender.url
 
         # Import event_bridge for WebSocket forwarding
         try:
@@ -357,9 +577,15 @@ class NotificationsDump(ConsumerMixin):
                     exchange,
                     routing_key=config["routing_key"],
                     auto_delete=False,
-                    no_ack=True,
+                    no_ack=False,
+                )
+                consumers.append(
+                    consumer(
+                        queue,
+                        callbacks=[self.on_message],
+                        prefetch_count=self.prefetch_count or None,
+                    )
                 )
-                consumers.append(consumer(queue, callbacks=[self.on_message]))
                 logger.info(
                     f"Configured consumer for {service_name} exchange: {config['exchange']}"
                 )
@@ -374,7 +600,59 @@ class NotificationsDump(ConsumerMixin):
 
         return consumers
 
+    def _ack_batch_threshold(self) -> int:
+        # The broker stops delivering once prefetch_count messages are
+        # unacknowledged, so a batch must never be larger than that
+        if self.prefetch_count:
+            return max(1, min(self.ack_batch_size, self.prefetch_count))
+        return max(1, self.ack_batch_size)
+
+    def _ack_later(self, message) -> None:
+        if not self._unacked:
+            self._unacked_since = time.monotonic()
+        self._unacked.append(message)
+        if len(self._unacked) >= self._ack_batch_threshold():
+            self._flush_acks()
+
+    def _flush_acks(self) -> None:
+        """Acknowledge all handled messages with a single basic.ack."""
+        if not self._unacked:
+            return
+        messages, self._unacked = self._unacked, []
+        try:
+            if isinstance(messages[-1].channel, virtual.Channel):
+                # Virtual transports (memory, redis) ignore multiple=True
+                for message in messages:
+                    message.ack()
+            else:
+                messages[-1].ack(multiple=True)
+        except Exception as e:
+            logger.warning(f"Failed to acknowledge {len(messages)} message(s): {e}")
+
+    def on_iteration(self):
+        if (
+            self._unacked
+            and time.monotonic() - self._unacked_since >= ACK_FLUSH_INTERVAL
+        ):
+            self._flush_acks()
+
+    def on_consume_end(self, connection, channel):
+        self._flush_acks()
+
+    def on_connection_revived(self):
+        # Delivery tags are only valid on the channel they were received on,
+        # the broker redelivers the messages of a lost connection anyway
+        self._unacked = []
+
     def on_message(self, body, message):
+        try:
+            self._handle_notification(body)
+        finally:
+            # Messages are acknowledged once handed off, failures included,
+            # so a broken notification is not redelivered forever
+            self._ack_later(message)
+
+    def _handle_notification(self, body):
         data = json.loads(body["oslo.message"])
 
         # Log event with service type detection
@@ -423,60 +701,19 @@ class NotificationsDump(ConsumerMixin):
                     f"Event data was: {data['event_type']} - {data.get('payload', {}).get('ironic_object.data', {}).get('name', 'unknown')}"
                 )
 
-        if self.osism_api_session:
-            tries = 1
-            max_tries = 3
-            while tries <= max_tries:
-                logger.info(
-                    f"Trying to deliver notification to {self.osism_baremetal_api_url} (Try: {tries}/{max_tries})\n"
+        if self.notification_sender:
+            # Delivery happens in the sender thread, the consumer only queues
+            self.notification_sender.start()
+            self.notification_sender.submit(
+                dict(
+                    priority=data["priority"],
+                    event_type=data["event_type"],
+                    timestamp=data["timestamp"],
+                    publisher_id=data["publisher_id"],
+                    message_id=data["message_id"],
+                    payload=data["payload"],
                 )
-                try:
-                    response = self.osism_api_session.post(
-                        self.osism_baremetal_api_url,
-                        timeout=5,
-                        json=dict(
-                            priority=data["priority"],
-                            event_type=data["event_type"],
-                            timestamp=data["timestamp"],
-                            publisher_id=data["publisher_id"],
-                            message_id=data["message_id"],
-                            payload=data["payload"],
-                        ),
-                    )
-                    if response.status_code == 204:
-                        logger.info(
-                            f"Successfully delivered notification to {self.osism_baremetal_api_url} (Try: {tries}/{max_tries})"
-                        )
-                        break
-                    else:
-                        response.raise_for_status()
-                except requests.ConnectionError:
-                    logger.error(f"Error connecting to {self.osism_baremetal_api_url}")
-                except requests.Timeout:
-                    logger.error(
-                        f"Timeout reached while connecting to {self.osism_baremetal_api_url}"
-                    )
-                except requests.HTTPError as e:
-                    logger.error(
-                        f"Received HTTP status code {e.response.status_code} while connecting to {self.osism_baremetal_api_url}"
-                    )
-                    if e.response.status_code <= 500:
-                        logger.error(
-                            f"Received HTTP status code {e.response.status_code} indicates a client side error, giving up early"
-                        )
-                        break
-
-                logger.error(
-                    f"Failed to deliver notification to {self.osism_baremetal_api_url} ({tries}/{max_tries})"
-                )
-                tries += 1
-                if tries > max_tries:
-                    logger.error(
-                        f"Giving up delivering notification to {self.osism_baremetal_api_url} with data:\n"
-                        + json.dumps(data)
-                    )
-                else:
-                    time.sleep(pow(3, tries - 1))
+            )
 
         else:
             handler = self.baremetal_events.get_handler(data["event_type"])
@@ -484,14 +721,16 @@ class NotificationsDump(ConsumerMixin):
 
 
 def main():
-    # Track available exchanges across restarts
+    # Track available exchanges across restarts, the one sender keeps the
+    # undelivered notifications across restarts and reconnects
     available_exchanges: dict[str, dict] = {}
+    notification_sender = create_notification_sender()
 
     while True:
         try:
             with Connection(BROKER_URI, connect_timeout=30.0) as connection:
                 connection.connect()
-                consumer = NotificationsDump(connection)
+                consumer = NotificationsDump(connection, notification_sender)
                 # Restore previously discovered exchanges
                 consumer._available_exchanges = available_exchanges
                 consumer.run()
@@ -3,14 +3,50 @@
 import asyncio
 import json
 import logging
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Any,
+    Iterable,
+    Optional,
+    List,
+    Set,
+    Tuple,
+)
 from uuid import uuid4
 
 from fastapi import WebSocket, WebSocketDisconnect
 
+from osism import settings
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger("osism.websocket")
 
+# What happens when the send queue of a connection is full:
+#   drop_oldest - the oldest queued event is dropped
+#   coalesce    - a queued event for the same event type and resource is
+#                 replaced, otherwise the oldest queued event is dropped
+#   disconnect  - the connection is closed
+SLOW_CONSUMER_POLICIES = ("drop_oldest", "coalesce", "disconnect")
+
+# Close code sent to consumers disconnected by the disconnect policy
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+# Seconds without events after which an event stream sends a comment, so
+# proxies do not close idle Server-Sent Events connections
+EVENT_STREAM_KEEPALIVE = 15
+
 
 class EventMessage:
     """Represents an event message for WebSocket streaming."""
@@ -21,13 +57,18 @@ class EventMessage:
         source: str,
         data: Dict[str, Any],
         node_name: Optional[str] = None,
+        event_id: Optional[str] = None,
+        timestamp: Optional[str] = None,
     ):
-        self.id = str(uuid4())
-        self.timestamp = datetime.utcnow().isoformat() + "Z"
+        self.id = event_id or str(uuid4())
+        self.timestamp = timestamp or datetime.utcnow().isoformat() + "Z"
         self.event_type = event_type
         self.source = source
         self.node_name = node_name
         self.data = data
+        self.service_type = event_type.split(".")[0] if event_type else "unknown"
+        self._json: Optional[str] = None
+        self._sse: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert event message to dictionary for JSON serialization."""
@@ -41,18 +82,142 @@ class EventMessage:
         }
 
     def to_json(self) -> str:
-        """Convert event message to JSON string."""
-        return json.dumps(self.to_dict())
+        """Convert event message to JSON string.
+
+        The string is built on the first call only, an event is broadcast to
+        all connections with the same serialization.
+        """
+        if self._json is None:
+            self._json = dumps(self.to_dict())
+        return self._json
+
+    def to_sse(self) -> str:
+        """Convert event message to a Server-Sent Events frame."""
+        if self._sse is None:
+            self._sse = f"id: {self.id}\ndata: {self.to_json()}\n\n"
+        return self._sse
+
+    def serialize(self, message_format: str = "json") -> str:
+        """Return the event in the given format ("json" or "sse")."""
+        return self.to_sse() if message_format == "sse" else self.to_json()
+
+
+def dumps(data: Any) -> str:
+    """Serialize to compact JSON, with orjson if it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # Types orjson does not know, the json module decides
+            pass
+    return json.dumps(data, separators=(",", ":"))
+
+
+class _FilterSet:
+    """Connection attribute holding a filter as a set.
+
+    Any iterable can be assigned, the registry the connection belongs to
+    is told to rebuild its index.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = "_" + name
+
+    def __get__(self, connection, owner=None):
+        if connection is None:
+            return self
+        return getattr(connection, self.name)
+
+    def __set__(self, connection, value: Optional[Iterable[str]]) -> None:
+        setattr(connection, self.name, set(value or ()))
+        if connection.on_filters_changed:
+            connection.on_filters_changed()
 
 
 class WebSocketConnection:
-    """Represents a WebSocket connection with filtering options."""
+    """Represents a WebSocket connection with filtering options.
 
-    def __init__(self, websocket: WebSocket):
+    Messages for the connection are queued in a bounded send queue and
+    written by a writer task of its own, so a slow client only delays
+    itself. What happens when the queue is full is decided by ``policy``.
+    """
+
+    event_filters = _FilterSet()  # Event types to filter
+    node_filters = _FilterSet()  # Node names to filter
+    service_filters = _FilterSet()  # Service types to filter
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_queue_size: Optional[int] = None,
+        policy: Optional[str] = None,
+        message_format: str = "json",
+    ):
         self.websocket = websocket
-        self.event_filters: List[str] = []  # List of event types to filter
-        self.node_filters: List[str] = []  # List of node names to filter
-        self.service_filters: List[str] = []  # List of service types to filter
+        # "json" for websockets, "sse" for event streams
+        self.message_format = message_format
+        # Set by the ConnectionRegistry the connection is added to
+        self.on_filters_changed: Optional[Callable[[], None]] = None
+        self.event_filters: Set[str] = set()
+        self.node_filters: Set[str] = set()
+        self.service_filters: Set[str] = set()
+        self.max_queue_size = max(
+            1, max_queue_size or settings.WEBSOCKET_SEND_QUEUE_SIZE
+        )
+        self.policy = policy or settings.WEBSOCKET_SLOW_CONSUMER_POLICY
+        # Queued (coalesce key, message) pairs, drained by the writer task
+        self.pending: Deque[Tuple[Optional[Tuple[str, str]], str]] = deque()
+        self.dropped = 0
+        self.writer_task: Optional[asyncio.Task] = None
+        self._ready = asyncio.Event()
+
+    def enqueue(self, message: str, key: Optional[Tuple[str, str]] = None) -> bool:
+        """Queue a message for the writer task without waiting.
+
+        Returns False if the queue is full and the connection has to be
+        closed (disconnect policy).
+        """
+        if len(self.pending) >= self.max_queue_size:
+            if self.policy == "disconnect":
+                return False
+            self.dropped += 1
+            if self.policy == "coalesce" and key is not None:
+                for index, (pending_key, _) in enumerate(self.pending):
+                    if pending_key == key:
+                        del self.pending[index]
+                        break
+                else:
+                    self.pending.popleft()
+            else:
+                self.pending.popleft()
+        self.pending.append((key, message))
+        self._ready.set()
+        return True
+
+    def start_writer(self, on_error: Callable[[WebSocket], Awaitable[None]]) -> None:
+        """Start the writer task unless it is already running."""
+        if self.writer_task is None or self.writer_task.done():
+            self.writer_task = asyncio.create_task(self._write(on_error))
+
+    def stop_writer(self) -> None:
+        if self.writer_task and not self.writer_task.done():
+            self.writer_task.cancel()
+
+    async def _write(self, on_error: Callable[[WebSocket], Awaitable[None]]) -> None:
+        while True:
+            await self._ready.wait()
+            while self.pending:
+                _, message = self.pending.popleft()
+                try:
+                    await self.websocket.send_text(message)
+                except WebSocketDisconnect:
+                    await on_error(self.websocket)
+                    return
+                except Exception as e:
+                    logger.error(f"Error sending message to WebSocket: {e}")
+                    await on_error(self.websocket)
+                    return
+            self._ready.clear()
 
     def matches_filters(self, event: "EventMessage") -> bool:
         """Check if event matches this connection's filters."""
@@ -73,18 +238,149 @@ class WebSocketConnection:
         )
 
         # Check service filters
-        service_type = event.event_type.split(".")[0] if event.event_type else "unknown"
-        service_match = not self.service_filters or service_type in self.service_filters
+        service_match = (
+            not self.service_filters or event.service_type in self.service_filters
+        )
 
         return event_match and node_match and service_match
 
 
+class EventStream:
+    """Takes the place of a websocket for a Server-Sent Events client.
+
+    The writer task of the connection hands over one frame at a time and
+    waits until the response has taken it, so a slow HTTP client backs up
+    into the send queue of its connection, where the slow consumer policy
+    applies.
+    """
+
+    def __init__(self) -> None:
+        self._frames: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self.closed = False
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, frame: str) -> None:
+        if self.closed:
+            raise WebSocketDisconnect()
+        await self._frames.put(frame)
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed = True
+        # Wake up frames(), a frame not taken yet is dropped
+        while not self._frames.empty():
+            self._frames.get_nowait()
+        self._frames.put_nowait(None)
+
+    async def frames(
+        self, keepalive: float = EVENT_STREAM_KEEPALIVE
+    ) -> AsyncIterator[str]:
+        """Yield the frames until the stream is closed."""
+        while not self.closed:
+            try:
+                frame = await asyncio.wait_for(self._frames.get(), keepalive)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if frame is None:
+                return
+            yield frame
+
+
+class ConnectionRegistry(Dict[WebSocket, WebSocketConnection]):
+    """The active connections with an inverted index of their filters.
+
+    For every filter dimension (event type, node, service) the index maps a
+    filter value to the connections filtering on it and keeps the
+    connections without a filter on that dimension apart. ``matching()``
+    only checks the connections of the dimension with the fewest
+    candidates instead of every connection. The index is rebuilt on the
+    next lookup after connections or filters changed.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._index: Optional[List[Tuple[Dict[str, list], list]]] = None
+
+    def __setitem__(self, websocket: WebSocket, connection: WebSocketConnection):
+        super().__setitem__(websocket, connection)
+        connection.on_filters_changed = self.invalidate
+        self.invalidate()
+
+    def __delitem__(self, websocket: WebSocket) -> None:
+        super().__delitem__(websocket)
+        self.invalidate()
+
+    def pop(self, websocket: WebSocket, *default):
+        connection = super().pop(websocket, *default)
+        self.invalidate()
+        return connection
+
+    def clear(self) -> None:
+        super().clear()
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        self._index = None
+
+    def _build_index(self) -> List[Tuple[Dict[str, list], list]]:
+        index: List[Tuple[Dict[str, list], list]] = []
+        for attribute in ("event_filters", "node_filters", "service_filters"):
+            by_value: Dict[str, list] = {}
+            unfiltered = []
+            for connection in self.values():
+                values = getattr(connection, attribute)
+                if not values:
+                    unfiltered.append(connection)
+                for value in values:
+                    by_value.setdefault(value, []).append(connection)
+            index.append((by_value, unfiltered))
+        return index
+
+    def matching(self, event: EventMessage) -> List[WebSocketConnection]:
+        """Return the connections whose filters match the event."""
+        if self._index is None:
+            self._index = self._build_index()
+
+        candidates: Optional[Tuple[list, list]] = None
+        for (by_value, unfiltered), value in zip(
+            self._index, (event.event_type, event.node_name, event.service_type)
+        ):
+            subscribed = by_value.get(value, []) if value is not None else []
+            if candidates is None or len(subscribed) + len(unfiltered) < sum(
+                map(len, candidates)
+            ):
+                candidates = (subscribed, unfiltered)
+
+        return [
+            connection
+            for group in candidates or ()
+            for connection in group
+            if connection.matches_filters(event)
+        ]
+
+
 class WebSocketManager:
     """Manages WebSocket connections and event broadcasting."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        send_queue_size: Optional[int] = None,
+        slow_consumer_policy: Optional[str] = None,
+    ):
+        self.send_queue_size = send_queue_size or settings.WEBSOCKET_SEND_QUEUE_SIZE
+        self.slow_consumer_policy = (
+            slow_consumer_policy or settings.WEBSOCKET_SLOW_CONSUMER_POLICY
+        )
+        if self.slow_consumer_policy not in SLOW_CONSUMER_POLICIES:
+            logger.warning(
+                f"Unknown slow consumer policy {self.slow_consumer_policy}, "
+                "using drop_oldest"
+            )
+            self.slow_consumer_policy = "drop_oldest"
         # Store active WebSocket connections with filtering support
-        self.connections: Dict[WebSocket, WebSocketConnection] = {}
+        self.connections = ConnectionRegistry()
         # Event queue for broadcasting
         self.event_queue: asyncio.Queue = asyncio.Queue()
         # Background task for event broadcasting
@@ -95,11 +391,20 @@ class WebSocketManager:
         # Lock for thread-safe operations
         self._lock = asyncio.Lock()
 
-    async def connect(self, websocket: WebSocket) -> None:
-        """Accept a new WebSocket connection."""
+    async def connect(self, websocket: WebSocket, message_format: str = "json") -> None:
+        """Accept a new WebSocket connection.
+
+        Event streams (see EventStream) are connected with the "sse" message
+        format.
+        """
         await websocket.accept()
         async with self._lock:
-            self.connections[websocket] = WebSocketConnection(websocket)
+            self.connections[websocket] = WebSocketConnection(
+                websocket,
+                max_queue_size=self.send_queue_size,
+                policy=self.slow_consumer_policy,
+                message_format=message_format,
+            )
         logger.info(f"WebSocket connected. Total connections: {len(self.connections)}")
 
         # Start broadcaster if this is the first connection
@@ -110,11 +415,39 @@ class WebSocketManager:
     async def disconnect(self, websocket: WebSocket) -> None:
         """Remove a WebSocket connection."""
         async with self._lock:
-            self.connections.pop(websocket, None)
+            connection = self.connections.pop(websocket, None)
+        if connection:
+            connection.stop_writer()
         logger.info(
             f"WebSocket disconnected. Total connections: {len(self.connections)}"
         )
 
+    async def _writer_failed(self, websocket: WebSocket) -> None:
+        """Drop a connection whose writer task could not send."""
+        async with self._lock:
+            self.connections.pop(websocket, None)
+        logger.info(
+            f"Removed disconnected WebSocket. Active connections: {len(self.connections)}"
+        )
+
+    async def _disconnect_slow_consumer(self, connection: WebSocketConnection) -> None:
+        async with self._lock:
+            self.connections.pop(connection.websocket, None)
+        connection.stop_writer()
+        logger.warning(
+            f"Disconnecting slow WebSocket consumer with {len(connection.pending)} "
+            f"queued message(s). Active connections: {len(self.connections)}"
+        )
+
+        async def close():
+            try:
+                await connection.websocket.close(code=SLOW_CONSUMER_CLOSE_CODE)
+            except Exception as e:
+                logger.debug(f"Error closing slow WebSocket consumer: {e}")
+
+        # Closing sends a frame as well, do not wait for the slow client
+        asyncio.create_task(close())
+
     async def update_filters(
         self,
         websocket: WebSocket,
@@ -141,70 +474,134 @@ class WebSocketManager:
         """Add an event to the broadcast queue."""
         await self.event_queue.put(event)
 
+    def create_event_from_notification(
+        self,
+        event_type: str,
+        payload: Dict[str, Any],
+        event_id: Optional[str] = None,
+        timestamp: Optional[str] = None,
+    ) -> EventMessage:
+        """Create an event message from a RabbitMQ notification."""
+        # Extract relevant identifiers from different service types
+        node_name = None
+        resource_id = None
+        service_type = event_type.split(".")[0] if event_type else "unknown"
+
+        # Extract identifiers based on service type
+        if service_type == "baremetal" and "ironic_object.data" in payload:
+            ironic_data = payload["ironic_object.data"]
+            node_name = ironic_data.get("name")
+            resource_id = ironic_data.get("uuid")
+        elif service_type in ["compute", "nova"] and "nova_object.data" in payload:
+            nova_data = payload["nova_object.data"]
+            node_name = nova_data.get("host") or nova_data.get("name")
+            resource_id = nova_data.get("uuid")
+        elif service_type in ["network", "neutron"]:
+            # Neutron events may have different payload structures
+            if "neutron_object.data" in payload:
+                neutron_data = payload["neutron_object.data"]
+                resource_id = neutron_data.get("id") or neutron_data.get("uuid")
+                node_name = neutron_data.get("name") or neutron_data.get("device_id")
+        elif service_type == "volume" and "cinder_object.data" in payload:
+            cinder_data = payload["cinder_object.data"]
+            resource_id = cinder_data.get("id") or cinder_data.get("uuid")
+            node_name = cinder_data.get("name") or cinder_data.get("display_name")
+        elif service_type == "image" and "glance_object.data" in payload:
+            glance_data = payload["glance_object.data"]
+            resource_id = glance_data.get("id") or glance_data.get("uuid")
+            node_name = glance_data.get("name")
+        elif service_type == "identity" and "keystone_object.data" in payload:
+            keystone_data = payload["keystone_object.data"]
+            resource_id = keystone_data.get("id") or keystone_data.get("uuid")
+            node_name = keystone_data.get("name")
+
+        # Create event message with enhanced metadata
+        event_data = payload.copy()
+        event_data["service_type"] = service_type
+        event_data["resource_id"] = resource_id
+
+        return EventMessage(
+            event_type=event_type,
+            source="openstack",
+            data=event_data,
+            node_name=node_name,
+            event_id=event_id,
+            timestamp=timestamp,
+        )
+
     async def broadcast_event_from_notification(
-        self, event_type: str, payload: Dict[str, Any]
+        self,
+        event_type: str,
+        payload: Dict[str, Any],
+        event_id: Optional[str] = None,
+        timestamp: Optional[str] = None,
     ) -> None:
         """Create and broadcast an event from RabbitMQ notification."""
         try:
             logger.info(f"Processing event for WebSocket broadcast: {event_type}")
             logger.debug(f"Active WebSocket connections: {len(self.connections)}")
 
-            # Extract relevant identifiers from different service types
-            node_name = None
-            resource_id = None
-            service_type = event_type.split(".")[0] if event_type else "unknown"
-
-            # Extract identifiers based on service type
-            if service_type == "baremetal" and "ironic_object.data" in payload:
-                ironic_data = payload["ironic_object.data"]
-                node_name = ironic_data.get("name")
-                resource_id = ironic_data.get("uuid")
-            elif service_type in ["compute", "nova"] and "nova_object.data" in payload:
-                nova_data = payload["nova_object.data"]
-                node_name = nova_data.get("host") or nova_data.get("name")
-                resource_id = nova_data.get("uuid")
-            elif service_type in ["network", "neutron"]:
-                # Neutron events may have different payload structures
-                if "neutron_object.data" in payload:
-                    neutron_data = payload["neutron_object.data"]
-                    resource_id = neutron_data.get("id") or neutron_data.get("uuid")
-                    node_name = neutron_data.get("name") or neutron_data.get(
-                        "device_id"
-                    )
-            elif service_type == "volume" and "cinder_object.data" in payload:
-                cinder_data = payload["cinder_object.data"]
-                resource_id = cinder_data.get("id") or cinder_data.get("uuid")
-                node_name = cinder_data.get("name") or cinder_data.get("display_name")
-            elif service_type == "image" and "glance_object.data" in payload:
-                glance_data = payload["glance_object.data"]
-                resource_id = glance_data.get("id") or glance_data.get("uuid")
-                node_name = glance_data.get("name")
-            elif service_type == "identity" and "keystone_object.data" in payload:
-                keystone_data = payload["keystone_object.data"]
-                resource_id = keystone_data.get("id") or keystone_data.get("uuid")
-                node_name = keystone_data.get("name")
-
-            # Create event message with enhanced metadata
-            event_data = payload.copy()
-            event_data["service_type"] = service_type
-            event_data["resource_id"] = resource_id
-
-            event = EventMessage(
-                event_type=event_type,
-                source="openstack",
-                data=event_data,
-                node_name=node_name,
+            event = self.create_event_from_notification(
+                event_type, payload, event_id=event_id, timestamp=timestamp
             )
 
             await self.add_event(event)
             logger.info(
-                f"Added {service_type} event to WebSocket queue: {event_type} for resource {node_name or resource_id}"
+                f"Added {event.data['service_type']} event to WebSocket queue: {event_type} for resource {event.node_name or event.data['resource_id']}"
             )
             logger.debug(f"Event queue size: {self.event_queue.qsize()}")
 
         except Exception as e:
             logger.error(f"Error creating event from notification: {e}")
 
+    async def send_message(self, websocket: WebSocket, message: str) -> bool:
+        """Queue a message, e.g. an acknowledgement, for a single connection.
+
+        The message goes through the send queue like the events, after the
+        events already queued. Returns False if the connection is unknown
+        or was closed as a slow consumer.
+        """
+        connection = self.connections.get(websocket)
+        if connection is None:
+            return False
+        if not connection.enqueue(message):
+            await self._disconnect_slow_consumer(connection)
+            return False
+        connection.start_writer(self._writer_failed)
+        return True
+
+    async def send_recent_events(
+        self, websocket: WebSocket, events: List[Dict[str, Any]]
+    ) -> int:
+        """Replay events kept by the event bridge to a single connection.
+
+        The events are queued in order and only if they match the filters of
+        the connection. Returns the number of events queued.
+        """
+        connection = self.connections.get(websocket)
+        if connection is None:
+            return 0
+
+        sent_count = 0
+        # More events than fit into the send queue would only be dropped again
+        for event_data in events[-connection.max_queue_size :]:
+            event = self.create_event_from_notification(
+                event_data["event_type"],
+                event_data["payload"],
+                event_id=event_data.get("id"),
+                timestamp=event_data.get("timestamp"),
+            )
+            if connection.matches_filters(event):
+                connection.enqueue(
+                    event.serialize(connection.message_format),
+                    self._coalesce_key(event),
+                )
+                sent_count += 1
+        connection.start_writer(self._writer_failed)
+
+        logger.info(f"Replayed {sent_count}/{len(events)} event(s) to WebSocket")
+        return sent_count
+
     async def _broadcast_events(self) -> None:
         """Background task to broadcast events to all connected clients."""
         logger.info("Starting WebSocket event broadcaster")
@@ -218,40 +615,35 @@ class WebSocketManager:
                     # No connections, skip broadcasting
                     continue
 
-                # Broadcast to filtered connections
-                message = event.to_json()
-                disconnected_connections = set()
+                # Serialize once per format and hand the message to the send
+                # queue of every matching connection, the writer tasks do the
+                # sending
+                key = self._coalesce_key(event)
+                slow_connections = []
                 sent_count = 0
 
                 async with self._lock:
-                    connections_copy = dict(self.connections)
-
-                for websocket, connection in connections_copy.items():
-                    try:
-                        # Check if event matches connection filters
-                        if connection.matches_filters(event):
-                            await websocket.send_text(message)
-                            sent_count += 1
-                    except WebSocketDisconnect:
-                        disconnected_connections.add(websocket)
-                    except Exception as e:
-                        logger.error(f"Error sending message to WebSocket: {e}")
-                        disconnected_connections.add(websocket)
-
-                # Remove disconnected connections
-                if disconnected_connections:
-                    async with self._lock:
-                        for websocket in disconnected_connections:
-                            self.connections.pop(websocket, None)
-                    logger.info(
-                        f"Removed {len(disconnected_connections)} disconnected WebSocket(s). "
-                        f"Active connections: {len(self.connections)}"
-                    )
+                    matching = self.connections.matching(event)
+
+                for connection in matching:
+                    message = event.serialize(connection.message_format)
+                    if connection.enqueue(message, key):
+                        connection.start_writer(self._writer_failed)
+                        sent_count += 1
+                    else:
+                        slow_connections.append(connection)
+
+                for connection in slow_connections:
+                    await self._disconnect_slow_consumer(connection)
 
                 logger.info(
                     f"Broadcasted event {event.event_type} to {sent_count}/{len(self.connections)} connection(s)"
                 )
 
+                # queue.get() does not suspend while events are waiting, give
+                # the writer tasks a chance to drain their queues during bursts
+                await asyncio.sleep(0)
+
             except asyncio.CancelledError:
                 logger.info("WebSocket broadcaster task cancelled")
                 break
@@ -259,6 +651,14 @@ class WebSocketManager:
                 logger.error(f"Error in WebSocket broadcaster: {e}")
                 # Continue broadcasting even if there's an error
 
+    @staticmethod
+    def _coalesce_key(event: EventMessage) -> Optional[Tuple[str, str]]:
+        """Events of the same type for the same resource can be coalesced."""
+        resource = event.node_name or event.data.get("resource_id")
+        if not resource:
+            return None
+        return (event.event_type, resource)
+
     async def send_heartbeat(self) -> None:
         """Send heartbeat to all connected clients."""
         if not self.connections:
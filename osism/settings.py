@@ -45,14 +45,96 @@ GATHER_FACTS_SCHEDULE = float(
 # Intentionally independent of GATHER_FACTS_SCHEDULE: setting the schedule to 0
 # to disable periodic gathering must not force every fact to look stale.
 FACTS_MAX_AGE = int(os.getenv("FACTS_MAX_AGE", str(_DEFAULT_FACTS_INTERVAL_SECONDS)))
+# Sorted set of the hosts with cached facts, scored with the time the facts
+# were gathered. The default is the keyset_name of Ansible's redis cache.
+FACTS_INDEX_KEY = os.getenv("FACTS_INDEX_KEY", "ansible_cache_keys")
+# "plain" reads the facts as Ansible cached them, "compressed" reads them
+# through a compact copy: the facts compressed with FACTS_COMPRESSION ("zstd"
+# if available, otherwise "zlib") and the FACTS_HOT_KEYS facts as separate
+# fields, so reading one of them does not decode all facts. The copy is
+# kept next to the facts Ansible writes and needs additional memory, reading
+# all facts or facts that are not hot gets slower.
+FACTS_STORAGE = os.getenv("FACTS_STORAGE", "plain")
+FACTS_COMPRESSION = os.getenv("FACTS_COMPRESSION", "zstd")
+FACTS_HOT_KEYS = [
+    name.strip()
+    for name in os.getenv(
+        "FACTS_HOT_KEYS",
+        "ansible_hostname,ansible_fqdn,ansible_default_ipv4,ansible_distribution,"
+        "ansible_distribution_version,ansible_kernel,ansible_date_time,ansible_local",
+    ).split(",")
+    if name.strip()
+]
+# Fact paths the fact search indexes, dot separated names that may be
+# shell-style wildcards ("ansible_*.module" are the interface drivers).
+FACTS_SEARCH_PATHS = [
+    path.strip()
+    for path in os.getenv(
+        "FACTS_SEARCH_PATHS",
+        "ansible_kernel,ansible_distribution,ansible_distribution_version,"
+        "ansible_product_name,ansible_bios_version,ansible_*.module",
+    ).split(",")
+    if path.strip()
+]
 INVENTORY_RECONCILER_SCHEDULE = float(
     os.getenv("INVENTORY_RECONCILER_SCHEDULE", "600.0")
 )
 
 OSISM_API_URL = os.getenv("OSISM_API_URL", None)
 
+# The listener queues notifications for the OSISM API in a buffer of
+# LISTENER_BUFFER_SIZE entries (the oldest are dropped when it is full) and
+# delivers them in batches of up to LISTENER_BATCH_SIZE.
+LISTENER_BUFFER_SIZE = int(os.getenv("LISTENER_BUFFER_SIZE", "10000"))
+LISTENER_BATCH_SIZE = int(os.getenv("LISTENER_BATCH_SIZE", "50"))
+
+# Transport of the event bridge between listener and API: "pubsub" only reaches
+# API processes subscribed at that moment, "stream" keeps the last
+# EVENTS_STREAM_MAXLEN events in a Redis stream. Every API process resumes from
+# the offset stored under its EVENTS_STREAM_CONSUMER name and websocket clients
+# can ask for recent events when connecting. The name has to be unique per
+# process, by default "<hostname>-<pid>" is used. That default changes with
+# every restart, a restarted process then starts at the newest event; set a
+# stable name per process to resume after restarts.
+EVENTS_TRANSPORT = os.getenv("EVENTS_TRANSPORT", "pubsub")
+EVENTS_STREAM_MAXLEN = int(os.getenv("EVENTS_STREAM_MAXLEN", "10000"))
+EVENTS_STREAM_CONSUMER = os.getenv("EVENTS_STREAM_CONSUMER", "")
+
+# Every websocket connection has a send queue of WEBSOCKET_SEND_QUEUE_SIZE
+# events. WEBSOCKET_SLOW_CONSUMER_POLICY decides what happens when a client
+# cannot keep up: "drop_oldest", "coalesce" (replace a queued event of the
+# same type for the same resource) or "disconnect".
+WEBSOCKET_SEND_QUEUE_SIZE = int(os.getenv("WEBSOCKET_SEND_QUEUE_SIZE", "1000"))
+WEBSOCKET_SLOW_CONSUMER_POLICY = os.getenv(
+    "WEBSOCKET_SLOW_CONSUMER_POLICY", "drop_oldest"
+)
+
+# The listener consumer asks RabbitMQ for up to LISTENER_PREFETCH_COUNT
+# unacknowledged messages (0 for no limit) and acknowledges handled messages
+# in batches of LISTENER_ACK_BATCH_SIZE with a single basic.ack.
+LISTENER_PREFETCH_COUNT = int(os.getenv("LISTENER_PREFETCH_COUNT", "200"))
+LISTENER_ACK_BATCH_SIZE = int(os.getenv("LISTENER_ACK_BATCH_SIZE", "50"))
+
 OPERATOR_USER = os.getenv("OSISM_OPERATOR_USER", "dragon")
 
+# The report commands query up to REPORT_SSH_CONCURRENCY hosts at the same
+# time, every command on a host may run REPORT_SSH_TIMEOUT seconds.
+REPORT_SSH_CONCURRENCY = int(os.getenv("REPORT_SSH_CONCURRENCY", "32"))
+REPORT_SSH_TIMEOUT = int(os.getenv("REPORT_SSH_TIMEOUT", "30"))
+
+# osism check mount keeps the content hashes of the files it checked in a
+# manifest per base path in this directory, private to the user, and only
+# hashes the files again whose inode, size or mtime changed. An empty value
+# disables the manifests.
+CHECK_MOUNT_MANIFEST_DIR = os.getenv(
+    "CHECK_MOUNT_MANIFEST_DIR",
+    os.path.join(
+        os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+        "osism",
+        "check-mount",
+    ),
+)
+
 FRR_DUMMY_INTERFACE = os.getenv("OSISM_FRR_DUMMY_INTERFACE", "loopback0")
 
 DEFAULT_NETBOX_FILTER_CONDUCTOR_IRONIC = (
@@ -110,6 +192,13 @@ SONIC_FIRMWARE_PREFIX = os.getenv(
 SONIC_FIRMWARE_SUFFIX = os.getenv("SONIC_FIRMWARE_SUFFIX", ".bin")
 SONIC_FIRMWARE_IDENTIFIER = os.getenv("SONIC_FIRMWARE_IDENTIFIER", "serial-number")
 
+# Incremental SONiC sync triggered by the NetBox webhook. Changes to devices,
+# interfaces, cables, IP addresses and VLANs regenerate only the affected
+# switches; changes arriving within SONIC_WEBHOOK_DEBOUNCE seconds are
+# collected into a single sync.
+SONIC_WEBHOOK_SYNC = os.getenv("SONIC_WEBHOOK_SYNC", "False") == "True"
+SONIC_WEBHOOK_DEBOUNCE = int(os.getenv("SONIC_WEBHOOK_DEBOUNCE", "10"))
+
 
 NETBOX_SECONDARIES = (
     os.getenv("NETBOX_SECONDARIES", read_secret("NETBOX_SECONDARIES")) or "[]"
@@ -1,9 +1,12 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from celery import Celery
+from loguru import logger
 
 from osism import settings, utils
 from osism.tasks import Config, run_ansible_in_environment
+from osism.utils.facts import compact_facts
+from osism.utils.facts_search import update_search_index
 
 app = Celery("ansible")
 app.config_from_object(Config)
@@ -22,9 +25,22 @@ def setup_periodic_tasks(sender, **kwargs):
 
 @app.task(bind=True, name="osism.tasks.ansible.gather_facts")
 def gather_facts(self, publish=True):
-    return run_ansible_in_environment(
+    result = run_ansible_in_environment(
         self.request.id, "osism-ansible", "generic", "facts", [], publish, False
     )
+    _update_fact_indexes()
+    return result
+
+
+def _update_fact_indexes():
+    try:
+        if settings.FACTS_STORAGE == "compressed":
+            # Build the compact copies now instead of on the first read
+            compact_facts(utils.redis)
+        update_search_index(utils.redis)
+    except Exception as exc:
+        # Both are brought up to date when read as well
+        logger.warning(f"Could not update the fact indexes: {exc}")
 
 
 @app.task(bind=True, name="osism.tasks.ansible.run")
@@ -40,7 +56,7 @@ def run(
     # Check if tasks are locked before execution
     utils.check_task_lock_and_exit()
 
-    return run_ansible_in_environment(
+    result = run_ansible_in_environment(
         self.request.id,
         "osism-ansible",
         environment,
@@ -50,6 +66,10 @@ def run(
         locking,
         auto_release_time,
     )
+    if environment == "generic" and playbook == "gather-facts":
+        # osism sync facts, index the facts like after gather_facts
+        _update_fact_indexes()
+    return result
 
 
 @app.task(bind=True, name="osism.tasks.ansible.noop")
@@ -4,13 +4,18 @@ import copy
 from celery import Celery
 from celery.signals import worker_process_init
 
-from osism import utils
+from osism import settings, utils
 from osism.tasks import Config
 from osism.tasks.conductor.config import get_configuration
 from osism.tasks.conductor.ironic import sync_ironic as _sync_ironic
 from osism.tasks.conductor.redfish import get_resources as _get_redfish_resources
 from osism.tasks.conductor.sonic import sync_sonic as _sync_sonic
 from osism.tasks.conductor.sonic import get_devices as _get_sonic_devices
+from osism.tasks.conductor.sonic import (
+    get_affected_devices as _get_affected_sonic_devices,
+    pop_pending_devices as _pop_pending_sonic_devices,
+    queue_devices as _queue_sonic_devices,
+)
 
 # App configuration
 app = Celery("conductor")
@@ -74,11 +79,33 @@ def sync_ironic(
 
 
 @app.task(bind=True, name="osism.tasks.conductor.sync_sonic")
-def sync_sonic(self, device_name=None, show_diff=True):
+def sync_sonic(self, device_name=None, show_diff=True, force=False):
     # Check if tasks are locked before execution
     utils.check_task_lock_and_exit()
 
-    return _sync_sonic(device_name, self.request.id, show_diff)
+    return _sync_sonic(device_name, self.request.id, show_diff, force)
+
+
+@app.task(bind=True, name="osism.tasks.conductor.handle_sonic_netbox_change")
+def handle_sonic_netbox_change(self, model, data, prechange=None):
+    device_names = _get_affected_sonic_devices(model, data, prechange)
+    if device_names and _queue_sonic_devices(
+        device_names, settings.SONIC_WEBHOOK_DEBOUNCE
+    ):
+        sync_sonic_pending.apply_async(countdown=settings.SONIC_WEBHOOK_DEBOUNCE)
+    return device_names
+
+
+@app.task(bind=True, name="osism.tasks.conductor.sync_sonic_pending")
+def sync_sonic_pending(self):
+    # Check if tasks are locked before execution
+    utils.check_task_lock_and_exit()
+
+    device_names = _pop_pending_sonic_devices()
+    if not device_names:
+        return {}
+
+    return _sync_sonic(device_names=device_names)
 
 
 @app.task(bind=True, name="osism.tasks.conductor.get_redfish_resources")
@@ -96,7 +123,9 @@ __all__ = [
     "get_ironic_parameters",
     "get_redfish_resources",
     "get_sonic_devices",
+    "handle_sonic_netbox_change",
     "sync_netbox",
     "sync_ironic",
     "sync_sonic",
+    "sync_sonic_pending",
 ]
@@ -5,6 +5,7 @@
 from .config_generator import generate_sonic_config
 from .exporter import save_config_to_netbox, export_config_to_file
 from .sync import sync_sonic
+from .changes import get_affected_devices, queue_devices, pop_pending_devices
 from .device import get_devices
 from .connections import (
     get_connected_interfaces,
@@ -19,6 +20,9 @@ __all__ = [
     "save_config_to_netbox",
     "export_config_to_file",
     "sync_sonic",
+    "get_affected_devices",
+    "queue_devices",
+    "pop_pending_devices",
     "get_connected_interfaces",
     "get_connected_device_for_sonic_interface",
     "get_connected_device_via_interface",
@@ -0,0 +1,242 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Incremental SONiC synchronization triggered by NetBox changes.
+
+A NetBox webhook reports a single changed object. This module maps such an
+object to the SONiC devices whose generated configuration may depend on it
+and collects those devices in Redis, so a debounced ``sync_sonic`` restricted
+to them can be run instead of a sync of the whole fabric.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from loguru import logger
+
+from osism import utils
+from osism.tasks.conductor.netbox import get_nb_device_query_list_sonic
+from .cache import clear_interface_cache
+from .connections import find_interconnected_devices
+from .constants import DEFAULT_SONIC_ROLES
+
+# NetBox models whose changes can affect a generated SONiC configuration
+SONIC_CHANGE_MODELS = ("device", "interface", "cable", "ipaddress", "vlan")
+
+# Redis set with the names of the devices waiting for the next incremental sync
+PENDING_DEVICES_KEY = "osism:sonic:pending_devices"
+
+# Redis key marking that a flush of the pending devices is already scheduled
+PENDING_FLUSH_KEY = "osism:sonic:pending_flush"
+
+# Extra lifetime of the flush marker on top of the debounce delay, so a lost
+# flush task cannot block incremental syncs forever
+PENDING_FLUSH_GRACE = 300
+
+SPINE_ROLES = ["spine", "superspine"]
+
+
+def _ref_id(value: Any) -> Optional[int]:
+    """Return the ID of a nested object (webhook data) or a plain ID (snapshot)."""
+    if isinstance(value, dict):
+        return value.get("id")
+    if isinstance(value, int):
+        return value
+    return None
+
+
+def _interface_device_ids(interface_ids: Iterable[int]) -> Set[int]:
+    interface_ids = [x for x in interface_ids if x is not None]
+    if not interface_ids:
+        return set()
+    return {
+        interface.device.id
+        for interface in utils.nb.dcim.interfaces.filter(id=interface_ids)
+        if interface.device
+    }
+
+
+def _cabled_peer_ids(device_ids: Set[int]) -> Set[int]:
+    """Return the IDs of all devices cabled to one of the given devices."""
+    if not device_ids:
+        return set()
+    peer_ids = set()
+    for interface in utils.nb.dcim.interfaces.filter(
+        device_id=list(device_ids), cabled=True
+    ):
+        for endpoint in getattr(interface, "connected_endpoints", None) or []:
+            peer_device = getattr(endpoint, "device", None)
+            if peer_device is not None:
+                peer_ids.add(peer_device.id)
+    return peer_ids - device_ids
+
+
+def _seed_device_ids(model: str, data: Dict[str, Any]) -> tuple:
+    """Map a changed object to the IDs of the devices it belongs to.
+
+    Returns:
+        tuple: (device IDs, whether the cable peers of these devices are
+               affected as well)
+    """
+    device_ids: Set[Optional[int]] = set()
+    with_peers = False
+
+    if model == "device":
+        device_ids.add(data.get("id"))
+        with_peers = True
+
+    elif model == "interface":
+        device_ids.add(_ref_id(data.get("device")))
+        for key in ("link_peers", "connected_endpoints"):
+            for peer in data.get(key) or []:
+                if isinstance(peer, dict):
+                    device_ids.add(_ref_id(peer.get("device")))
+
+    elif model == "cable":
+        interface_ids = []
+        for side in ("a_terminations", "b_terminations"):
+            for termination in data.get(side) or []:
+                if not isinstance(termination, dict):
+                    # Snapshots only carry the IDs of the terminations
+                    interface_ids.append(_ref_id(termination))
+                elif termination.get("object_type", "dcim.interface") == (
+                    "dcim.interface"
+                ):
+                    termination_object = termination.get("object") or {}
+                    device_id = _ref_id(termination_object.get("device"))
+                    if device_id is not None:
+                        device_ids.add(device_id)
+                    else:
+                        interface_ids.append(termination.get("object_id"))
+        device_ids |= _interface_device_ids(interface_ids)
+
+    elif model == "ipaddress":
+        if data.get("assigned_object_type") == "dcim.interface":
+            assigned_object = data.get("assigned_object")
+            if isinstance(assigned_object, dict):
+                device_ids.add(_ref_id(assigned_object.get("device")))
+            else:
+                device_ids |= _interface_device_ids([data.get("assigned_object_id")])
+            # Peers build their BGP neighbors from the addresses of this device
+            with_peers = True
+
+    elif model == "vlan":
+        device_ids |= {
+            interface.device.id
+            for interface in utils.nb.dcim.interfaces.filter(vlan_id=data.get("id"))
+            if interface.device
+        }
+
+    device_ids.discard(None)
+    return device_ids, with_peers
+
+
+def _add_spine_group_members(devices: Dict[int, Any]) -> None:
+    """Add all members of the spine/superspine groups of the given devices.
+
+    All members of a group share the minimum AS of the group, so a change
+    to one member can change the configuration of every other member.
+    """
+    if not any(
+        device.role and device.role.slug in SPINE_ROLES for device in devices.values()
+    ):
+        return
+
+    all_spine_devices = []
+    for nb_device_query in get_nb_device_query_list_sonic():
+        for device in utils.nb.dcim.devices.filter(**nb_device_query):
+            if device.role and device.role.slug in SPINE_ROLES:
+                all_spine_devices.append(device)
+
+    try:
+        for group in find_interconnected_devices(all_spine_devices, SPINE_ROLES):
+            if any(device.id in devices for device in group):
+                for device in group:
+                    devices.setdefault(device.id, device)
+    finally:
+        clear_interface_cache()
+
+
+def get_affected_devices(
+    model: str, data: Dict[str, Any], prechange: Optional[Dict[str, Any]] = None
+) -> List[str]:
+    """Return the names of the SONiC devices affected by a NetBox change.
+
+    Both the current state of the object and its pre-change snapshot are
+    considered, so moving a cable or an IP address also regenerates the
+    devices it was removed from. Only devices matching
+    NETBOX_FILTER_CONDUCTOR_SONIC with a SONiC role are returned.
+
+    Args:
+        model: NetBox model name of the changed object (e.g. "cable")
+        data: Webhook data of the changed object
+        prechange: Pre-change snapshot of the changed object
+
+    Returns:
+        list: Sorted names of the affected devices
+    """
+    if model not in SONIC_CHANGE_MODELS:
+        return []
+
+    device_ids: Set[int] = set()
+    peers_of: Set[int] = set()
+    for state in (data, prechange):
+        if not state:
+            continue
+        seed_ids, with_peers = _seed_device_ids(model, state)
+        device_ids |= seed_ids
+        if with_peers:
+            peers_of |= seed_ids
+
+    device_ids |= _cabled_peer_ids(peers_of)
+    if not device_ids:
+        return []
+
+    devices: Dict[int, Any] = {}
+    for nb_device_query in get_nb_device_query_list_sonic():
+        for device in utils.nb.dcim.devices.filter(
+            id=sorted(device_ids), **nb_device_query
+        ):
+            if device.role and device.role.slug in DEFAULT_SONIC_ROLES:
+                devices[device.id] = device
+
+    if devices:
+        _add_spine_group_members(devices)
+
+    device_names = sorted(device.name for device in devices.values())
+    logger.debug(f"NetBox {model} change affects SONiC devices: {device_names}")
+    return device_names
+
+
+def queue_devices(device_names: List[str], delay: int) -> bool:
+    """Add devices to the pending incremental sync.
+
+    Args:
+        device_names: Names of the devices to sync
+        delay: Debounce delay in seconds before the pending devices are synced
+
+    Returns:
+        bool: True if the caller has to schedule the flush of the pending
+              devices, False if a flush is already scheduled
+    """
+    pipe = utils.redis.pipeline()
+    pipe.sadd(PENDING_DEVICES_KEY, *device_names)
+    pipe.set(PENDING_FLUSH_KEY, 1, nx=True, ex=delay + PENDING_FLUSH_GRACE)
+    _, scheduled = pipe.execute()
+    return bool(scheduled)
+
+
+def pop_pending_devices() -> List[str]:
+    """Atomically take all pending devices and clear the flush marker.
+
+    Changes arriving after this call schedule a new flush.
+
+    Returns:
+        list: Sorted names of the pending devices
+    """
+    pipe = utils.redis.pipeline()
+    pipe.delete(PENDING_FLUSH_KEY)
+    pipe.smembers(PENDING_DEVICES_KEY)
+    pipe.delete(PENDING_DEVICES_KEY)
+    _, members, _ = pipe.execute()
+    return sorted(
+        member.decode() if isinstance(member, bytes) else member for member in members
+    )
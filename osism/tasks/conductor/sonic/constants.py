@@ -109,3 +109,8 @@ SUPPORTED_HWSKUS = [
     "Accton-AS9726-32D",
     "DellEMC-S5212f-P-25G",
 ]
+
+# Version of the configuration generator, part of every device fingerprint
+# (see fingerprint.py). Bump it whenever the generated configuration changes
+# for unchanged NetBox data, so the next sync regenerates every device.
+GENERATOR_VERSION = "1"
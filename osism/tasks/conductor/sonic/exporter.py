@@ -131,6 +131,48 @@ def save_config_to_netbox(device, config, return_diff=False):
         raise
 
 
+def get_export_filepath(device):
+    """Return the path of the exported SONiC configuration file of a device.
+
+    The file is named ``<prefix><identifier><suffix>`` in the export
+    directory, the identifier is the serial number or the hostname depending
+    on SONIC_EXPORT_IDENTIFIER.
+
+    Args:
+        device: NetBox device object
+
+    Returns:
+        str: Path of the export file
+    """
+    export_dir = settings.SONIC_EXPORT_DIR
+    prefix = settings.SONIC_EXPORT_PREFIX
+    suffix = settings.SONIC_EXPORT_SUFFIX
+    identifier_type = settings.SONIC_EXPORT_IDENTIFIER
+
+    # Get identifier based on configuration
+    if identifier_type == "serial-number":
+        # Get serial number from device
+        identifier = (
+            device.serial if hasattr(device, "serial") and device.serial else None
+        )
+        if not identifier:
+            logger.warning(
+                f"Serial number not found for device {device.name}, falling back to hostname"
+            )
+            identifier = get_device_hostname(device)
+        else:
+            logger.debug(
+                f"Using serial number {identifier} as identifier for device {device.name}"
+            )
+    else:
+        # Default to hostname (inventory_hostname custom field or device name)
+        identifier = get_device_hostname(device)
+
+    # Generate filename: prefix + identifier + suffix
+    filename = f"{prefix}{identifier}{suffix}"
+    return os.path.join(export_dir, filename)
+
+
 def export_config_to_file(device, config):
     """Export SONiC configuration to local file with diff checking.
 
@@ -159,28 +201,8 @@ def export_config_to_file(device, config):
         # Create export directory if it doesn't exist
         os.makedirs(export_dir, exist_ok=True)
 
-        # Get identifier based on configuration
-        if identifier_type == "serial-number":
-            # Get serial number from device
-            identifier = (
-                device.serial if hasattr(device, "serial") and device.serial else None
-            )
-            if not identifier:
-                logger.warning(
-                    f"Serial number not found for device {device.name}, falling back to hostname"
-                )
-                identifier = get_device_hostname(device)
-            else:
-                logger.debug(
-                    f"Using serial number {identifier} as identifier for device {device.name}"
-                )
-        else:
-            # Default to hostname (inventory_hostname custom field or device name)
-            identifier = get_device_hostname(device)
-
-        # Generate filename: prefix + identifier + suffix
-        filename = f"{prefix}{identifier}{suffix}"
-        filepath = os.path.join(export_dir, filename)
+        filepath = get_export_filepath(device)
+        filename = os.path.basename(filepath)
 
         # Check if file exists and compare content
         config_changed = True
@@ -0,0 +1,377 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Fabric-wide validation of SONiC configurations.
+
+``validate_config`` checks a single ConfigDB document. This module validates
+the configurations of all devices of a fabric in parallel and adds the checks
+that need more than one configuration: both ends of a BGP session have to
+point at each other's addresses and agree on whether the session is internal
+or external, and cabled ports have to use the same MTU.
+"""
+
+import ipaddress
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from osism import utils
+from osism.tasks.conductor.netbox import get_nb_device_query_list_sonic
+from .cache import clear_interface_cache, get_cached_device_interfaces
+from .constants import DEFAULT_SONIC_ROLES
+from .interface import convert_netbox_interface_to_sonic
+from .validator import ValidationResult, validate_config
+
+# A cable between two SONiC ports: ((device name, port), (device name, port))
+Link = Tuple[Tuple[str, str], Tuple[str, str]]
+
+# ConfigDB tables whose "<interface>|<prefix>" keys assign addresses
+ADDRESS_TABLES = (
+    "INTERFACE",
+    "PORTCHANNEL_INTERFACE",
+    "VLAN_INTERFACE",
+    "VLAN_SUB_INTERFACE",
+    "LOOPBACK_INTERFACE",
+)
+
+
+@dataclass
+class FabricIssue:
+    check: str
+    message: str
+    devices: List[str] = field(default_factory=list)
+
+
+@dataclass
+class FabricValidationResult:
+    results: Dict[str, Optional[ValidationResult]]
+    issues: List[FabricIssue] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        return not self.issues and all(
+            result is not None and result.valid for result in self.results.values()
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        devices = {
+            name: (
+                result.to_dict()
+                if result
+                else {
+                    "valid": False,
+                    "errors": [{"message": "config not available"}],
+                }
+            )
+            for name, result in self.results.items()
+        }
+        return {
+            "valid": self.valid,
+            "devices": devices,
+            "fabric": {
+                "valid": not self.issues,
+                "errors": [
+                    {"check": i.check, "message": i.message, "devices": i.devices}
+                    for i in self.issues
+                ],
+            },
+            "summary": {
+                "devices": len(self.results),
+                "valid": sum(1 for d in devices.values() if d["valid"]),
+                "failed": sum(1 for d in devices.values() if not d["valid"]),
+                "fabric_errors": len(self.issues),
+            },
+        }
+
+
+def get_fabric_devices(hostnames: Iterable[str] = ()) -> List[Any]:
+    """Return the SONiC devices matching NETBOX_FILTER_CONDUCTOR_SONIC.
+
+    Args:
+        hostnames: Optional device names to restrict the fabric to
+
+    Returns:
+        list: NetBox device objects sorted by name
+    """
+    wanted = set(hostnames)
+    devices: Dict[int, Any] = {}
+    for nb_device_query in get_nb_device_query_list_sonic():
+        for device in utils.nb.dcim.devices.filter(**nb_device_query):
+            if not (device.role and device.role.slug in DEFAULT_SONIC_ROLES):
+                continue
+            if wanted and device.name not in wanted:
+                continue
+            devices[device.id] = device
+    return sorted(devices.values(), key=lambda device: device.name)
+
+
+def get_fabric_links(devices: List[Any]) -> List[Link]:
+    """Collect the cables between the given devices from NetBox.
+
+    Interface names are converted to SONiC port names, so the links can be
+    matched against the PORT tables of the generated configurations.
+    """
+    devices_by_id = {device.id: device for device in devices}
+    links: Set[Link] = set()
+    try:
+        for device in devices:
+            for interface in get_cached_device_interfaces(device.id):
+                for endpoint in getattr(interface, "connected_endpoints", None) or []:
+                    peer_id = getattr(getattr(endpoint, "device", None), "id", None)
+                    peer = devices_by_id.get(peer_id)
+                    if peer is None or peer.id == device.id:
+                        continue
+                    if not getattr(endpoint, "name", None):
+                        continue
+                    local = (
+                        device.name,
+                        convert_netbox_interface_to_sonic(interface, device),
+                    )
+                    remote = (
+                        peer.name,
+                        convert_netbox_interface_to_sonic(endpoint, peer),
+                    )
+                    links.add((local, remote) if local < remote else (remote, local))
+    finally:
+        clear_interface_cache()
+    return sorted(links)
+
+
+def validate_configs(
+    configs: Dict[str, Optional[Dict[str, Any]]], max_workers: int = 4
+) -> Dict[str, Optional[ValidationResult]]:
+    """Validate several configurations in parallel.
+
+    All workers share the table models of the generated schemas, so every
+    model is only built once per process. Unavailable configurations (None)
+    are passed through as None.
+    """
+    names = [name for name, config in configs.items() if config is not None]
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        validated = dict(
+            zip(names, executor.map(lambda name: validate_config(configs[name]), names))
+        )
+    return {name: validated.get(name) for name in configs}
+
+
+def _split_key(key: str) -> Tuple[str, str]:
+    """Split a "<vrf>|<peer>" BGP_NEIGHBOR key; keys without VRF are default."""
+    if "|" in key:
+        vrf, peer = key.split("|", 1)
+        return vrf, peer
+    return "default", key
+
+
+def _parse_ip(value: Any) -> Optional[str]:
+    try:
+        return str(ipaddress.ip_address(str(value)))
+    except ValueError:
+        return None
+
+
+def _device_asn(config: Dict[str, Any]) -> Optional[str]:
+    metadata = (config.get("DEVICE_METADATA") or {}).get("localhost") or {}
+    asn = metadata.get("bgp_asn")
+    if asn is None:
+        asn = ((config.get("BGP_GLOBALS") or {}).get("default") or {}).get("local_asn")
+    return str(asn) if asn is not None else None
+
+
+def _address_owners(configs: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+    """Map every interface address to the device it is configured on.
+
+    Addresses configured on more than one device (anycast gateways) cannot
+    identify a peer and are left out.
+    """
+    owners: Dict[str, str] = {}
+    shared: Set[str] = set()
+    for name, config in configs.items():
+        for table in ADDRESS_TABLES:
+            for key in config.get(table) or {}:
+                if "|" not in key:
+                    continue
+                address = _parse_ip(key.split("|", 1)[1].split("/")[0])
+                if address is None:
+                    continue
+                if owners.setdefault(address, name) != name:
+                    shared.add(address)
+    for address in shared:
+        del owners[address]
+    return owners
+
+
+def _portchannel_members(config: Dict[str, Any]) -> Dict[str, List[str]]:
+    members: Dict[str, List[str]] = {}
+    for key in config.get("PORTCHANNEL_MEMBER") or {}:
+        if "|" in key:
+            portchannel, port = key.split("|", 1)
+            members.setdefault(portchannel, []).append(port)
+    return members
+
+
+def check_bgp_sessions(
+    configs: Dict[str, Dict[str, Any]], links: Iterable[Link] = ()
+) -> List[FabricIssue]:
+    """Check that both ends of every BGP session inside the fabric match.
+
+    Numbered neighbors are resolved to the device owning the neighbor
+    address, unnumbered neighbors (interface or port channel names) through
+    the cabling. Neighbors outside the fabric are ignored. For every session
+    the peer has to configure the reverse neighbor, an explicit
+    ``local_addr`` has to be the address the peer points at, and
+    ``peer_type`` has to match the ASNs of both devices.
+    """
+    issues: List[FabricIssue] = []
+    owners = _address_owners(configs)
+    cabling: Dict[Tuple[str, str], Tuple[str, str]] = {}
+    for local, remote in links:
+        cabling[local] = remote
+        cabling[remote] = local
+
+    neighbors = {
+        name: {
+            _split_key(key): row if isinstance(row, dict) else {}
+            for key, row in (config.get("BGP_NEIGHBOR") or {}).items()
+        }
+        for name, config in configs.items()
+    }
+    asns = {name: _device_asn(config) for name, config in configs.items()}
+    members = {name: _portchannel_members(config) for name, config in configs.items()}
+    portchannel_of = {
+        name: {port: pc for pc, ports in pcs.items() for port in ports}
+        for name, pcs in members.items()
+    }
+
+    for name in sorted(configs):
+        for (vrf, peer), row in sorted(neighbors[name].items()):
+            session = f"{name} -> {vrf}|{peer}"
+            peer_ip = _parse_ip(peer)
+
+            if peer_ip is not None:
+                peer_name = owners.get(peer_ip)
+                if peer_name is None or peer_name == name:
+                    continue
+                reverse = {
+                    p
+                    for (v, p) in neighbors[peer_name]
+                    if v == vrf and owners.get(_parse_ip(p) or "") == name
+                }
+                local_addr = _parse_ip(row.get("local_addr"))
+                if local_addr is not None and owners.get(local_addr) != name:
+                    issues.append(
+                        FabricIssue(
+                            "bgp",
+                            f"BGP session {session}: local_addr {local_addr} is "
+                            f"not configured on {name}",
+                            [name],
+                        )
+                    )
+                elif local_addr is not None and reverse and local_addr not in reverse:
+                    issues.append(
+                        FabricIssue(
+                            "bgp",
+                            f"BGP session {session}: {peer_name} peers with "
+                            f"{', '.join(sorted(reverse))} instead of local_addr "
+                            f"{local_addr}",
+                            [name, peer_name],
+                        )
+                    )
+            else:
+                ports = members[name].get(peer, [peer])
+                # Peers without a configuration are outside the check
+                remotes = [
+                    cabling[(name, port)]
+                    for port in ports
+                    if (name, port) in cabling and cabling[(name, port)][0] in configs
+                ]
+                if not remotes:
+                    continue
+                peer_name = remotes[0][0]
+                peer_interfaces = {
+                    portchannel_of[peer_name].get(port, port)
+                    for remote_name, port in remotes
+                    if remote_name == peer_name
+                }
+                reverse = {
+                    p
+                    for (v, p) in neighbors[peer_name]
+                    if v == vrf
+                    and (p in peer_interfaces or owners.get(_parse_ip(p) or "") == name)
+                }
+
+            if not reverse:
+                issues.append(
+                    FabricIssue(
+                        "bgp",
+                        f"BGP session {session}: {peer_name} has no matching "
+                        f"neighbor in VRF {vrf}",
+                        [name, peer_name],
+                    )
+                )
+
+            local_asn, peer_asn = asns[name], asns[peer_name]
+            peer_type = row.get("peer_type")
+            if local_asn and peer_asn and peer_type:
+                expected = "internal" if local_asn == peer_asn else "external"
+                if peer_type != expected:
+                    issues.append(
+                        FabricIssue(
+                            "bgp",
+                            f"BGP session {session}: peer_type {peer_type} but "
+                            f"{name} has AS {local_asn} and {peer_name} has AS "
+                            f"{peer_asn}",
+                            [name, peer_name],
+                        )
+                    )
+    return issues
+
+
+def check_link_mtu(
+    configs: Dict[str, Dict[str, Any]], links: Iterable[Link]
+) -> List[FabricIssue]:
+    """Check that both ports of every cable use the same MTU."""
+    issues: List[FabricIssue] = []
+    for (name_a, port_a), (name_b, port_b) in links:
+        if name_a not in configs or name_b not in configs:
+            continue
+        mtu_a = ((configs[name_a].get("PORT") or {}).get(port_a) or {}).get("mtu")
+        mtu_b = ((configs[name_b].get("PORT") or {}).get(port_b) or {}).get("mtu")
+        if mtu_a is None or mtu_b is None:
+            continue
+        if str(mtu_a) != str(mtu_b):
+            issues.append(
+                FabricIssue(
+                    "mtu",
+                    f"MTU mismatch on link {name_a}:{port_a} ({mtu_a}) <-> "
+                    f"{name_b}:{port_b} ({mtu_b})",
+                    [name_a, name_b],
+                )
+            )
+    return issues
+
+
+def validate_fabric(
+    configs: Dict[str, Optional[Dict[str, Any]]],
+    links: Iterable[Link] = (),
+    max_workers: int = 4,
+) -> FabricValidationResult:
+    """Validate all configurations of a fabric and their consistency.
+
+    Args:
+        configs: Configuration per device name, None if not available
+        links: Cables between the devices, see get_fabric_links()
+        max_workers: Number of configurations validated in parallel
+
+    Returns:
+        FabricValidationResult: Per-device results and cross-device issues
+    """
+    links = list(links)
+    results = validate_configs(configs, max_workers)
+    available = {name: config for name, config in configs.items() if config}
+    issues = check_bgp_sessions(available, links) + check_link_mtu(available, links)
+    logger.debug(
+        f"Validated {len(results)} SONiC configurations, "
+        f"{len(issues)} cross-device issues"
+    )
+    return FabricValidationResult(results=results, issues=issues)
@@ -0,0 +1,253 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Input fingerprints for SONiC configuration generation.
+
+A fingerprint is a digest over everything that feeds the configuration of a
+single device: the device itself, its interfaces and IP addresses, the
+directly cabled peer devices and their IP addresses, the NetBox objects shared
+by all devices (VIPs, FHRP assignments, transfer prefixes, metalboxes), the
+local base/port configuration files, the relevant settings and the generator
+version. ``sync_sonic`` stores the fingerprint of every device it synced
+successfully and skips a device on the next run when its fingerprint is
+unchanged, so devices nothing touched are neither regenerated nor diffed.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, Optional
+
+from loguru import logger
+
+from osism import __version__, settings, utils
+from . import config_generator, connections
+from .cache import get_cached_device_interfaces
+from .constants import GENERATOR_VERSION, PORT_CONFIG_PATH
+from .exporter import get_export_filepath
+
+# Redis hash holding the last stored fingerprint per device name
+FINGERPRINTS_KEY = "osism:sonic:fingerprints"
+
+# Device fields that change as a side effect of the sync itself (the saved
+# ``sonic_config`` local context and the resulting ``last_updated``) and must
+# therefore not feed the fingerprint
+_VOLATILE_DEVICE_FIELDS = ("last_updated", "local_context_data")
+
+
+def _record_to_data(record: Any, exclude: Iterable[str] = ()) -> Any:
+    """Convert a pynetbox record (or a test stub) into plain data."""
+    if record is None:
+        return None
+    try:
+        data = dict(record)
+    except (TypeError, ValueError):
+        data = dict(vars(record)) if hasattr(record, "__dict__") else str(record)
+    if isinstance(data, dict):
+        for key in exclude:
+            data.pop(key, None)
+    return data
+
+
+def _device_to_data(device: Any) -> Any:
+    data = _record_to_data(device, exclude=_VOLATILE_DEVICE_FIELDS)
+    if isinstance(data, dict) and isinstance(data.get("config_context"), dict):
+        # NetBox merges the local context into the rendered config context,
+        # so the generated sonic_config shows up here as well
+        data["config_context"] = {
+            key: value
+            for key, value in data["config_context"].items()
+            if key != "sonic_config"
+        }
+    return data
+
+
+def _records_to_data(records: Iterable[Any], exclude: Iterable[str] = ()) -> list:
+    """Convert records into plain data ordered by their NetBox ID."""
+    data = [_record_to_data(record, exclude) for record in records]
+    return sorted(
+        data,
+        key=lambda item: str(item.get("id")) if isinstance(item, dict) else item,
+    )
+
+
+def _digest(data: Any) -> str:
+    payload = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _file_digest(path: str) -> Optional[str]:
+    """Return the SHA-256 of a local file, or None if it does not exist."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _get_peer_device_ids(device: Any, interfaces: Iterable[Any]) -> list:
+    """Collect the IDs of all devices cabled to the given interfaces."""
+    peer_ids = set()
+    for interface in interfaces:
+        for endpoint in getattr(interface, "connected_endpoints", None) or []:
+            peer_device = getattr(endpoint, "device", None)
+            peer_id = getattr(peer_device, "id", None)
+            if peer_id is not None and peer_id != device.id:
+                peer_ids.add(peer_id)
+    return sorted(peer_ids)
+
+
+def compute_global_fingerprint() -> str:
+    """Compute the digest of the inputs shared by all devices of a sync run.
+
+    Must be called after the metalbox and VIP caches have been loaded, their
+    content is reused instead of querying NetBox again.
+    """
+    metalboxes = []
+    for _, metalbox in sorted((config_generator._metalbox_devices_cache or {}).items()):
+        metalboxes.append(
+            {
+                "device": _device_to_data(metalbox["device"]),
+                "interfaces": [
+                    {
+                        "interface": _record_to_data(entry["interface"]),
+                        "ips": _records_to_data(entry["ips"]),
+                    }
+                    for _, entry in sorted(metalbox["interfaces"].items())
+                ],
+            }
+        )
+
+    data = {
+        "generator_version": GENERATOR_VERSION,
+        "osism_version": __version__,
+        "settings": {
+            "base_config_path": settings.SONIC_BASE_CONFIG_PATH,
+            "export_dir": settings.SONIC_EXPORT_DIR,
+            "export_prefix": settings.SONIC_EXPORT_PREFIX,
+            "export_suffix": settings.SONIC_EXPORT_SUFFIX,
+            "export_identifier": settings.SONIC_EXPORT_IDENTIFIER,
+            "port_config_path": PORT_CONFIG_PATH,
+        },
+        "base_config": _file_digest(settings.SONIC_BASE_CONFIG_PATH),
+        "metalboxes": metalboxes,
+        "vip_addresses": _records_to_data(connections._vip_addresses_cache or []),
+        "transfer_prefixes": _records_to_data(
+            utils.nb.ipam.prefixes.filter(role="transfer")
+        ),
+        "fhrp_group_assignments": _records_to_data(
+            utils.nb.ipam.fhrp_group_assignments.all()
+        ),
+    }
+    return _digest(data)
+
+
+def compute_device_fingerprint(
+    device: Any,
+    hwsku: str,
+    global_fingerprint: str,
+    device_as_mapping: Optional[Dict[int, int]] = None,
+    config_version: Optional[str] = None,
+) -> str:
+    """Compute the input fingerprint of a single device.
+
+    Interfaces are read through the interface cache, so the generator reuses
+    them instead of fetching them a second time.
+
+    Args:
+        device: NetBox device object
+        hwsku: Hardware SKU of the device
+        global_fingerprint: Result of compute_global_fingerprint() for this run
+        device_as_mapping: Device ID to AS number mapping of spine groups
+        config_version: Custom CONFIG DB VERSION of the device
+
+    Returns:
+        str: Hex digest of all inputs
+    """
+    interfaces = get_cached_device_interfaces(device.id)
+    peer_ids = _get_peer_device_ids(device, interfaces)
+
+    # The IP addresses of the peers cover their Loopback0 and connected
+    # interface addresses used for the BGP neighbors, the nested assigned
+    # object carries the interface name
+    peer_devices = []
+    peer_ip_addresses = []
+    if peer_ids:
+        peer_devices = [
+            _device_to_data(peer) for peer in utils.nb.dcim.devices.filter(id=peer_ids)
+        ]
+        peer_ip_addresses = _records_to_data(
+            utils.nb.ipam.ip_addresses.filter(device_id=peer_ids)
+        )
+
+    data = {
+        "global": global_fingerprint,
+        "hwsku": hwsku,
+        "port_config": _file_digest(f"{PORT_CONFIG_PATH}/{hwsku}.ini"),
+        "config_version": config_version,
+        "local_as": (device_as_mapping or {}).get(device.id),
+        "device": _device_to_data(device),
+        "interfaces": _records_to_data(interfaces),
+        "ip_addresses": _records_to_data(
+            utils.nb.ipam.ip_addresses.filter(device_id=device.id)
+        ),
+        "peer_devices": sorted(
+            peer_devices,
+            key=lambda item: str(item.get("id")) if isinstance(item, dict) else item,
+        ),
+        "peer_ip_addresses": peer_ip_addresses,
+    }
+    return _digest(data)
+
+
+def outputs_present(device: Any) -> bool:
+    """Check that the outputs of a previous sync still exist.
+
+    The fingerprint only covers the inputs, so a device is not skipped when
+    its ``sonic_config`` local context or its exported file has been removed
+    in the meantime.
+    """
+    local_context = getattr(device, "local_context_data", None) or {}
+    if local_context.get("sonic_config") is None:
+        return False
+    return os.path.exists(get_export_filepath(device))
+
+
+class FingerprintStore:
+    """Redis-backed store of the last synced fingerprint per device.
+
+    All stored fingerprints are read with a single HGETALL when the store is
+    loaded. If Redis is not reachable the store stays empty and writes are
+    dropped, so every device is regenerated as before.
+    """
+
+    def __init__(self):
+        self._fingerprints: Dict[str, str] = {}
+        self._available = False
+
+    def load(self):
+        try:
+            stored = utils.redis.hgetall(FINGERPRINTS_KEY)
+        except Exception as e:
+            logger.warning(f"Could not load SONiC config fingerprints: {e}")
+            return
+        self._available = True
+        self._fingerprints = {
+            (key.decode() if isinstance(key, bytes) else key): (
+                value.decode() if isinstance(value, bytes) else value
+            )
+            for key, value in stored.items()
+        }
+        logger.debug(f"Loaded {len(self._fingerprints)} SONiC config fingerprints")
+
+    def get(self, device_name: str) -> Optional[str]:
+        return self._fingerprints.get(device_name)
+
+    def set(self, device_name: str, fingerprint: str):
+        if not self._available:
+            return
+        try:
+            utils.redis.hset(FINGERPRINTS_KEY, device_name, fingerprint)
+            self._fingerprints[device_name] = fingerprint
+        except Exception as e:
+            logger.warning(
+                f"Could not store SONiC config fingerprint for device {device_name}: {e}"
+            )
@@ -24,6 +24,12 @@ from .exporter import (
     export_firmware_link,
 )
 from .cache import clear_interface_cache, get_interface_cache_stats
+from .fingerprint import (
+    FingerprintStore,
+    compute_device_fingerprint,
+    compute_global_fingerprint,
+    outputs_present,
+)
 
 
 def _get_sonic_parameter(device, key):
@@ -39,23 +45,37 @@ def _get_sonic_parameter(device, key):
     return sonic_parameters.get(key)
 
 
-def sync_sonic(device_name=None, task_id=None, show_diff=True):
+def sync_sonic(
+    device_name=None, task_id=None, show_diff=True, force=False, device_names=None
+):
     """Sync SONiC configurations for eligible devices.
 
     Caches are always cleared and the task output is always finished, even
     when the sync exits early or a device fails. Failures are reported to the
     task layer via a non-zero rc.
 
+    Devices whose input fingerprint (see fingerprint.py) matches the one
+    stored by the last successful sync are skipped without regenerating or
+    diffing their configuration, unless ``force`` is set.
+
     Args:
         device_name (str, optional): Name of specific device to sync. If None, sync all eligible devices.
         task_id (str, optional): Task ID for output logging.
         show_diff (bool, optional): Whether to show diffs when changes are detected. Defaults to True.
+        force (bool, optional): Regenerate all devices even if their fingerprint is unchanged. Defaults to False.
+        device_names (list, optional): Names of the devices to sync, used by the incremental
+            sync triggered by NetBox webhooks. Devices that are not found or have no SONiC role
+            are ignored. Ignored if device_name is set.
 
     Returns:
         dict: Dictionary with device names as keys and their SONiC configs as values
     """
     if device_name:
         logger.info(f"Preparing SONIC configuration for device: {device_name}")
+    elif device_names:
+        logger.info(
+            f"Preparing SONIC configuration for devices: {', '.join(device_names)}"
+        )
     else:
         logger.info("Preparing SONIC configuration files")
 
@@ -76,6 +96,8 @@ def sync_sonic(device_name=None, task_id=None, show_diff=True):
     device_configs = {}
 
     rc = 0
+    skipped = 0
+    regenerated = 0
 
     try:
         logger.debug(f"Supported HWSKUs: {', '.join(SUPPORTED_HWSKUS)}")
@@ -108,6 +130,13 @@ def sync_sonic(device_name=None, task_id=None, show_diff=True):
                 logger.error(f"Error fetching device {device_name}: {e}")
                 rc = 1
                 return device_configs
+        elif device_names:
+            for device in utils.nb.dcim.devices.filter(name=list(device_names)):
+                if device.role and device.role.slug in DEFAULT_SONIC_ROLES:
+                    devices.append(device)
+                    logger.debug(
+                        f"Found device: {device.name} with role: {device.role.slug}"
+                    )
         else:
             # Get device query list from NETBOX_FILTER_CONDUCTOR_SONIC
             nb_device_query_list = get_nb_device_query_list_sonic()
@@ -125,15 +154,14 @@ def sync_sonic(device_name=None, task_id=None, show_diff=True):
         logger.info(f"Found {len(devices)} devices matching criteria")
 
         # Find interconnected spine/superspine groups for special AS calculation
-        # When processing a single device, we need to consider all spine/superspine devices
-        # to properly detect interconnected groups, not just the requested device
-        if device_name and devices:
-            # Check if the single device is a spine/superspine
-            target_device = devices[0]
-            if target_device.role and target_device.role.slug in [
-                "spine",
-                "superspine",
-            ]:
+        # When processing a subset of devices, we need to consider all spine/superspine devices
+        # to properly detect interconnected groups, not just the requested devices
+        if (device_name or device_names) and devices:
+            # Check if any requested device is a spine/superspine
+            if any(
+                device.role and device.role.slug in ["spine", "superspine"]
+                for device in devices
+            ):
                 # Fetch ALL spine/superspine devices to properly detect groups
                 logger.debug(
                     "Single spine/superspine device detected, fetching all spine/superspine devices for group detection"
@@ -171,6 +199,16 @@ def sync_sonic(device_name=None, task_id=None, show_diff=True):
                     f"Assigned AS {min_as} to {len(group)} devices in spine/superspine group"
                 )
 
+        # Load the fingerprints stored by previous runs and compute the part
+        # of the fingerprint shared by all devices once
+        fingerprint_store = FingerprintStore()
+        fingerprint_store.load()
+        try:
+            global_fingerprint = compute_global_fingerprint()
+        except Exception as e:
+            logger.warning(f"Could not compute global SONiC config fingerprint: {e}")
+            global_fingerprint = None
+
         # Generate SONIC configuration for each device
         for device in devices:
             # Read the per-device SONiC settings from the sonic_parameters
@@ -226,6 +264,37 @@ def sync_sonic(device_name=None, task_id=None, show_diff=True):
                 )
                 continue
 
+            fingerprint = None
+            if global_fingerprint:
+                try:
+                    fingerprint = compute_device_fingerprint(
+                        device,
+                        hwsku,
+                        global_fingerprint,
+                        device_as_mapping,
+                        config_version,
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Could not compute SONiC config fingerprint for device {device.name}: {e}"
+                    )
+
+            if (
+                not force
+                and fingerprint
+                and fingerprint_store.get(device.name) == fingerprint
+                and outputs_present(device)
+            ):
+                logger.info(
+                    f"Skipping device {device.name}: inputs unchanged since last sync"
+                )
+                if task_id:
+                    utils.push_task_output(
+                        task_id, f"Skipping unchanged device: {device.name}\n"
+                    )
+                skipped += 1
+                continue
+
             # A failing device must not abort the sync of the remaining
             # devices, but it has to surface in the task rc
             try:
@@ -272,6 +341,11 @@ def sync_sonic(device_name=None, task_id=None, show_diff=True):
                 logger.info(
                     f"Generated SONiC config for device {device.name} with {len(sonic_config.get('PORT', {}))} ports"
                 )
+
+                # Only remember the fingerprint once the outputs are in place
+                if fingerprint:
+                    fingerprint_store.set(device.name, fingerprint)
+                regenerated += 1
             except Exception as e:
                 logger.error(
                     f"Failed to sync SONiC configuration for device {device.name}: {e}"
@@ -279,6 +353,9 @@ def sync_sonic(device_name=None, task_id=None, show_diff=True):
                 rc = 1
 
         logger.info(f"Generated SONiC configurations for {len(device_configs)} devices")
+        logger.info(
+            f"Skipped {skipped} unchanged devices, regenerated {regenerated} devices"
+        )
 
         # Log cache statistics
         cache_stats = get_interface_cache_stats()
@@ -5,11 +5,12 @@
 The schemas in `_generated/` are produced offline from the SONiC YANG models
 in `files/sonic/yang_models/` by `tools/sonic_yang_to_pydantic.py`. This
 validator does not depend on libyang or sonic-yang-mgmt at runtime — only on
-pydantic.
+pydantic. Table models are built on first access, so a validation run only
+pays for the tables present in the checked configuration.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from pydantic import ValidationError as PydValidationError
 
@@ -89,6 +90,20 @@ def validate_config(config: Dict[str, Any]) -> ValidationResult:
     return ValidationResult(valid=not errors, errors=errors, warnings=warnings)
 
 
+def _group_constraints_by_source(
+    constraints: Iterable[LeafrefConstraint],
+) -> Dict[str, List[LeafrefConstraint]]:
+    """Group leafref constraints by their source table, keeping their order."""
+    grouped: Dict[str, List[LeafrefConstraint]] = {}
+    for constraint in constraints:
+        grouped.setdefault(constraint.source_table, []).append(constraint)
+    return grouped
+
+
+# Only depends on the generated constraints and is computed once
+_CONSTRAINTS_BY_SOURCE = _group_constraints_by_source(LEAFREFS)
+
+
 def _check_leafrefs(config: Dict[str, Any]) -> List[ValidationError]:
     """Verify every cross-table leafref reference resolves to an existing key.
 
@@ -102,80 +117,101 @@ def _check_leafrefs(config: Dict[str, Any]) -> List[ValidationError]:
     encoded only inside a `|`-separated row key, we can't safely split without
     YANG key metadata, so we only check explicit row-dict fields plus the
     ``source_is_simple_key`` shortcut where the row key alone is the value.
+
+    The legal values of the targets are indexed once per config and every
+    source table is walked a single time, checking all of its constraints
+    per row.
     """
     errors: List[ValidationError] = []
-    for constraint in LEAFREFS:
-        rows = config.get(constraint.source_table)
+    target_index = _TargetIndex(config)
+    for source_table, constraints in _CONSTRAINTS_BY_SOURCE.items():
+        rows = config.get(source_table)
         if not isinstance(rows, dict):
             continue
-        target_keysets = _collect_target_keysets(config, constraint)
         # If the config does not declare any of the target tables, the
         # references are unresolvable — flag them.
+        checks = [
+            (constraint, target_index.legal_values(constraint.targets))
+            for constraint in constraints
+        ]
         for row_key, row in rows.items():
-            for value in _iter_leafref_values(constraint, row_key, row):
-                if not _value_in_any_target(value, target_keysets):
+            row_is_dict = isinstance(row, dict)
+            for constraint, legal_values in checks:
+                if row_is_dict and constraint.source_field in row:
+                    raw = row[constraint.source_field]
+                elif constraint.source_is_simple_key and "|" not in row_key:
+                    # Single-key list: row key directly carries the leaf value.
+                    raw = row_key
+                else:
+                    continue
+
+                if isinstance(raw, str):
+                    if raw in legal_values:
+                        continue
+                    missing = [raw]
+                elif constraint.is_leaf_list and isinstance(raw, list):
+                    missing = [
+                        item
+                        for item in raw
+                        if isinstance(item, str) and item not in legal_values
+                    ]
+                else:
+                    continue
+
+                for value in missing:
                     errors.append(
                         ValidationError(
                             message=_format_missing_message(constraint, value),
                             path=f"{row_key}.{constraint.source_field}",
-                            table=constraint.source_table,
+                            table=source_table,
                         )
                     )
     return errors
 
 
-def _collect_target_keysets(
-    config: Dict[str, Any], constraint: LeafrefConstraint
-) -> List[set]:
-    """Return one set of legal values per target. ``target_field == "name"``
+class _TargetIndex:
+    """Legal leafref values of one config, indexed per (table, field).
+
+    Each target table and each referenced field is scanned at most once,
+    no matter how many constraints point at it. ``target_field == "name"``
     (the list key) is the common case and corresponds to row keys; for
-    non-key targets we also accept matching values inside the rows."""
-    keysets: List[set] = []
-    for target_table, target_field in constraint.targets:
-        rows = config.get(target_table)
-        keys: set = set()
-        if isinstance(rows, dict):
-            for k, v in rows.items():
-                keys.add(k)
-                if isinstance(v, dict):
-                    inner = v.get(target_field)
-                    if isinstance(inner, str):
-                        keys.add(inner)
-                    elif isinstance(inner, list):
-                        for item in inner:
-                            if isinstance(item, str):
-                                keys.add(item)
-        keysets.append(keys)
-    return keysets
-
-
-def _iter_leafref_values(
-    constraint: LeafrefConstraint, row_key: str, row: Any
-) -> Iterable[str]:
-    """Yield the values from one row that this constraint should validate."""
-    raw: Any = None
-    if isinstance(row, dict) and constraint.source_field in row:
-        raw = row[constraint.source_field]
-    elif constraint.source_is_simple_key and "|" not in row_key:
-        # Single-key list: row key directly carries the leaf value.
-        raw = row_key
-
-    if raw is None:
-        return
-    if constraint.is_leaf_list:
-        if isinstance(raw, list):
-            for item in raw:
-                if isinstance(item, str):
-                    yield item
-        elif isinstance(raw, str):
-            yield raw
-    else:
-        if isinstance(raw, str):
-            yield raw
-
-
-def _value_in_any_target(value: str, keysets: List[set]) -> bool:
-    return any(value in ks for ks in keysets)
+    non-key targets we also accept matching values inside the rows.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        self._config = config
+        self._keysets: Dict[Tuple[str, str], frozenset] = {}
+        self._legal_values: Dict[Tuple[Tuple[str, str], ...], frozenset] = {}
+
+    def _keyset(self, target_table: str, target_field: str) -> frozenset:
+        key = (target_table, target_field)
+        if key not in self._keysets:
+            rows = self._config.get(target_table)
+            keys: set = set()
+            if isinstance(rows, dict):
+                keys.update(rows)
+                for v in rows.values():
+                    if isinstance(v, dict):
+                        inner = v.get(target_field)
+                        if isinstance(inner, str):
+                            keys.add(inner)
+                        elif isinstance(inner, list):
+                            for item in inner:
+                                if isinstance(item, str):
+                                    keys.add(item)
+            self._keysets[key] = frozenset(keys)
+        return self._keysets[key]
+
+    def legal_values(self, targets: Tuple[Tuple[str, str], ...]) -> frozenset:
+        """Return the union of the keysets of all targets of a constraint."""
+        if targets not in self._legal_values:
+            if len(targets) == 1:
+                self._legal_values[targets] = self._keyset(*targets[0])
+            else:
+                self._legal_values[targets] = frozenset().union(
+                    *(self._keyset(*target) for target in targets)
+                )
+        return self._legal_values[targets]
 
 
 def _format_missing_message(constraint: LeafrefConstraint, value: str) -> str:
@@ -594,79 +594,37 @@ def is_task_locked():
 def check_ansible_facts(max_age=None):
     """Check if Ansible facts exist in Redis and are not stale.
 
-    Scans Redis for ansible_facts* keys and checks the
-    ansible_date_time.epoch field to determine freshness.
+    Uses the sorted set of fact gather times maintained next to the facts
+    (see osism.utils.facts), so the facts themselves are not read.
 
     Args:
         max_age: Maximum age in seconds (default: settings.FACTS_MAX_AGE)
     """
-    import json
+    from osism.utils import facts
 
     if max_age is None:
         max_age = settings.FACTS_MAX_AGE
 
     try:
-        r = _init_redis()
-
-        # Find all ansible_facts keys
-        keys = []
-        cursor = 0
-        while True:
-            cursor, batch = r.scan(cursor, match="ansible_facts*", count=100)
-            keys.extend(batch)
-            if cursor == 0:
-                break
+        stale_hosts = facts.get_stale_hosts(_init_redis(), max_age)
     except Exception as e:
         logger.warning(f"Could not check Ansible facts freshness: {e}")
         return
 
-    if not keys:
+    if stale_hosts is None:
         logger.warning(
             "No Ansible facts found in Redis cache. "
             "Run 'osism sync facts' to gather facts."
         )
         return
 
-    now = time.time()
-    stale_hosts = []
-
-    for key in keys:
-        data = None
-        try:
-            key_str = key.decode() if isinstance(key, bytes) else key
-            hostname = key_str.replace("ansible_facts", "", 1)
-
-            # Skip localhost and friends: their facts are never refreshed via
-            # 'osism sync facts', so reporting them as stale is misleading.
-            if hostname in LOCAL_FACT_HOSTS:
-                continue
-
-            data = r.get(key)
-            if not data:
-                continue
-            facts = json.loads(data)
-            date_time = facts.get("ansible_date_time", {})
-            epoch = date_time.get("epoch")
-            if epoch is None:
-                logger.debug(
-                    f"Host '{hostname}': facts missing ansible_date_time.epoch"
-                )
-                continue
-            age = now - float(epoch)
-            if age > max_age:
-                stale_hosts.append((hostname, int(age)))
-        except (json.JSONDecodeError, ValueError, TypeError):
-            truncated_value = data
-            if isinstance(truncated_value, (bytes, str)):
-                truncated_value = truncated_value[:200]
-            # loguru formats with str.format and knows no exc_info kwarg, so
-            # printf-style placeholders would be logged verbatim and the
-            # traceback dropped.
-            logger.opt(exception=True).debug(
-                f"Skipping malformed ansible_facts entry for key {key!r}: "
-                f"{truncated_value!r}"
-            )
-            continue
+    # Skip localhost and friends: their facts are never refreshed via
+    # 'osism sync facts', so reporting them as stale is misleading.
+    stale_hosts = [
+        (hostname, age)
+        for hostname, age in stale_hosts
+        if hostname not in LOCAL_FACT_HOSTS
+    ]
 
     if stale_hosts:
         logger.warning(
@@ -0,0 +1,318 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Run workflows of API actions on many OpenStack resources at once.
+
+A workflow is a list of steps for one resource, e.g. evacuate a server and
+start it again. Every step issues an API call and is done once the polled
+resource satisfies the step. run_workflows runs the workflows of up to
+concurrency resources at a time and polls all of them with one call per
+interval; the interval starts at interval seconds and doubles up to
+max_interval while nothing changes, so fast steps finish fast and long
+ones do not hammer the API. Resources can be grouped, e.g. servers by
+their compute node, to also limit the workflows running per group, and
+failed steps can be retried after a growing delay.
+
+run_actions is for actions that are only submitted, e.g. the provision
+state changes of baremetal nodes: it calls an action per resource in a
+pool of threads and logs how many resources reached which outcome.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from loguru import logger
+
+
+@dataclass
+class Step:
+    """One API call of a workflow and the condition that completes it.
+
+    done and failed get the polled resource, failed returns the reason the
+    step failed or None.
+    """
+
+    name: str
+    action: Callable[[str], Any]
+    done: Callable[[Any], bool]
+    failed: Callable[[Any], Optional[str]] = lambda resource: None
+
+
+@dataclass
+class WorkflowResult:
+    id: str
+    name: str
+    # Seconds each finished step took, in the order of the steps
+    durations: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+    # Failed attempts of steps that were retried
+    retries: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class _Running:
+    steps: Sequence[Step]
+    result: WorkflowResult
+    index: int = 0
+    started: float = 0.0
+    # Set while a failed step waits to be retried
+    retry_at: Optional[float] = None
+
+
+def status_failed(*statuses: str) -> Callable[[Any], Optional[str]]:
+    """Return a Step.failed that fails for the given resource statuses."""
+
+    def failed(resource) -> Optional[str]:
+        status = getattr(resource, "status", None)
+        return f"status {status}" if status in statuses else None
+
+    return failed
+
+
+class RateLimiter:
+    """Allow at most rate calls per second, None for no limit."""
+
+    def __init__(self, rate: Optional[float]):
+        self.interval = 1 / rate if rate else 0.0
+        self.next_call = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        # Reserve the next slot under the lock, sleep outside of it
+        with self.lock:
+            now = time.monotonic()
+            call_at = max(now, self.next_call)
+            self.next_call = call_at + self.interval
+        if call_at > now:
+            time.sleep(call_at - now)
+
+
+def run_workflows(
+    workflows: Dict[str, Sequence[Step]],
+    poll: Callable[[List[str]], Dict[str, Any]],
+    names: Optional[Dict[str, str]] = None,
+    concurrency: int = 10,
+    timeout: float = 600,
+    interval: float = 1.0,
+    max_interval: float = 10.0,
+    rate: Optional[float] = None,
+    groups: Optional[Dict[str, str]] = None,
+    group_concurrency: Optional[int] = None,
+    retries: int = 0,
+    retry_delay: float = 30.0,
+) -> List[WorkflowResult]:
+    """Run the steps of the workflows, returns the results in input order.
+
+    workflows maps the resource IDs to their steps, in the order they are
+    started. poll gets the IDs of the resources with a running step and
+    returns the current resources by ID, resources it does not return are
+    considered unchanged. rate limits the API calls of the steps per
+    second. With groups, mapping resource IDs to a group, at most
+    group_concurrency workflows of a group run at a time.
+
+    A step failing, raising or taking longer than timeout seconds is
+    started again up to retries times, after retry_delay seconds, doubled
+    for every further attempt, and ends its workflow after that.
+    """
+    names = names or {}
+    groups = groups or {}
+    attempts: Dict[str, int] = {}
+    results = {
+        resource_id: WorkflowResult(resource_id, names.get(resource_id, ""))
+        for resource_id in workflows
+    }
+    waiting = [resource_id for resource_id, steps in workflows.items() if steps]
+    running: Dict[str, _Running] = {}
+    per_group: Dict[Optional[str], int] = {}
+    limiter = RateLimiter(rate)
+
+    def next_waiting() -> Optional[str]:
+        for position, resource_id in enumerate(waiting):
+            group = groups.get(resource_id)
+            if (
+                group is None
+                or group_concurrency is None
+                or per_group.get(group, 0) < max(1, group_concurrency)
+            ):
+                return waiting.pop(position)
+        return None
+
+    def start_step(resource_id: str) -> None:
+        workflow = running[resource_id]
+        step = workflow.steps[workflow.index]
+        limiter.wait()
+        workflow.started = time.monotonic()
+        workflow.retry_at = None
+        try:
+            step.action(resource_id)
+        except Exception as exc:
+            fail(resource_id, f"{step.name} failed: {exc}")
+
+    def fail(resource_id: str, error: str) -> None:
+        workflow = running[resource_id]
+        attempt = attempts.get(resource_id, 0)
+        if attempt >= retries:
+            finish(resource_id, error)
+            return
+        attempts[resource_id] = attempt + 1
+        workflow.result.retries += 1
+        delay = retry_delay * 2**attempt
+        workflow.retry_at = time.monotonic() + delay
+        name = workflow.result.name or resource_id
+        logger.warning(f"{name}: {error}, retrying in {delay:.0f}s")
+
+    def finish(resource_id: str, error: Optional[str] = None) -> None:
+        workflow = running.pop(resource_id)
+        group = groups.get(resource_id)
+        per_group[group] = per_group.get(group, 0) - 1
+        workflow.result.error = error
+        name = workflow.result.name or resource_id
+        if error:
+            logger.error(f"{name}: {error}")
+        else:
+            logger.info(f"{name}: done")
+
+    delay = interval
+    while waiting or running:
+        while waiting and len(running) < max(1, concurrency):
+            resource_id = next_waiting()
+            if resource_id is None:
+                break
+            group = groups.get(resource_id)
+            per_group[group] = per_group.get(group, 0) + 1
+            running[resource_id] = _Running(
+                workflows[resource_id], results[resource_id]
+            )
+            start_step(resource_id)
+        if not running:
+            continue
+
+        time.sleep(delay)
+        polled = [
+            resource_id
+            for resource_id, workflow in running.items()
+            if workflow.retry_at is None
+        ]
+        try:
+            resources = poll(polled) if polled else {}
+        except Exception as exc:
+            logger.warning(f"Polling failed, retrying: {exc}")
+            resources = {}
+
+        changed = False
+        now = time.monotonic()
+        for resource_id in list(running):
+            workflow = running[resource_id]
+            step = workflow.steps[workflow.index]
+            if workflow.retry_at is not None:
+                if now >= workflow.retry_at:
+                    changed = True
+                    start_step(resource_id)
+                continue
+            resource = resources.get(resource_id)
+            if resource is not None and step.done(resource):
+                workflow.result.durations[step.name] = now - workflow.started
+                workflow.index += 1
+                changed = True
+                if workflow.index == len(workflow.steps):
+                    finish(resource_id)
+                else:
+                    start_step(resource_id)
+                continue
+            reason = step.failed(resource) if resource is not None else None
+            if reason:
+                changed = True
+                fail(resource_id, f"{step.name} failed: {reason}")
+            elif now - workflow.started > timeout:
+                changed = True
+                fail(resource_id, f"{step.name} timed out after {timeout}s")
+        # Back off while nothing happens, poll quickly again once it does
+        delay = interval if changed else min(delay * 2, max_interval)
+
+    return [results[resource_id] for resource_id in workflows]
+
+
+# Outcome of run_actions for resources whose action failed
+FAILED = "failed"
+
+
+@dataclass
+class ActionResult:
+    id: str
+    name: str
+    outcome: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.outcome != FAILED
+
+
+def _outcomes(results: Sequence[ActionResult]) -> str:
+    counts: Dict[str, int] = {}
+    for result in results:
+        if result.outcome is not None:
+            counts[result.outcome] = counts.get(result.outcome, 0) + 1
+    return ", ".join(f"{outcome}: {count}" for outcome, count in sorted(counts.items()))
+
+
+def run_actions(
+    resources: Dict[str, Any],
+    action: Callable[[Any], str],
+    names: Optional[Dict[str, str]] = None,
+    concurrency: int = 10,
+    rate: Optional[float] = None,
+    progress_interval: float = 10.0,
+) -> List[ActionResult]:
+    """Call action for the resources in a pool of threads.
+
+    resources maps the resource IDs to the resources passed to action,
+    action returns the outcome for the resource, e.g. the requested
+    provision state, or FAILED. An exception is logged and counts as
+    FAILED. rate limits the actions started per second. Every
+    progress_interval seconds the outcomes so far are logged.
+
+    Returns the results in input order.
+    """
+    names = names or {}
+    results = {
+        resource_id: ActionResult(resource_id, names.get(resource_id, ""))
+        for resource_id in resources
+    }
+    limiter = RateLimiter(rate)
+    started = time.monotonic()
+
+    def run(resource_id: str) -> None:
+        result = results[resource_id]
+        limiter.wait()
+        try:
+            result.outcome = action(resources[resource_id])
+        except Exception as exc:
+            result.outcome = FAILED
+            result.error = str(exc)
+            logger.error(f"{result.name or resource_id}: {exc}")
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        pending = {executor.submit(run, resource_id) for resource_id in resources}
+        while pending:
+            _, pending = wait(pending, timeout=progress_interval)
+            if pending:
+                logger.info(
+                    f"{len(resources) - len(pending)} of {len(resources)} done "
+                    f"({_outcomes(list(results.values()))})"
+                )
+
+    if resources:
+        logger.info(
+            f"{len(resources)} done in {time.monotonic() - started:.1f}s "
+            f"({_outcomes(list(results.values()))})"
+        )
+    return [results[resource_id] for resource_id in resources]
@@ -0,0 +1,325 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Access to the Ansible facts cached in Redis.
+
+Ansible's redis fact cache stores the facts of every host as JSON under
+``ansible_facts<host>`` and adds the host to a sorted set (its
+``keyset_name``, ``FACTS_INDEX_KEY``) scored with the time the facts were
+written. That sorted set is the freshness index: the hosts with old facts
+are one ZRANGEBYSCORE away and no facts have to be read for it. When the
+index is empty, e.g. because the facts were written before it existed, it
+is rebuilt once from a SCAN of the fact keys, scored with
+``ansible_date_time.epoch``.
+
+With ``FACTS_STORAGE=compressed`` the facts are read through a compact copy
+next to them, a hash ``osism_facts<host>`` holding the compressed facts and
+the facts named in ``FACTS_HOT_KEYS`` as separate JSON fields. A hot fact is
+then one HMGET instead of reading and decoding all facts. The copy is kept
+in addition to the facts Ansible writes, so it costs memory rather than
+saving it, and decompressing makes reading all or other facts slower. The
+copy records the index score of the facts it was built from. compact_facts
+rebuilds the outdated copies after the facts were gathered, until then the
+facts Ansible wrote are read. Reading never writes.
+"""
+
+import json
+import time
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from osism import settings
+
+try:
+    from compression import zstd
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    try:
+        from backports import zstd
+
+        ZSTD_AVAILABLE = True
+    except ImportError:
+        ZSTD_AVAILABLE = False
+
+FACTS_KEY_PREFIX = "ansible_facts"
+COMPACT_KEY_PREFIX = "osism_facts"
+
+# Number of fact keys read with one MGET
+MGET_BATCH_SIZE = 500
+
+# Compact copies not refreshed by compact_facts for a day expire, e.g. the
+# ones of removed hosts
+COMPACT_TTL = 86400
+
+# Fields of the compact copy besides the hot facts, top-level facts never
+# start with an underscore
+_BLOB_FIELD = "_facts"
+_WRITTEN_FIELD = "_written"
+
+
+def facts_key(host: str) -> str:
+    return f"{FACTS_KEY_PREFIX}{host}"
+
+
+def decode(value: Any) -> str:
+    """Return a value read from Redis as str."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _mget(redis, keys: List[str]) -> List[Any]:
+    """Read the keys with MGETs of MGET_BATCH_SIZE keys in one pipeline."""
+    if not keys:
+        return []
+    pipeline = redis.pipeline(transaction=False)
+    for start in range(0, len(keys), MGET_BATCH_SIZE):
+        pipeline.mget(keys[start : start + MGET_BATCH_SIZE])
+    return [value for batch in pipeline.execute() for value in batch]
+
+
+def get_facts(redis, hosts: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Return the cached facts of the given hosts.
+
+    Hosts without facts or with facts that cannot be decoded map to None.
+    """
+    hosts = list(hosts)
+    result: Dict[str, Optional[Dict[str, Any]]] = {}
+    for host, data in zip(hosts, _mget(redis, [facts_key(h) for h in hosts])):
+        facts = None
+        if data:
+            try:
+                facts = json.loads(data)
+            except (json.JSONDecodeError, TypeError, ValueError):
+                logger.debug(f"Skipping malformed ansible_facts entry for {host}")
+        result[host] = facts if isinstance(facts, dict) else None
+    return result
+
+
+def _facts_epoch(host: str, data: Any) -> Optional[float]:
+    try:
+        facts = json.loads(data)
+        epoch = facts.get("ansible_date_time", {}).get("epoch")
+        if epoch is None:
+            logger.debug(f"Host '{host}': facts missing ansible_date_time.epoch")
+            return None
+        return float(epoch)
+    except (json.JSONDecodeError, ValueError, TypeError, AttributeError):
+        truncated_value = data
+        if isinstance(truncated_value, (bytes, str)):
+            truncated_value = truncated_value[:200]
+        logger.opt(exception=True).debug(
+            f"Skipping malformed ansible_facts entry for key "
+            f"{facts_key(host)!r}: {truncated_value!r}"
+        )
+        return None
+
+
+def index_facts(redis, epochs: Dict[str, float]) -> None:
+    """Record when the facts of the given hosts were gathered."""
+    if epochs:
+        redis.zadd(settings.FACTS_INDEX_KEY, epochs)
+
+
+def rebuild_facts_index(redis) -> Tuple[int, Dict[str, float]]:
+    """Index the gather time of all cached facts.
+
+    Returns the number of fact keys found and the gather time per host of
+    the facts that carry one.
+    """
+    keys: List[str] = []
+    cursor = 0
+    while True:
+        cursor, batch = redis.scan(cursor, match=f"{FACTS_KEY_PREFIX}*", count=100)
+        keys.extend(decode(key) for key in batch)
+        if cursor == 0:
+            break
+
+    epochs: Dict[str, float] = {}
+    for key, data in zip(keys, _mget(redis, keys)):
+        host = key[len(FACTS_KEY_PREFIX) :]
+        if not data:
+            continue
+        epoch = _facts_epoch(host, data)
+        if epoch is not None:
+            epochs[host] = epoch
+
+    index_facts(redis, epochs)
+    logger.debug(f"Indexed the facts of {len(epochs)}/{len(keys)} host(s)")
+    return len(keys), epochs
+
+
+def get_stale_hosts(
+    redis, max_age: float, now: Optional[float] = None
+) -> Optional[List[Tuple[str, int]]]:
+    """Return (host, age in seconds) of all hosts with facts older than max_age.
+
+    Returns None if there are no cached facts at all.
+    """
+    if now is None:
+        now = time.time()
+
+    if redis.zcard(settings.FACTS_INDEX_KEY) == 0:
+        found, epochs = rebuild_facts_index(redis)
+        if not found:
+            return None
+        return [
+            (host, int(now - epoch))
+            for host, epoch in epochs.items()
+            if now - epoch > max_age
+        ]
+
+    stale = redis.zrangebyscore(
+        settings.FACTS_INDEX_KEY, "-inf", f"({now - max_age}", withscores=True
+    )
+    return [(decode(host), int(now - epoch)) for host, epoch in stale]
+
+
+def remove_from_index(redis, hosts: Iterable[str]) -> None:
+    """Drop hosts whose facts were removed from the index."""
+    hosts = list(hosts)
+    if hosts:
+        redis.zrem(settings.FACTS_INDEX_KEY, *hosts)
+
+
+def clear_index(redis) -> None:
+    redis.delete(settings.FACTS_INDEX_KEY)
+
+
+def compact_key(host: str) -> str:
+    return f"{COMPACT_KEY_PREFIX}{host}"
+
+
+def _compress(data: bytes) -> bytes:
+    # The first byte tells how the facts were compressed
+    if settings.FACTS_COMPRESSION == "zstd" and ZSTD_AVAILABLE:
+        return b"z" + zstd.compress(data)
+    return b"d" + zlib.compress(data)
+
+
+def _decompress(blob: bytes) -> bytes:
+    if blob[:1] == b"z":
+        if not ZSTD_AVAILABLE:
+            raise ValueError("Facts are compressed with zstd, zstd is not available")
+        return zstd.decompress(blob[1:])
+    return zlib.decompress(blob[1:])
+
+
+def _select(facts: Dict[str, Any], names: Optional[Sequence[str]]) -> Dict[str, Any]:
+    if names is None:
+        return facts
+    return {name: facts[name] for name in names if name in facts}
+
+
+def store_compact_facts(
+    redis, host: str, data: Any, facts: Dict[str, Any], written: float
+) -> None:
+    """Write the compact copy of the facts of a host.
+
+    data is the JSON the facts were decoded from, written the index score
+    of the facts.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    mapping = {_BLOB_FIELD: _compress(data), _WRITTEN_FIELD: repr(float(written))}
+    for name in settings.FACTS_HOT_KEYS:
+        if name in facts:
+            mapping[name] = json.dumps(facts[name])
+
+    # One transaction, readers never see a half written copy
+    key = compact_key(host)
+    pipeline = redis.pipeline()
+    pipeline.delete(key)
+    pipeline.hset(key, mapping=mapping)
+    pipeline.expire(key, COMPACT_TTL)
+    pipeline.execute()
+
+
+def _load_plain(
+    redis, host: str, names: Optional[Sequence[str]]
+) -> Optional[Dict[str, Any]]:
+    data = redis.get(facts_key(host))
+    if not data:
+        return None
+    return _select(json.loads(data), names)
+
+
+def _load_compact(
+    redis, host: str, names: Optional[Sequence[str]]
+) -> Optional[Dict[str, Any]]:
+    hot = names is not None and set(names) <= set(settings.FACTS_HOT_KEYS)
+    fields = [_WRITTEN_FIELD] + (list(names) if hot else [_BLOB_FIELD])
+
+    pipeline = redis.pipeline(transaction=False)
+    pipeline.zscore(settings.FACTS_INDEX_KEY, host)
+    pipeline.hmget(compact_key(host), fields)
+    written, values = pipeline.execute()
+
+    if written is None or values[0] is None or float(values[0]) != written:
+        return _load_plain(redis, host, names)
+
+    if hot and None not in values[1:]:
+        return {name: json.loads(value) for name, value in zip(names, values[1:])}
+    # A missing hot fact was either not gathered or FACTS_HOT_KEYS changed
+    # since the copy was written, the compressed facts tell
+    blob = redis.hget(compact_key(host), _BLOB_FIELD) if hot else values[1]
+    if blob is None:
+        return _load_plain(redis, host, names)
+    return _select(json.loads(_decompress(blob)), names)
+
+
+def load_facts(
+    redis, host: str, names: Optional[Sequence[str]] = None
+) -> Optional[Dict[str, Any]]:
+    """Return the cached facts of a host, only the given facts if names is set.
+
+    Returns None if there are no facts for the host, raises
+    json.JSONDecodeError if they cannot be decoded.
+    """
+    if settings.FACTS_STORAGE == "compressed":
+        return _load_compact(redis, host, names)
+    return _load_plain(redis, host, names)
+
+
+def compact_facts(redis) -> int:
+    """Rebuild the outdated compact copies of all indexed hosts.
+
+    The copies that are up to date are kept from expiring. Returns the
+    number of copies written.
+    """
+    indexed = [
+        (decode(host), score)
+        for host, score in redis.zrange(
+            settings.FACTS_INDEX_KEY, 0, -1, withscores=True
+        )
+    ]
+    pipeline = redis.pipeline(transaction=False)
+    for host, _ in indexed:
+        pipeline.hget(compact_key(host), _WRITTEN_FIELD)
+    copies = pipeline.execute()
+
+    outdated = []
+    pipeline = redis.pipeline(transaction=False)
+    for (host, score), written in zip(indexed, copies):
+        if written is None or float(written) != score:
+            outdated.append((host, score))
+        else:
+            pipeline.expire(compact_key(host), COMPACT_TTL)
+    pipeline.execute()
+
+    count = 0
+    for (host, score), data in zip(
+        outdated, _mget(redis, [facts_key(host) for host, _ in outdated])
+    ):
+        if not data:
+            continue
+        try:
+            facts = json.loads(data)
+        except (json.JSONDecodeError, TypeError, ValueError):
+            logger.debug(f"Skipping malformed ansible_facts entry for {host}")
+            continue
+        if isinstance(facts, dict):
+            store_compact_facts(redis, host, data, facts, score)
+            count += 1
+    logger.debug(f"Compacted the facts of {count} host(s)")
+    return count
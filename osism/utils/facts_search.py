@@ -0,0 +1,216 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Search the cached Ansible facts of all hosts by value.
+
+For every fact path in ``FACTS_SEARCH_PATHS`` an inverted index maps the
+values found under the path to the hosts having them, so "which hosts run
+kernel X" is a single SMEMBERS. A path is a dot separated list of fact
+names, a name may be a shell-style wildcard: ``ansible_*.module`` are the
+drivers of all interfaces. Lists on the way are searched element by element.
+
+The index is kept in these keys:
+
+* ``facts_search:<path>:<value>``: set of the hosts with the value
+* ``facts_search_values:<path>``: set of the values of the path
+* ``facts_search_host:<host>``: hash of path to the JSON list of values of
+  the host, to remove them again
+* ``facts_search_indexed``: sorted set of the indexed hosts, scored like
+  the fact index (``FACTS_INDEX_KEY``) when they were indexed
+* ``facts_search_paths``: the paths the index was built for
+
+update_search_index compares the fact index with ``facts_search_indexed``
+and only indexes the hosts whose facts changed since. It reads both sorted
+sets completely and runs after the facts were gathered, readers only check
+search_index_outdated, a few commands whatever the number of hosts.
+"""
+
+import fnmatch
+import json
+from typing import Any, Dict, List, Set
+
+from loguru import logger
+
+from osism import settings
+from osism.utils.facts import decode, get_facts, rebuild_facts_index
+
+SEARCH_KEY_PREFIX = "facts_search"
+_INDEXED_KEY = f"{SEARCH_KEY_PREFIX}_indexed"
+_PATHS_KEY = f"{SEARCH_KEY_PREFIX}_paths"
+
+
+def _value_key(path: str, value: str) -> str:
+    return f"{SEARCH_KEY_PREFIX}:{path}:{value}"
+
+
+def _values_key(path: str) -> str:
+    return f"{SEARCH_KEY_PREFIX}_values:{path}"
+
+
+def _host_key(host: str) -> str:
+    return f"{SEARCH_KEY_PREFIX}_host:{host}"
+
+
+def fact_values(data: Any, path: str) -> Set[str]:
+    """Return the values found under the fact path.
+
+    Strings are used as they are, other scalars as JSON (``true``, ``1500``),
+    dictionaries are not values.
+    """
+    return _fact_values(data, path.split("."))
+
+
+def _fact_values(data: Any, segments: List[str]) -> Set[str]:
+    if isinstance(data, list):
+        return set().union(*(_fact_values(item, segments) for item in data))
+    if not segments:
+        if isinstance(data, str):
+            return {data}
+        if isinstance(data, (bool, int, float)):
+            return {json.dumps(data)}
+        return set()
+    if not isinstance(data, dict):
+        return set()
+
+    segment, rest = segments[0], segments[1:]
+    if any(char in segment for char in "*?["):
+        names = fnmatch.filter(data, segment)
+    else:
+        names = [segment] if segment in data else []
+    return set().union(*(_fact_values(data[name], rest) for name in names))
+
+
+def clear_search_index(redis) -> None:
+    """Remove the whole search index."""
+    keys: List[Any] = [_INDEXED_KEY, _PATHS_KEY]
+    for pattern in (f"{SEARCH_KEY_PREFIX}:*", f"{SEARCH_KEY_PREFIX}_*"):
+        cursor = 0
+        while True:
+            cursor, batch = redis.scan(cursor, match=pattern, count=1000)
+            keys.extend(batch)
+            if cursor == 0:
+                break
+    for start in range(0, len(keys), 1000):
+        redis.delete(*keys[start : start + 1000])
+
+
+def search_index_outdated(redis) -> bool:
+    """Return whether the facts changed since the search index was updated.
+
+    Compares the configured paths and the number of hosts and the newest
+    entry of the fact index and of the indexed hosts. Facts written again
+    get a newer score and removed hosts change the number of hosts.
+    """
+    pipeline = redis.pipeline(transaction=False)
+    pipeline.get(_PATHS_KEY)
+    pipeline.zcard(settings.FACTS_INDEX_KEY)
+    pipeline.zrange(settings.FACTS_INDEX_KEY, -1, -1, withscores=True)
+    pipeline.zcard(_INDEXED_KEY)
+    pipeline.zrange(_INDEXED_KEY, -1, -1, withscores=True)
+    paths, count, newest, indexed_count, indexed_newest = pipeline.execute()
+    return (
+        decode(paths) != json.dumps(settings.FACTS_SEARCH_PATHS)
+        or count != indexed_count
+        or newest != indexed_newest
+    )
+
+
+def update_search_index(redis) -> int:
+    """Index the hosts whose facts changed since they were last indexed.
+
+    Returns the number of hosts (re)indexed or removed from the index.
+    """
+    paths = settings.FACTS_SEARCH_PATHS
+    configured = json.dumps(paths)
+    if decode(redis.get(_PATHS_KEY)) != configured:
+        logger.debug("Fact search paths changed, rebuilding the fact search index")
+        clear_search_index(redis)
+        redis.set(_PATHS_KEY, configured)
+
+    if redis.zcard(settings.FACTS_INDEX_KEY) == 0:
+        rebuild_facts_index(redis)
+    current = {
+        decode(host): score
+        for host, score in redis.zrange(
+            settings.FACTS_INDEX_KEY, 0, -1, withscores=True
+        )
+    }
+    indexed = {
+        decode(host): score
+        for host, score in redis.zrange(_INDEXED_KEY, 0, -1, withscores=True)
+    }
+    removed = [host for host in indexed if host not in current]
+    changed = [host for host, score in current.items() if indexed.get(host) != score]
+    if not removed and not changed:
+        return 0
+
+    pipeline = redis.pipeline(transaction=False)
+    for host in removed + changed:
+        pipeline.hgetall(_host_key(host))
+    previous = dict(zip(removed + changed, pipeline.execute()))
+    facts = get_facts(redis, changed)
+
+    pipeline = redis.pipeline()
+    for host, entries in previous.items():
+        for path, values in entries.items():
+            for value in json.loads(values):
+                pipeline.srem(_value_key(decode(path), value), host)
+        pipeline.delete(_host_key(host))
+    for host in changed:
+        host_facts = facts.get(host)
+        if host_facts is None:
+            continue
+        entries = {}
+        for path in paths:
+            values = sorted(fact_values(host_facts, path))
+            if not values:
+                continue
+            entries[path] = json.dumps(values)
+            pipeline.sadd(_values_key(path), *values)
+            for value in values:
+                pipeline.sadd(_value_key(path, value), host)
+        if entries:
+            pipeline.hset(_host_key(host), mapping=entries)
+    if removed:
+        pipeline.zrem(_INDEXED_KEY, *removed)
+    if changed:
+        pipeline.zadd(_INDEXED_KEY, {host: current[host] for host in changed})
+    pipeline.execute()
+
+    logger.debug(
+        f"Updated the fact search index for {len(changed)} host(s), "
+        f"removed {len(removed)} host(s)"
+    )
+    return len(removed) + len(changed)
+
+
+def _check_path(path: str) -> None:
+    if path not in settings.FACTS_SEARCH_PATHS:
+        raise ValueError(f"Fact path '{path}' is not indexed")
+
+
+def search_facts(redis, path: str, value: str) -> List[str]:
+    """Return the hosts with the value under the fact path, sorted by name.
+
+    Raises ValueError if the path is not in FACTS_SEARCH_PATHS.
+    """
+    _check_path(path)
+    return sorted(decode(host) for host in redis.smembers(_value_key(path, value)))
+
+
+def count_fact_values(redis, path: str) -> Dict[str, int]:
+    """Return the values of the fact path and the number of hosts having them.
+
+    Raises ValueError if the path is not in FACTS_SEARCH_PATHS.
+    """
+    _check_path(path)
+    values = sorted(decode(value) for value in redis.smembers(_values_key(path)))
+    pipeline = redis.pipeline(transaction=False)
+    for value in values:
+        pipeline.scard(_value_key(path, value))
+    counts = dict(zip(values, pipeline.execute()))
+
+    # Values whose hosts are all gone
+    unused = [value for value, count in counts.items() if not count]
+    if unused:
+        redis.srem(_values_key(path), *unused)
+    return {value: count for value, count in counts.items() if count}
@@ -0,0 +1,252 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Ping many hosts at once.
+
+ping_hosts sends the echo requests to all hosts from one unprivileged ICMP
+socket (SOCK_DGRAM, allowed by net.ipv4.ping_group_range, which Docker
+sets for its containers) and matches the replies by address and sequence
+number, so a thousand hosts need neither a thousand threads nor a thousand
+ping processes. Where the kernel does not allow these sockets the ping
+command is run instead, at most concurrency at a time, from asyncio.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+import math
+import re
+import select
+import socket
+import struct
+import time
+from typing import Dict, Iterable, List, Optional
+
+from loguru import logger
+
+# ping commands running at the same time without an ICMP socket
+DEFAULT_CONCURRENCY = 64
+
+_ICMP_ECHO_REQUEST = 8
+_ICMP_ECHO_REPLY = 0
+_PAYLOAD = b"osism-ping".ljust(56, b"\0")
+# Echo requests sent between reading the replies
+_RECEIVE_EVERY = 32
+
+_TRANSMITTED = re.compile(r"(\d+) packets transmitted, (\d+) (?:packets )?received")
+_RTT = re.compile(r"= ([\d.]+)/([\d.]+)/([\d.]+)(?:/([\d.]+))? ms")
+
+
+@dataclass
+class PingResult:
+    host: str
+    sent: int = 0
+    received: int = 0
+    # Round-trip times in milliseconds
+    rtt_min: Optional[float] = None
+    rtt_avg: Optional[float] = None
+    rtt_max: Optional[float] = None
+    rtt_mdev: Optional[float] = None
+    error: Optional[str] = None
+    rtts: List[float] = field(default_factory=list, repr=False)
+
+    @property
+    def loss(self) -> Optional[float]:
+        """Lost echo requests in percent, None if none were sent."""
+        if not self.sent:
+            return None
+        return 100.0 * (self.sent - self.received) / self.sent
+
+    def summarize(self) -> None:
+        """Compute the RTT statistics from rtts, like ping does."""
+        if not self.rtts:
+            return
+        self.received = len(self.rtts)
+        self.rtt_min = min(self.rtts)
+        self.rtt_max = max(self.rtts)
+        self.rtt_avg = sum(self.rtts) / len(self.rtts)
+        squares = sum(rtt * rtt for rtt in self.rtts) / len(self.rtts)
+        self.rtt_mdev = math.sqrt(max(0.0, squares - self.rtt_avg**2))
+
+
+def parse_ping_output(host: str, output: str) -> PingResult:
+    """Return the result of a host from the output of the ping command."""
+    result = PingResult(host)
+    transmitted = _TRANSMITTED.search(output)
+    if transmitted:
+        result.sent = int(transmitted.group(1))
+        result.received = int(transmitted.group(2))
+    rtt = _RTT.search(output)
+    if rtt:
+        result.rtt_min, result.rtt_avg, result.rtt_max = (
+            float(value) for value in rtt.groups()[:3]
+        )
+        if rtt.group(4) is not None:
+            result.rtt_mdev = float(rtt.group(4))
+    return result
+
+
+def icmp_socket() -> Optional[socket.socket]:
+    """Return an unprivileged ICMP socket, None if the kernel refuses it."""
+    try:
+        return socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+    except OSError:
+        return None
+
+
+def _ping_socket(
+    sock: socket.socket,
+    hosts: List[str],
+    count: int,
+    interval: float,
+    timeout: float,
+) -> Dict[str, PingResult]:
+    results = {host: PingResult(host) for host in hosts}
+    # Hosts by address, a reply counts for every host with the address
+    addresses: Dict[str, List[str]] = {}
+    for host in hosts:
+        try:
+            address = socket.gethostbyname(host)
+        except (OSError, UnicodeError) as exc:
+            results[host].error = str(exc)
+            continue
+        addresses.setdefault(address, []).append(host)
+    if not addresses:
+        return results
+
+    sock.setblocking(False)
+    # Send time of the echo requests without a reply by address and sequence
+    pending: Dict[tuple, float] = {}
+    rtts: Dict[str, List[float]] = {address: [] for address in addresses}
+    rounds = 0
+    next_round = time.monotonic()
+    deadline = None
+
+    def receive() -> None:
+        while True:
+            try:
+                data, (address, _) = sock.recvfrom(2048)
+            except BlockingIOError:
+                return
+            received = time.monotonic()
+            if len(data) < 8:
+                continue
+            kind, _, _, _, sequence = struct.unpack("!BBHHH", data[:8])
+            if kind != _ICMP_ECHO_REPLY:
+                continue
+            send_time = pending.pop((address, sequence), None)
+            if send_time is not None:
+                rtts[address].append((received - send_time) * 1000)
+
+    while True:
+        now = time.monotonic()
+        if rounds < count and now >= next_round:
+            rounds += 1
+            for sent, address in enumerate(addresses, 1):
+                # Take the replies in between, before the receive buffer
+                # of the socket overflows
+                if sent % _RECEIVE_EVERY == 0:
+                    receive()
+                # The kernel sets the identifier and the checksum
+                packet = struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, 0, 0, rounds)
+                try:
+                    _send(sock, packet + _PAYLOAD, address)
+                except OSError as exc:
+                    for host in addresses[address]:
+                        results[host].error = str(exc)
+                    continue
+                pending[(address, rounds)] = time.monotonic()
+                for host in addresses[address]:
+                    results[host].sent += 1
+            next_round = now + interval
+            if rounds == count:
+                deadline = time.monotonic() + timeout
+
+        if deadline is not None and (now >= deadline or not pending):
+            break
+        wake = deadline if deadline is not None else next_round
+        readable, _, _ = select.select([sock], [], [], max(0.0, wake - now))
+        if readable:
+            receive()
+
+    for address, hosts_of_address in addresses.items():
+        for host in hosts_of_address:
+            results[host].rtts = list(rtts[address])
+            results[host].summarize()
+    return results
+
+
+def _send(sock: socket.socket, packet: bytes, address: str) -> None:
+    """Send a packet, waiting while the send buffer is full."""
+    while True:
+        try:
+            sock.sendto(packet, (address, 0))
+            return
+        except BlockingIOError:
+            select.select([], [sock], [], 1.0)
+
+
+async def _ping_command(
+    host: str,
+    count: int,
+    interval: float,
+    timeout: float,
+    semaphore: asyncio.Semaphore,
+) -> PingResult:
+    async with semaphore:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "ping",
+                "-n",
+                "-c",
+                str(count),
+                "-i",
+                str(interval),
+                "-W",
+                str(max(1, round(timeout))),
+                host,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except OSError as exc:
+            return PingResult(host, error=str(exc))
+        try:
+            stdout, _ = await asyncio.wait_for(
+                process.communicate(), count * interval + timeout + 5
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return PingResult(host, sent=count, error="ping timed out")
+    return parse_ping_output(host, stdout.decode(errors="replace"))
+
+
+async def _ping_commands(
+    hosts: List[str], count: int, interval: float, timeout: float, concurrency: int
+) -> Dict[str, PingResult]:
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    results = await asyncio.gather(
+        *(_ping_command(host, count, interval, timeout, semaphore) for host in hosts)
+    )
+    return {result.host: result for result in results}
+
+
+def ping_hosts(
+    hosts: Iterable[str],
+    count: int = 3,
+    interval: float = 1.0,
+    timeout: float = 5.0,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> Dict[str, PingResult]:
+    """Send count echo requests to every host, returns the results by host.
+
+    The requests to all hosts go out every interval seconds, replies are
+    awaited until timeout seconds after the last ones.
+    """
+    hosts = list(dict.fromkeys(hosts))
+    if not hosts:
+        return {}
+    sock = icmp_socket()
+    if sock is not None:
+        with sock:
+            return _ping_socket(sock, hosts, count, interval, timeout)
+    logger.debug("ICMP sockets are not allowed, running the ping command")
+    return asyncio.run(_ping_commands(hosts, count, interval, timeout, concurrency))
@@ -1,15 +1,31 @@
 # SPDX-License-Identifier: Apache-2.0
 
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import os
 import subprocess
-from typing import List, Optional
+import tempfile
+import threading
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
 from loguru import logger
 
-from osism import utils
+from osism import settings, utils
 
 # Default path for SSH known_hosts file
 KNOWN_HOSTS_PATH = "/share/known_hosts"
 
+# Serializes the changes of the known_hosts file, e.g. by the nodes of a
+# bulk undeploy
+_KNOWN_HOSTS_LOCK = threading.Lock()
+
+SSH_BINARY = "/usr/bin/ssh"
+OPERATOR_KEY_PATH = "/ansible/secrets/id_rsa.operator"
+
+# Sockets of the shared SSH connections (ControlMaster). A connection stays
+# open for SSH_CONTROL_PERSIST seconds after its last use, so consecutive
+# commands on a host, and consecutive reports, do not connect again.
+SSH_CONTROL_DIR = os.path.join(tempfile.gettempdir(), "osism-ssh")
+SSH_CONTROL_PERSIST = 60
+
 
 def ensure_known_hosts_file(known_hosts_path: str = KNOWN_HOSTS_PATH) -> bool:
     """
@@ -283,17 +299,97 @@ def cleanup_ssh_known_hosts_for_node(hostname: str, create_backup: bool = True)
     known_hosts_path = KNOWN_HOSTS_PATH
 
     try:
-        # Create backup if requested
-        if create_backup:
-            backup_path = backup_known_hosts(known_hosts_path)
-            if backup_path:
-                logger.debug(f"SSH known_hosts backup created: {backup_path}")
+        with _KNOWN_HOSTS_LOCK:
+            # Create backup if requested
+            if create_backup:
+                backup_path = backup_known_hosts(known_hosts_path)
+                if backup_path:
+                    logger.debug(f"SSH known_hosts backup created: {backup_path}")
 
-        # Perform the cleanup
-        success = remove_known_hosts_entries(hostname, known_hosts_path)
+            # Perform the cleanup
+            success = remove_known_hosts_entries(hostname, known_hosts_path)
 
         return success
 
     except Exception as e:
         logger.error(f"Error during SSH known_hosts cleanup for {hostname}: {e}")
         return False
+
+
+def operator_ssh_command(
+    address: str, command: str, ssh_binary: str = SSH_BINARY
+) -> List[str]:
+    """Return the ssh command line running a command as the operator user.
+
+    The connection is shared with other commands on the same host through
+    a ControlMaster socket in SSH_CONTROL_DIR.
+    """
+    options = [
+        "-i",
+        OPERATOR_KEY_PATH,
+        "-o",
+        "StrictHostKeyChecking=no",
+        "-o",
+        "LogLevel=ERROR",
+        "-o",
+        f"UserKnownHostsFile={KNOWN_HOSTS_PATH}",
+        "-o",
+        "ConnectTimeout=10",
+    ]
+    try:
+        os.makedirs(SSH_CONTROL_DIR, mode=0o700, exist_ok=True)
+        options += [
+            "-o",
+            "ControlMaster=auto",
+            "-o",
+            f"ControlPath={SSH_CONTROL_DIR}/%C",
+            "-o",
+            f"ControlPersist={SSH_CONTROL_PERSIST}",
+        ]
+    except OSError as e:
+        logger.debug(
+            f"Not sharing SSH connections, cannot create {SSH_CONTROL_DIR}: {e}"
+        )
+    return [ssh_binary, *options, f"{settings.OPERATOR_USER}@{address}", command]
+
+
+def run_remote(
+    address: str,
+    command: str,
+    timeout: Optional[float] = None,
+    ssh_binary: str = SSH_BINARY,
+) -> subprocess.CompletedProcess:
+    """Run a command on a host as the operator user.
+
+    Raises subprocess.TimeoutExpired if it does not finish within timeout
+    seconds (default: REPORT_SSH_TIMEOUT).
+    """
+    return subprocess.run(
+        operator_ssh_command(address, command, ssh_binary),
+        capture_output=True,
+        text=True,
+        timeout=settings.REPORT_SSH_TIMEOUT if timeout is None else timeout,
+    )
+
+
+def run_on_hosts(
+    hosts: Iterable[str],
+    task: Callable[[str], Any],
+    concurrency: Optional[int] = None,
+) -> Iterator[Tuple[str, Future]]:
+    """Run task(host) for all hosts, at most concurrency at a time.
+
+    Yields (host, future) in the order the hosts finish, the result or
+    exception of the task is taken from the future. concurrency defaults to
+    REPORT_SSH_CONCURRENCY.
+    """
+    hosts = list(hosts)
+    if not hosts:
+        return
+    if concurrency is None:
+        concurrency = settings.REPORT_SSH_CONCURRENCY
+    workers = max(1, min(concurrency, len(hosts)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(task, host): host for host in hosts}
+        for future in as_completed(futures):
+            yield futures[future], future
@@ -2,7 +2,6 @@
 
 import json
 import os
-import subprocess
 from unittest.mock import MagicMock, call, patch
 
 import openstack.exceptions
@@ -11,6 +10,7 @@ import yaml
 
 from osism import settings
 from osism.commands import baremetal
+from osism.utils.ping import PingResult
 
 # Each of these command classes follows the identical pattern: when the
 # requested node cannot be found, the command logs a warning and must return
@@ -246,6 +246,9 @@ class FakeNode:
             "target_raid_config": None,
             "properties": {},
             "power_state": "power on",
+            "target_provision_state": None,
+            "last_error": None,
+            "driver_internal_info": {},
         }
         defaults.update(fields)
         self._fields = defaults
@@ -959,73 +962,38 @@ def test_undeploy_all_iterates_nodes():
     assert conn.baremetal.set_node_provision_state.call_count == 2
 
 
-# --- BaremetalPing._ping_host ---
+# --- BaremetalPing result formatting ---
 
 
-def _ping(run_result=None, side_effect=None):
-    cmd = baremetal.BaremetalPing(MagicMock(), MagicMock())
-    results = {}
-    run_mock = MagicMock(return_value=run_result, side_effect=side_effect)
-    with patch("osism.commands.baremetal.subprocess.run", run_mock):
-        cmd._ping_host("10.0.0.1", results, "node1")
-    return results["node1"]
-
-
-def _ping_output(returncode, stdout):
-    result = MagicMock()
-    result.returncode = returncode
-    result.stdout = stdout
-    return result
-
+def test_ping_status_success():
+    result = PingResult("10.0.0.1", sent=3, received=3)
+    assert baremetal._ping_status(result) == "SUCCESS"
 
-def test_ping_host_success_with_round_trip_line():
-    stdout = (
-        "PING 10.0.0.1 (10.0.0.1): 56 data bytes\n"
-        "3 packets transmitted, 3 packets received, 0% packet loss\n"
-        "round-trip min/avg/max = 1.0/2.0/3.0 ms\n"
-    )
-    result = _ping(_ping_output(0, stdout))
-    assert result == {
-        "host": "10.0.0.1",
-        "status": "SUCCESS",
-        "time_info": "1.0/2.0/3.0 ms",
-    }
 
+def test_ping_status_partial_packet_loss():
+    result = PingResult("10.0.0.1", sent=3, received=2)
+    assert baremetal._ping_status(result) == "PARTIAL (33% packet loss)"
 
-def test_ping_host_partial_packet_loss():
-    stdout = "3 packets transmitted, 2 packets received, 33% packet loss\n"
-    result = _ping(_ping_output(0, stdout))
-    assert result["status"] == "PARTIAL (33% packet loss)"
-    assert result["time_info"] == "N/A"
 
+def test_ping_status_no_reply_fails():
+    result = PingResult("10.0.0.1", sent=3, received=0)
+    assert baremetal._ping_status(result) == "FAILED"
 
-def test_ping_host_success_without_stats_line():
-    result = _ping(_ping_output(0, "PING 10.0.0.1 (10.0.0.1): 56 data bytes\n"))
-    assert result["status"] == "SUCCESS"
-    assert result["time_info"] == "N/A"
 
-
-def test_ping_host_parses_linux_rtt_line():
-    stdout = (
-        "3 packets transmitted, 3 received, 0% packet loss, time 2003ms\n"
-        "rtt min/avg/max/mdev = 1.1/2.2/3.3/0.4 ms\n"
-    )
-    result = _ping(_ping_output(0, stdout))
-    assert result["status"] == "SUCCESS"
-    assert result["time_info"] == "1.1/2.2/3.3/0.4 ms"
+def test_ping_status_error_is_truncated():
+    result = PingResult("10.0.0.1", error="x" * 80)
+    assert baremetal._ping_status(result) == f"ERROR ({'x' * 50})"
 
 
-def test_ping_host_nonzero_returncode_fails():
-    result = _ping(_ping_output(1, ""))
-    assert result["status"] == "FAILED"
-    assert result["time_info"] == "N/A"
+def test_ping_rtt_formats_statistics():
+    result = PingResult("10.0.0.1", rtt_min=1.1, rtt_avg=2.2, rtt_max=3.3, rtt_mdev=0.4)
+    assert baremetal._ping_rtt(result) == "1.100/2.200/3.300/0.400"
 
 
-def test_ping_host_timeout_reports_error():
-    error = subprocess.TimeoutExpired(cmd="ping", timeout=20)
-    result = _ping(side_effect=error)
-    assert result["status"] == "ERROR"
-    assert result["time_info"] == str(error)[:50]
+def test_ping_rtt_without_replies_or_mdev():
+    assert baremetal._ping_rtt(PingResult("10.0.0.1", sent=3)) == "N/A"
+    result = PingResult("10.0.0.1", rtt_min=1.0, rtt_avg=2.0, rtt_max=3.0)
+    assert baremetal._ping_rtt(result) == "1.000/2.000/3.000/-"
 
 
 # --- BaremetalPing.take_action (device discovery) ---
@@ -1051,29 +1019,35 @@ def _nb_device(
     return device
 
 
-def _run_ping_all(devices_per_query, queries=None, ping_impl=None):
-    cmd = baremetal.BaremetalPing(MagicMock(), MagicMock())
-    parsed_args = cmd.get_parser("test").parse_args([])
+def _ping_success(hosts, **kwargs):
+    return {
+        host: PingResult(
+            host,
+            sent=3,
+            received=3,
+            rtt_min=1.0,
+            rtt_avg=2.0,
+            rtt_max=3.0,
+            rtt_mdev=0.5,
+        )
+        for host in hosts
+    }
 
-    if ping_impl is None:
 
-        def ping_impl(self, host, results, host_name):
-            results[host_name] = {
-                "host": host,
-                "status": "SUCCESS",
-                "time_info": "1.0/2.0/3.0 ms",
-            }
+def _run_ping_all(devices_per_query, queries=None, ping_impl=None, args=()):
+    cmd = baremetal.BaremetalPing(MagicMock(), MagicMock())
+    parsed_args = cmd.get_parser("test").parse_args(list(args))
 
     with patch.dict("osism.utils.__dict__", {"nb": MagicMock()}), patch(
         "osism.tasks.conductor.netbox.get_nb_device_query_list_ironic",
         return_value=queries or [{"role": "server"}],
     ), patch(
         "osism.tasks.netbox.get_devices", side_effect=devices_per_query
-    ) as get_devices, patch.object(
-        baremetal.BaremetalPing, "_ping_host", ping_impl
-    ):
+    ) as get_devices, patch(
+        "osism.commands.baremetal.ping_hosts", side_effect=ping_impl or _ping_success
+    ) as ping_hosts:
         rc = cmd.take_action(parsed_args)
-    return rc, get_devices
+    return rc, get_devices, ping_hosts
 
 
 def test_ping_all_collects_devices_from_all_queries_and_filters(capsys):
@@ -1081,7 +1055,7 @@ def test_ping_all_collects_devices_from_all_queries_and_filters(capsys):
     wrong_power = _nb_device("node-b", power_state="power off")
     wrong_state = _nb_device("node-c", provision_state="available")
 
-    rc, get_devices = _run_ping_all(
+    rc, get_devices, _ = _run_ping_all(
         devices_per_query=[[matching], [wrong_power, wrong_state]],
         queries=[{"role": "server"}, {"role": "storage"}],
     )
@@ -1097,7 +1071,7 @@ def test_ping_all_collects_devices_from_all_queries_and_filters(capsys):
 
 
 def test_ping_all_no_matching_devices_returns_none(loguru_logs):
-    rc, _ = _run_ping_all(
+    rc, _, _ = _run_ping_all(
         devices_per_query=[[_nb_device("node-b", power_state="power off")]]
     )
 
@@ -1124,7 +1098,7 @@ def test_ping_all_device_without_ip_excluded(capsys, loguru_logs):
 
 
 def test_ping_all_only_ip_less_devices_returns_none(loguru_logs):
-    rc, _ = _run_ping_all(devices_per_query=[[_nb_device("node-a", has_ip=False)]])
+    rc, _, _ = _run_ping_all(devices_per_query=[[_nb_device("node-a", has_ip=False)]])
 
     assert rc is None
     assert any(
@@ -1142,9 +1116,11 @@ def test_ping_all_strips_prefix_from_ip(capsys):
 
 
 def test_ping_all_summary_counts_partial_as_failed(capsys):
-    def ping_impl(self, host, results, host_name):
-        status = "SUCCESS" if host_name == "node-a" else "PARTIAL (33% packet loss)"
-        results[host_name] = {"host": host, "status": status, "time_info": "N/A"}
+    def ping_impl(hosts, **kwargs):
+        return {
+            "10.0.0.1": PingResult("10.0.0.1", sent=3, received=3),
+            "10.0.0.2": PingResult("10.0.0.2", sent=3, received=2),
+        }
 
     _run_ping_all(
         devices_per_query=[
@@ -1157,9 +1133,35 @@ def test_ping_all_summary_counts_partial_as_failed(capsys):
     )
 
     out = capsys.readouterr().out
+    assert "PARTIAL (33% packet loss)" in out
     assert "Summary: 1 successful, 1 failed/partial out of 2 total" in out
 
 
+def test_ping_all_pings_all_nodes_at_once_sorted_by_name(capsys):
+    _, _, ping_hosts = _run_ping_all(
+        devices_per_query=[
+            [
+                _nb_device("node-b", ip="10.0.0.2/24"),
+                _nb_device("node-a", ip="10.0.0.1/24"),
+            ]
+        ],
+        args=["--count", "5", "--timeout", "2", "--concurrency", "8"],
+    )
+
+    ping_hosts.assert_called_once()
+    hosts = ping_hosts.call_args.args[0]
+    assert sorted(hosts) == ["10.0.0.1", "10.0.0.2"]
+    assert ping_hosts.call_args.kwargs == {
+        "count": 5,
+        "timeout": 2.0,
+        "concurrency": 8,
+    }
+    out = capsys.readouterr().out
+    assert out.index("node-a") < out.index("node-b")
+    assert "1.000/2.000/3.000/0.500" in out
+    assert "Summary: 2 successful, 0 failed/partial out of 2 total" in out
+
+
 # --- BaremetalBurnIn ---
 
 DEFAULT_BURNIN_STEPS = [
@@ -1167,118 +1169,236 @@ DEFAULT_BURNIN_STEPS = [
     {"step": "burnin_memory", "interface": "deploy"},
     {"step": "burnin_disk", "interface": "deploy"},
 ]
+SERVICE_BURNIN_STEPS = DEFAULT_BURNIN_STEPS[:2]
+
+
+class FakeIronic:
+    """Ironic double running burn-ins, every listing of the nodes is a tick.
+
+    A launched node sends the first heartbeat of its agent ``boot_ticks``
+    listings after the launch and finishes ``run_ticks`` listings later,
+    in "clean failed" or "service failed" if it is in ``failing``. Nodes
+    in ``manage_failing`` fall back to enroll when they are managed.
+    """
+
+    def __init__(self, nodes, boot_ticks=1, run_ticks=2, failing=(), manage_failing=()):
+        self.baremetal = self
+        self.nodes_by_id = {}
+        self.boot_ticks = boot_ticks
+        self.run_ticks = run_ticks
+        self.failing = set(failing)
+        self.manage_failing = set(manage_failing)
+        self.tick = 0
+        self.launched = {}
+        self.managed = {}
+        self.calls = []
+        self.listings = []
+        self.max_booting = 0
+        for node in nodes:
+            node._fields.setdefault("driver_internal_info", {})
+            node.set_provision_state = (
+                lambda session, target, node_id=node.id, **kwargs: (
+                    self.set_node_provision_state(node_id, target, **kwargs)
+                )
+            )
+            self.nodes_by_id[node.id] = node
+
+    def _booting(self):
+        return sum(
+            1
+            for node_id, tick in self.launched.items()
+            if self.tick - tick < self.boot_ticks
+            and self.nodes_by_id[node_id].target_provision_state
+        )
+
+    def find_node(self, name, ignore_missing=True, details=True):
+        for node in self.nodes_by_id.values():
+            if name in (node.id, node.name):
+                return node
+        return None
+
+    def nodes(self, details=False, **query):
+        self.listings.append(query)
+        self.tick += 1
+        for node_id, tick in self.managed.items():
+            fields = self.nodes_by_id[node_id]._fields
+            if fields["provision_state"] == "verifying":
+                if node_id in self.manage_failing:
+                    fields["provision_state"] = "enroll"
+                    fields["last_error"] = "Failed to validate power driver"
+                else:
+                    fields["provision_state"] = "manageable"
+                fields["target_provision_state"] = None
+        for node_id, tick in self.launched.items():
+            fields = self.nodes_by_id[node_id]._fields
+            if not fields["target_provision_state"]:
+                continue
+            age = self.tick - tick
+            if age == self.boot_ticks:
+                fields["driver_internal_info"] = {"agent_last_heartbeat": self.tick}
+            if age >= self.boot_ticks + self.run_ticks:
+                stable = fields["target_provision_state"]
+                if node_id in self.failing:
+                    action = "clean" if stable == "manageable" else "service"
+                    fields["provision_state"] = f"{action} failed"
+                    fields["last_error"] = "burnin_cpu failed"
+                else:
+                    fields["provision_state"] = stable
+                fields["target_provision_state"] = None
+            elif age >= self.boot_ticks:
+                fields["provision_state"] = fields["provision_state"].replace(
+                    " wait", "ing"
+                )
+        return [FakeNode(**dict(node._fields)) for node in self.nodes_by_id.values()]
+
+    def set_node_provision_state(self, node_id, target, **kwargs):
+        self.calls.append(call(node_id, target, **kwargs))
+        fields = self.nodes_by_id[node_id]._fields
+        if target == "manage":
+            assert fields["provision_state"] == "available"
+            fields["provision_state"] = "verifying"
+            fields["target_provision_state"] = "manageable"
+            self.managed[node_id] = self.tick
+            return self.nodes_by_id[node_id]
+        if target == "clean":
+            assert fields["provision_state"] == "manageable"
+            fields["provision_state"] = "clean wait"
+            fields["target_provision_state"] = "manageable"
+        else:
+            assert fields["provision_state"] == "active"
+            fields["provision_state"] = "service wait"
+            fields["target_provision_state"] = "active"
+        self.launched[node_id] = self.tick
+        self.max_booting = max(self.max_booting, self._booting())
+        return self.nodes_by_id[node_id]
+
+    def update_node(self, node, **attrs):
+        self.calls.append(call.update_node(node.id, **attrs))
+        node._fields.update(attrs)
+        return node
+
+    def set_node_boot_device(self, node_id, boot_device, persistent=False):
+        self.calls.append(
+            call.set_node_boot_device(node_id, boot_device, persistent=persistent)
+        )
+
+
+def _burnin_nodes(count, provision_state="manageable", **fields):
+    return [
+        FakeNode(
+            id=f"uuid-{i}",
+            name=f"node{i}",
+            provision_state=provision_state,
+            **fields,
+        )
+        for i in range(1, count + 1)
+    ]
 
 
 def _run_burnin(args, conn):
     cmd = baremetal.BaremetalBurnIn(MagicMock(), MagicMock())
     parsed_args = cmd.get_parser("test").parse_args(args)
     setup, getconn, cleanup = _cloud_helpers(conn)
-    with _patch_cloud(setup, getconn, cleanup):
+    with _patch_cloud(setup, getconn, cleanup), patch(
+        "osism.commands.baremetal.time.sleep"
+    ):
         return cmd.take_action(parsed_args)
 
 
 def test_burnin_manageable_uses_default_steps():
-    node = FakeNode(provision_state="manageable")
-    conn = MagicMock()
-    conn.baremetal.find_node.return_value = node
+    ironic = FakeIronic(_burnin_nodes(1))
 
-    _run_burnin(["node1"], conn)
+    rc = _run_burnin(["node1"], ironic)
 
-    conn.baremetal.set_node_provision_state.assert_called_once_with(
-        node.id, "clean", clean_steps=DEFAULT_BURNIN_STEPS
-    )
+    assert rc is None
+    assert ironic.calls == [call("uuid-1", "clean", clean_steps=DEFAULT_BURNIN_STEPS)]
+    assert ironic.nodes_by_id["uuid-1"].provision_state == "manageable"
 
 
 def test_burnin_no_disk_removes_only_disk_step():
-    node = FakeNode(provision_state="manageable")
-    conn = MagicMock()
-    conn.baremetal.find_node.return_value = node
+    ironic = FakeIronic(_burnin_nodes(1))
 
-    _run_burnin(["node1", "--no-disk"], conn)
+    _run_burnin(["node1", "--no-disk"], ironic)
 
-    conn.baremetal.set_node_provision_state.assert_called_once_with(
-        node.id,
-        "clean",
-        clean_steps=[
-            {"step": "burnin_cpu", "interface": "deploy"},
-            {"step": "burnin_memory", "interface": "deploy"},
-        ],
-    )
+    assert ironic.calls == [
+        call("uuid-1", "clean", clean_steps=SERVICE_BURNIN_STEPS),
+    ]
 
 
 def test_burnin_available_node_moved_to_manageable_first():
-    available = FakeNode(provision_state="available")
-    manageable = FakeNode(provision_state="manageable")
-    conn = MagicMock()
-    conn.baremetal.find_node.return_value = available
-    conn.baremetal.set_node_provision_state.return_value = manageable
-    conn.baremetal.wait_for_nodes_provision_state.return_value = [manageable]
+    ironic = FakeIronic(_burnin_nodes(1, provision_state="available"))
 
-    _run_burnin(["node1"], conn)
+    rc = _run_burnin(["node1"], ironic)
 
-    assert conn.baremetal.set_node_provision_state.call_args_list == [
+    assert rc is None
+    assert ironic.calls == [
         call("uuid-1", "manage"),
         call("uuid-1", "clean", clean_steps=DEFAULT_BURNIN_STEPS),
     ]
-    conn.baremetal.wait_for_nodes_provision_state.assert_called_once_with(
-        ["uuid-1"], "manageable"
-    )
+    # The burn-in is launched once a listing shows the node manageable
+    assert ironic.launched["uuid-1"] == 1
 
 
 def test_burnin_manage_failure_skips_node():
-    available = FakeNode(provision_state="available")
-    conn = MagicMock()
-    conn.baremetal.find_node.return_value = available
-    conn.baremetal.set_node_provision_state.side_effect = RuntimeError("boom")
+    ironic = FakeIronic(_burnin_nodes(1, provision_state="available"))
+    ironic.set_node_provision_state = MagicMock(side_effect=RuntimeError("boom"))
 
-    rc = _run_burnin(["node1"], conn)
+    rc = _run_burnin(["node1"], ironic)
 
     assert rc == 1
-    assert conn.baremetal.set_node_provision_state.call_count == 1
-    conn.baremetal.wait_for_nodes_provision_state.assert_not_called()
+    assert ironic.set_node_provision_state.call_count == 1
+    assert ironic.listings == []
+
+
+def test_burnin_node_falling_back_to_enroll_fails(capsys):
+    ironic = FakeIronic(
+        _burnin_nodes(2, provision_state="available"), manage_failing={"uuid-2"}
+    )
+
+    rc = _run_burnin(["--all"], ironic)
+
+    assert rc == 1
+    assert call("uuid-2", "clean", clean_steps=DEFAULT_BURNIN_STEPS) not in (
+        ironic.calls
+    )
+    assert ironic.nodes_by_id["uuid-1"].provision_state == "manageable"
+    assert "Failed to validate power driver" in capsys.readouterr().out
 
 
 def test_burnin_manageable_refreshes_instance_info_and_boot_device():
-    node = FakeNode(
-        provision_state="manageable",
+    nodes = _burnin_nodes(
+        1,
         instance_info={},
         extra={"instance_info": json.dumps({"image_source": "img"})},
         properties={"vendor": "Supermicro"},
     )
-    conn = MagicMock()
-    conn.baremetal.find_node.return_value = node
-    conn.baremetal.update_node.side_effect = lambda n, **kwargs: n
+    ironic = FakeIronic(nodes)
 
-    _run_burnin(["node1"], conn)
+    _run_burnin(["node1"], ironic)
 
-    conn.baremetal.update_node.assert_called_once_with(
-        node, instance_info={"image_source": "img"}
-    )
-    conn.baremetal.set_node_boot_device.assert_called_once_with(
-        node.id, "cdrom", persistent=False
-    )
+    assert ironic.calls == [
+        call.update_node("uuid-1", instance_info={"image_source": "img"}),
+        call.set_node_boot_device("uuid-1", "cdrom", persistent=False),
+        call("uuid-1", "clean", clean_steps=DEFAULT_BURNIN_STEPS),
+    ]
 
 
 def test_burnin_clean_failure_returns_1():
-    node = FakeNode(provision_state="manageable")
-    conn = MagicMock()
-    conn.baremetal.find_node.return_value = node
-    conn.baremetal.set_node_provision_state.side_effect = RuntimeError("boom")
+    ironic = FakeIronic(_burnin_nodes(1))
+    ironic.set_node_provision_state = MagicMock(side_effect=RuntimeError("boom"))
 
-    rc = _run_burnin(["node1"], conn)
+    rc = _run_burnin(["node1"], ironic)
 
     assert rc == 1
 
 
 def test_burnin_active_without_confirmation_refused(loguru_logs):
-    node = FakeNode(provision_state="active")
-    node.set_provision_state = MagicMock()
-    conn = MagicMock()
-    conn.baremetal.find_node.return_value = node
+    ironic = FakeIronic(_burnin_nodes(1, provision_state="active"))
 
-    _run_burnin(["node1"], conn)
+    rc = _run_burnin(["node1"], ironic)
 
-    node.set_provision_state.assert_not_called()
+    assert rc is None
+    assert ironic.calls == []
     assert any(
         record["level"] == "ERROR"
         and "yes-i-really-really-mean-it" in record["message"]
@@ -1287,39 +1407,158 @@ def test_burnin_active_without_confirmation_refused(loguru_logs):
 
 
 def test_burnin_active_with_confirmation_uses_service_steps(loguru_logs):
-    node = FakeNode(provision_state="active")
-    node.set_provision_state = MagicMock()
-    conn = MagicMock()
-    conn.baremetal.find_node.return_value = node
+    ironic = FakeIronic(_burnin_nodes(1, provision_state="active"))
 
-    _run_burnin(["node1", "--yes-i-really-really-mean-it"], conn)
+    rc = _run_burnin(["node1", "--yes-i-really-really-mean-it"], ironic)
 
-    node.set_provision_state.assert_called_once_with(
-        conn.baremetal,
-        "service",
-        service_steps=[
-            {"step": "burnin_cpu", "interface": "deploy"},
-            {"step": "burnin_memory", "interface": "deploy"},
-        ],
-    )
+    assert rc is None
+    assert ironic.calls == [
+        call("uuid-1", "service", service_steps=SERVICE_BURNIN_STEPS),
+    ]
+    assert ironic.nodes_by_id["uuid-1"].provision_state == "active"
     assert any("Skipping disk burn-in" in record["message"] for record in loguru_logs)
 
 
 def test_burnin_unsupported_state_warns(loguru_logs):
-    node = FakeNode(provision_state="enroll")
-    conn = MagicMock()
-    conn.baremetal.find_node.return_value = node
+    ironic = FakeIronic(_burnin_nodes(1, provision_state="enroll"))
 
-    rc = _run_burnin(["node1"], conn)
+    rc = _run_burnin(["node1"], ironic)
 
     assert rc is None
-    conn.baremetal.set_node_provision_state.assert_not_called()
+    assert ironic.calls == []
     assert any(
         record["level"] == "WARNING" and "not in supported state" in record["message"]
         for record in loguru_logs
     )
 
 
+def test_burnin_boots_nodes_in_waves_tracked_by_one_listing():
+    ironic = FakeIronic(_burnin_nodes(25), boot_ticks=2, run_ticks=3)
+
+    rc = _run_burnin(["--all", "--wave", "5"], ironic)
+
+    assert rc is None
+    assert ironic.max_booting == 5
+    assert len(ironic.launched) == 25
+    assert all(
+        node.provision_state == "manageable" for node in ironic.nodes_by_id.values()
+    )
+    # After the listing selecting the nodes one listing per interval for
+    # all nodes, the waves of five nodes boot one after the other
+    assert ironic.listings[0] == {}
+    tracking = ironic.listings[1:]
+    assert all(query == {"fields": baremetal.BURNIN_FIELDS} for query in tracking)
+    assert len(tracking) == 5 * 2 + 3
+
+
+def test_burnin_logs_aggregated_progress(loguru_logs):
+    ironic = FakeIronic(_burnin_nodes(3), boot_ticks=2, run_ticks=2)
+
+    _run_burnin(["--all", "--wave", "2"], ironic)
+
+    progress = [
+        record["message"]
+        for record in loguru_logs
+        if record["message"].startswith("Burn-in 0m")
+    ]
+    assert progress[0] == (
+        "Burn-in 0m00s: 1 waiting, 2 booting (clean wait: 2, manageable: 1)"
+    )
+    # The next wave starts after the progress is logged
+    assert progress[1] == (
+        "Burn-in 0m00s: 1 waiting, 2 running (cleaning: 2, manageable: 1)"
+    )
+    assert progress[2] == (
+        "Burn-in 0m00s: 1 booting, 2 running (clean wait: 1, cleaning: 2)"
+    )
+    assert any(
+        record["message"].startswith("Burn-in finished after 0m00s: 3 done")
+        for record in loguru_logs
+    )
+
+
+def test_burnin_failed_nodes_are_reported(capsys, loguru_logs):
+    ironic = FakeIronic(_burnin_nodes(3), failing={"uuid-2"})
+
+    rc = _run_burnin(["--all"], ironic)
+
+    assert rc == 1
+    out = capsys.readouterr().out
+    assert "node2" in out
+    assert "clean failed" in out
+    assert "burnin_cpu failed" in out
+    assert "node1" not in out
+    assert any(
+        "2 done, 1 failed (clean failed: 1, manageable: 2)" in record["message"]
+        for record in loguru_logs
+    )
+
+
+def test_burnin_no_wait_returns_once_all_nodes_booted():
+    ironic = FakeIronic(_burnin_nodes(4), boot_ticks=1, run_ticks=100)
+
+    rc = _run_burnin(["--all", "--wave", "2", "--no-wait"], ironic)
+
+    assert rc is None
+    assert len(ironic.launched) == 4
+    # The listing selecting the nodes and one for each wave
+    assert len(ironic.listings) == 1 + 2
+    assert all(
+        node.provision_state == "cleaning" for node in ironic.nodes_by_id.values()
+    )
+
+
+def test_burnin_boot_timeout_frees_the_wave(loguru_logs):
+    ironic = FakeIronic(_burnin_nodes(3), boot_ticks=1000)
+
+    rc = _run_burnin(
+        ["--all", "--wave", "1", "--boot-timeout", "0", "--no-wait"], ironic
+    )
+
+    assert rc is None
+    assert len(ironic.launched) == 3
+    assert any(
+        record["level"] == "WARNING"
+        and "no longer counted as booting" in record["message"]
+        for record in loguru_logs
+    )
+
+
+def test_burnin_timeout_fails_unfinished_nodes(capsys):
+    ironic = FakeIronic(_burnin_nodes(1), run_ticks=1000)
+
+    rc = _run_burnin(["node1", "--timeout", "0.000001"], ironic)
+
+    assert rc == 1
+    assert "burn-in timed out" in capsys.readouterr().out
+
+
+class FlakyIronic(FakeIronic):
+    """Fails the second listing, node2 is gone from the ones after it."""
+
+    def nodes(self, details=False, **query):
+        listed = super().nodes(details=details, **query)
+        if len(self.listings) == 2:
+            raise RuntimeError("ironic-api unavailable")
+        if len(self.listings) > 2:
+            return [node for node in listed if node.id != "uuid-2"]
+        return listed
+
+
+def test_burnin_retries_failed_listing_and_fails_vanished_nodes(loguru_logs):
+    ironic = FlakyIronic(_burnin_nodes(2))
+
+    rc = _run_burnin(["--all"], ironic)
+
+    assert rc == 1
+    assert any(
+        "Listing the nodes failed, retrying" in record["message"]
+        for record in loguru_logs
+    )
+    assert any("node2: node not found" in record["message"] for record in loguru_logs)
+    assert ironic.nodes_by_id["uuid-1"].provision_state == "manageable"
+
+
 # --- BaremetalClean ---
 
 ERASE_DEVICES_STEP = {"interface": "deploy", "step": "erase_devices"}
@@ -1729,3 +1968,138 @@ def test_delete_all_continues_after_node_failure(loguru_logs):
         record["level"] == "ERROR" and "Failed to delete node" in record["message"]
         for record in loguru_logs
     )
+
+
+# --- Bulk node actions ---
+
+
+def test_several_names_are_taken_from_one_listing():
+    nodes = [
+        FakeNode(name="node1", id="uuid-1", provision_state="manageable"),
+        FakeNode(name="node2", id="uuid-2", provision_state="manageable"),
+        FakeNode(name="node3", id="uuid-3", provision_state="manageable"),
+    ]
+    conn = MagicMock()
+    conn.baremetal.nodes.return_value = nodes
+
+    rc = _run_simple(baremetal.BaremetalProvide, ["node1", "uuid-3", "node3"], conn)
+
+    assert rc is None
+    conn.baremetal.find_node.assert_not_called()
+    conn.baremetal.nodes.assert_called_once_with(details=True)
+    # node3 is given twice, by name and by ID, and provided once
+    assert sorted(
+        c.args for c in conn.baremetal.set_node_provision_state.call_args_list
+    ) == [("uuid-1", "provide"), ("uuid-3", "provide")]
+
+
+def test_several_names_with_unknown_node_returns_1(loguru_logs):
+    conn = MagicMock()
+    conn.baremetal.nodes.return_value = [FakeNode(name="node1", id="uuid-1")]
+
+    rc = _run_simple(baremetal.BaremetalPowerOn, ["node1", "node9"], conn)
+
+    assert rc == 1
+    conn.baremetal.set_node_power_state.assert_not_called()
+    assert any("Could not find node(s) node9" in r["message"] for r in loguru_logs)
+
+
+def test_deploy_all_submits_all_deployable_nodes(loguru_logs):
+    nodes = [
+        FakeNode(
+            name=f"node{i}",
+            id=f"uuid-{i}",
+            provision_state="available" if i % 10 else "active",
+            extra={"frr_parameters": json.dumps({"frr_local_as": 65000 + i})},
+        )
+        for i in range(400)
+    ]
+    conn = MagicMock()
+    conn.baremetal.nodes.return_value = nodes
+
+    rc, _, deep_decrypt, _ = _run_deploy(
+        ["--all", "--parallel", "16", "--rate", "0"], conn
+    )
+
+    assert rc is None
+    conn.baremetal.nodes.assert_called_once_with(details=True)
+    # The config drive is built once per deployable node
+    assert conn.baremetal.set_node_provision_state.call_count == 360
+    assert deep_decrypt.call_count == 360
+    assert any(
+        "400 done in" in r["message"] and "(active: 360, skipped: 40)" in r["message"]
+        for r in loguru_logs
+    )
+
+
+def test_deploy_reads_vault_once_for_all_nodes():
+    nodes = [
+        FakeNode(
+            name=f"node{i}",
+            id=f"uuid-{i}",
+            extra={"frr_parameters": json.dumps({"frr_local_as": 65000})},
+        )
+        for i in range(5)
+    ]
+    conn = MagicMock()
+    conn.baremetal.nodes.return_value = nodes
+    vault = MagicMock()
+
+    with patch(
+        "osism.tasks.conductor.utils.get_vault", return_value=vault
+    ) as get_vault, patch(
+        "osism.tasks.conductor.utils.deep_decrypt"
+    ) as deep_decrypt, patch(
+        "openstack.baremetal.configdrive.pack", return_value="config-drive"
+    ), patch(
+        "osism.commands.baremetal._get_metalbox_primary_ip4", return_value=None
+    ), patch.dict(
+        "osism.utils.__dict__", {"nb": None}
+    ), _patch_cloud(
+        *_cloud_helpers(conn)
+    ):
+        cmd = baremetal.BaremetalDeploy(MagicMock(), MagicMock())
+        rc = cmd.take_action(cmd.get_parser("test").parse_args(["--all"]))
+
+    assert rc is None
+    get_vault.assert_called_once_with()
+    assert deep_decrypt.call_count == 5
+    assert all(c.args[1] is vault for c in deep_decrypt.call_args_list)
+
+
+def test_bulk_actions_forward_parallel_and_rate():
+    conn = MagicMock()
+    conn.baremetal.find_node.return_value = FakeNode()
+
+    with patch("osism.commands.baremetal.run_actions", return_value=[]) as run_actions:
+        _run_simple(
+            baremetal.BaremetalPowerOff,
+            ["node1", "--parallel", "3", "--rate", "2.5"],
+            conn,
+        )
+
+    assert run_actions.call_args.kwargs["concurrency"] == 3
+    assert run_actions.call_args.kwargs["rate"] == 2.5
+    assert run_actions.call_args.kwargs["names"] == {"uuid-1": "node1"}
+
+
+def test_clean_all_does_not_accumulate_raid_steps():
+    nodes = [
+        FakeNode(
+            name=f"node{i}",
+            id=f"uuid-{i}",
+            provision_state="manageable",
+            raid_interface="agent",
+        )
+        for i in range(3)
+    ]
+    conn = MagicMock()
+    conn.baremetal.nodes.return_value = nodes
+
+    rc = _run_baremetal_clean(["--all", "--yes-i-really-really-mean-it"], conn)
+
+    assert rc is None
+    assert [
+        c.kwargs["clean_steps"]
+        for c in conn.baremetal.set_node_provision_state.call_args_list
+    ] == [[RAID_DELETE_STEP, ERASE_DEVICES_STEP]] * 3
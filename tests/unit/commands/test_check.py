@@ -7,18 +7,23 @@ view of /opt/configuration with the view from a freshly started container;
 ``check inode`` prints a lightweight inode snapshot without spawning one.
 These tests cover:
 
-- the pure helpers ``get_file_info``, ``collect_file_info`` and
-  ``parse_stat_output`` on real temporary trees;
+- the pure helpers ``get_file_info``, ``collect_file_info`` (including its
+  hash manifest), ``parse_stat_output`` and ``build_scan_script`` on real
+  temporary trees;
 - the ``Mount`` helpers ``_compare_file_info`` (mismatch classification) and
   ``_get_container_id`` / ``_get_mount_source`` (procfs parsing);
 - the ``Mount.take_action`` guard rails (missing path, missing Docker,
   undeterminable mount source) and its exit-code / script-output contract;
-- ``Inode.take_action`` for explicit file lists and random sampling.
+- ``Inode.take_action`` for explicit file lists and random sampling, and
+  the inode usage scan of ``--usage`` through ``count_entries``.
 """
 
 import hashlib
 import io
+import json
 import os
+import stat
+import subprocess
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
@@ -137,6 +142,135 @@ def test_collect_file_info_stops_at_max_files_and_warns(tmp_path, loguru_logs):
     )
 
 
+def test_collect_file_info_lists_entries_in_os_walk_order(tmp_path):
+    for directory in ["b", "a", "a/c", "a/c/d"]:
+        (tmp_path / directory).mkdir()
+        for name in ["2.txt", "1.txt"]:
+            (tmp_path / directory / name).write_text(name)
+    (tmp_path / "linked").symlink_to(tmp_path / "a", target_is_directory=True)
+
+    expected = []
+    for root, dirs, files in os.walk(tmp_path):
+        for name in files + dirs:
+            filepath = os.path.join(root, name)
+            if not os.path.islink(filepath):
+                expected.append(os.path.relpath(filepath, tmp_path))
+
+    assert list(check.collect_file_info(str(tmp_path))) == expected
+
+
+def test_collect_file_info_without_content_check_hashes_nothing(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    manifest = tmp_path.parent / f"{tmp_path.name}-manifest.json"
+
+    result = check.collect_file_info(
+        str(tmp_path), check_content=False, manifest_path=str(manifest)
+    )
+
+    assert result["a.txt"]["hash"] is None
+    assert not manifest.exists()
+
+
+def test_collect_file_info_reuses_manifest_hashes(tmp_path):
+    base = tmp_path / "base"
+    base.mkdir()
+    (base / "a.txt").write_text("a")
+    (base / "b.txt").write_text("b")
+    manifest = str(tmp_path / "manifest.json")
+    check.collect_file_info(str(base), manifest_path=manifest)
+    # Replacing a file changes its inode
+    (base / "b.txt").unlink()
+    (base / "b.txt").write_text("B")
+
+    with patch("osism.commands.check._hash_file", wraps=check._hash_file) as hash_file:
+        result = check.collect_file_info(str(base), manifest_path=manifest)
+
+    hash_file.assert_called_once_with(str(base / "b.txt"))
+    assert result["a.txt"]["hash"] == hashlib.md5(b"a").hexdigest()
+    assert result["b.txt"]["hash"] == hashlib.md5(b"B").hexdigest()
+    with open(manifest) as f:
+        assert sorted(json.load(f)["hashes"].values()) == sorted(
+            [hashlib.md5(b"a").hexdigest(), hashlib.md5(b"B").hexdigest()]
+        )
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["not json", '{"base_path": "/other", "hashes": {}}', "[]"],
+    ids=["malformed", "other-base-path", "not-a-dict"],
+)
+def test_collect_file_info_ignores_unusable_manifest(tmp_path, content):
+    base = tmp_path / "base"
+    base.mkdir()
+    (base / "a.txt").write_text("a")
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(content)
+    manifest.chmod(0o600)
+
+    result = check.collect_file_info(str(base), manifest_path=str(manifest))
+
+    assert result["a.txt"]["hash"] == hashlib.md5(b"a").hexdigest()
+    assert json.loads(manifest.read_text())["base_path"] == str(base)
+
+
+def test_collect_file_info_ignores_manifest_writable_by_others(tmp_path, loguru_logs):
+    base = tmp_path / "base"
+    base.mkdir()
+    (base / "a.txt").write_text("a")
+    manifest = str(tmp_path / "manifest.json")
+    check.collect_file_info(str(base), manifest_path=manifest)
+    # Anyone could have planted a hash that hides a content difference
+    os.chmod(manifest, 0o666)
+
+    with patch("osism.commands.check._hash_file", wraps=check._hash_file) as hash_file:
+        check.collect_file_info(str(base), manifest_path=manifest)
+
+    hash_file.assert_called_once_with(str(base / "a.txt"))
+    assert any(
+        r["level"] == "WARNING" and "not private to the user" in r["message"]
+        for r in loguru_logs
+    )
+    # Replaced by a private manifest
+    assert stat.S_IMODE(os.stat(manifest).st_mode) == 0o600
+
+
+def test_collect_file_info_creates_private_manifest_directory(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    manifest_dir = tmp_path / "cache" / "check-mount"
+    manifest = check.manifest_file(str(manifest_dir), str(tmp_path))
+
+    check.collect_file_info(str(tmp_path), manifest_path=manifest)
+
+    assert stat.S_IMODE(os.stat(manifest_dir).st_mode) == 0o700
+    with open(manifest) as f:
+        assert json.load(f)["base_path"] == str(tmp_path)
+
+
+def test_manifest_file_is_keyed_on_base_path():
+    assert check.manifest_file("/cache", "/opt/configuration") == (
+        check.manifest_file("/cache", "/opt/configuration/")
+    )
+    assert check.manifest_file("/cache", "/opt/configuration") != (
+        check.manifest_file("/cache", "/opt/other")
+    )
+    assert check.manifest_file("/cache", "/opt/other").startswith("/cache/")
+
+
+def test_collect_file_info_warns_when_manifest_cannot_be_written(tmp_path, loguru_logs):
+    (tmp_path / "a.txt").write_text("a")
+    # The manifest directory cannot be created below a file
+    manifest = tmp_path / "a.txt" / "manifest.json"
+
+    result = check.collect_file_info(str(tmp_path), manifest_path=str(manifest))
+
+    assert result["a.txt"]["hash"] == hashlib.md5(b"a").hexdigest()
+    assert any(
+        r["level"] == "WARNING"
+        and r["message"].startswith(f"Could not write manifest {manifest}")
+        for r in loguru_logs
+    )
+
+
 # --- parse_stat_output ---
 
 
@@ -218,6 +352,99 @@ def test_parse_stat_output_returns_empty_dict_for_empty_output():
     assert check.parse_stat_output("") == {}
 
 
+def test_parse_stat_output_merges_repeated_file_records():
+    output = "FILE:a.txt\nINODE:1\nSIZE:2\nFILE:b.txt\nINODE:3\nFILE:a.txt\nHASH:aaa\n"
+
+    result = check.parse_stat_output(output)
+
+    assert result == {
+        "a.txt": {"inode": 1, "size": 2, "hash": "aaa"},
+        "b.txt": {"inode": 3},
+    }
+
+
+# --- build_scan_script ---
+
+
+def _scan(path, max_files=100, check_content=True, env=None):
+    script = check.build_scan_script(str(path), max_files, check_content)
+    result = subprocess.run(
+        ["/bin/sh", "-c", script], capture_output=True, text=True, env=env
+    )
+    return check.parse_stat_output(result.stdout)
+
+
+def test_build_scan_script_matches_collect_file_info(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    sub = tmp_path / "sub dir"
+    sub.mkdir()
+    (sub / "it's.yml").write_text("b: 1\n")
+    (tmp_path / "large.bin").write_bytes(b"x" * (1024 * 1024))
+    for skip in (".git", "venv", "__pycache__"):
+        (tmp_path / skip).mkdir()
+        (tmp_path / skip / "ignored").write_text("x")
+    (tmp_path / "link.txt").symlink_to(tmp_path / "a.txt")
+
+    fresh = _scan(tmp_path)
+    local = check.collect_file_info(str(tmp_path))
+
+    assert set(fresh) == set(local)
+    for name, info in local.items():
+        assert fresh[name]["inode"] == info["inode"]
+        assert fresh[name]["size"] == info["size"]
+        assert fresh[name]["mtime"] == int(info["mtime"])
+        assert fresh[name].get("hash") == info["hash"]
+
+
+def test_build_scan_script_without_content_check_has_no_hashes(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+
+    assert "hash" not in _scan(tmp_path, check_content=False)["a.txt"]
+
+
+def test_build_scan_script_stops_at_max_files(tmp_path):
+    for i in range(5):
+        (tmp_path / f"{i}.txt").write_text("x")
+
+    # The listing starts with the mount path itself
+    assert len(_scan(tmp_path, max_files=3)) == 2
+
+
+def test_build_scan_script_reports_stat_errors(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    bin_dir = tmp_path.parent / f"{tmp_path.name}-bin"
+    bin_dir.mkdir()
+    fake_stat = bin_dir / "stat"
+    fake_stat.write_text(
+        "#!/bin/sh\necho \"stat: can't stat './a.txt': Permission denied\" >&2\n"
+        "exit 1\n"
+    )
+    fake_stat.chmod(0o755)
+    env = {**os.environ, "PATH": f"{bin_dir}:{os.environ['PATH']}"}
+
+    assert _scan(tmp_path, env=env) == {"a.txt": {"error": "Permission denied"}}
+
+
+def test_run_fresh_container_runs_scan_script_as_operator():
+    client = MagicMock()
+    client.containers.run.return_value = b"FILE:a.txt\n"
+    cmd = make_command(check.Mount)
+
+    output = cmd._run_fresh_container(
+        client, "alpine:latest", "/host/configuration", "/opt/configuration", True, 10
+    )
+
+    assert output == "FILE:a.txt\n"
+    kwargs = client.containers.run.call_args.kwargs
+    script = kwargs["command"][2]
+    assert check.build_scan_script("/opt/configuration", 10, True) in script
+    operator_user = check.settings.OPERATOR_USER
+    assert f'su {operator_user} -c "/bin/sh /tmp/scan.sh"' in script
+    assert kwargs["volumes"] == {
+        "/host/configuration": {"bind": "/opt/configuration", "mode": "ro"}
+    }
+
+
 # --- Mount._compare_file_info ---
 
 
@@ -432,7 +659,7 @@ def _run_mount(
     The instance helpers that talk to procfs and Docker are replaced with
     mocks so the tests steer the control flow purely through return values.
     Returns the ``(exit_code, command)`` pair; the command exposes the helper
-    mocks for call assertions.
+    mocks and the patched ``collect_file_info`` for call assertions.
     """
     cmd, parsed_args = parse_args(check.Mount, argv)
     cmd._get_container_id = MagicMock(return_value=container_id)
@@ -450,10 +677,12 @@ def _run_mount(
             return socket_exists
         return path_exists
 
+    cmd.collect_file_info = MagicMock(return_value=local_info or {})
+
     with patch("osism.commands.check.DOCKER_AVAILABLE", docker_available), patch(
         "osism.commands.check.docker", docker_mock, create=True
     ), patch("osism.commands.check.os.path.exists", side_effect=fake_exists), patch(
-        "osism.commands.check.collect_file_info", return_value=local_info or {}
+        "osism.commands.check.collect_file_info", cmd.collect_file_info
     ):
         return cmd.take_action(parsed_args), cmd
 
@@ -555,6 +784,28 @@ def test_mount_volume_uses_detected_name_without_override():
     assert cmd._run_fresh_container.call_args[0][2] == "auto"
 
 
+def test_mount_passes_content_check_and_manifest_to_local_scan():
+    _, cmd = _run_mount(
+        ["--check-content", "--manifest-dir", "/cache", "--max-files", "7"],
+        mountinfo_source="/host/configuration",
+    )
+
+    cmd.collect_file_info.assert_called_once_with(
+        "/opt/configuration",
+        7,
+        True,
+        check.manifest_file("/cache", "/opt/configuration"),
+    )
+
+
+def test_mount_without_manifest():
+    _, cmd = _run_mount(["--manifest-dir", ""], mountinfo_source="/host/configuration")
+
+    cmd.collect_file_info.assert_called_once_with(
+        "/opt/configuration", 100000, False, None
+    )
+
+
 def test_mount_fails_when_fresh_container_fails(capsys):
     result, _ = _run_mount(
         ["--format", "script"],
@@ -700,3 +951,132 @@ def test_inode_returns_zero_without_configuration_directories(tmp_path, capsys):
 
     assert result == 0
     assert capsys.readouterr().out == ""
+
+
+# --- count_entries ---
+
+
+def _usage_tree(base):
+    (base / "small").mkdir()
+    (base / "small" / "a.txt").write_text("a")
+    deep = base / "big" / "x" / "y"
+    deep.mkdir(parents=True)
+    for i in range(5):
+        (deep / f"{i}.txt").write_text("x")
+    (base / "top.txt").write_text("t")
+    (base / "link").symlink_to(base / "big", target_is_directory=True)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_count_entries_counts_per_top_level_directory(tmp_path, workers):
+    _usage_tree(tmp_path)
+    completed = []
+
+    counts, complete = check.count_entries(
+        str(tmp_path),
+        workers,
+        on_complete=lambda directory, count: completed.append((directory, count)),
+    )
+
+    expected = {
+        str(tmp_path): 2,
+        str(tmp_path / "small"): 2,
+        str(tmp_path / "big"): 8,
+    }
+    assert counts == expected
+    assert complete is True
+    assert sorted(completed) == sorted(
+        item for item in expected.items() if item[0] != str(tmp_path)
+    )
+
+
+def test_count_entries_stops_at_max_depth(tmp_path):
+    _usage_tree(tmp_path)
+
+    counts, complete = check.count_entries(str(tmp_path), max_depth=2)
+
+    assert counts[str(tmp_path / "big")] == 3
+    assert complete is True
+
+
+def test_count_entries_stops_when_time_budget_is_spent(tmp_path):
+    _usage_tree(tmp_path)
+
+    counts, complete = check.count_entries(str(tmp_path), time_budget=0)
+
+    assert counts[str(tmp_path / "big")] == 1
+    assert complete is False
+
+
+# --- Inode.take_action --usage ---
+
+
+def test_inode_usage_script_lists_biggest_first(tmp_path, capsys):
+    _usage_tree(tmp_path)
+
+    cmd, parsed_args = parse_args(
+        check.Inode, ["--usage", str(tmp_path), "--format", "script", "--top", "2"]
+    )
+    result = cmd.take_action(parsed_args)
+
+    assert result == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 2
+    assert lines[0] == f"USAGE:{tmp_path / 'big'}:8"
+    assert lines[1].endswith(":2")
+
+
+def test_inode_usage_script_marks_incomplete_counts(tmp_path, capsys):
+    _usage_tree(tmp_path)
+
+    cmd, parsed_args = parse_args(
+        check.Inode,
+        ["--usage", str(tmp_path), "--format", "script", "--time-budget", "0"],
+    )
+    result = cmd.take_action(parsed_args)
+
+    assert result == 0
+    assert capsys.readouterr().out.splitlines()[-1] == f"INCOMPLETE:{tmp_path}"
+
+
+def test_inode_usage_table_prints_filesystem_usage(tmp_path, capsys):
+    _usage_tree(tmp_path)
+
+    cmd, parsed_args = parse_args(check.Inode, ["--usage", str(tmp_path)])
+    result = cmd.take_action(parsed_args)
+
+    assert result == 0
+    out = capsys.readouterr().out
+    assert f"Inodes used on the filesystem of {tmp_path}: " in out
+    assert f"12 entries below {tmp_path}" in out
+    assert "Entries" in out
+
+
+def test_inode_usage_log_reports_subtrees_as_they_complete(tmp_path, loguru_logs):
+    _usage_tree(tmp_path)
+
+    cmd, parsed_args = parse_args(
+        check.Inode, ["--usage", str(tmp_path), "--format", "log"]
+    )
+    result = cmd.take_action(parsed_args)
+
+    assert result == 0
+    messages = [r["message"] for r in loguru_logs]
+    # The subtrees are reported as they complete, then biggest first
+    progress = messages.index(f"Counted 8 entries below {tmp_path / 'big'}")
+    biggest = messages.index(f"{tmp_path / 'big'}: 8 entries")
+    assert progress < biggest
+    assert messages[biggest + 1 :] == [
+        f"{tmp_path}: 2 entries",
+        f"{tmp_path / 'small'}: 2 entries",
+    ]
+
+
+def test_inode_usage_fails_for_missing_path(tmp_path, capsys):
+    cmd, parsed_args = parse_args(
+        check.Inode, ["--usage", str(tmp_path / "missing"), "--format", "script"]
+    )
+    result = cmd.take_action(parsed_args)
+
+    assert result == 1
+    assert capsys.readouterr().out.startswith("FAILED: ")
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import datetime
+from types import SimpleNamespace
 from unittest.mock import MagicMock, call, patch
 
 import openstack
@@ -124,7 +125,7 @@ def _run_command(command_class, args, conn, setup_success=True, prompt_mock=None
         "osism.tasks.openstack.get_cloud_helpers",
         return_value=(setup, getconn, cleanup),
     ), patch("osism.commands.compute.prompt", prompt_mock), patch(
-        "osism.commands.compute.time.sleep", MagicMock()
+        "osism.utils.actions.time.sleep", MagicMock()
     ):
         return cmd.take_action(parsed_args)
 
@@ -393,40 +394,6 @@ def test_migrate_prompt_no_skips_migration():
     conn.compute.migrate_server.assert_not_called()
 
 
-def test_migrate_cold_wait_confirms_verify_resize():
-    conn = MagicMock()
-    conn.compute.servers.return_value = [_server("id1", "srv1", "SHUTOFF")]
-    polled = _polled_server("VERIFY_RESIZE")
-    conn.compute.get_server.return_value = polled
-    result = _run_command(compute.ComputeMigrate, ["--yes", "somehost"], conn)
-    assert result is None
-    conn.compute.confirm_server_resize.assert_called_once_with(polled)
-
-
-def test_migrate_confirm_failure_reraises():
-    conn = MagicMock()
-    conn.compute.servers.return_value = [_server("id1", "srv1", "SHUTOFF")]
-    conn.compute.get_server.return_value = _polled_server("VERIFY_RESIZE")
-    conn.compute.confirm_server_resize.side_effect = RuntimeError("confirm failed")
-    with pytest.raises(RuntimeError):
-        _run_command(compute.ComputeMigrate, ["--yes", "somehost"], conn)
-
-
-def test_migrate_live_wait_until_migration_completes(loguru_logs):
-    conn = MagicMock()
-    conn.compute.servers.return_value = [_server("id1", "srv1", "ACTIVE")]
-    conn.compute.get_server.side_effect = [
-        _polled_server("MIGRATING"),
-        _polled_server("ACTIVE"),
-    ]
-    result = _run_command(compute.ComputeMigrate, ["--yes", "somehost"], conn)
-    assert result is None
-    assert conn.compute.get_server.call_count == 2
-    messages = [r["message"] for r in loguru_logs]
-    assert any("still in progress" in m for m in messages)
-    assert any("completed with status ACTIVE" in m for m in messages)
-
-
 def test_migrate_no_instances_found(loguru_logs):
     conn = MagicMock()
     conn.compute.servers.return_value = []
@@ -518,20 +485,22 @@ def test_migration_list_passes_resolved_filters_to_query():
 
 
 def test_start_starts_only_shutoff_servers(loguru_logs):
-    conn = MagicMock()
-    conn.compute.servers.return_value = [
-        _server("id1", "srv1", "SHUTOFF"),
-        _server("id2", "srv2", "ACTIVE"),
-    ]
+    fake = FakeCompute([("id1", "srv1", "SHUTOFF"), ("id2", "srv2", "ACTIVE")])
     prompt_mock = MagicMock(return_value="no")
     result = _run_command(
-        compute.ComputeStart, ["--yes", "somehost"], conn, prompt_mock=prompt_mock
+        compute.ComputeStart,
+        ["--yes", "somehost"],
+        _fake_conn(fake),
+        prompt_mock=prompt_mock,
     )
     assert result is None
     # --yes starts without consulting the prompt.
     prompt_mock.assert_not_called()
-    conn.compute.start_server.assert_called_once_with("id1")
-    assert any("cannot be started" in r["message"] for r in loguru_logs)
+    assert fake.actions == [("start", "id1")]
+    assert fake.servers_by_id["id1"].status == "ACTIVE"
+    messages = [r["message"] for r in loguru_logs]
+    assert any("cannot be started" in m for m in messages)
+    assert any("1 of 1 server(s) reached ACTIVE" in m for m in messages)
 
 
 def test_start_prompt_no_skips():
@@ -546,21 +515,44 @@ def test_start_prompt_no_skips():
     conn.compute.start_server.assert_not_called()
 
 
-def test_stop_stops_only_active_and_paused_servers(loguru_logs):
+def test_start_no_wait_only_requests(loguru_logs):
     conn = MagicMock()
     conn.compute.servers.return_value = [
-        _server("id1", "srv1", "ACTIVE"),
-        _server("id2", "srv2", "PAUSED"),
-        _server("id3", "srv3", "SHUTOFF"),
+        _server("id1", "srv1", "SHUTOFF"),
+        _server("id2", "srv2", "SHUTOFF"),
     ]
+    result = _run_command(
+        compute.ComputeStart, ["--yes", "--no-wait", "somehost"], conn
+    )
+    assert result is None
+    assert conn.compute.start_server.call_args_list == [call("id1"), call("id2")]
+    # Only the servers of the host are listed, nothing is polled
+    conn.compute.servers.assert_called_once_with(all_projects=True, node="somehost")
+    assert any(
+        "Requested start of 2 of 2 server(s)" in r["message"] for r in loguru_logs
+    )
+
+
+def test_stop_stops_only_active_and_paused_servers(loguru_logs):
+    fake = FakeCompute(
+        [
+            ("id1", "srv1", "ACTIVE"),
+            ("id2", "srv2", "PAUSED"),
+            ("id3", "srv3", "SHUTOFF"),
+        ]
+    )
     prompt_mock = MagicMock(return_value="no")
     result = _run_command(
-        compute.ComputeStop, ["--yes", "somehost"], conn, prompt_mock=prompt_mock
+        compute.ComputeStop,
+        ["--yes", "somehost"],
+        _fake_conn(fake),
+        prompt_mock=prompt_mock,
     )
     assert result is None
     # --yes stops without consulting the prompt.
     prompt_mock.assert_not_called()
-    assert conn.compute.stop_server.call_args_list == [call("id1"), call("id2")]
+    assert fake.actions == [("stop", "id1"), ("stop", "id2")]
+    assert all(s.status == "SHUTOFF" for s in fake.servers_by_id.values())
     assert any("cannot be stopped" in r["message"] for r in loguru_logs)
 
 
@@ -596,52 +588,403 @@ def test_evacuate_prompt_no_makes_no_changes():
     conn.compute.disable_service.assert_not_called()
 
 
-def test_evacuate_full_flow(loguru_logs):
+class FakeCompute:
+    """A compute API whose servers change their state over a few polls.
+
+    Every action puts the server into a task state for ``ticks`` calls of
+    ``servers(changes_since=...)``, the poll of the bulk actions, after
+    which the action completes.
+    """
+
+    def __init__(self, servers, host="somehost", ticks=2):
+        self.host = host
+        self.ticks = ticks
+        # Servers are (id, name, status), optionally followed by the RAM of
+        # their flavor and their host
+        self.servers_by_id = {
+            server[0]: SimpleNamespace(
+                id=server[0],
+                name=server[1],
+                status=server[2],
+                flavor={"ram": server[3] if len(server) > 3 else 1024},
+                compute_host=server[4] if len(server) > 4 else host,
+                task_state=None,
+            )
+            for server in servers
+        }
+        self.service = SimpleNamespace(id="service-1")
+        self.forced_down = False
+        self.disabled = False
+        self.pending = {}
+        self.polls = 0
+        self.max_in_flight = 0
+        self.failing = set()
+        # Live migrations of these servers are rolled back that many times
+        self.rollbacks = {}
+        self.sources = {}
+        self.max_in_flight_per_host = 0
+        self.actions = []
+
+    def servers(self, **query):
+        if "changes_since" in query:
+            self.polls += 1
+            for server_id in list(self.pending):
+                ticks, final = self.pending[server_id]
+                if ticks > 1:
+                    self.pending[server_id] = (ticks - 1, final)
+                    continue
+                del self.pending[server_id]
+                server = self.servers_by_id[server_id]
+                vars(server).update(final, task_state=None)
+            return [SimpleNamespace(**vars(s)) for s in self.servers_by_id.values()]
+        return [
+            SimpleNamespace(**vars(s))
+            for s in self.servers_by_id.values()
+            if s.compute_host == query.get("node")
+        ]
+
+    def _schedule(self, server_id, action, task_state, **final):
+        self.actions.append((action, server_id))
+        server = self.servers_by_id[server_id]
+        assert server.task_state is None, f"{server_id} is busy"
+        server.task_state = task_state
+        if server_id in self.failing:
+            final = {"status": "ERROR"}
+        self.pending[server_id] = (self.ticks, final)
+        self.sources[server_id] = server.compute_host
+        self.max_in_flight = max(self.max_in_flight, len(self.pending))
+        self.max_in_flight_per_host = max(
+            self.max_in_flight_per_host,
+            max(
+                sum(1 for s in self.pending if self.sources[s] == source)
+                for source in self.sources.values()
+            ),
+        )
+
+    def stop_server(self, server_id):
+        assert self.servers_by_id[server_id].status in ["ACTIVE", "PAUSED"]
+        self._schedule(server_id, "stop", "powering-off", status="SHUTOFF")
+
+    def start_server(self, server_id):
+        assert self.servers_by_id[server_id].status == "SHUTOFF"
+        self._schedule(server_id, "start", "powering-on", status="ACTIVE")
+
+    def evacuate_server(self, server_id, host=None):
+        assert self.forced_down, "evacuated before the service was forced down"
+        server = self.servers_by_id[server_id]
+        status = server.status
+        server.status = "REBUILD"
+        self._schedule(
+            server_id,
+            "evacuate",
+            "rebuilding",
+            status=status,
+            compute_host=host or "otherhost",
+        )
+
+    def live_migrate_server(self, server_id, host, block_migration, force):
+        server = self.servers_by_id[server_id]
+        assert server.status in ["ACTIVE", "PAUSED"]
+        final = {"status": server.status, "compute_host": host or "otherhost"}
+        if self.rollbacks.get(server_id):
+            self.rollbacks[server_id] -= 1
+            final = {"status": server.status}
+        server.status = "MIGRATING"
+        self._schedule(server_id, "live", "migrating", **final)
+
+    def migrate_server(self, server_id, host):
+        server = self.servers_by_id[server_id]
+        assert server.status == "SHUTOFF"
+        server.status = "RESIZE"
+        self._schedule(
+            server_id,
+            "cold",
+            "resize_prep",
+            status="VERIFY_RESIZE",
+            compute_host=host or "otherhost",
+        )
+
+    def confirm_server_resize(self, server_id):
+        assert self.servers_by_id[server_id].status == "VERIFY_RESIZE"
+        self._schedule(server_id, "confirm", "resize_confirming", status="SHUTOFF")
+
+    def services(self, **query):
+        return iter([self.service])
+
+    def update_service_forced_down(self, service, host, binary, forced):
+        assert not self.pending, "forced down while servers were still stopping"
+        self.forced_down = forced
+
+    def disable_service(self, service, host, binary, disabled_reason):
+        self.disabled = disabled_reason
+
+
+def _fake_conn(compute_api):
     conn = MagicMock()
-    conn.compute.servers.return_value = [
-        _server("id1", "srv1", "ACTIVE"),
-        _server("id2", "srv2", "SHUTOFF"),
-        _server("id3", "srv3", "ERROR"),
-    ]
-    service = _service()
-    conn.compute.services.return_value = iter([service])
-    # First poll: the stopped server reached SHUTOFF; second poll: the
-    # restarted server reached ACTIVE.
-    conn.compute.get_server.side_effect = [
-        _polled_server("SHUTOFF"),
-        _polled_server("ACTIVE"),
+    conn.compute = compute_api
+    return conn
+
+
+def test_evacuate_full_flow(capsys, loguru_logs):
+    fake = FakeCompute(
+        [
+            ("id1", "srv1", "ACTIVE"),
+            ("id2", "srv2", "SHUTOFF"),
+            ("id3", "srv3", "ERROR"),
+        ]
+    )
+
+    result = _run_command(
+        compute.ComputeEvacuate,
+        ["--yes", "--target", "target1", "somehost"],
+        _fake_conn(fake),
+    )
+
+    assert result is None
+    servers = fake.servers_by_id
+    # The running server is stopped, evacuated and started again, the
+    # stopped one only evacuated
+    assert [a for a in fake.actions if a[1] == "id1"] == [
+        ("stop", "id1"),
+        ("evacuate", "id1"),
+        ("start", "id1"),
     ]
+    assert [a for a in fake.actions if a[1] == "id2"] == [("evacuate", "id2")]
+    assert (servers["id1"].status, servers["id1"].compute_host) == (
+        "ACTIVE",
+        "target1",
+    )
+    assert (servers["id2"].status, servers["id2"].compute_host) == (
+        "SHUTOFF",
+        "target1",
+    )
+    assert servers["id3"].compute_host == "somehost"
+    assert fake.disabled == "EVACUATE"
+
+    assert any(
+        "srv3" in r["message"] and "cannot be evacuated" in r["message"]
+        for r in loguru_logs
+    )
+    out = capsys.readouterr().out
+    for header in ["Stop", "Evacuate", "Start", "Result"]:
+        assert header in out
+    rows = [line for line in out.splitlines() if "srv" in line]
+    assert len(rows) == 2
+    assert all("OK" in row for row in rows)
+
+
+def test_evacuate_runs_servers_concurrently_with_batched_polls():
+    fake = FakeCompute(
+        [(f"id{i}", f"srv{i}", "ACTIVE" if i % 2 else "SHUTOFF") for i in range(30)]
+    )
 
     result = _run_command(
-        compute.ComputeEvacuate, ["--yes", "--target", "target1", "somehost"], conn
+        compute.ComputeEvacuate,
+        ["--yes", "--parallel", "5", "somehost"],
+        _fake_conn(fake),
     )
+
     assert result is None
+    assert fake.max_in_flight == 5
+    assert all(
+        s.compute_host == "otherhost" and s.task_state is None
+        for s in fake.servers_by_id.values()
+    )
+    # One list call per poll for all servers instead of one GET per server
+    # and poll: 15 stops, 30 evacuations and 15 starts take 2 polls each
+    assert fake.polls <= 2 * (3 + 6 + 3) + 2
 
-    # The ACTIVE server is stopped first and recorded for restart.
-    conn.compute.stop_server.assert_called_once_with("id1")
-    conn.compute.start_server.assert_called_once_with("id1")
 
-    conn.compute.update_service_forced_down.assert_called_once_with(
-        service=service.id, host="somehost", binary="nova-compute", forced=True
+def test_evacuate_reports_failed_servers(capsys):
+    fake = FakeCompute([("id1", "srv1", "SHUTOFF"), ("id2", "srv2", "SHUTOFF")])
+    fake.failing.add("id2")
+
+    result = _run_command(
+        compute.ComputeEvacuate, ["--yes", "somehost"], _fake_conn(fake)
     )
-    assert conn.compute.evacuate_server.call_args_list == [
-        call("id1", host="target1"),
-        call("id2", host="target1"),
+
+    assert result == 1
+    assert fake.servers_by_id["id1"].compute_host == "otherhost"
+    row = next(line for line in capsys.readouterr().out.splitlines() if "srv2" in line)
+    assert "evacuate failed: status ERROR" in row
+    assert fake.disabled == "EVACUATE"
+
+
+# ---------------------------------------------------------------------------
+# ComputeMigrate with waiting
+# ---------------------------------------------------------------------------
+
+
+def test_migrate_live_and_cold_wait_until_done(capsys):
+    fake = FakeCompute([("id1", "srv1", "ACTIVE"), ("id2", "srv2", "SHUTOFF")])
+
+    result = _run_command(
+        compute.ComputeMigrate,
+        ["--yes", "--target", "target1", "somehost"],
+        _fake_conn(fake),
+    )
+
+    assert result is None
+    servers = fake.servers_by_id
+    assert (servers["id1"].status, servers["id1"].compute_host) == (
+        "ACTIVE",
+        "target1",
+    )
+    # The cold migration is confirmed once the server waits in VERIFY_RESIZE
+    assert [a for a in fake.actions if a[1] == "id2"] == [
+        ("cold", "id2"),
+        ("confirm", "id2"),
     ]
-    conn.compute.disable_service.assert_called_once_with(
-        service=service.id,
-        host="somehost",
-        binary="nova-compute",
-        disabled_reason="EVACUATE",
+    assert (servers["id2"].status, servers["id2"].compute_host) == (
+        "SHUTOFF",
+        "target1",
+    )
+    out = capsys.readouterr().out
+    for header in ["Host", "RAM (MB)", "Type", "Retries", "Result"]:
+        assert header in out
+    rows = [line for line in out.splitlines() if "srv" in line]
+    assert len(rows) == 2
+    assert all("OK" in row for row in rows)
+
+
+@pytest.mark.parametrize(
+    "order, expected",
+    [("small-first", ["id2", "id3", "id1"]), ("large-first", ["id1", "id3", "id2"])],
+)
+def test_migrate_orders_by_ram(order, expected):
+    fake = FakeCompute(
+        [
+            ("id1", "srv1", "ACTIVE", 8192),
+            ("id2", "srv2", "ACTIVE", 512),
+            ("id3", "srv3", "ACTIVE", 2048),
+        ]
+    )
+
+    result = _run_command(
+        compute.ComputeMigrate,
+        ["--yes", "--parallel", "1", "--order", order, "somehost"],
+        _fake_conn(fake),
+    )
+
+    assert result is None
+    assert [server_id for _, server_id in fake.actions] == expected
+
+
+def test_migrate_limits_migrations_per_host():
+    fake = FakeCompute(
+        [
+            (f"id{i}", f"srv{i}", "ACTIVE", 1024, "node-a" if i < 6 else "node-b")
+            for i in range(12)
+        ]
+    )
+
+    result = _run_command(
+        compute.ComputeMigrate,
+        ["--yes", "--parallel", "3", "--parallel-per-host", "1", "node-a", "node-b"],
+        _fake_conn(fake),
+    )
+
+    assert result is None
+    assert fake.max_in_flight == 2
+    assert fake.max_in_flight_per_host == 1
+    assert all(s.compute_host == "otherhost" for s in fake.servers_by_id.values())
+
+
+def test_migrate_retries_rolled_back_live_migration(capsys, loguru_logs):
+    fake = FakeCompute([("id1", "srv1", "ACTIVE")])
+    fake.rollbacks["id1"] = 1
+
+    result = _run_command(
+        compute.ComputeMigrate,
+        ["--yes", "--retry-delay", "0", "somehost"],
+        _fake_conn(fake),
+    )
+
+    assert result is None
+    assert fake.actions == [("live", "id1"), ("live", "id1")]
+    assert fake.servers_by_id["id1"].compute_host == "otherhost"
+    assert any(
+        "migration was rolled back, retrying" in r["message"] for r in loguru_logs
+    )
+    row = next(line for line in capsys.readouterr().out.splitlines() if "srv1" in line)
+    cells = [cell.strip() for cell in row.strip("|").split("|")]
+    assert cells[-2:] == ["1", "OK"]
+
+
+def test_migrate_reports_migrations_failing_after_retries(capsys):
+    fake = FakeCompute([("id1", "srv1", "ACTIVE"), ("id2", "srv2", "ACTIVE")])
+    fake.rollbacks["id2"] = 3
+
+    result = _run_command(
+        compute.ComputeMigrate,
+        ["--yes", "--retries", "1", "--retry-delay", "0", "somehost"],
+        _fake_conn(fake),
+    )
+
+    assert result == 1
+    assert fake.servers_by_id["id1"].compute_host == "otherhost"
+    assert fake.servers_by_id["id2"].compute_host == "somehost"
+    assert fake.actions.count(("live", "id2")) == 2
+    row = next(line for line in capsys.readouterr().out.splitlines() if "srv2" in line)
+    assert "live failed: migration was rolled back" in row
+
+
+# ---------------------------------------------------------------------------
+# ComputeStart / ComputeStop in bulk
+# ---------------------------------------------------------------------------
+
+
+def test_start_500_servers_of_several_hosts(loguru_logs):
+    fake = FakeCompute(
+        [(f"id{i}", f"srv{i}", "SHUTOFF", 1024, f"node-{i % 20}") for i in range(500)],
+        ticks=3,
     )
 
-    # The service is forced down before any server is evacuated.
-    method_calls = [name for name, _args, _kwargs in conn.mock_calls]
-    assert method_calls.index(
-        "compute.update_service_forced_down"
-    ) < method_calls.index("compute.evacuate_server")
+    result = _run_command(
+        compute.ComputeStart,
+        ["--yes", "--parallel", "50", "--rate", "0"] + [f"node-{i}" for i in range(20)],
+        _fake_conn(fake),
+    )
 
+    assert result is None
+    assert all(
+        s.status == "ACTIVE" and s.task_state is None
+        for s in fake.servers_by_id.values()
+    )
+    assert fake.max_in_flight == 50
+    # One list call per poll for all servers in flight instead of one GET
+    # per server: 10 rounds of 50 servers taking 3 polls each
+    assert fake.polls <= 10 * 3 + 3
     assert any(
-        "srv3" in r["message"] and "cannot be evacuated" in r["message"]
+        "500 of 500 server(s) reached ACTIVE" in r["message"] for r in loguru_logs
+    )
+
+
+def test_stop_rate_limits_api_calls(mocker):
+    fake = FakeCompute([(f"id{i}", f"srv{i}", "ACTIVE") for i in range(5)])
+    run = mocker.patch("osism.commands.compute.run_workflows", return_value=[])
+
+    _run_command(
+        compute.ComputeStop, ["--yes", "--rate", "2.5", "somehost"], _fake_conn(fake)
+    )
+
+    assert run.call_args.kwargs["rate"] == 2.5
+    assert len(run.call_args.args[0]) == 5
+
+
+def test_stop_reports_failed_servers(capsys, loguru_logs):
+    fake = FakeCompute([("id1", "srv1", "ACTIVE"), ("id2", "srv2", "ACTIVE")])
+    fake.failing.add("id2")
+
+    result = _run_command(compute.ComputeStop, ["--yes", "somehost"], _fake_conn(fake))
+
+    assert result == 1
+    assert fake.servers_by_id["id1"].status == "SHUTOFF"
+    out = capsys.readouterr().out
+    assert "srv1" not in out
+    row = next(line for line in out.splitlines() if "srv2" in line)
+    assert "stop failed: status ERROR" in row
+    assert any(
+        r["level"] == "ERROR" and "1 of 2 server(s) reached SHUTOFF" in r["message"]
         for r in loguru_logs
     )
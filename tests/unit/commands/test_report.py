@@ -16,6 +16,7 @@ must end up in the failure summary instead of the table.
 
 import json
 import subprocess
+import time
 from contextlib import contextmanager
 from unittest.mock import MagicMock, patch
 
@@ -29,9 +30,12 @@ COMMANDS = [report.Memory, report.Lldp, report.Bgp, report.Status]
 ARGS = {report.Status: ["bootstrap"]}
 
 
-def _make(cls):
+def _make(cls, *args):
+    # One host at a time, so the mocked SSH results are handed out in order
     cmd = cls(MagicMock(), MagicMock())
-    return cmd, cmd.get_parser("test").parse_args(ARGS.get(cls, []))
+    return cmd, cmd.get_parser("test").parse_args(
+        [*ARGS.get(cls, []), "--parallel", "1", *args]
+    )
 
 
 @pytest.mark.parametrize("cls", COMMANDS)
@@ -420,3 +424,36 @@ def test_status_marks_host_failed_on_unparsable_facts(loguru_logs):
     messages = [record["message"] for record in loguru_logs]
     assert any("Could not parse bootstrap info from host-a." in m for m in messages)
     assert any("Failed to query 1 host(s): host-a" in m for m in messages)
+
+
+# --- parallel fan-out ---
+
+
+def test_parallel_report_keeps_inventory_order(capsys):
+    """Hosts finishing out of order still appear in inventory order."""
+    cmd, parsed_args = _make(report.Memory, "--parallel", "3")
+    memory = {"host-a": "64", "host-b": "32", "host-c": "16"}
+
+    def run(command, **kwargs):
+        if command[0] == "ansible-inventory":
+            return _proc(stdout="{}")
+        host = command[-2].split("@")[1]
+        if host == "host-a":
+            # The first host answers last
+            time.sleep(0.2)
+        if "dmidecode" in command[-1]:
+            return _proc(stdout=memory[host] + "\n")
+        return _proc(stdout=f"uuid-{host}\n")
+
+    with _ssh_env(["host-a", "host-b", "host-c"], []), patch(
+        "osism.commands.report.subprocess.run", side_effect=run
+    ):
+        result = cmd.take_action(parsed_args)
+
+    assert not result
+    out = capsys.readouterr().out
+    assert (
+        out.index("uuid-host-a") < out.index("uuid-host-b") < out.index("uuid-host-c")
+    )
+    assert "Memory: 112 GB" in out
+    assert "Duration: " in out
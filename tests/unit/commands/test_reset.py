@@ -4,12 +4,13 @@
 
 These cover the two reset paths and their edge cases: flushing the whole
 ``ansible_facts*`` cache (including the empty-cache no-op), restricting the
-reset to the hosts a ``--limit`` pattern resolves to, and the error contracts
+reset to the hosts a ``--limit`` pattern resolves to, together with their
+entries in the fact index (``ansible_cache_keys``), and the error contracts
 for a failed inventory load and an unreachable Redis.
 """
 
 import subprocess
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 from redis.exceptions import RedisError
@@ -53,9 +54,11 @@ def test_facts_flushes_all_keys_when_no_limit(mock_redis, loguru_logs):
 
     assert rc == 0
     mock_redis.scan.assert_called_once_with(0, match="ansible_facts*", count=100)
-    mock_redis.delete.assert_called_once_with(
-        b"ansible_factsnode1", b"ansible_factsnode2"
-    )
+    # The facts and the index of their gather times
+    assert mock_redis.delete.call_args_list == [
+        call(b"ansible_factsnode1", b"ansible_factsnode2"),
+        call("ansible_cache_keys"),
+    ]
     assert any("2 host(s)" in r["message"] for r in loguru_logs)
 
 
@@ -65,7 +68,7 @@ def test_facts_succeeds_and_skips_delete_when_cache_empty(mock_redis, loguru_log
     rc = _make().take_action(_parse())
 
     assert rc == 0
-    mock_redis.delete.assert_not_called()
+    mock_redis.delete.assert_called_once_with("ansible_cache_keys")
     infos = [r for r in loguru_logs if r["level"] == "INFO"]
     assert any("0 host(s)" in r["message"] for r in infos)
 
@@ -117,6 +120,7 @@ def test_facts_limit_deletes_only_selected_hosts(mock_redis):
     mock_redis.delete.assert_called_once_with(
         "ansible_factsnode1", "ansible_factsnode2"
     )
+    mock_redis.zrem.assert_called_once_with("ansible_cache_keys", "node1", "node2")
 
 
 def test_facts_limit_returns_nonzero_when_inventory_fails(mock_redis, loguru_logs):
@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the ``osism search facts`` command."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+import pytest
+from redis.exceptions import RedisError
+
+from osism.commands import search
+
+
+def _make():
+    return search.Facts(MagicMock(), MagicMock())
+
+
+def _parse(*args):
+    return _make().get_parser("test").parse_args(list(args))
+
+
+@pytest.fixture
+def fake_redis():
+    client = fakeredis.FakeStrictRedis()
+    for host, kernel in (("node1", "6.8.0"), ("node2", "6.9.0"), ("node3", "6.8.0")):
+        client.set(
+            f"ansible_facts{host}",
+            json.dumps(
+                {"ansible_date_time": {"epoch": "100"}, "ansible_kernel": kernel}
+            ),
+        )
+        client.zadd("ansible_cache_keys", {host: 100})
+    with patch("osism.utils._init_redis", return_value=client), patch(
+        "osism.commands.search.utils.redis", client, create=True
+    ), patch("osism.settings.FACTS_SEARCH_PATHS", ["ansible_kernel"]):
+        yield client
+
+
+def test_facts_lists_hosts_with_value(fake_redis, capsys):
+    rc = _make().take_action(_parse("ansible_kernel", "6.8.0"))
+
+    assert rc == 0
+    out = capsys.readouterr().out
+    assert "node1" in out
+    assert "node3" in out
+    assert "node2" not in out
+
+
+def test_facts_lists_values_with_host_counts(fake_redis, capsys):
+    rc = _make().take_action(_parse("ansible_kernel"))
+
+    assert rc == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert any("6.8.0" in line and "2" in line for line in lines)
+    assert any("6.9.0" in line and "1" in line for line in lines)
+
+
+def test_facts_without_matches_logs_info(fake_redis, capsys, loguru_logs):
+    rc = _make().take_action(_parse("ansible_kernel", "5.15.0"))
+
+    assert rc == 0
+    assert capsys.readouterr().out == ""
+    assert any(
+        "No hosts found with ansible_kernel 5.15.0" in r["message"] for r in loguru_logs
+    )
+
+
+def test_facts_unindexed_path_returns_nonzero(fake_redis, loguru_logs):
+    rc = _make().take_action(_parse("ansible_lsb", "x"))
+
+    assert rc == 1
+    errors = [r["message"] for r in loguru_logs if r["level"] == "ERROR"]
+    assert any(
+        "Fact path 'ansible_lsb' is not indexed. Indexed fact paths: ansible_kernel"
+        in m
+        for m in errors
+    )
+
+
+def test_facts_returns_nonzero_on_redis_error(loguru_logs):
+    client = MagicMock()
+    client.pipeline.return_value.execute.side_effect = RedisError("connection refused")
+    with patch("osism.utils._init_redis", return_value=client), patch(
+        "osism.commands.search.utils.redis", client, create=True
+    ):
+        rc = _make().take_action(_parse("ansible_kernel", "6.8.0"))
+
+    assert rc == 1
+    errors = [r["message"] for r in loguru_logs if r["level"] == "ERROR"]
+    assert any("Failed to search the Ansible fact cache" in m for m in errors)
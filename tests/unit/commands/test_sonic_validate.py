@@ -434,3 +434,88 @@ def test_print_text_report_formats_results(capsys):
     assert "- just broken" in out
     assert "[ERROR] missing: configuration not available" in out
     assert "Summary: 1 valid, 2 failed, 3 total" in out
+
+
+# --- Validate --fabric ---
+
+
+def _fabric_device(name, sonic_config=None):
+    return SimpleNamespace(
+        id=hash(name),
+        name=name,
+        serial=None,
+        custom_fields={},
+        local_context_data={"sonic_config": sonic_config} if sonic_config else None,
+    )
+
+
+@pytest.fixture
+def fabric_mocks(mocker):
+    from osism.tasks.conductor.sonic import fabric
+    from osism.tasks.conductor.sonic.validator import ValidationResult
+
+    return SimpleNamespace(
+        devices=mocker.patch.object(fabric, "get_fabric_devices"),
+        links=mocker.patch.object(fabric, "get_fabric_links", return_value=[]),
+        validate=mocker.patch.object(
+            fabric, "validate_config", return_value=ValidationResult(valid=True)
+        ),
+    )
+
+
+def test_fabric_requires_netbox_or_export_dir(fabric_mocks, loguru_logs):
+    cmd, parsed_args = _parse_validate(["--generate", "h1", "--fabric"])
+
+    assert cmd.take_action(parsed_args) == 2
+    fabric_mocks.devices.assert_not_called()
+    assert any("--fabric requires" in record["message"] for record in loguru_logs)
+
+
+def test_fabric_without_devices_returns_two(fabric_mocks):
+    fabric_mocks.devices.return_value = []
+    cmd, parsed_args = _parse_validate(["--from-netbox", "--fabric"])
+
+    assert cmd.take_action(parsed_args) == 2
+
+
+def test_fabric_from_netbox_json_report(fabric_mocks, capsys):
+    devices = [_fabric_device("leaf1", {"PORT": {}}), _fabric_device("leaf2")]
+    fabric_mocks.devices.return_value = devices
+    cmd, parsed_args = _parse_validate(
+        ["leaf1", "leaf2", "--from-netbox", "--fabric", "--format", "json"]
+    )
+
+    assert cmd.take_action(parsed_args) == 2
+
+    fabric_mocks.devices.assert_called_once_with(["leaf1", "leaf2"])
+    fabric_mocks.links.assert_called_once_with(devices)
+    fabric_mocks.validate.assert_called_once_with({"PORT": {}})
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["devices"]["leaf1"]["valid"] is True
+    assert payload["devices"]["leaf2"]["valid"] is False
+    assert payload["summary"]["failed"] == 1
+
+
+def test_fabric_from_export_dir_reports_cross_device_issues(
+    fabric_mocks, export_settings, monkeypatch, tmp_path, capsys
+):
+    monkeypatch.setattr("osism.settings.SONIC_EXPORT_IDENTIFIER", "hostname")
+    for name, mtu in (("leaf1", "9100"), ("spine1", "1500")):
+        (tmp_path / f"osism_{name}_config_db.json").write_text(
+            json.dumps({"PORT": {"Ethernet0": {"mtu": mtu}}})
+        )
+    fabric_mocks.devices.return_value = [
+        _fabric_device("leaf1"),
+        _fabric_device("spine1"),
+    ]
+    fabric_mocks.links.return_value = [
+        (("leaf1", "Ethernet0"), ("spine1", "Ethernet0"))
+    ]
+    cmd, parsed_args = _parse_validate(["--from-export-dir", str(tmp_path), "--fabric"])
+
+    assert cmd.take_action(parsed_args) == 1
+
+    out = capsys.readouterr().out
+    assert "[OK]    leaf1" in out
+    assert "[FAIL]  fabric (mtu): MTU mismatch on link leaf1:Ethernet0" in out
+    assert "Fabric: 1 cross-device error(s)" in out
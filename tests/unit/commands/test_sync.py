@@ -108,7 +108,7 @@ def test_sonic_syncs_specific_device_and_logs_device_name(loguru_logs):
     result, mock_check, mock_delay, mock_handle = _run_sonic(["switch1"])
 
     mock_check.assert_called_once()
-    mock_delay.assert_called_once_with("switch1", True)
+    mock_delay.assert_called_once_with("switch1", True, False)
     mock_handle.assert_called_once_with(mock_delay.return_value, wait=True)
     assert result == 0
     assert any(
@@ -120,7 +120,7 @@ def test_sonic_syncs_specific_device_and_logs_device_name(loguru_logs):
 def test_sonic_without_device_logs_generic_message(loguru_logs):
     _, _, mock_delay, _ = _run_sonic([])
 
-    mock_delay.assert_called_once_with(None, True)
+    mock_delay.assert_called_once_with(None, True, False)
     assert any("(sync sonic) started" in record["message"] for record in loguru_logs)
     assert not any("for device" in record["message"] for record in loguru_logs)
 
@@ -128,10 +128,16 @@ def test_sonic_without_device_logs_generic_message(loguru_logs):
 def test_sonic_no_diff_and_no_wait_are_forwarded():
     _, _, mock_delay, mock_handle = _run_sonic(["switch1", "--no-diff", "--no-wait"])
 
-    mock_delay.assert_called_once_with("switch1", False)
+    mock_delay.assert_called_once_with("switch1", False, False)
     mock_handle.assert_called_once_with(mock_delay.return_value, wait=False)
 
 
+def test_sonic_force_is_forwarded():
+    _, _, mock_delay, _ = _run_sonic(["--force"])
+
+    mock_delay.assert_called_once_with(None, True, True)
+
+
 # --- Versions._get_kolla_version_from_release ---
 
 
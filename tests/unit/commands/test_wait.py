@@ -16,12 +16,19 @@ raised ``UnboundLocalError`` on a timeout with two tasks.
 
 The remaining tests characterize the non-``--live`` loop: task-id discovery
 via the Celery inspect API, the PENDING/STARTED re-queue behaviour, the
-``--output`` and ``--refresh`` options, and the script output format.
+``--output`` and ``--refresh`` options, and the script output format. The
+last ones run against a Redis result backend on fakeredis and cover waiting
+for the state changes the backend publishes.
 """
 
+import threading
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import fakeredis
+import pytest
+from celery.backends.redis import RedisBackend
+
 from osism.commands import wait
 
 
@@ -194,6 +201,24 @@ def test_started_task_without_live_is_requeued_until_success(loguru_logs):
     assert "Task taskid1 is in state SUCCESS" in messages
 
 
+def test_started_task_waits_the_delay_before_every_check():
+    # The queue of the next check must not alias the queue of the current
+    # one, that re-checked the tasks without any delay after the first one
+    mocks = _run_states(
+        ["taskid1"],
+        results=[
+            _make_result("STARTED"),
+            _make_result("STARTED"),
+            _make_result("STARTED"),
+            _make_result("SUCCESS"),
+        ],
+    )
+
+    assert mocks.rc == 0
+    assert mocks.async_result.call_count == 4
+    assert mocks.sleep.call_count == 3
+
+
 def test_refresh_consults_task_list_again_after_queue_drains():
     # NOTE: ``--refresh`` only takes effect when no task IDs are given on the
     # command line: with explicit IDs ``do_refresh`` stays False and the loop
@@ -235,3 +260,145 @@ def test_script_format_prints_unavailable_for_unknown_pending_task(capsys):
 
     assert mocks.rc == 0
     assert capsys.readouterr().out == "taskid1 = UNAVAILABLE\n"
+
+
+# --- state changes pushed by the Redis result backend ---
+
+
+@pytest.fixture
+def backend():
+    """A Celery app whose Redis result backend runs on fakeredis.
+
+    ``osism wait`` builds its own app from the same configuration, so it
+    gets the same fakeredis client.
+    """
+    from celery import Celery
+
+    from osism.tasks import Config
+
+    client = fakeredis.FakeRedis()
+    with patch(
+        "celery.backends.redis.RedisBackend._create_client", return_value=client
+    ):
+        app = Celery("test")
+        app.config_from_object(Config)
+        yield app.backend
+
+
+def _finish_on_first_wait(backend, *task_ids):
+    """Store SUCCESS for the tasks one after the other in a thread.
+
+    The thread starts when wait first waits for a state change, so the
+    tasks are still running at the first check.
+    """
+
+    def finish():
+        for task_id in task_ids:
+            backend.store_result(task_id, task_id, "SUCCESS")
+
+    thread = threading.Thread(target=finish)
+    original_wait = wait.StateChanges.wait
+
+    def wait_and_finish(self, timeout):
+        if not thread.is_alive() and thread.ident is None:
+            thread.start()
+        return original_wait(self, timeout)
+
+    return thread, patch.object(wait.StateChanges, "wait", wait_and_finish)
+
+
+def _run_wait(args):
+    cmd = wait.Run(MagicMock(), MagicMock())
+    parsed_args = cmd.get_parser("test").parse_args(args)
+    with patch("osism.commands.wait.time.sleep") as mock_sleep:
+        rc = cmd.take_action(parsed_args)
+    return rc, mock_sleep
+
+
+def test_push_waits_for_state_changes_instead_of_polling(backend, loguru_logs):
+    for task_id in ("taskid1", "taskid2"):
+        backend.store_result(task_id, None, "STARTED")
+    thread, finishing = _finish_on_first_wait(backend, "taskid1", "taskid2")
+
+    # Reads of the task states by wait, not by the thread storing them
+    reads = []
+    get = RedisBackend.get
+
+    def counting_get(self, key):
+        if threading.current_thread() is threading.main_thread():
+            reads.append(key)
+        return get(self, key)
+
+    with finishing, patch.object(RedisBackend, "get", counting_get):
+        rc, mock_sleep = _run_wait(["taskid1", "taskid2", "--delay", "10"])
+    thread.join()
+
+    assert rc == 0
+    mock_sleep.assert_not_called()
+    # One read per task at the start and one per change
+    assert len(reads) == 4
+    messages = [record["message"] for record in loguru_logs]
+    assert "Task taskid1 is in state SUCCESS" in messages
+    assert "Task taskid2 is in state SUCCESS" in messages
+    assert "Wait for a state change of 2 task(s)" in messages
+
+
+def test_push_rechecks_all_tasks_when_no_change_arrives(backend, loguru_logs):
+    backend.store_result("taskid1", None, "STARTED")
+
+    def finish_silently():
+        # Store the result without publishing it, like a lost message
+        threading.Event().wait(0.05)
+        meta = backend._get_result_meta("taskid1", "SUCCESS", None, None)
+        backend.client.set(backend.get_key_for_task("taskid1"), backend.encode(meta))
+
+    thread = threading.Thread(target=finish_silently)
+    thread.start()
+    with patch("osism.commands.wait.RECHECK_INTERVAL", 0.2):
+        rc, _ = _run_wait(["taskid1", "--delay", "0"])
+    thread.join()
+
+    assert rc == 0
+    assert "Task taskid1 is in state SUCCESS" in [
+        record["message"] for record in loguru_logs
+    ]
+
+
+def test_poll_option_sleeps_between_checks(backend):
+    backend.store_result("taskid1", None, "STARTED")
+    states = iter(["STARTED", "SUCCESS"])
+
+    with patch(
+        "celery.result.AsyncResult",
+        side_effect=lambda *args, **kwargs: _make_result(next(states)),
+    ):
+        rc, mock_sleep = _run_wait(["taskid1", "--poll"])
+
+    assert rc == 0
+    mock_sleep.assert_called_once_with(1)
+
+
+def test_push_falls_back_to_polling_when_waiting_fails(backend, loguru_logs):
+    states = iter(["STARTED", "SUCCESS"])
+
+    with patch(
+        "celery.result.AsyncResult",
+        side_effect=lambda *args, **kwargs: _make_result(next(states)),
+    ), patch.object(
+        wait.StateChanges, "wait", side_effect=ConnectionError("connection lost")
+    ):
+        rc, mock_sleep = _run_wait(["taskid1"])
+
+    assert rc == 0
+    mock_sleep.assert_called_once_with(1)
+    assert any(
+        record["level"] == "WARNING"
+        and "Waiting for state changes failed, polling" in record["message"]
+        for record in loguru_logs
+    )
+
+
+def test_state_changes_are_unavailable_without_redis_backend():
+    app = MagicMock()
+
+    assert wait.StateChanges.create(app) is None
@@ -4,7 +4,9 @@
 
 Covers Redis initialization, the publish path with reconnect and local-queue
 fallback in ``add_event``, the subscriber and processor loops, single-event
-processing and shutdown.
+processing and shutdown. The stream transport runs against ``fakeredis``, so
+pipelined writes, the stored offset and replay round-trip through real stream
+commands.
 
 Every test constructs a fresh ``EventBridge`` with
 ``osism.services.event_bridge.redis.Redis`` patched (the ``bridge`` fixture)
@@ -25,12 +27,14 @@ so the plain ``caplog`` fixture is used for log assertions.
 import asyncio
 import json
 import logging
+import uuid
 import queue
 from unittest.mock import AsyncMock, MagicMock
 
+import fakeredis
 import pytest
 
-from osism.services.event_bridge import EventBridge
+from osism.services.event_bridge import STREAM_OFFSET_TTL, EventBridge
 from osism.services.websocket_manager import WebSocketManager
 
 
@@ -449,6 +453,23 @@ class TestProcessSingleEvent:
             "a.b", {"x": 1}
         )
 
+    def test_stream_entry_id_and_timestamp_are_kept(self, bridge):
+        manager = MagicMock()
+        manager.broadcast_event_from_notification = AsyncMock()
+        manager.loop = None
+        bridge._websocket_manager = manager
+        bridge._process_single_event(
+            {
+                "id": "1-0",
+                "timestamp": "2026-01-01T00:00:00Z",
+                "event_type": "a.b",
+                "payload": {},
+            }
+        )
+        manager.broadcast_event_from_notification.assert_awaited_once_with(
+            "a.b", {}, event_id="1-0", timestamp="2026-01-01T00:00:00Z"
+        )
+
     def test_coroutine_error_is_swallowed(self, bridge, caplog):
         caplog.set_level(logging.ERROR, logger="osism.event_bridge")
         manager = MagicMock()
@@ -588,3 +609,236 @@ class TestShutdown:
         bridge._subscriber_thread = None
         bridge.shutdown()
         processor.join.assert_not_called()
+
+
+@pytest.fixture
+def stream_bridge(redis_cls):
+    """Bridge on the stream transport backed by a shared fakeredis server."""
+    server = fakeredis.FakeServer()
+
+    def make(consumer="api", stream_maxlen=None):
+        redis_cls.return_value = fakeredis.FakeRedis(
+            server=server, decode_responses=True
+        )
+        return EventBridge(
+            transport="stream", consumer=consumer, stream_maxlen=stream_maxlen
+        )
+
+    return make
+
+
+def _drain_publish_queue(bridge):
+    """Run the publisher loop synchronously until the queue is empty."""
+    bridge._shutdown_event.set()
+    bridge._stream_publisher_loop()
+
+
+def _read_stream(bridge, events):
+    """Run the stream reader until ``events`` events have been handled."""
+    handled = []
+
+    def handle(event_data):
+        handled.append(event_data)
+        if len(handled) == events:
+            bridge._shutdown_event.set()
+
+    bridge._process_single_event = handle
+    bridge._websocket_manager = MagicMock()
+    bridge._redis_stream_loop()
+    bridge._shutdown_event.clear()
+    return handled
+
+
+class TestStreamTransport:
+    def test_unknown_transport_falls_back_to_pubsub(self, redis_cls, caplog):
+        caplog.set_level(logging.WARNING, logger="osism.event_bridge")
+        bridge = EventBridge(transport="kafka")
+        assert bridge._transport == "pubsub"
+        assert "Unknown event bridge transport kafka" in caplog.text
+
+    def test_stream_transport_does_not_create_pubsub(self, redis_cls):
+        bridge = EventBridge(transport="stream")
+        redis_cls.return_value.pubsub.assert_not_called()
+        assert bridge._redis_subscriber is None
+
+    def test_set_websocket_manager_starts_stream_reader(self, redis_cls, mocker):
+        bridge = EventBridge(transport="stream")
+        start_reader = mocker.patch.object(bridge, "_start_redis_stream_reader")
+        start_subscriber = mocker.patch.object(bridge, "_start_redis_subscriber")
+        mocker.patch.object(bridge, "_start_processor_thread")
+        bridge.set_websocket_manager(MagicMock())
+        start_reader.assert_called_once_with()
+        start_subscriber.assert_not_called()
+
+    def test_add_event_queues_for_publisher(self, stream_bridge, mocker):
+        bridge = stream_bridge()
+        start = mocker.patch.object(bridge, "_start_stream_publisher")
+        bridge.add_event("a.b", {"x": 1})
+        start.assert_called_once_with()
+        assert bridge._publish_queue.get_nowait() == {
+            "event_type": "a.b",
+            "payload": {"x": 1},
+        }
+
+    def test_publisher_writes_batches_with_one_pipeline(self, stream_bridge, mocker):
+        bridge = stream_bridge()
+        for i in range(150):
+            bridge._publish_queue.put_nowait({"event_type": "a.b", "payload": {"i": i}})
+        pipeline = mocker.spy(bridge._redis_client, "pipeline")
+
+        _drain_publish_queue(bridge)
+
+        assert pipeline.call_count == 2
+        entries = bridge._redis_client.xrange("osism:events")
+        assert [json.loads(f["data"])["payload"]["i"] for _, f in entries] == list(
+            range(150)
+        )
+
+    def test_publisher_falls_back_to_local_queue(self, stream_bridge, mocker, caplog):
+        caplog.set_level(logging.ERROR, logger="osism.event_bridge")
+        bridge = stream_bridge()
+        mocker.patch.object(
+            bridge._redis_client, "pipeline", side_effect=ConnectionError("gone")
+        )
+
+        def drop_client():
+            bridge._redis_client = None
+
+        init_redis = mocker.patch.object(bridge, "_init_redis", side_effect=drop_client)
+        bridge._publish_stream_batch([{"event_type": "a.b", "payload": {}}])
+
+        init_redis.assert_called_once_with()
+        assert bridge._event_queue.get_nowait() == {"event_type": "a.b", "payload": {}}
+        assert "Failed to publish events to Redis stream" in caplog.text
+
+    def test_stream_is_capped(self, redis_cls):
+        bridge = EventBridge(transport="stream", stream_maxlen=10)
+        pipe = redis_cls.return_value.pipeline.return_value
+
+        bridge._publish_stream_batch([{"event_type": "a.b", "payload": {}}])
+
+        redis_cls.return_value.pipeline.assert_called_once_with(transaction=False)
+        pipe.xadd.assert_called_once_with(
+            "osism:events",
+            {"data": json.dumps({"event_type": "a.b", "payload": {}})},
+            maxlen=10,
+            approximate=True,
+        )
+        pipe.execute.assert_called_once_with()
+
+    def test_reader_resumes_from_stored_offset(self, stream_bridge):
+        publisher = stream_bridge()
+        reader = stream_bridge()
+        publisher._publish_stream_batch([{"event_type": "old", "payload": {}}])
+
+        publisher._publish_stream_batch(
+            [{"event_type": f"e{i}", "payload": {}} for i in range(3)]
+        )
+        reader._redis_client.set(
+            reader._offset_key, reader._redis_client.xrange("osism:events")[0][0]
+        )
+        handled = _read_stream(reader, 3)
+        assert [e["event_type"] for e in handled] == ["e0", "e1", "e2"]
+
+        # After a restart only the events published in between are handled
+        publisher._publish_stream_batch([{"event_type": "e3", "payload": {}}])
+        restarted = stream_bridge()
+        assert [e["event_type"] for e in _read_stream(restarted, 1)] == ["e3"]
+
+        # Offsets are per consumer
+        assert restarted._redis_client.get("osism:events:offset:other") is None
+
+    def test_reader_without_offset_skips_existing_entries(self, stream_bridge):
+        bridge = stream_bridge()
+        bridge._publish_stream_batch([{"event_type": "old", "payload": {}}])
+        newest = bridge._redis_client.xrevrange("osism:events", count=1)[0][0]
+        assert bridge._stream_start_id() == newest
+
+        bridge._redis_client.delete("osism:events")
+        assert bridge._stream_start_id() == "0-0"
+
+    def test_default_consumer_is_unique_per_process(self, stream_bridge, mocker):
+        mocker.patch("osism.services.event_bridge.settings.EVENTS_STREAM_CONSUMER", "")
+        mocker.patch("socket.gethostname", return_value="api-host")
+        getpid = mocker.patch("os.getpid", return_value=100)
+        bridge = stream_bridge(consumer=None)
+
+        # Resolved on use, not when the module level bridge is created
+        getpid.return_value = 101
+        assert bridge._offset_key == "osism:events:offset:api-host-101"
+
+        getpid.return_value = 102
+        assert stream_bridge(consumer=None)._offset_key == (
+            "osism:events:offset:api-host-102"
+        )
+        assert bridge._offset_key == "osism:events:offset:api-host-101"
+
+    def test_stored_offset_expires(self, stream_bridge):
+        publisher = stream_bridge()
+        reader = stream_bridge()
+        publisher._publish_stream_batch([{"event_type": "old", "payload": {}}])
+        publisher._publish_stream_batch([{"event_type": "e0", "payload": {}}])
+        reader._redis_client.set(
+            reader._offset_key, reader._redis_client.xrange("osism:events")[0][0]
+        )
+
+        _read_stream(reader, 1)
+
+        assert 0 < reader._redis_client.ttl(reader._offset_key) <= STREAM_OFFSET_TTL
+
+    def test_recent_events_are_returned_oldest_first(self, stream_bridge):
+        bridge = stream_bridge()
+        bridge._publish_stream_batch(
+            [{"event_type": f"e{i}", "payload": {"i": i}} for i in range(5)]
+        )
+        bridge._redis_client.xadd("osism:events", {"data": "{not json"})
+
+        events = bridge.get_recent_events(3)
+
+        assert [e["event_type"] for e in events] == ["e3", "e4"]
+        assert events[0]["payload"] == {"i": 3}
+        assert events[0]["id"].count("-") == 1
+        assert events[0]["timestamp"].endswith("Z")
+
+    def test_events_after_an_entry_are_returned_oldest_first(self, stream_bridge):
+        bridge = stream_bridge()
+        bridge._publish_stream_batch(
+            [{"event_type": f"e{i}", "payload": {}} for i in range(5)]
+        )
+        ids = [
+            entry_id
+            for entry_id, _ in bridge._redis_client.xrange("osism:events", count=5)
+        ]
+
+        events = bridge.get_events_after(ids[1], 10)
+        assert [e["event_type"] for e in events] == ["e2", "e3", "e4"]
+        assert events[0]["id"] == ids[2]
+
+        # Too many missed events, the newest follow on seamlessly to live ones
+        assert [e["event_type"] for e in bridge.get_events_after(ids[0], 2)] == [
+            "e3",
+            "e4",
+        ]
+        assert bridge.get_events_after(ids[4], 10) == []
+
+    def test_events_after_ignores_ids_of_other_transports(self, stream_bridge):
+        bridge = stream_bridge()
+        bridge._publish_stream_batch([{"event_type": "e", "payload": {}}])
+        assert bridge.get_events_after(str(uuid.uuid4()), 10) == []
+        assert bridge.get_events_after("", 10) == []
+
+    def test_events_after_empty_for_pubsub(self, bridge):
+        assert bridge.get_events_after("1-0", 10) == []
+        bridge._redis_client.xrevrange.assert_not_called()
+
+    def test_recent_events_empty_for_pubsub(self, bridge):
+        assert bridge.get_recent_events(10) == []
+        bridge._redis_client.xrevrange.assert_not_called()
+
+    def test_shutdown_joins_publisher(self, stream_bridge):
+        bridge = stream_bridge()
+        publisher = MagicMock()
+        publisher.is_alive.return_value = True
+        bridge._publisher_thread = publisher
+        bridge.shutdown()
+        publisher.join.assert_called_once_with(timeout=5.0)
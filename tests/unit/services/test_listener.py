@@ -5,19 +5,22 @@
 Covers the ``EXCHANGES_CONFIG`` module constants, the ``BaremetalEvents``
 dispatcher (handler resolution and the NetBox task calls of every handler),
 the ``NotificationsDump`` consumer (initialization, passive exchange
-discovery, consumer setup and message handling including event-bridge
-forwarding and OSISM API delivery retries) and the ``main()`` retry loop.
+discovery, consumer setup, batched acknowledgements and message handling
+including event-bridge forwarding), the ``NotificationSender`` delivering to the OSISM API
+(batching, retries and the buffer counters) and the ``main()`` retry loop.
 
 The NetBox Celery tasks are only ever invoked via ``.delay`` here, so the
 three ``osism.services.listener.netbox.*.delay`` attributes are patched and
 no broker is needed. Threads and timeouts are never real: the discovery loop
 is driven synchronously with a scripted ``_stop_discovery`` mock,
 ``threading.Thread`` and ``time.sleep`` are patched, and ``main()``'s
-``while True`` loop is escaped with a sentinel exception.
+``while True`` loop is escaped with a sentinel exception. The only real
+thread is the sender thread in the consumer rate test.
 """
 
 import json
 import sys
+import time
 from unittest.mock import MagicMock, call
 
 import pytest
@@ -106,14 +109,39 @@ def consumer(mocker):
 
 @pytest.fixture
 def api_consumer(consumer):
-    """Consumer wired for OSISM API delivery with stubbed session and events."""
+    """Consumer wired for OSISM API delivery with a stubbed sender and events."""
     consumer.event_bridge = None
     consumer.baremetal_events = MagicMock()
-    consumer.osism_api_session = MagicMock()
-    consumer.osism_baremetal_api_url = API_URL
+    consumer.notification_sender = MagicMock()
     return consumer
 
 
+@pytest.fixture
+def sender():
+    """``NotificationSender`` with a stubbed session, driven synchronously.
+
+    ``_stop`` is replaced so the retry backoff is recorded instead of waited.
+    """
+    sender = listener.NotificationSender(API_URL, session=MagicMock(), batch_size=3)
+    sender._stop = MagicMock()
+    sender._stop.is_set.return_value = True
+    return sender
+
+
+def _response(status_code):
+    response = MagicMock(status_code=status_code)
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+    else:
+        response.raise_for_status.return_value = None
+    return response
+
+
+def _drain(sender):
+    """Deliver everything buffered in the calling thread."""
+    sender._run()
+
+
 @pytest.fixture
 def sleep_mock(mocker):
     """Patch ``time.sleep`` with a bounded guard so regressions cannot hang."""
@@ -285,6 +313,7 @@ def test_init_without_api_url(mocker):
 
     assert dump.osism_api_session is None
     assert dump.osism_baremetal_api_url is None
+    assert dump.notification_sender is None
     session_cls.assert_not_called()
 
 
@@ -296,6 +325,21 @@ def test_init_with_api_url_strips_trailing_slash(mocker):
 
     assert dump.osism_api_session is session_cls.return_value
     assert dump.osism_baremetal_api_url == "http://api:8000/notifications/baremetal"
+    assert dump.notification_sender.url == dump.osism_baremetal_api_url
+    assert dump.notification_sender.session is session_cls.return_value
+
+
+def test_init_uses_supplied_sender(mocker):
+    mocker.patch("osism.services.listener.settings.OSISM_API_URL", "http://api:8000")
+    sender = listener.NotificationSender(API_URL, session=MagicMock())
+    create_sender = mocker.patch("osism.services.listener.create_notification_sender")
+
+    dump = listener.NotificationsDump(MagicMock(), sender)
+
+    create_sender.assert_not_called()
+    assert dump.notification_sender is sender
+    assert dump.osism_api_session is sender.session
+    assert dump.osism_baremetal_api_url == API_URL
 
 
 def test_init_connects_event_bridge_singleton(consumer):
@@ -599,20 +643,27 @@ def test_get_consumers_creates_consumer_per_available_exchange(consumer, mocker)
             exchange_cls.return_value,
             routing_key="ironic_versioned_notifications.info",
             auto_delete=False,
-            no_ack=True,
+            no_ack=False,
         ),
         call(
             "osism-listener-nova",
             exchange_cls.return_value,
             routing_key="nova_versioned_notifications.info",
             auto_delete=False,
-            no_ack=True,
+            no_ack=False,
         ),
     ]
-    assert factory.call_args_list == [
-        call(queue_cls.return_value, callbacks=[consumer.on_message]),
-        call(queue_cls.return_value, callbacks=[consumer.on_message]),
-    ]
+    assert (
+        factory.call_args_list
+        == [
+            call(
+                queue_cls.return_value,
+                callbacks=[consumer.on_message],
+                prefetch_count=consumer.prefetch_count,
+            ),
+        ]
+        * 2
+    )
 
 
 def test_get_consumers_defaults_for_missing_exchange_props(consumer, mocker):
@@ -666,7 +717,7 @@ def test_get_consumers_no_exchanges_returns_empty_list(consumer, mocker, loguru_
 
 def test_on_message_baremetal_payload_info(consumer, loguru_logs):
     consumer.event_bridge = None
-    consumer.osism_api_session = None
+    consumer.notification_sender = None
     consumer.baremetal_events = MagicMock()
     payload = {
         "ironic_object.data": {
@@ -699,7 +750,7 @@ def test_on_message_baremetal_payload_info(consumer, loguru_logs):
 
 def test_on_message_nova_payload_info(consumer, loguru_logs):
     consumer.event_bridge = None
-    consumer.osism_api_session = None
+    consumer.notification_sender = None
     consumer.baremetal_events = MagicMock()
     payload = {
         "nova_object.data": {
@@ -728,7 +779,7 @@ def test_on_message_nova_payload_info(consumer, loguru_logs):
 
 def test_on_message_neutron_payload_info(consumer, loguru_logs):
     consumer.event_bridge = None
-    consumer.osism_api_session = None
+    consumer.notification_sender = None
     consumer.baremetal_events = MagicMock()
     data = _make_data("network.port.create.end", {"port": {"id": "port-1"}})
 
@@ -741,7 +792,7 @@ def test_on_message_neutron_payload_info(consumer, loguru_logs):
 
 def test_on_message_other_service_payload_info(consumer, loguru_logs):
     consumer.event_bridge = None
-    consumer.osism_api_session = None
+    consumer.notification_sender = None
     consumer.baremetal_events = MagicMock()
     data = _make_data("identity.user.created", {"user": {"id": "user-1"}})
 
@@ -755,7 +806,7 @@ def test_on_message_other_service_payload_info(consumer, loguru_logs):
 
 def test_on_message_missing_event_type(consumer, loguru_logs):
     consumer.event_bridge = None
-    consumer.osism_api_session = None
+    consumer.notification_sender = None
     data = _make_data()
     del data["event_type"]
 
@@ -824,7 +875,7 @@ def test_on_message_event_bridge_error_non_ironic_payload(consumer, loguru_logs)
 
 def test_on_message_without_event_bridge(consumer, loguru_logs):
     consumer.event_bridge = None
-    consumer.osism_api_session = None
+    consumer.notification_sender = None
     consumer.baremetal_events = MagicMock()
     data = _make_data()
 
@@ -833,63 +884,317 @@ def test_on_message_without_event_bridge(consumer, loguru_logs):
     assert not any("Forwarding event to WebSocket" in r["message"] for r in loguru_logs)
 
 
+# ---------------------------------------------------------------------------
+# Acknowledgements
+# ---------------------------------------------------------------------------
+
+
+def test_on_message_acks_batch_with_single_multiple_ack(consumer):
+    consumer.event_bridge = None
+    consumer.baremetal_events = MagicMock()
+    consumer.ack_batch_size = 3
+    messages = [MagicMock() for _ in range(4)]
+
+    for message in messages:
+        consumer.on_message(_make_body(_make_data()), message)
+
+    messages[2].ack.assert_called_once_with(multiple=True)
+    for message in (messages[0], messages[1], messages[3]):
+        message.ack.assert_not_called()
+    assert consumer._unacked == [messages[3]]
+
+
+def test_ack_batch_is_limited_by_prefetch_count(consumer):
+    consumer.ack_batch_size = 50
+    consumer.prefetch_count = 2
+    assert consumer._ack_batch_threshold() == 2
+
+    consumer.prefetch_count = 0
+    assert consumer._ack_batch_threshold() == 50
+
+
+def test_on_message_acks_failed_notifications(consumer):
+    consumer.ack_batch_size = 1
+    message = MagicMock()
+
+    with pytest.raises(json.JSONDecodeError):
+        consumer.on_message({"oslo.message": "{not json"}, message)
+
+    message.ack.assert_called_once_with(multiple=True)
+
+
+def test_on_iteration_flushes_acks_after_interval(consumer, mocker):
+    monotonic = mocker.patch("osism.services.listener.time.monotonic")
+    monotonic.return_value = 100.0
+    message = MagicMock()
+    consumer._ack_later(message)
+
+    consumer.on_iteration()
+    message.ack.assert_not_called()
+
+    monotonic.return_value = 100.0 + listener.ACK_FLUSH_INTERVAL
+    consumer.on_iteration()
+    message.ack.assert_called_once_with(multiple=True)
+    assert consumer._unacked == []
+
+
+def test_on_consume_end_flushes_and_revival_forgets_acks(consumer, loguru_logs):
+    message = MagicMock()
+    message.ack.side_effect = OSError("connection lost")
+    consumer._ack_later(message)
+
+    consumer.on_consume_end(MagicMock(), MagicMock())
+
+    assert consumer._unacked == []
+    assert _has_log(loguru_logs, "WARNING", "Failed to acknowledge 1 message(s)")
+
+    consumer._ack_later(MagicMock())
+    consumer.on_connection_revived()
+    assert consumer._unacked == []
+
+
+def test_consumer_on_memory_transport_respects_prefetch_and_acks_all(consumer):
+    # End-to-end against kombu's in-memory transport, which ignores
+    # multiple=True and is acknowledged message by message instead.
+    from kombu import Connection, Exchange, Producer
+    from kombu import Queue as KombuQueue
+
+    config = listener.EXCHANGES_CONFIG["ironic"]
+    handled = []
+
+    with Connection(
+        "memory://", transport_options={"polling_interval": 0.001}
+    ) as connection:
+        channel = connection.default_channel
+        exchange = Exchange(config["exchange"], type="topic")
+        KombuQueue(config["queue"], exchange, routing_key=config["routing_key"])(
+            channel
+        ).declare()
+        producer = Producer(channel, exchange, routing_key=config["routing_key"])
+        for _ in range(25):
+            producer.publish(_make_body(_make_data()), serializer="json")
+
+        consumer.connection = connection
+        consumer.event_bridge = None
+        consumer.prefetch_count = 4
+        consumer.ack_batch_size = 10
+        consumer._available_exchanges = {
+            "ironic": {**config, "exchange_props": {"type": "topic"}}
+        }
+        consumer._start_exchange_discovery = MagicMock()
+
+        def handle(payload):
+            qos = connection.default_channel.qos
+            handled.append(len(qos._delivered) - len(qos._dirty))
+            if len(handled) == 25:
+                consumer.should_stop = True
+
+        consumer.baremetal_events = MagicMock()
+        consumer.baremetal_events.get_handler.return_value = handle
+        consumer.run()
+
+        remaining = channel.queue_declare(config["queue"], passive=True)
+        channel.queue_delete(config["queue"])
+
+    assert len(handled) == 25
+    assert max(handled) <= 4
+    assert remaining.message_count == 0
+
+
 # ---------------------------------------------------------------------------
 # on_message() - OSISM API delivery
 # ---------------------------------------------------------------------------
 
 
-def test_on_message_api_delivery_success(api_consumer, loguru_logs):
-    api_consumer.osism_api_session.post.return_value = MagicMock(status_code=204)
+def test_on_message_api_delivery_submits_to_sender(api_consumer):
     data = _make_data()
 
     api_consumer.on_message(_make_body(data), MagicMock())
 
-    api_consumer.osism_api_session.post.assert_called_once_with(
-        API_URL,
-        timeout=5,
-        json={
+    api_consumer.notification_sender.start.assert_called_once_with()
+    api_consumer.notification_sender.submit.assert_called_once_with(
+        {
             "priority": data["priority"],
             "event_type": data["event_type"],
             "timestamp": data["timestamp"],
             "publisher_id": data["publisher_id"],
             "message_id": data["message_id"],
             "payload": data["payload"],
-        },
+        }
     )
-    assert _has_log(loguru_logs, "INFO", "Successfully delivered notification")
     api_consumer.baremetal_events.get_handler.assert_not_called()
 
 
 def test_on_message_api_delivery_non_baremetal_event(api_consumer):
-    # API delivery does not filter by event type: with a session configured,
-    # any event is posted to the baremetal endpoint and the handler dispatch
+    # API delivery does not filter by event type: with a sender configured,
+    # any event is queued for the baremetal endpoint and the handler dispatch
     # in the else branch is skipped. This path is currently dormant (only
     # ironic emits versioned notifications by default, and OSISM_API_URL is
     # unset in a default deployment) and not the intended end-state.
-    api_consumer.osism_api_session.post.return_value = MagicMock(status_code=204)
     data = _make_data("compute.instance.update", {"nova_object.data": {"uuid": "u1"}})
 
     api_consumer.on_message(_make_body(data), MagicMock())
 
-    api_consumer.osism_api_session.post.assert_called_once()
-    posted = api_consumer.osism_api_session.post.call_args.kwargs["json"]
-    assert posted["event_type"] == "compute.instance.update"
+    submitted = api_consumer.notification_sender.submit.call_args.args[0]
+    assert submitted["event_type"] == "compute.instance.update"
     api_consumer.baremetal_events.get_handler.assert_not_called()
 
 
-def test_on_message_api_delivery_succeeds_after_transient_error(
-    api_consumer, sleep_mock, loguru_logs
-):
-    api_consumer.osism_api_session.post.side_effect = [
-        requests.ConnectionError,
-        MagicMock(status_code=204),
+def test_on_message_keeps_rate_while_api_is_unavailable(consumer, mocker):
+    # The consumer must not slow down when the OSISM API is unreachable: every
+    # delivery attempt blocks the sender thread for a while and fails, but
+    # on_message() only queues into the bounded buffer.
+    consumer.event_bridge = None
+    mocker.patch("osism.services.listener.logger")
+    messages = [_make_body(_make_data()) for _ in range(2000)]
+
+    def consume(post):
+        session = MagicMock()
+        session.post.side_effect = post
+        consumer.notification_sender = listener.NotificationSender(
+            API_URL, session=session, buffer_size=500, batch_size=50
+        )
+        started = time.perf_counter()
+        for body in messages:
+            consumer.on_message(body, MagicMock())
+        elapsed = time.perf_counter() - started
+        consumer.notification_sender.stop(timeout=10)
+        return elapsed, consumer.notification_sender.stats
+
+    def unavailable(*args, **kwargs):
+        time.sleep(0.05)
+        raise requests.ConnectionError
+
+    healthy_time, healthy = consume(lambda *args, **kwargs: _response(204))
+    unavailable_time, stats = consume(unavailable)
+
+    assert healthy["delivered"] == 2000
+    assert healthy["dropped_overflow"] == 0
+    # With a blocking delivery 2000 messages would take at least 100 seconds
+    assert unavailable_time < max(2 * healthy_time, 1.0)
+    assert stats["submitted"] == 2000
+    assert stats["delivered"] == 0
+    # Only the buffer and the batch in flight survive the overflow
+    assert stats["dropped_overflow"] >= 2000 - 500 - 50
+    assert stats["dropped_overflow"] + stats["dropped_failed"] == 2000
+
+
+# ---------------------------------------------------------------------------
+# NotificationSender
+# ---------------------------------------------------------------------------
+
+
+def test_sender_init_mounts_pooled_adapters():
+    session = MagicMock()
+
+    sender = listener.NotificationSender(API_URL, session=session)
+
+    assert sender.batch_url == API_URL + "/batch"
+    assert [c.args[0] for c in session.mount.call_args_list] == [
+        "http://",
+        "https://",
     ]
 
-    api_consumer.on_message(_make_body(_make_data()), MagicMock())
 
-    assert api_consumer.osism_api_session.post.call_count == 2
-    sleep_mock.assert_called_once_with(3)
-    assert _has_log(loguru_logs, "INFO", "Successfully delivered notification")
+def test_sender_delivers_single_notification_to_endpoint(sender, loguru_logs):
+    sender.session.post.return_value = _response(204)
+    notification = {"event_type": "baremetal.node.power_set.end"}
+
+    sender.submit(notification)
+    _drain(sender)
+
+    sender.session.post.assert_called_once_with(API_URL, timeout=5, json=notification)
+    assert sender.stats["delivered"] == 1
+    assert _has_log(loguru_logs, "INFO", "Successfully delivered 1 notification(s)")
+
+
+def test_sender_batches_notifications(sender):
+    sender.session.post.return_value = _response(204)
+    notifications = [{"n": i} for i in range(7)]
+
+    for notification in notifications:
+        sender.submit(notification)
+    _drain(sender)
+
+    assert sender.session.post.call_args_list == [
+        call(API_URL + "/batch", timeout=5, json=notifications[0:3]),
+        call(API_URL + "/batch", timeout=5, json=notifications[3:6]),
+        call(API_URL, timeout=5, json=notifications[6]),
+    ]
+    assert sender.stats == {
+        "submitted": 7,
+        "delivered": 7,
+        "dropped_overflow": 0,
+        "dropped_failed": 0,
+        "batches": 3,
+    }
+
+
+def test_sender_falls_back_to_single_delivery_without_batch_endpoint(sender):
+    sender.session.post.side_effect = [_response(404)] + [_response(204)] * 5
+
+    for i in range(5):
+        sender.submit({"n": i})
+    _drain(sender)
+
+    urls = [c.args[0] for c in sender.session.post.call_args_list]
+    assert urls == [API_URL + "/batch"] + [API_URL] * 5
+    assert sender.stats["delivered"] == 5
+
+
+def test_sender_logs_failures_of_partially_processed_batch(sender, loguru_logs):
+    response = _response(207)
+    response.json.return_value = {
+        "processed": 3,
+        "failed": [
+            {
+                "index": 1,
+                "message_id": "m1",
+                "event_type": "baremetal.node.delete.end",
+                "error": "handler broken",
+            }
+        ],
+    }
+    sender.session.post.return_value = response
+
+    for i in range(3):
+        sender.submit({"n": i})
+    _drain(sender)
+
+    # Not sent again, the other notifications were processed
+    sender.session.post.assert_called_once()
+    assert sender.stats["delivered"] == 2
+    assert sender.stats["dropped_failed"] == 1
+    assert _has_log(
+        loguru_logs,
+        "ERROR",
+        "Failed to process notification m1 (baremetal.node.delete.end)",
+    )
+    assert _has_log(loguru_logs, "WARNING", "1 of them failed to process")
+
+
+def test_sender_overflow_drops_oldest(loguru_logs):
+    sender = listener.NotificationSender(API_URL, session=MagicMock(), buffer_size=2)
+
+    for i in range(5):
+        sender.submit({"n": i})
+
+    assert list(sender._buffer) == [{"n": 3}, {"n": 4}]
+    assert sender.pending() == 2
+    assert sender.stats["dropped_overflow"] == 3
+    assert _has_log(loguru_logs, "WARNING", "Notification buffer full (2)")
+
+
+def test_sender_succeeds_after_transient_error(sender, loguru_logs):
+    sender.session.post.side_effect = [requests.ConnectionError, _response(204)]
+
+    sender.submit({"n": 1})
+    _drain(sender)
+
+    assert sender.session.post.call_count == 2
+    sender._stop.wait.assert_called_once_with(3)
+    assert sender.stats["delivered"] == 1
+    assert _has_log(loguru_logs, "ERROR", f"Error connecting to {API_URL}")
 
 
 @pytest.mark.parametrize(
@@ -897,81 +1202,90 @@ def test_on_message_api_delivery_succeeds_after_transient_error(
     [requests.ConnectionError, requests.Timeout],
     ids=["connection", "timeout"],
 )
-def test_on_message_api_delivery_retries_and_gives_up(
-    api_consumer, sleep_mock, loguru_logs, exception
-):
-    api_consumer.osism_api_session.post.side_effect = exception
-    data = _make_data()
+def test_sender_retries_and_gives_up(sender, loguru_logs, exception):
+    sender.session.post.side_effect = exception
+    notification = {"n": 1}
 
-    api_consumer.on_message(_make_body(data), MagicMock())
+    sender.submit(notification)
+    _drain(sender)
 
-    assert api_consumer.osism_api_session.post.call_count == 3
-    assert sleep_mock.call_args_list == [call(3), call(9)]
+    assert sender.session.post.call_count == 3
+    assert sender._stop.wait.call_args_list == [call(3), call(9)]
+    assert sender.stats["dropped_failed"] == 1
     give_up = next(
         r
         for r in loguru_logs
-        if r["level"] == "ERROR" and "Giving up delivering notification" in r["message"]
+        if r["level"] == "ERROR" and "Giving up delivering" in r["message"]
     )
-    assert json.dumps(data) in give_up["message"]
+    assert json.dumps([notification]) in give_up["message"]
 
 
-def test_on_message_api_delivery_gives_up_early_on_http_error(
-    api_consumer, sleep_mock, loguru_logs
-):
+def test_sender_gives_up_early_on_http_error(sender, loguru_logs):
     # A 4xx client error is not retried.
-    response = MagicMock(status_code=404)
-    response.raise_for_status.side_effect = requests.HTTPError(response=response)
-    api_consumer.osism_api_session.post.return_value = response
+    sender.session.post.return_value = _response(404)
 
-    api_consumer.on_message(_make_body(_make_data()), MagicMock())
+    sender.submit({"n": 1})
+    _drain(sender)
 
-    assert api_consumer.osism_api_session.post.call_count == 1
-    sleep_mock.assert_not_called()
+    assert sender.session.post.call_count == 1
+    sender._stop.wait.assert_not_called()
+    assert sender.stats["dropped_failed"] == 1
     assert _has_log(loguru_logs, "ERROR", "client side error, giving up early")
 
 
 @pytest.mark.xfail(
     strict=True,
-    reason="listener guards with status_code <= 500; a server 500 is retryable "
+    reason="sender guards with status_code <= 500; a server 500 is retryable "
     "and the boundary should be < 500",
 )
-def test_on_message_api_delivery_retries_on_500(api_consumer, sleep_mock):
+def test_sender_retries_on_500(sender):
     # A 500 is a server error and should be retried like the 503 case.
-    response = MagicMock(status_code=500)
-    response.raise_for_status.side_effect = requests.HTTPError(response=response)
-    api_consumer.osism_api_session.post.return_value = response
+    sender.session.post.return_value = _response(500)
 
-    api_consumer.on_message(_make_body(_make_data()), MagicMock())
+    sender.submit({"n": 1})
+    _drain(sender)
 
-    assert api_consumer.osism_api_session.post.call_count == 3
+    assert sender.session.post.call_count == 3
 
 
-def test_on_message_api_delivery_retries_on_server_error(api_consumer, sleep_mock):
-    response = MagicMock(status_code=503)
-    response.raise_for_status.side_effect = requests.HTTPError(response=response)
-    api_consumer.osism_api_session.post.return_value = response
+def test_sender_retries_on_server_error(sender):
+    sender.session.post.return_value = _response(503)
 
-    api_consumer.on_message(_make_body(_make_data()), MagicMock())
+    sender.submit({"n": 1})
+    _drain(sender)
 
-    assert api_consumer.osism_api_session.post.call_count == 3
-    assert sleep_mock.call_args_list == [call(3), call(9)]
+    assert sender.session.post.call_count == 3
+    assert sender._stop.wait.call_args_list == [call(3), call(9)]
 
 
-def test_on_message_api_delivery_status_200_retries(
-    api_consumer, sleep_mock, loguru_logs
-):
+def test_sender_status_200_retries(sender, loguru_logs):
     # Only 204 counts as success; a 200 passes raise_for_status() and falls
-    # through to the retry branch. This path is currently dormant (API
-    # delivery only runs when OSISM_API_URL is set) and not the intended
-    # end-state.
-    response = MagicMock(status_code=200)
-    response.raise_for_status.return_value = None
-    api_consumer.osism_api_session.post.return_value = response
+    # through to the retry branch.
+    sender.session.post.return_value = _response(200)
+
+    sender.submit({"n": 1})
+    _drain(sender)
 
-    api_consumer.on_message(_make_body(_make_data()), MagicMock())
+    assert sender.session.post.call_count == 3
+    assert _has_log(loguru_logs, "ERROR", "Giving up delivering")
 
-    assert api_consumer.osism_api_session.post.call_count == 3
-    assert _has_log(loguru_logs, "ERROR", "Giving up delivering notification")
+
+def test_sender_start_is_idempotent_and_stop_flushes():
+    session = MagicMock()
+    session.post.return_value = _response(204)
+    sender = listener.NotificationSender(API_URL, session=session)
+
+    sender.start()
+    thread = sender._thread
+    sender.start()
+    for i in range(3):
+        sender.submit({"n": i})
+    sender.stop()
+
+    assert sender._thread is thread
+    assert not thread.is_alive()
+    assert sender.pending() == 0
+    assert sender.stats["delivered"] == 3
 
 
 # ---------------------------------------------------------------------------
@@ -981,7 +1295,7 @@ def test_on_message_api_delivery_status_200_retries(
 
 def test_on_message_dispatches_to_handler(consumer):
     consumer.event_bridge = None
-    consumer.osism_api_session = None
+    consumer.notification_sender = None
     consumer.baremetal_events = MagicMock()
     data = _make_data()
 
@@ -995,7 +1309,7 @@ def test_on_message_dispatches_to_handler(consumer):
 
 def test_on_message_dispatch_triggers_netbox_task(consumer, netbox_delays):
     consumer.event_bridge = None
-    consumer.osism_api_session = None
+    consumer.notification_sender = None
     data = _make_data(
         "baremetal.node.power_set.end",
         {"ironic_object.data": {"name": "node-1", "power_state": "power on"}},
@@ -1030,11 +1344,30 @@ def test_main_retries_on_connection_refused(mocker, loguru_logs):
     assert _has_log(loguru_logs, "ERROR", "Connection with broker refused")
 
 
+def test_main_keeps_one_sender_across_reconnects(mocker):
+    mocker.patch("osism.services.listener.BROKER_URI", "amqp://broker")
+    mocker.patch("osism.services.listener.time.sleep")
+    mocker.patch("osism.services.listener.Connection")
+    dump_cls = mocker.patch("osism.services.listener.NotificationsDump")
+    create_sender = mocker.patch("osism.services.listener.create_notification_sender")
+    # The first consumer loses the broker, the second one ends the loop
+    dump_cls.return_value.run.side_effect = [ConnectionRefusedError, LoopExit]
+
+    with pytest.raises(LoopExit):
+        listener.main()
+
+    create_sender.assert_called_once_with()
+    assert [c.args[1] for c in dump_cls.call_args_list] == [
+        create_sender.return_value
+    ] * 2
+
+
 def test_main_restarts_consumer_when_new_exchanges_found(mocker, loguru_logs):
     mocker.patch("osism.services.listener.BROKER_URI", "amqp://broker")
     mocker.patch("osism.services.listener.time.sleep")
     connection_cls = mocker.patch("osism.services.listener.Connection")
     dump_cls = mocker.patch("osism.services.listener.NotificationsDump")
+    create_sender = mocker.patch("osism.services.listener.create_notification_sender")
 
     discovered = {"ironic": {"exchange": "ironic", "exchange_props": {}}}
     first = MagicMock()
@@ -1048,10 +1381,12 @@ def test_main_restarts_consumer_when_new_exchanges_found(mocker, loguru_logs):
         listener.main()
 
     connection = connection_cls.return_value.__enter__.return_value
-    assert dump_cls.call_args_list == [call(connection)] * 2
+    sender = create_sender.return_value
+    # The exchanges discovered in the first iteration and the one sender with
+    # the notifications not yet delivered are carried over into the
+    # restarted consumer.
+    assert dump_cls.call_args_list == [call(connection, sender)] * 2
     first._stop_exchange_discovery.assert_called_once_with()
     first._new_exchanges_found.clear.assert_called_once_with()
-    # The exchanges discovered in the first iteration are carried over into
-    # the restarted consumer.
     assert second._available_exchanges == discovered
     assert _has_log(loguru_logs, "INFO", "Restarting consumer to add new exchange")
@@ -29,9 +29,12 @@ import pytest
 from fastapi import WebSocketDisconnect
 
 from osism.services.websocket_manager import (
+    ConnectionRegistry,
     EventMessage,
+    EventStream,
     WebSocketConnection,
     WebSocketManager,
+    dumps,
 )
 
 
@@ -114,6 +117,38 @@ class TestEventMessage:
         )
         assert json.loads(event.to_json()) == event.to_dict()
 
+    def test_to_json_serializes_once(self):
+        event = EventMessage(event_type="a.b", source="test", data={"x": 1})
+        with patch(
+            "osism.services.websocket_manager.dumps", return_value="{}"
+        ) as dumps:
+            assert event.to_json() == "{}"
+            assert event.to_json() == "{}"
+        dumps.assert_called_once_with(event.to_dict())
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_dumps_is_compact_json(self, orjson_available):
+        with patch(
+            "osism.services.websocket_manager.ORJSON_AVAILABLE", orjson_available
+        ):
+            assert dumps({"a": [1, "b"], 2: None}) == '{"a":[1,"b"],"2":null}'
+
+    def test_dumps_falls_back_to_json_for_values_orjson_rejects(self):
+        pytest.importorskip("orjson")
+        # orjson only serializes 64 bit integers
+        assert dumps({"a": 2**70}) == '{"a":%d}' % 2**70
+
+    def test_to_sse_frames_the_json_with_the_event_id(self):
+        event = EventMessage(event_type="a.b", source="test", data={}, event_id="1-0")
+        assert event.to_sse() == f"id: 1-0\ndata: {event.to_json()}\n\n"
+        assert event.to_sse() is event.to_sse()
+        assert event.serialize("sse") is event.to_sse()
+        assert event.serialize("json") is event.to_json()
+
+    def test_service_type_is_first_event_type_component(self):
+        assert EventMessage("baremetal.node.x", "test", {}).service_type == "baremetal"
+        assert EventMessage("", "test", {}).service_type == "unknown"
+
 
 class TestMatchesFilters:
     def make_event(self, event_type="a.b", node_name=None):
@@ -191,6 +226,61 @@ class TestMatchesFilters:
         assert connection.matches_filters(event) is False
 
 
+class TestConnectionRegistry:
+    def make_connection(self, registry, **filters):
+        websocket = make_websocket()
+        connection = WebSocketConnection(websocket)
+        for name, value in filters.items():
+            setattr(connection, name, value)
+        registry[websocket] = connection
+        return connection
+
+    def test_matching_returns_only_matching_connections(self):
+        registry = ConnectionRegistry()
+        unfiltered = self.make_connection(registry)
+        node1 = self.make_connection(registry, node_filters=["node1"])
+        self.make_connection(registry, node_filters=["node2"])
+        baremetal = self.make_connection(registry, service_filters=["baremetal"])
+        self.make_connection(
+            registry, node_filters=["node1"], event_filters=["other.event"]
+        )
+        event = EventMessage(
+            "baremetal.node.power_set.end", "test", {}, node_name="node1"
+        )
+
+        matching = registry.matching(event)
+
+        assert set(map(id, matching)) == {id(unfiltered), id(node1), id(baremetal)}
+        assert len(matching) == 3
+
+    def test_matching_checks_only_the_smallest_candidate_group(self):
+        registry = ConnectionRegistry()
+        for i in range(20):
+            self.make_connection(registry, node_filters=[f"node{i}"])
+        event = EventMessage("a.b", "test", {}, node_name="node3")
+
+        with patch.object(
+            WebSocketConnection,
+            "matches_filters",
+            autospec=True,
+            side_effect=lambda connection, event: True,
+        ) as matches_filters:
+            assert len(registry.matching(event)) == 1
+        assert matches_filters.call_count == 1
+
+    def test_filter_changes_and_removal_update_the_index(self):
+        registry = ConnectionRegistry()
+        connection = self.make_connection(registry, node_filters=["node1"])
+        event = EventMessage("a.b", "test", {}, node_name="node2")
+        assert registry.matching(event) == []
+
+        connection.node_filters = ["node2"]
+        assert registry.matching(event) == [connection]
+
+        registry.pop(connection.websocket)
+        assert registry.matching(event) == []
+
+
 class TestConnectDisconnect:
     @pytest.mark.asyncio
     async def test_connect_accepts_and_registers_connection(self):
@@ -250,7 +340,7 @@ class TestConnectDisconnect:
 
 class TestUpdateFilters:
     @pytest.mark.asyncio
-    async def test_update_filters_sets_all_filter_lists(self):
+    async def test_update_filters_sets_all_filters(self):
         manager = WebSocketManager()
         websocket = make_websocket()
         manager.connections[websocket] = WebSocketConnection(websocket)
@@ -261,12 +351,12 @@ class TestUpdateFilters:
             service_filters=["baremetal"],
         )
         connection = manager.connections[websocket]
-        assert connection.event_filters == ["a.b"]
-        assert connection.node_filters == ["node1"]
-        assert connection.service_filters == ["baremetal"]
+        assert connection.event_filters == {"a.b"}
+        assert connection.node_filters == {"node1"}
+        assert connection.service_filters == {"baremetal"}
 
     @pytest.mark.asyncio
-    async def test_update_filters_partial_update_keeps_other_lists(self):
+    async def test_update_filters_partial_update_keeps_other_filters(self):
         manager = WebSocketManager()
         websocket = make_websocket()
         connection = WebSocketConnection(websocket)
@@ -275,9 +365,9 @@ class TestUpdateFilters:
         connection.service_filters = ["baremetal"]
         manager.connections[websocket] = connection
         await manager.update_filters(websocket, node_filters=["node2"])
-        assert connection.event_filters == ["a.b"]
-        assert connection.node_filters == ["node2"]
-        assert connection.service_filters == ["baremetal"]
+        assert connection.event_filters == {"a.b"}
+        assert connection.node_filters == {"node2"}
+        assert connection.service_filters == {"baremetal"}
 
     @pytest.mark.asyncio
     async def test_update_filters_empty_list_clears_a_filter(self):
@@ -287,7 +377,7 @@ class TestUpdateFilters:
         connection.event_filters = ["a.b"]
         manager.connections[websocket] = connection
         await manager.update_filters(websocket, event_filters=[])
-        assert connection.event_filters == []
+        assert connection.event_filters == set()
 
     @pytest.mark.asyncio
     async def test_update_filters_unknown_websocket_is_a_noop(self):
@@ -323,6 +413,98 @@ class TestAddEventAndHeartbeat:
         assert event.data == {"message": "ping"}
 
 
+class TestSendRecentEvents:
+    @pytest.mark.asyncio
+    async def test_sends_matching_events_with_stream_id_and_timestamp(self):
+        manager = WebSocketManager()
+        websocket = make_websocket()
+        manager.connections[websocket] = WebSocketConnection(websocket)
+        manager.connections[websocket].service_filters = ["baremetal"]
+        events = [
+            {
+                "id": "1-0",
+                "timestamp": "2026-01-01T00:00:00Z",
+                "event_type": "baremetal.node.power_set.end",
+                "payload": {"ironic_object.data": {"name": "node1"}},
+            },
+            {"id": "2-0", "event_type": "compute.instance.update", "payload": {}},
+        ]
+
+        sent = await manager.send_recent_events(websocket, events)
+
+        assert sent == 1
+        await wait_until(lambda: websocket.send_text.await_count == 1)
+        message = json.loads(websocket.send_text.await_args.args[0])
+        assert message["id"] == "1-0"
+        assert message["timestamp"] == "2026-01-01T00:00:00Z"
+        assert message["node_name"] == "node1"
+        manager.connections[websocket].stop_writer()
+
+    @pytest.mark.asyncio
+    async def test_replay_is_limited_to_the_send_queue_size(self):
+        manager = WebSocketManager()
+        websocket = make_websocket()
+        manager.connections[websocket] = WebSocketConnection(
+            websocket, max_queue_size=2
+        )
+        events = [
+            {"id": f"{i}-0", "event_type": "a.b", "payload": {}} for i in range(5)
+        ]
+
+        assert await manager.send_recent_events(websocket, events) == 2
+        await wait_until(lambda: websocket.send_text.await_count == 2)
+        ids = [json.loads(c.args[0])["id"] for c in websocket.send_text.await_args_list]
+        assert ids == ["3-0", "4-0"]
+        manager.connections[websocket].stop_writer()
+
+    @pytest.mark.asyncio
+    async def test_unknown_websocket_is_a_noop(self):
+        manager = WebSocketManager()
+        websocket = make_websocket()
+        events = [{"event_type": "a.b", "payload": {}}]
+        assert await manager.send_recent_events(websocket, events) == 0
+        websocket.send_text.assert_not_awaited()
+
+
+class TestSendMessage:
+    @pytest.mark.asyncio
+    async def test_message_is_queued_after_pending_events(self):
+        manager = WebSocketManager()
+        websocket = make_websocket()
+        connection = WebSocketConnection(websocket)
+        manager.connections[websocket] = connection
+        connection.enqueue("event")
+
+        assert await manager.send_message(websocket, "ack")
+        await wait_until(lambda: websocket.send_text.await_count == 2)
+        assert [c.args[0] for c in websocket.send_text.await_args_list] == [
+            "event",
+            "ack",
+        ]
+        connection.stop_writer()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_disconnects_slow_consumer(self):
+        manager = WebSocketManager()
+        websocket = make_websocket()
+        connection = WebSocketConnection(
+            websocket, max_queue_size=1, policy="disconnect"
+        )
+        manager.connections[websocket] = connection
+        connection.enqueue("event")
+
+        assert not await manager.send_message(websocket, "ack")
+        assert websocket not in manager.connections
+
+    @pytest.mark.asyncio
+    async def test_unknown_websocket_is_a_noop(self):
+        manager = WebSocketManager()
+        websocket = make_websocket()
+
+        assert not await manager.send_message(websocket, "ack")
+        websocket.send_text.assert_not_awaited()
+
+
 class TestBroadcastEventFromNotification:
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -477,6 +659,188 @@ class TestBroadcastEventFromNotification:
         assert "Error creating event from notification" in caplog.text
 
 
+class TestSendQueue:
+    def test_drop_oldest_policy(self):
+        connection = WebSocketConnection(
+            make_websocket(), max_queue_size=2, policy="drop_oldest"
+        )
+        for message in ("1", "2", "3"):
+            assert connection.enqueue(message) is True
+        assert [m for _, m in connection.pending] == ["2", "3"]
+        assert connection.dropped == 1
+
+    def test_coalesce_policy_replaces_event_for_same_resource(self):
+        connection = WebSocketConnection(
+            make_websocket(), max_queue_size=2, policy="coalesce"
+        )
+        connection.enqueue("a1", ("a.b", "node1"))
+        connection.enqueue("b1", ("a.b", "node2"))
+        connection.enqueue("a2", ("a.b", "node1"))
+        assert [m for _, m in connection.pending] == ["b1", "a2"]
+
+        # Nothing to coalesce with, the oldest event is dropped
+        connection.enqueue("c1", ("a.b", "node3"))
+        assert [m for _, m in connection.pending] == ["a2", "c1"]
+        connection.enqueue("x", None)
+        assert [m for _, m in connection.pending] == ["c1", "x"]
+        assert connection.dropped == 3
+
+    def test_disconnect_policy_rejects_when_full(self):
+        connection = WebSocketConnection(
+            make_websocket(), max_queue_size=1, policy="disconnect"
+        )
+        assert connection.enqueue("1") is True
+        assert connection.enqueue("2") is False
+        assert [m for _, m in connection.pending] == ["1"]
+
+    def test_unknown_policy_falls_back_to_drop_oldest(self, caplog):
+        caplog.set_level(logging.WARNING, logger="osism.websocket")
+        manager = WebSocketManager(slow_consumer_policy="invalid")
+        assert manager.slow_consumer_policy == "drop_oldest"
+        assert "Unknown slow consumer policy invalid" in caplog.text
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(10)
+    async def test_slow_consumer_does_not_delay_fast_consumer(self):
+        manager = WebSocketManager(
+            send_queue_size=3, slow_consumer_policy="drop_oldest"
+        )
+        blocked = asyncio.Event()
+
+        async def slow_send(message):
+            await blocked.wait()
+
+        slow_websocket = make_websocket()
+        slow_websocket.send_text.side_effect = slow_send
+        fast_websocket = make_websocket()
+        for websocket in (slow_websocket, fast_websocket):
+            manager.connections[websocket] = WebSocketConnection(
+                websocket, max_queue_size=3
+            )
+        for i in range(10):
+            manager.event_queue.put_nowait(
+                EventMessage(event_type="a.b", source="test", data={"i": i})
+            )
+
+        task = asyncio.create_task(manager._broadcast_events())
+        try:
+            await wait_until(lambda: fast_websocket.send_text.await_count == 10)
+            slow_connection = manager.connections[slow_websocket]
+            # One message is stuck in send_text, the queue holds the last three
+            assert slow_connection.dropped == 6
+            assert [json.loads(m)["data"]["i"] for _, m in slow_connection.pending] == [
+                7,
+                8,
+                9,
+            ]
+
+            blocked.set()
+            await wait_until(lambda: slow_websocket.send_text.await_count == 4)
+        finally:
+            task.cancel()
+            await task
+            await manager.disconnect(slow_websocket)
+            await manager.disconnect(fast_websocket)
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(10)
+    async def test_disconnect_policy_closes_slow_consumer(self, caplog):
+        caplog.set_level(logging.WARNING, logger="osism.websocket")
+        manager = WebSocketManager()
+        websocket = make_websocket()
+        websocket.close = AsyncMock()
+        blocked = asyncio.Event()
+
+        async def slow_send(message):
+            await blocked.wait()
+
+        websocket.send_text.side_effect = slow_send
+        manager.connections[websocket] = WebSocketConnection(
+            websocket, max_queue_size=1, policy="disconnect"
+        )
+        for _ in range(3):
+            manager.event_queue.put_nowait(
+                EventMessage(event_type="a.b", source="test", data={})
+            )
+
+        task = asyncio.create_task(manager._broadcast_events())
+        try:
+            await wait_until(lambda: websocket.close.await_count == 1)
+            websocket.close.assert_awaited_once_with(code=1013)
+            assert websocket not in manager.connections
+            assert "Disconnecting slow WebSocket consumer" in caplog.text
+        finally:
+            task.cancel()
+            await task
+
+    @pytest.mark.asyncio
+    async def test_disconnect_stops_writer(self):
+        manager = WebSocketManager()
+        websocket = make_websocket()
+        connection = WebSocketConnection(websocket)
+        manager.connections[websocket] = connection
+        connection.start_writer(manager._writer_failed)
+
+        await manager.disconnect(websocket)
+        await asyncio.sleep(0)
+
+        assert connection.writer_task.cancelled()
+
+
+class TestEventStream:
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(10)
+    async def test_frames_are_handed_over_one_at_a_time(self):
+        stream = EventStream()
+        frames = stream.frames()
+        await stream.send_text("one")
+        send = asyncio.create_task(stream.send_text("two"))
+        await asyncio.sleep(0)
+        # The writer waits until the response has taken the first frame
+        assert not send.done()
+
+        assert await frames.__anext__() == "one"
+        await send
+        assert await frames.__anext__() == "two"
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(10)
+    async def test_keepalive_comment_when_idle(self):
+        frames = EventStream().frames(keepalive=0.01)
+        assert await frames.__anext__() == ": keepalive\n\n"
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(10)
+    async def test_close_ends_frames_and_rejects_sends(self):
+        stream = EventStream()
+        await stream.send_text("dropped")
+        await stream.close()
+
+        assert [frame async for frame in stream.frames()] == []
+        with pytest.raises(WebSocketDisconnect):
+            await stream.send_text("late")
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(10)
+    async def test_event_stream_connection_gets_sse_frames(self):
+        manager = WebSocketManager()
+        stream = EventStream()
+        await manager.connect(stream, message_format="sse")
+        websocket = make_websocket()
+        manager.connections[websocket] = WebSocketConnection(websocket)
+        event = EventMessage(event_type="a.b", source="test", data={})
+        await manager.add_event(event)
+
+        try:
+            assert await stream.frames().__anext__() == event.to_sse()
+            await wait_until(lambda: websocket.send_text.await_count == 1)
+            websocket.send_text.assert_awaited_once_with(event.to_json())
+        finally:
+            await manager.disconnect(stream)
+            await manager.disconnect(websocket)
+            manager._broadcaster_task.cancel()
+
+
 class TestBroadcastEvents:
     @pytest.mark.asyncio
     @pytest.mark.timeout(10)
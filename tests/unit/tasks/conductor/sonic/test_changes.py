@@ -0,0 +1,195 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for ``osism.tasks.conductor.sonic.changes``.
+
+``get_affected_devices`` maps the object reported by a NetBox webhook to the
+SONiC devices that have to be regenerated; ``queue_devices`` and
+``pop_pending_devices`` implement the Redis-backed debounce in front of the
+restricted ``sync_sonic`` run.
+"""
+
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+
+from osism.tasks.conductor.sonic import changes
+from osism.tasks.conductor.sonic.changes import (
+    PENDING_DEVICES_KEY,
+    PENDING_FLUSH_KEY,
+    get_affected_devices,
+    pop_pending_devices,
+    queue_devices,
+)
+
+
+def _device(device_id, role_slug="leaf"):
+    return SimpleNamespace(
+        id=device_id,
+        name=f"device-{device_id}",
+        role=SimpleNamespace(slug=role_slug) if role_slug else None,
+    )
+
+
+def _interface(interface_id, device_id, peer_device_ids=()):
+    return SimpleNamespace(
+        id=interface_id,
+        device=SimpleNamespace(id=device_id),
+        connected_endpoints=[
+            SimpleNamespace(device=SimpleNamespace(id=peer_id))
+            for peer_id in peer_device_ids
+        ],
+    )
+
+
+@pytest.fixture
+def netbox(mock_nb, mocker):
+    """A small fabric: leaves 1 and 2, server 3 cabled to leaf 1, spines 10/11.
+
+    ``devices.filter`` honours ``id`` lists so the SONiC role filter and the
+    NETBOX_FILTER_CONDUCTOR_SONIC query are exercised for real.
+    """
+    devices = {
+        1: _device(1),
+        2: _device(2),
+        3: _device(3, role_slug="server"),
+        10: _device(10, role_slug="spine"),
+        11: _device(11, role_slug="spine"),
+    }
+    interfaces = {
+        100: _interface(100, 1, peer_device_ids=[3]),
+        101: _interface(101, 1, peer_device_ids=[10]),
+        200: _interface(200, 2, peer_device_ids=[10]),
+        300: _interface(300, 3, peer_device_ids=[1]),
+    }
+
+    def devices_filter(id=None, **query):
+        ids = id if id is not None else devices.keys()
+        return [devices[device_id] for device_id in ids if device_id in devices]
+
+    def interfaces_filter(id=None, device_id=None, cabled=None, vlan_id=None):
+        if id is not None:
+            return [interfaces[x] for x in id if x in interfaces]
+        if device_id is not None:
+            return [i for i in interfaces.values() if i.device.id in device_id]
+        if vlan_id == 42:
+            return [interfaces[100], interfaces[200]]
+        return []
+
+    mock_nb.dcim.devices.filter.side_effect = devices_filter
+    mock_nb.dcim.interfaces.filter.side_effect = interfaces_filter
+    mocker.patch.object(
+        changes, "get_nb_device_query_list_sonic", return_value=[{"status": "active"}]
+    )
+    find_groups = mocker.patch.object(
+        changes,
+        "find_interconnected_devices",
+        return_value=[[devices[10], devices[11]]],
+    )
+    mocker.patch.object(changes, "clear_interface_cache")
+    return SimpleNamespace(devices=devices, find_groups=find_groups)
+
+
+def test_unsupported_model_is_ignored(netbox):
+    assert get_affected_devices("site", {"id": 1}) == []
+
+
+def test_interface_change_affects_device_and_link_peers(netbox):
+    data = {
+        "id": 101,
+        "device": {"id": 1, "name": "device-1"},
+        "link_peers": [{"id": 900, "device": {"id": 2}}],
+    }
+
+    assert get_affected_devices("interface", data) == ["device-1", "device-2"]
+    netbox.find_groups.assert_not_called()
+
+
+def test_cable_change_affects_both_ends_and_skips_non_sonic_devices(netbox):
+    data = {
+        "a_terminations": [
+            {"object_type": "dcim.interface", "object": {"device": {"id": 1}}}
+        ],
+        "b_terminations": [
+            {"object_type": "dcim.interface", "object": {"device": {"id": 3}}}
+        ],
+    }
+
+    assert get_affected_devices("cable", data) == ["device-1"]
+
+
+def test_cable_prechange_snapshot_resolves_termination_ids(netbox):
+    data = {
+        "a_terminations": [
+            {"object_type": "dcim.interface", "object": {"device": {"id": 1}}}
+        ],
+        "b_terminations": [],
+    }
+    prechange = {"a_terminations": [100], "b_terminations": [200]}
+
+    assert get_affected_devices("cable", data, prechange) == ["device-1", "device-2"]
+
+
+def test_ip_address_change_affects_device_and_cable_peers(netbox):
+    data = {
+        "assigned_object_type": "dcim.interface",
+        "assigned_object": {"id": 200, "device": {"id": 2}},
+    }
+
+    # Leaf 2 is cabled to spine 10, which pulls in its whole spine group
+    assert get_affected_devices("ipaddress", data) == [
+        "device-10",
+        "device-11",
+        "device-2",
+    ]
+
+
+def test_ip_address_on_vm_interface_is_ignored(netbox):
+    data = {"assigned_object_type": "virtualization.vminterface"}
+
+    assert get_affected_devices("ipaddress", data) == []
+
+
+def test_vlan_change_affects_devices_with_member_interfaces(netbox):
+    assert get_affected_devices("vlan", {"id": 42}) == ["device-1", "device-2"]
+
+
+def test_spine_change_affects_spine_group_and_peers(netbox):
+    assert get_affected_devices("device", {"id": 11}) == ["device-10", "device-11"]
+    netbox.find_groups.assert_called_once()
+    changes.clear_interface_cache.assert_called_once_with()
+
+
+def test_device_change_affects_cabled_sonic_peers(netbox):
+    # Server 3 itself is not a SONiC device, but leaf 1 peers with it
+    assert get_affected_devices("device", {"id": 3}) == ["device-1"]
+
+
+# ---------------------------------------------------------------------------
+# Debounce
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def redis(mocker):
+    client = fakeredis.FakeStrictRedis()
+    mocker.patch("osism.utils._init_redis", return_value=client)
+    mocker.patch("osism.utils.redis", new=client, create=True)
+    return client
+
+
+def test_first_queue_requests_flush_and_later_ones_do_not(redis):
+    assert queue_devices(["device-1"], 10) is True
+    assert queue_devices(["device-2", "device-1"], 10) is False
+
+    assert redis.ttl(PENDING_FLUSH_KEY) > 10
+    assert redis.smembers(PENDING_DEVICES_KEY) == {b"device-1", b"device-2"}
+
+
+def test_pop_returns_pending_devices_and_rearms_flush(redis):
+    queue_devices(["device-2", "device-1"], 10)
+
+    assert pop_pending_devices() == ["device-1", "device-2"]
+    assert pop_pending_devices() == []
+    assert not redis.exists(PENDING_FLUSH_KEY)
+    assert queue_devices(["device-3"], 10) is True
@@ -0,0 +1,332 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for ``osism.tasks.conductor.sonic.fabric``.
+
+The cross-device checks work on plain ConfigDB dicts plus the cabling as
+``((device, port), (device, port))`` tuples, so most tests build two small
+configurations by hand. Only ``get_fabric_devices`` and ``get_fabric_links``
+talk to NetBox.
+"""
+
+import copy
+from types import SimpleNamespace
+
+import pytest
+
+from osism.tasks.conductor.sonic import fabric
+from osism.tasks.conductor.sonic.fabric import (
+    check_bgp_sessions,
+    check_link_mtu,
+    get_fabric_devices,
+    get_fabric_links,
+    validate_configs,
+    validate_fabric,
+)
+
+LINK = (("leaf1", "Ethernet0"), ("spine1", "Ethernet8"))
+
+
+def _switch(asn, port, address=None, neighbors=None, mtu="9100"):
+    config = {
+        "DEVICE_METADATA": {"localhost": {"bgp_asn": asn}},
+        "PORT": {port: {"lanes": "0", "speed": "100000", "mtu": mtu}},
+        "INTERFACE": {port: {}},
+        "BGP_NEIGHBOR": neighbors or {},
+    }
+    if address:
+        config["INTERFACE"][f"{port}|{address}"] = {}
+    return config
+
+
+@pytest.fixture
+def numbered():
+    """leaf1 (AS 65001) and spine1 (AS 65000) peering over 10.0.0.0/31."""
+    return {
+        "leaf1": _switch(
+            "65001",
+            "Ethernet0",
+            "10.0.0.1/31",
+            {
+                "default|10.0.0.0": {
+                    "peer_type": "external",
+                    "local_addr": "10.0.0.1",
+                    "v6only": "false",
+                }
+            },
+        ),
+        "spine1": _switch(
+            "65000",
+            "Ethernet8",
+            "10.0.0.0/31",
+            {
+                "default|10.0.0.1": {
+                    "peer_type": "external",
+                    "local_addr": "10.0.0.0",
+                    "v6only": "false",
+                }
+            },
+        ),
+    }
+
+
+@pytest.fixture
+def unnumbered():
+    return {
+        "leaf1": _switch(
+            "65001",
+            "Ethernet0",
+            neighbors={"default|Ethernet0": {"peer_type": "external"}},
+        ),
+        "spine1": _switch(
+            "65000",
+            "Ethernet8",
+            neighbors={"default|Ethernet8": {"peer_type": "external"}},
+        ),
+    }
+
+
+def _messages(issues):
+    return [issue.message for issue in issues]
+
+
+# ---------------------------------------------------------------------------
+# BGP sessions
+# ---------------------------------------------------------------------------
+
+
+def test_matching_numbered_session_has_no_issues(numbered):
+    assert check_bgp_sessions(numbered) == []
+
+
+def test_numbered_session_missing_on_peer(numbered):
+    numbered["spine1"]["BGP_NEIGHBOR"] = {}
+
+    issues = check_bgp_sessions(numbered)
+
+    assert _messages(issues) == [
+        "BGP session leaf1 -> default|10.0.0.0: spine1 has no matching neighbor "
+        "in VRF default"
+    ]
+    assert issues[0].devices == ["leaf1", "spine1"]
+
+
+def test_local_addr_not_owned_by_device(numbered):
+    numbered["leaf1"]["BGP_NEIGHBOR"]["default|10.0.0.0"]["local_addr"] = "10.9.9.9"
+
+    assert _messages(check_bgp_sessions(numbered)) == [
+        "BGP session leaf1 -> default|10.0.0.0: local_addr 10.9.9.9 is not "
+        "configured on leaf1"
+    ]
+
+
+def test_peer_points_at_other_address_than_local_addr(numbered):
+    numbered["leaf1"]["INTERFACE"]["Loopback0|10.1.0.1/32"] = {}
+    numbered["leaf1"]["BGP_NEIGHBOR"]["default|10.0.0.0"]["local_addr"] = "10.1.0.1"
+
+    assert _messages(check_bgp_sessions(numbered)) == [
+        "BGP session leaf1 -> default|10.0.0.0: spine1 peers with 10.0.0.1 "
+        "instead of local_addr 10.1.0.1"
+    ]
+
+
+def test_peer_type_must_match_asns(numbered):
+    numbered["spine1"]["DEVICE_METADATA"]["localhost"]["bgp_asn"] = "65001"
+
+    issues = check_bgp_sessions(numbered)
+
+    assert len(issues) == 2
+    assert "peer_type external but leaf1 has AS 65001 and spine1 has AS 65001" in (
+        issues[0].message
+    )
+
+
+def test_neighbors_outside_the_fabric_are_ignored(numbered):
+    numbered["leaf1"]["BGP_NEIGHBOR"]["default|192.0.2.1"] = {"peer_type": "external"}
+
+    assert check_bgp_sessions(numbered) == []
+
+
+def test_matching_unnumbered_session_has_no_issues(unnumbered):
+    assert check_bgp_sessions(unnumbered, [LINK]) == []
+
+
+def test_unnumbered_session_missing_on_cabled_peer(unnumbered):
+    unnumbered["spine1"]["BGP_NEIGHBOR"] = {}
+
+    assert _messages(check_bgp_sessions(unnumbered, [LINK])) == [
+        "BGP session leaf1 -> default|Ethernet0: spine1 has no matching neighbor "
+        "in VRF default"
+    ]
+
+
+def test_unnumbered_session_without_cabling_is_skipped(unnumbered):
+    unnumbered["spine1"]["BGP_NEIGHBOR"] = {}
+
+    assert check_bgp_sessions(unnumbered) == []
+
+
+def test_unnumbered_session_to_peer_without_config_is_skipped(unnumbered):
+    del unnumbered["spine1"]
+
+    assert check_bgp_sessions(unnumbered, [LINK]) == []
+
+
+def test_validate_fabric_with_cabled_peer_without_config():
+    configs = {
+        "a": {
+            "BGP_NEIGHBOR": {"default|Ethernet0": {"peer_type": "external"}},
+            "PORT": {"Ethernet0": {}},
+        },
+        "b": None,
+    }
+
+    result = validate_fabric(configs, [(("a", "Ethernet0"), ("b", "Ethernet0"))])
+
+    assert result.issues == []
+    assert result.to_dict()["devices"]["b"]["valid"] is False
+
+
+def test_unnumbered_port_channel_session_resolves_members(unnumbered):
+    for name, port in (("leaf1", "Ethernet0"), ("spine1", "Ethernet8")):
+        unnumbered[name]["PORTCHANNEL_MEMBER"] = {f"PortChannel1|{port}": {}}
+        unnumbered[name]["BGP_NEIGHBOR"] = {
+            "default|PortChannel1": {"peer_type": "external"}
+        }
+
+    assert check_bgp_sessions(unnumbered, [LINK]) == []
+
+    unnumbered["spine1"]["BGP_NEIGHBOR"] = {"default|Ethernet8": {}}
+
+    assert len(check_bgp_sessions(unnumbered, [LINK])) == 1
+
+
+# ---------------------------------------------------------------------------
+# Link MTU
+# ---------------------------------------------------------------------------
+
+
+def test_link_mtu_mismatch(numbered):
+    assert check_link_mtu(numbered, [LINK]) == []
+
+    numbered["spine1"]["PORT"]["Ethernet8"]["mtu"] = "1500"
+
+    issues = check_link_mtu(numbered, [LINK])
+    assert _messages(issues) == [
+        "MTU mismatch on link leaf1:Ethernet0 (9100) <-> spine1:Ethernet8 (1500)"
+    ]
+    assert issues[0].check == "mtu"
+
+
+def test_link_mtu_skips_unknown_ports_and_devices(numbered):
+    assert check_link_mtu(numbered, [(("leaf1", "Ethernet4"), LINK[1])]) == []
+    assert check_link_mtu(numbered, [(("leaf9", "Ethernet0"), LINK[1])]) == []
+
+
+# ---------------------------------------------------------------------------
+# Validation and report
+# ---------------------------------------------------------------------------
+
+
+def test_validate_configs_keeps_order_and_unavailable_configs(mocker):
+    validate = mocker.patch.object(
+        fabric, "validate_config", side_effect=lambda config: config["marker"]
+    )
+
+    results = validate_configs(
+        {"sw3": {"marker": 3}, "sw1": None, "sw2": {"marker": 2}}, max_workers=2
+    )
+
+    assert list(results.items()) == [("sw3", 3), ("sw1", None), ("sw2", 2)]
+    assert validate.call_count == 2
+
+
+def test_validate_fabric_report(numbered):
+    # The YANG model types local_addr as an interface name leafref, keep the
+    # per-device validation clean
+    for config in numbered.values():
+        for neighbor in config["BGP_NEIGHBOR"].values():
+            del neighbor["local_addr"]
+    broken = copy.deepcopy(numbered)
+    broken["spine1"]["PORT"]["Ethernet8"]["mtu"] = "1500"
+    broken["leaf2"] = None
+
+    report = validate_fabric(broken, [LINK], max_workers=2).to_dict()
+
+    assert report["valid"] is False
+    assert report["devices"]["leaf1"]["valid"] is True
+    assert report["devices"]["leaf2"] == {
+        "valid": False,
+        "errors": [{"message": "config not available"}],
+    }
+    assert report["fabric"]["errors"] == [
+        {
+            "check": "mtu",
+            "message": "MTU mismatch on link leaf1:Ethernet0 (9100) <-> "
+            "spine1:Ethernet8 (1500)",
+            "devices": ["leaf1", "spine1"],
+        }
+    ]
+    assert report["summary"] == {
+        "devices": 3,
+        "valid": 2,
+        "failed": 1,
+        "fabric_errors": 1,
+    }
+
+    assert validate_fabric(numbered, [LINK]).valid is True
+
+
+# ---------------------------------------------------------------------------
+# NetBox
+# ---------------------------------------------------------------------------
+
+
+def _device(device_id, name, role="leaf"):
+    return SimpleNamespace(id=device_id, name=name, role=SimpleNamespace(slug=role))
+
+
+def test_get_fabric_devices_filters_roles_and_hostnames(mock_nb, mocker):
+    mocker.patch.object(
+        fabric, "get_nb_device_query_list_sonic", return_value=[{"site": "a"}]
+    )
+    mock_nb.dcim.devices.filter.return_value = [
+        _device(2, "spine1", "spine"),
+        _device(1, "leaf1"),
+        _device(3, "server1", "server"),
+    ]
+
+    assert [d.name for d in get_fabric_devices()] == ["leaf1", "spine1"]
+    assert [d.name for d in get_fabric_devices(["spine1"])] == ["spine1"]
+    mock_nb.dcim.devices.filter.assert_called_with(site="a")
+
+
+def test_get_fabric_links_deduplicates_and_skips_foreign_devices(mocker):
+    leaf, spine = _device(1, "leaf1"), _device(2, "spine1", "spine")
+
+    def endpoint(device_id, name):
+        return SimpleNamespace(device=SimpleNamespace(id=device_id), name=name)
+
+    interfaces = {
+        1: [
+            SimpleNamespace(name="Eth1/1", connected_endpoints=[endpoint(2, "Eth1/3")]),
+            SimpleNamespace(name="Eth1/2", connected_endpoints=[endpoint(9, "eth0")]),
+            SimpleNamespace(name="Eth1/4", connected_endpoints=None),
+        ],
+        2: [
+            SimpleNamespace(name="Eth1/3", connected_endpoints=[endpoint(1, "Eth1/1")]),
+        ],
+    }
+    mocker.patch.object(
+        fabric, "get_cached_device_interfaces", side_effect=interfaces.get
+    )
+    mocker.patch.object(
+        fabric,
+        "convert_netbox_interface_to_sonic",
+        side_effect=lambda interface, device: f"{device.name}-{interface.name}",
+    )
+    clear = mocker.patch.object(fabric, "clear_interface_cache")
+
+    assert get_fabric_links([leaf, spine]) == [
+        (("leaf1", "leaf1-Eth1/1"), ("spine1", "spine1-Eth1/3"))
+    ]
+    clear.assert_called_once_with()
@@ -0,0 +1,208 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for ``osism.tasks.conductor.sonic.fingerprint``.
+
+The digest must be stable for identical NetBox data, change whenever an input
+of the generator changes, and ignore the fields the sync itself rewrites (the
+``sonic_config`` local context and ``last_updated``), otherwise every save
+would invalidate the fingerprint of the device and of its cable peers.
+"""
+
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+
+from osism.tasks.conductor.sonic import fingerprint
+from osism.tasks.conductor.sonic.fingerprint import (
+    FINGERPRINTS_KEY,
+    FingerprintStore,
+    compute_device_fingerprint,
+    compute_global_fingerprint,
+    outputs_present,
+)
+
+
+def _device(device_id=1, **attrs):
+    defaults = dict(
+        id=device_id,
+        name=f"sw-{device_id}",
+        serial=f"SER{device_id}",
+        last_updated="2026-01-01T00:00:00Z",
+        local_context_data={"sonic_config": {"PORT": {}}},
+        config_context={"sonic_config": {"PORT": {}}, "_segment_ntp": "a"},
+        custom_fields={"sonic_parameters": {"hwsku": "Accton-AS7326-56X"}},
+    )
+    defaults.update(attrs)
+    return SimpleNamespace(**defaults)
+
+
+def _interface(interface_id, name="Eth1/1", peer_device_id=None):
+    endpoints = None
+    if peer_device_id is not None:
+        endpoints = [SimpleNamespace(device=SimpleNamespace(id=peer_device_id))]
+    return SimpleNamespace(id=interface_id, name=name, connected_endpoints=endpoints)
+
+
+@pytest.fixture
+def topology(mock_nb, mocker):
+    """Wire device 1 to peer device 2 and return the mutable NetBox data."""
+    data = SimpleNamespace(
+        interfaces={
+            1: [_interface(10, peer_device_id=2)],
+            2: [_interface(20, name="Loopback0")],
+        },
+        peers=[_device(2)],
+        ips={1: [SimpleNamespace(id=100, address="10.0.0.1/31")], 2: []},
+    )
+    mocker.patch(
+        "osism.tasks.conductor.sonic.fingerprint.get_cached_device_interfaces",
+        side_effect=lambda device_id: data.interfaces.get(device_id, []),
+    )
+    mock_nb.dcim.devices.filter.side_effect = lambda **kw: data.peers
+    mock_nb.ipam.ip_addresses.filter.side_effect = lambda device_id: (
+        data.ips.get(device_id, [])
+        if not isinstance(device_id, list)
+        else [ip for peer_id in device_id for ip in data.ips.get(peer_id, [])]
+    )
+    return data
+
+
+def _fingerprint(device):
+    return compute_device_fingerprint(device, "Accton-AS7326-56X", "global")
+
+
+def test_fingerprint_is_stable(topology):
+    assert _fingerprint(_device()) == _fingerprint(_device())
+
+
+def test_fingerprint_ignores_fields_rewritten_by_sync(topology):
+    before = _fingerprint(_device())
+
+    after = _fingerprint(
+        _device(
+            last_updated="2026-02-02T00:00:00Z",
+            local_context_data={"sonic_config": {"PORT": {"Ethernet0": {}}}},
+            config_context={
+                "sonic_config": {"PORT": {"Ethernet0": {}}},
+                "_segment_ntp": "a",
+            },
+        )
+    )
+
+    assert before == after
+
+
+def test_fingerprint_changes_with_config_context(topology):
+    before = _fingerprint(_device())
+
+    after = _fingerprint(
+        _device(config_context={"sonic_config": {}, "_segment_ntp": "b"})
+    )
+
+    assert before != after
+
+
+def test_fingerprint_changes_with_interface(topology):
+    before = _fingerprint(_device())
+    topology.interfaces[1] = [_interface(10, peer_device_id=3)]
+
+    assert _fingerprint(_device()) != before
+
+
+def test_fingerprint_changes_with_peer_device(topology):
+    before = _fingerprint(_device())
+    topology.peers = [_device(2, name="renamed")]
+
+    assert _fingerprint(_device()) != before
+
+
+def test_fingerprint_changes_with_peer_ip_address(topology):
+    before = _fingerprint(_device())
+    topology.ips[2] = [SimpleNamespace(id=200, address="10.0.0.0/31")]
+
+    assert _fingerprint(_device()) != before
+
+
+def test_fingerprint_changes_with_global_inputs_and_as(topology):
+    device = _device()
+    base = compute_device_fingerprint(device, "Accton-AS7326-56X", "global")
+
+    assert compute_device_fingerprint(device, "Accton-AS7326-56X", "other") != base
+    assert (
+        compute_device_fingerprint(
+            device, "Accton-AS7326-56X", "global", {1: 4200000001}
+        )
+        != base
+    )
+
+
+def test_device_without_peers_does_not_query_peers(topology, mock_nb):
+    topology.interfaces[1] = [_interface(10)]
+
+    _fingerprint(_device())
+
+    mock_nb.dcim.devices.filter.assert_not_called()
+
+
+def test_global_fingerprint_changes_with_generator_version(
+    mock_nb, mocker, reset_vip_cache
+):
+    mock_nb.ipam.prefixes.filter.return_value = []
+    mock_nb.ipam.fhrp_group_assignments.all.return_value = []
+    before = compute_global_fingerprint()
+
+    mocker.patch.object(fingerprint, "GENERATOR_VERSION", "999")
+
+    assert compute_global_fingerprint() != before
+
+
+def test_outputs_present_requires_local_context_and_file(tmp_path, mocker):
+    export_file = tmp_path / "osism_SER1_config_db.json"
+    mocker.patch.object(
+        fingerprint, "get_export_filepath", return_value=str(export_file)
+    )
+
+    assert not outputs_present(_device(local_context_data={}))
+    assert not outputs_present(_device())
+
+    export_file.write_text("{}")
+
+    assert outputs_present(_device())
+
+
+def _patch_redis(mocker, client):
+    # ``osism.utils.redis`` is lazily initialised; patch the initialiser
+    # first so resolving the attribute for patching cannot connect
+    mocker.patch("osism.utils._init_redis", return_value=client)
+    mocker.patch("osism.utils.redis", new=client, create=True)
+
+
+def test_store_roundtrip(mocker):
+    redis = fakeredis.FakeStrictRedis()
+    redis.hset(FINGERPRINTS_KEY, "sw-1", "abc")
+    _patch_redis(mocker, redis)
+
+    store = FingerprintStore()
+    store.load()
+    store.set("sw-2", "def")
+
+    assert store.get("sw-1") == "abc"
+    assert store.get("sw-2") == "def"
+    assert redis.hget(FINGERPRINTS_KEY, "sw-2") == b"def"
+
+
+def test_store_without_redis_is_empty_and_drops_writes(mocker, loguru_logs):
+    redis = mocker.MagicMock()
+    redis.hgetall.side_effect = ConnectionError("unreachable")
+    _patch_redis(mocker, redis)
+
+    store = FingerprintStore()
+    store.load()
+    store.set("sw-1", "abc")
+
+    assert store.get("sw-1") is None
+    redis.hset.assert_not_called()
+    assert any(
+        "Could not load SONiC config fingerprints" in r["message"] for r in loguru_logs
+    )
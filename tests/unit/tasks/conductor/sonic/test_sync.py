@@ -95,6 +95,14 @@ def patch_sync_deps(mocker):
         get_interface_cache_stats=patch("get_interface_cache_stats", return_value={}),
         push_task_output=patch("utils.push_task_output"),
         finish_task_output=patch("utils.finish_task_output"),
+        FingerprintStore=patch("FingerprintStore"),
+        compute_global_fingerprint=patch(
+            "compute_global_fingerprint", return_value="global"
+        ),
+        compute_device_fingerprint=patch(
+            "compute_device_fingerprint", return_value="fp-new"
+        ),
+        outputs_present=patch("outputs_present", return_value=True),
     )
 
 
@@ -239,6 +247,38 @@ def test_single_spine_fetches_all_spine_devices(mock_nb, patch_sync_deps):
     )
 
 
+def test_device_names_sync_only_sonic_devices(mock_nb, patch_sync_deps):
+    deps = patch_sync_deps
+    leaf = make_device(name="leaf-1", device_id=1, role_slug="leaf")
+    server = make_device(name="srv-1", device_id=2, role_slug="server")
+    mock_nb.dcim.devices.filter.return_value = [leaf, server]
+
+    result = sync_sonic(device_names=["leaf-1", "srv-1"])
+
+    mock_nb.dcim.devices.filter.assert_called_once_with(name=["leaf-1", "srv-1"])
+    deps.get_nb_device_query_list_sonic.assert_not_called()
+    deps.find_interconnected_devices.assert_called_once_with(
+        [leaf], ["spine", "superspine"]
+    )
+    assert list(result) == ["leaf-1"]
+
+
+def test_device_names_with_spine_fetch_all_spine_devices(mock_nb, patch_sync_deps):
+    deps = patch_sync_deps
+    spine = make_device(name="spine-1", role_slug="spine")
+    other_spine = make_device(name="spine-2", device_id=2, role_slug="spine")
+    deps.get_nb_device_query_list_sonic.return_value = [{"status": "active"}]
+    mock_nb.dcim.devices.filter.side_effect = lambda **kw: (
+        [spine] if "name" in kw else [spine, other_spine]
+    )
+
+    sync_sonic(device_names=["spine-1"])
+
+    deps.find_interconnected_devices.assert_called_once_with(
+        [spine, other_spine], ["spine", "superspine"]
+    )
+
+
 def test_single_leaf_uses_device_list_without_extra_fetch(mock_nb, patch_sync_deps):
     deps = patch_sync_deps
     device = make_device(name="leaf-1", role_slug="leaf")
@@ -676,6 +716,115 @@ def test_config_without_port_section_is_handled(mock_nb, patch_sync_deps, loguru
     assert _has_log(loguru_logs, "INFO", "with 0 ports")
 
 
+# ---------------------------------------------------------------------------
+# Input fingerprints
+# ---------------------------------------------------------------------------
+
+
+def _stored_fingerprint(deps, fingerprint):
+    store = deps.FingerprintStore.return_value
+    store.get.return_value = fingerprint
+    return store
+
+
+def test_unchanged_fingerprint_skips_device(mock_nb, patch_sync_deps, loguru_logs):
+    deps = patch_sync_deps
+    device = make_device(name="sw-1", role_slug="leaf")
+    mock_nb.dcim.devices.get.return_value = device
+    store = _stored_fingerprint(deps, "fp-new")
+
+    result = sync_sonic(device_name="sw-1", task_id="t")
+
+    assert result == {}
+    deps.generate_sonic_config.assert_not_called()
+    deps.save_config_to_netbox.assert_not_called()
+    deps.export_config_to_file.assert_not_called()
+    store.set.assert_not_called()
+    # The firmware link is reconciled even for skipped devices
+    deps.export_firmware_link.assert_called_once_with(device, None)
+    deps.push_task_output.assert_any_call("t", "Skipping unchanged device: sw-1\n")
+    deps.finish_task_output.assert_called_once_with("t", rc=0)
+    assert _has_log(
+        loguru_logs, "INFO", "Skipped 1 unchanged devices, regenerated 0 devices"
+    )
+
+
+def test_changed_fingerprint_regenerates_and_stores(
+    mock_nb, patch_sync_deps, loguru_logs
+):
+    deps = patch_sync_deps
+    device = make_device(name="sw-1", role_slug="leaf")
+    mock_nb.dcim.devices.get.return_value = device
+    store = _stored_fingerprint(deps, "fp-old")
+
+    sync_sonic(device_name="sw-1")
+
+    deps.generate_sonic_config.assert_called_once()
+    deps.compute_device_fingerprint.assert_called_once_with(
+        device, "Accton-AS7326-56X", "global", {}, None
+    )
+    store.load.assert_called_once_with()
+    store.set.assert_called_once_with("sw-1", "fp-new")
+    assert _has_log(
+        loguru_logs, "INFO", "Skipped 0 unchanged devices, regenerated 1 devices"
+    )
+
+
+def test_force_regenerates_unchanged_device(mock_nb, patch_sync_deps):
+    deps = patch_sync_deps
+    device = make_device(name="sw-1", role_slug="leaf")
+    mock_nb.dcim.devices.get.return_value = device
+    store = _stored_fingerprint(deps, "fp-new")
+
+    sync_sonic(device_name="sw-1", force=True)
+
+    deps.generate_sonic_config.assert_called_once()
+    store.set.assert_called_once_with("sw-1", "fp-new")
+
+
+def test_missing_outputs_regenerate_unchanged_device(mock_nb, patch_sync_deps):
+    deps = patch_sync_deps
+    device = make_device(name="sw-1", role_slug="leaf")
+    mock_nb.dcim.devices.get.return_value = device
+    _stored_fingerprint(deps, "fp-new")
+    deps.outputs_present.return_value = False
+
+    sync_sonic(device_name="sw-1")
+
+    deps.generate_sonic_config.assert_called_once()
+
+
+def test_failed_device_does_not_store_fingerprint(mock_nb, patch_sync_deps):
+    deps = patch_sync_deps
+    device = make_device(name="sw-1", role_slug="leaf")
+    mock_nb.dcim.devices.get.return_value = device
+    store = _stored_fingerprint(deps, None)
+    deps.export_config_to_file.side_effect = OSError("disk full")
+
+    sync_sonic(device_name="sw-1")
+
+    store.set.assert_not_called()
+
+
+def test_fingerprint_failure_falls_back_to_regeneration(
+    mock_nb, patch_sync_deps, loguru_logs
+):
+    deps = patch_sync_deps
+    device = make_device(name="sw-1", role_slug="leaf")
+    mock_nb.dcim.devices.get.return_value = device
+    store = _stored_fingerprint(deps, "fp-new")
+    deps.compute_device_fingerprint.side_effect = RuntimeError("netbox down")
+
+    sync_sonic(device_name="sw-1", task_id="t")
+
+    deps.generate_sonic_config.assert_called_once()
+    store.set.assert_not_called()
+    deps.finish_task_output.assert_called_once_with("t", rc=0)
+    assert _has_log(
+        loguru_logs, "WARNING", "Could not compute SONiC config fingerprint"
+    )
+
+
 # ---------------------------------------------------------------------------
 # Cache stats
 # ---------------------------------------------------------------------------
@@ -7,6 +7,9 @@ validation is exercised end-to-end by the existing CLI tests and only checked
 here for non-regression.
 """
 
+from osism.tasks.conductor.sonic import validator
+from osism.tasks.conductor.sonic._generated import LEAFREFS, TABLE_MODELS
+from osism.tasks.conductor.sonic._generated._schemas import TableModelRegistry
 from osism.tasks.conductor.sonic.validator import validate_config
 
 
@@ -84,7 +87,7 @@ def test_union_leafref_fails_when_no_target_matches():
 
 def test_leafref_resolves_via_non_key_target_field():
     """TUNNEL.src_ip → PEER_SWITCH.address_ipv4: target_field is not the row key,
-    so the value must resolve via the inner field in `_collect_target_keysets`."""
+    so the value must resolve via the inner field in `_TargetIndex`."""
     config = {
         # Row key deliberately differs from address_ipv4 so the only way the
         # leafref can resolve is via the inner non-key field.
@@ -176,3 +179,155 @@ def test_unknown_table_emits_warning_not_error():
     result = validate_config(config)
     assert any("NOT_A_REAL_TABLE" in w for w in result.warnings)
     assert _leafref_errors(result) == []
+
+
+# ---------------------------------------------------------------------------
+# Lazy table model registry
+# ---------------------------------------------------------------------------
+
+
+def test_registry_builds_table_models_on_first_access(mocker):
+    builder = mocker.Mock(return_value=TABLE_MODELS["PORT"])
+    registry = TableModelRegistry({"PORT": builder})
+
+    assert "PORT" in registry
+    assert list(registry) == ["PORT"]
+    assert registry.loaded() == []
+    builder.assert_not_called()
+
+    assert registry["PORT"] is registry["PORT"]
+    assert registry.loaded() == ["PORT"]
+    builder.assert_called_once_with()
+
+
+def test_registry_returns_none_for_unknown_tables():
+    assert "NOT_A_REAL_TABLE" not in TABLE_MODELS
+    assert TABLE_MODELS.get("NOT_A_REAL_TABLE") is None
+
+
+def test_validation_only_builds_models_of_present_tables(mocker):
+    registry = TableModelRegistry(dict(TABLE_MODELS._builders))
+    mocker.patch.object(validator, "TABLE_MODELS", registry)
+
+    validate_config({"PORT": {"Ethernet0": {"lanes": "0", "speed": "10000"}}})
+
+    assert registry.loaded() == ["PORT"]
+
+
+def test_every_table_model_can_be_built():
+    for table_name in TABLE_MODELS:
+        model = TABLE_MODELS[table_name]
+        assert model.model_validate({}).root == {}, table_name
+
+
+# ---------------------------------------------------------------------------
+# Target index benchmark
+# ---------------------------------------------------------------------------
+
+
+def _check_leafrefs_per_constraint(config):
+    """Reference implementation rebuilding the target keysets per constraint."""
+    errors = []
+    for constraint in LEAFREFS:
+        rows = config.get(constraint.source_table)
+        if not isinstance(rows, dict):
+            continue
+        keysets = []
+        for target_table, target_field in constraint.targets:
+            keys = set()
+            for k, v in (config.get(target_table) or {}).items():
+                keys.add(k)
+                inner = v.get(target_field) if isinstance(v, dict) else None
+                if isinstance(inner, str):
+                    keys.add(inner)
+                elif isinstance(inner, list):
+                    keys.update(i for i in inner if isinstance(i, str))
+            keysets.append(keys)
+        for row_key, row in rows.items():
+            raw = None
+            if isinstance(row, dict) and constraint.source_field in row:
+                raw = row[constraint.source_field]
+            elif constraint.source_is_simple_key and "|" not in row_key:
+                raw = row_key
+            if isinstance(raw, str):
+                values = [raw]
+            elif constraint.is_leaf_list and isinstance(raw, list):
+                values = [i for i in raw if isinstance(i, str)]
+            else:
+                values = []
+            for value in values:
+                if not any(value in keys for keys in keysets):
+                    errors.append(
+                        (
+                            constraint.source_table,
+                            f"{row_key}.{constraint.source_field}",
+                        )
+                    )
+    return errors
+
+
+def _large_config(ports_count=625):
+    """Build a ConfigDB of about 5,000 rows, most of them referencing PORT."""
+    ports = [f"Ethernet{i * 4}" for i in range(ports_count)]
+    return {
+        "PORT": {port: {"lanes": "0", "speed": "100000"} for port in ports},
+        "PORTCHANNEL": {"PortChannel1": {"admin_status": "up"}},
+        "PORTCHANNEL_MEMBER": {
+            f"PortChannel1|{port}": {"name": "PortChannel1", "port": port}
+            for port in ports
+        },
+        "INTERFACE": {port: {} for port in ports},
+        "TC_TO_QUEUE_MAP": {"AZURE": {}},
+        "PORT_QOS_MAP": {port: {"tc_to_queue_map": "AZURE"} for port in ports},
+        "QUEUE": {f"{port}|0": {"ifname": port} for port in ports},
+        "BUFFER_PG": {f"{port}|3-4": {"port": port} for port in ports},
+        "VLAN": {"Vlan100": {}},
+        "VLAN_MEMBER": {
+            f"Vlan100|{port}": {"name": "Vlan100", "port": port} for port in ports
+        },
+        "VRF": {"default": {}},
+        "BGP_GLOBALS": {"default": {}},
+        "BGP_NEIGHBOR": {
+            f"default|10.0.{i // 250}.{i % 250}": {
+                "local_addr": port,
+                "vrf_name": "default",
+            }
+            for i, port in enumerate(ports)
+        },
+    }
+
+
+def test_indexed_leafrefs_match_per_constraint_reference():
+    config = _large_config()
+    # Break a few references in different tables and targets
+    config["INTERFACE"]["Ethernet9999"] = {}
+    config["VLAN_MEMBER"]["Vlan100|Ethernet0"]["port"] = "PortChannel9"
+    config["BGP_NEIGHBOR"]["default|10.0.0.0"]["vrf_name"] = "Vrf1"
+
+    errors = validator._check_leafrefs(config)
+
+    assert sorted((e.table, e.path) for e in errors) == sorted(
+        _check_leafrefs_per_constraint(config)
+    )
+    assert len(errors) == 3
+
+
+class _CountingConfig(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lookups = {}
+
+    def get(self, key, default=None):
+        self.lookups[key] = self.lookups.get(key, 0) + 1
+        return super().get(key, default)
+
+
+def test_target_tables_are_scanned_once():
+    config = _CountingConfig(_large_config())
+
+    validator._check_leafrefs(config)
+
+    # PORT is the target of most present tables and a source table itself
+    # (PORT.macsec), yet it is only read once as target and once as source
+    assert config.lookups["PORT"] == 2
+    assert config.lookups["PORTCHANNEL"] == 1
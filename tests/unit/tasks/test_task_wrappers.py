@@ -221,6 +221,7 @@ def test_setup_periodic_tasks_is_noop(mocker, module, worker):
 
 def test_gather_facts_delegates_with_defaults(mocker):
     """``gather_facts`` delegates the seven positional args and no lock check."""
+    mocker.patch("osism.tasks.ansible._update_fact_indexes")
     delegate = mocker.patch(
         "osism.tasks.ansible.run_ansible_in_environment", return_value="RESULT"
     )
@@ -237,6 +238,7 @@ def test_gather_facts_delegates_with_defaults(mocker):
 
 def test_gather_facts_forwards_publish_false(mocker):
     """``publish=False`` is forwarded as the sixth positional argument."""
+    mocker.patch("osism.tasks.ansible._update_fact_indexes")
     delegate = mocker.patch("osism.tasks.ansible.run_ansible_in_environment")
 
     ansible.gather_facts.__wrapped__(publish=False)
@@ -246,6 +248,42 @@ def test_gather_facts_forwards_publish_false(mocker):
     )
 
 
+def test_gather_facts_updates_fact_indexes(mocker):
+    """After gathering the fact search index is updated, compact copies only
+    with compressed facts storage."""
+    mocker.patch("osism.tasks.ansible.run_ansible_in_environment")
+    redis = mocker.patch("osism.tasks.ansible.utils.redis", create=True)
+    compact = mocker.patch("osism.tasks.ansible.compact_facts")
+    update = mocker.patch("osism.tasks.ansible.update_search_index")
+
+    ansible.gather_facts.__wrapped__()
+
+    compact.assert_not_called()
+    update.assert_called_once_with(redis)
+
+    mocker.patch("osism.tasks.ansible.settings.FACTS_STORAGE", "compressed")
+    ansible.gather_facts.__wrapped__()
+
+    compact.assert_called_once_with(redis)
+
+
+def test_gather_facts_survives_fact_index_errors(mocker, loguru_logs):
+    mocker.patch(
+        "osism.tasks.ansible.run_ansible_in_environment", return_value="RESULT"
+    )
+    mocker.patch("osism.tasks.ansible.utils.redis", create=True)
+    mocker.patch(
+        "osism.tasks.ansible.update_search_index",
+        side_effect=RuntimeError("redis down"),
+    )
+
+    assert ansible.gather_facts.__wrapped__() == "RESULT"
+    assert any(
+        "Could not update the fact indexes: redis down" in r["message"]
+        for r in loguru_logs
+    )
+
+
 # ---------------------------------------------------------------------------
 # ansible.run
 # ---------------------------------------------------------------------------
@@ -281,6 +319,20 @@ def test_ansible_run_forwards_arguments(mocker):
     )
 
 
+def test_ansible_run_gather_facts_updates_fact_indexes(mocker):
+    """osism sync facts indexes the facts like gather_facts, other playbooks
+    do not."""
+    mocker.patch("osism.tasks.ansible.run_ansible_in_environment")
+    mocker.patch("osism.tasks.ansible.utils.check_task_lock_and_exit")
+    update = mocker.patch("osism.tasks.ansible._update_fact_indexes")
+
+    ansible.run.__wrapped__("generic", "site", [])
+    update.assert_not_called()
+
+    ansible.run.__wrapped__("generic", "gather-facts", [])
+    update.assert_called_once_with()
+
+
 def test_ansible_run_aborts_when_task_lock_active(mocker):
     """The lock check runs before delegation; ``SystemExit`` skips the runner."""
     delegate = mocker.patch("osism.tasks.ansible.run_ansible_in_environment")
@@ -24,17 +24,21 @@ synchronously; patching ``osism.api.openstack.<task>`` replaces the attribute
 on the shared module object, so no Celery broker is involved.
 """
 
+import asyncio
 import json
 import os
 import subprocess
+import zlib
 from unittest.mock import AsyncMock, MagicMock, call, mock_open, patch
 from uuid import UUID
 
+import fakeredis
 import pytest
 from fastapi import WebSocket
 from fastapi.testclient import TestClient
 
 from osism import api
+from osism.utils.facts import compact_facts
 
 INVENTORY_PATH = "/inventory/hosts.yml"
 FULL_INVENTORY = "/inventory/hosts.yml"
@@ -71,6 +75,7 @@ def test_events_info_points_to_websocket_endpoint(client):
     body = response.json()
     assert body["result"] == "ok"
     assert body["websocket_endpoint"] == "/v1/events/openstack"
+    assert body["sse_endpoint"] == "/v1/events/openstack/sse"
 
 
 # ---------------------------------------------------------------------------
@@ -372,6 +377,47 @@ def test_notifications_baremetal_unknown_event_type_uses_default_handler(client)
     assert response.status_code == 204
 
 
+def test_notifications_baremetal_batch_dispatches_in_order(client, mocker):
+    get_handler = mocker.patch.object(api.baremetal_events, "get_handler")
+    notifications = [
+        VALID_NOTIFICATION,
+        {**VALID_NOTIFICATION, "event_type": "baremetal.node.delete.end"},
+    ]
+
+    response = client.post("/v1/notifications/baremetal/batch", json=notifications)
+
+    assert response.status_code == 204
+    assert [c.args[0] for c in get_handler.call_args_list] == [
+        "baremetal.node.power_set.end",
+        "baremetal.node.delete.end",
+    ]
+
+
+def test_notifications_baremetal_batch_processes_rest_after_error(client, mocker):
+    get_handler = mocker.patch.object(api.baremetal_events, "get_handler")
+    get_handler.return_value.side_effect = [RuntimeError("handler broken"), None]
+
+    response = client.post(
+        "/v1/notifications/baremetal/batch",
+        json=[VALID_NOTIFICATION, VALID_NOTIFICATION],
+    )
+
+    # Not a 5xx, the sender must not send the processed notification again
+    assert response.status_code == 207
+    assert response.json() == {
+        "processed": 2,
+        "failed": [
+            {
+                "index": 0,
+                "message_id": VALID_NOTIFICATION["message_id"],
+                "event_type": "baremetal.node.power_set.end",
+                "error": "handler broken",
+            }
+        ],
+    }
+    assert get_handler.return_value.call_count == 2
+
+
 # ---------------------------------------------------------------------------
 # sonic_ztp_complete
 # ---------------------------------------------------------------------------
@@ -504,12 +550,18 @@ def ws_manager(mocker):
     """
     manager = MagicMock()
 
-    async def fake_connect(websocket):
+    async def fake_connect(websocket, message_format="json"):
         await websocket.accept()
 
     manager.connect = AsyncMock(side_effect=fake_connect)
     manager.update_filters = AsyncMock()
     manager.disconnect = AsyncMock()
+
+    async def fake_send_message(websocket, message):
+        await websocket.send_text(message)
+        return True
+
+    manager.send_message = AsyncMock(side_effect=fake_send_message)
     mocker.patch("osism.api.websocket_manager", manager)
     return manager
 
@@ -530,6 +582,8 @@ def test_websocket_set_filters_acknowledged(client, ws_manager):
 
     assert ack == {"type": "filter_update", "status": "success", **FILTERS}
     connected = ws_manager.connect.await_args.args[0]
+    # Through the send queue of the connection, not past its writer task
+    assert ws_manager.send_message.await_args.args[0] is connected
     ws_manager.update_filters.assert_awaited_once_with(
         connected,
         event_filters=FILTERS["event_filters"],
@@ -592,6 +646,142 @@ def test_websocket_update_filters_error_keeps_connection_open(client, ws_manager
     assert ws_manager.update_filters.await_count == 2
 
 
+def test_websocket_replay_on_connect(client, ws_manager, mocker):
+    ws_manager.send_recent_events = AsyncMock()
+    recent = [{"event_type": "a.b", "payload": {}}]
+    get_recent = mocker.patch.object(
+        api.event_bridge, "get_recent_events", return_value=recent
+    )
+
+    with client.websocket_connect("/v1/events/openstack?replay=5"):
+        pass
+
+    get_recent.assert_called_once_with(5)
+    connected = ws_manager.connect.await_args.args[0]
+    ws_manager.send_recent_events.assert_awaited_once_with(connected, recent)
+
+
+def test_websocket_replay_action_after_filters(client, ws_manager, mocker):
+    ws_manager.send_recent_events = AsyncMock()
+    get_recent = mocker.patch.object(
+        api.event_bridge, "get_recent_events", return_value=[]
+    )
+
+    with client.websocket_connect("/v1/events/openstack") as websocket:
+        websocket.send_text(json.dumps({"action": "set_filters", **FILTERS}))
+        websocket.receive_json()
+        websocket.send_text(json.dumps({"action": "replay", "count": 20}))
+        websocket.send_text(json.dumps({"action": "set_filters", **FILTERS}))
+        websocket.receive_json()
+
+    get_recent.assert_called_once_with(20)
+    ws_manager.send_recent_events.assert_awaited_once()
+
+
+# ---------------------------------------------------------------------------
+# sse_openstack_events
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def sse_manager(ws_manager):
+    """Connect event streams that yield the frames in ``frames`` and end."""
+    ws_manager.frames = ["id: 1-0\ndata: {}\n\n"]
+    ws_manager.send_queue_size = 1000
+    ws_manager.send_recent_events = AsyncMock()
+
+    async def fake_connect(stream, message_format="json"):
+        assert message_format == "sse"
+        # Unbounded, so all frames and the end marker fit without a reader
+        stream._frames = asyncio.Queue()
+        for frame in ws_manager.frames:
+            stream._frames.put_nowait(frame)
+        stream._frames.put_nowait(None)
+
+    ws_manager.connect.side_effect = fake_connect
+    return ws_manager
+
+
+def test_sse_streams_frames_with_filters_from_query(client, sse_manager):
+    response = client.get(
+        "/v1/events/openstack/sse?service_filters=baremetal,compute"
+        "&node_filters=node1&node_filters=node2"
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.text == "retry: 5000\n\nid: 1-0\ndata: {}\n\n"
+    stream = sse_manager.connect.await_args.args[0]
+    sse_manager.update_filters.assert_awaited_once_with(
+        stream,
+        event_filters=None,
+        node_filters=["node1", "node2"],
+        service_filters=["baremetal", "compute"],
+    )
+    sse_manager.send_recent_events.assert_not_awaited()
+    sse_manager.disconnect.assert_awaited_once_with(stream)
+
+
+def test_sse_resumes_after_last_event_id(client, sse_manager, mocker):
+    missed = [{"id": "2-0", "event_type": "a.b", "payload": {}}]
+    get_after = mocker.patch.object(
+        api.event_bridge, "get_events_after", return_value=missed
+    )
+    get_recent = mocker.patch.object(api.event_bridge, "get_recent_events")
+
+    client.get("/v1/events/openstack/sse?replay=10", headers={"Last-Event-ID": "1-0"})
+
+    get_after.assert_called_once_with("1-0", 1000)
+    get_recent.assert_not_called()
+    stream = sse_manager.connect.await_args.args[0]
+    sse_manager.send_recent_events.assert_awaited_once_with(stream, missed)
+
+
+def test_sse_last_event_id_query_parameter(client, sse_manager, mocker):
+    get_after = mocker.patch.object(
+        api.event_bridge, "get_events_after", return_value=[]
+    )
+
+    client.get("/v1/events/openstack/sse?last_event_id=1-0")
+
+    get_after.assert_called_once_with("1-0", 1000)
+    sse_manager.send_recent_events.assert_not_awaited()
+
+
+def test_sse_replay(client, sse_manager, mocker):
+    get_recent = mocker.patch.object(
+        api.event_bridge, "get_recent_events", return_value=[]
+    )
+
+    client.get("/v1/events/openstack/sse?replay=5")
+
+    get_recent.assert_called_once_with(5)
+
+
+def test_sse_gzip_compression(client, sse_manager):
+    sse_manager.frames = [f"id: {i}-0\ndata: {{}}\n\n" for i in range(50)]
+
+    with client.stream(
+        "GET", "/v1/events/openstack/sse", headers={"Accept-Encoding": "gzip"}
+    ) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    text = zlib.decompress(raw, wbits=31).decode()
+    assert text.count("data: {}") == 50
+    assert len(raw) < len(text)
+
+
+def test_sse_without_gzip_is_not_compressed(client, sse_manager):
+    response = client.get(
+        "/v1/events/openstack/sse", headers={"Accept-Encoding": "gzip;q=0, br"}
+    )
+
+    assert "content-encoding" not in response.headers
+
+
 # ---------------------------------------------------------------------------
 # get_inventory_hosts
 # ---------------------------------------------------------------------------
@@ -952,6 +1142,132 @@ def test_get_host_fact_invalid_json(client):
     assert response.json()["detail"] == "Failed to parse facts for node-1"
 
 
+def test_get_host_fact_from_compressed_storage(client, mocker):
+    mocker.patch("osism.settings.FACTS_STORAGE", "compressed")
+    mocker.patch("osism.settings.FACTS_HOT_KEYS", ["ansible_hostname"])
+    fake_redis = fakeredis.FakeStrictRedis()
+    fake_redis.set(
+        "ansible_factsnode-1",
+        json.dumps({"ansible_hostname": "node-1", "ansible_kernel": "6.8.0"}),
+    )
+    fake_redis.zadd("ansible_cache_keys", {"node-1": 100})
+
+    # Without a compact copy the plain facts are read, reading does not
+    # write the copy
+    url = "/v1/inventory/hosts/node-1/facts/ansible_hostname"
+    assert get_with_redis(client, fake_redis, url).json()["value"] == "node-1"
+    assert not fake_redis.exists("osism_factsnode-1")
+
+    compact_facts(fake_redis)
+    response = get_with_redis(client, fake_redis, url)
+    assert response.status_code == 200
+    assert response.json()["value"] == "node-1"
+    response = get_with_redis(client, fake_redis, "/v1/inventory/hosts/node-1/facts")
+
+    assert response.status_code == 200
+    assert response.json()["count"] == 2
+
+
+# ---------------------------------------------------------------------------
+# search_fact_values / get_fact_values
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def search_redis(mocker):
+    mocker.patch("osism.settings.FACTS_SEARCH_PATHS", ["ansible_kernel"])
+    fake_redis = fakeredis.FakeStrictRedis()
+    for host, kernel in (("node-1", "6.8.0"), ("node-2", "6.9.0"), ("node-3", "6.8.0")):
+        fake_redis.set(
+            f"ansible_facts{host}",
+            json.dumps(
+                {"ansible_date_time": {"epoch": "100"}, "ansible_kernel": kernel}
+            ),
+        )
+        fake_redis.zadd("ansible_cache_keys", {host: 100})
+    return fake_redis
+
+
+def test_search_fact_values_returns_hosts(client, search_redis):
+    response = get_with_redis(
+        client,
+        search_redis,
+        "/v1/inventory/facts/search?path=ansible_kernel&value=6.8.0",
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "path": "ansible_kernel",
+        "value": "6.8.0",
+        "hosts": ["node-1", "node-3"],
+        "count": 2,
+    }
+
+
+def test_search_fact_values_sees_refreshed_facts(client, search_redis):
+    url = "/v1/inventory/facts/search?path=ansible_kernel&value=6.9.0"
+    assert get_with_redis(client, search_redis, url).json()["hosts"] == ["node-2"]
+
+    search_redis.set(
+        "ansible_factsnode-1",
+        json.dumps({"ansible_date_time": {"epoch": "200"}, "ansible_kernel": "6.9.0"}),
+    )
+    search_redis.zadd("ansible_cache_keys", {"node-1": 200})
+
+    assert get_with_redis(client, search_redis, url).json()["hosts"] == [
+        "node-1",
+        "node-2",
+    ]
+
+
+def test_fact_search_does_not_reindex_up_to_date_index(client, search_redis, mocker):
+    url = "/v1/inventory/facts/search?path=ansible_kernel&value=6.9.0"
+    get_with_redis(client, search_redis, url)
+    update = mocker.patch.object(api, "update_search_index")
+
+    assert get_with_redis(client, search_redis, url).json()["hosts"] == ["node-2"]
+    update.assert_not_called()
+
+
+def test_get_fact_values_returns_counts(client, search_redis):
+    response = get_with_redis(
+        client, search_redis, "/v1/inventory/facts/values?path=ansible_kernel"
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "path": "ansible_kernel",
+        "values": {"6.8.0": 2, "6.9.0": 1},
+        "count": 2,
+    }
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/v1/inventory/facts/search?path=ansible_lsb&value=x",
+        "/v1/inventory/facts/values?path=ansible_lsb",
+    ],
+)
+def test_fact_search_unindexed_path(client, search_redis, url):
+    response = get_with_redis(client, search_redis, url)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Fact path 'ansible_lsb' is not indexed"
+
+
+def test_fact_search_redis_error(client):
+    fake_redis = MagicMock()
+    fake_redis.pipeline.return_value.execute.side_effect = RuntimeError("redis down")
+
+    response = get_with_redis(
+        client, fake_redis, "/v1/inventory/facts/values?path=ansible_kernel"
+    )
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Failed to search facts: redis down"
+
+
 # ---------------------------------------------------------------------------
 # search_inventory
 # ---------------------------------------------------------------------------
@@ -274,6 +274,46 @@ def test_webhook_unmanaged_device_is_ignored(mocker):
     run.delay.assert_not_called()
 
 
+def test_webhook_sonic_sync_disabled_does_not_schedule(mocker):
+    mocker.patch("osism.api.reconciler.run")
+    handle = mocker.patch("osism.api.conductor.handle_sonic_netbox_change")
+    mocker.patch("osism.api.settings.SONIC_WEBHOOK_SYNC", False)
+
+    api.process_netbox_webhook(make_webhook_input(device_data(device_type="switch")))
+
+    handle.delay.assert_not_called()
+
+
+def test_webhook_sonic_sync_schedules_device_change(mocker):
+    run = mocker.patch("osism.api.reconciler.run")
+    handle = mocker.patch("osism.api.conductor.handle_sonic_netbox_change")
+    mocker.patch("osism.api.settings.SONIC_WEBHOOK_SYNC", True)
+    webhook_input = make_webhook_input(device_data(device_type="switch"))
+    webhook_input.snapshots = {"prechange": {"name": "old"}}
+
+    api.process_netbox_webhook(webhook_input)
+
+    handle.delay.assert_called_once_with("device", webhook_input.data, {"name": "old"})
+    run.delay.assert_not_called()
+
+
+def test_webhook_sonic_sync_handles_models_without_name(mocker):
+    """Cables carry no ``name``; with the SONiC sync enabled they are
+    scheduled instead of being rejected as unknown."""
+    run = mocker.patch("osism.api.reconciler.run")
+    handle = mocker.patch("osism.api.conductor.handle_sonic_netbox_change")
+    mocker.patch("osism.api.settings.SONIC_WEBHOOK_SYNC", True)
+    webhook_input = make_webhook_input({"url": "/api/dcim/cables/7/", "id": 7})
+    webhook_input.model = "cable"
+
+    api.process_netbox_webhook(webhook_input)
+
+    handle.delay.assert_called_once_with(
+        "cable", {"url": "/api/dcim/cables/7/", "id": 7}, None
+    )
+    run.delay.assert_not_called()
+
+
 def test_webhook_missing_data_keys_raises_key_error(mocker):
     mocker.patch("osism.api.reconciler.run")
     with pytest.raises(KeyError):
@@ -539,3 +579,24 @@ def test_baremetal_nodes_netbox_response_coerces_plain_dicts():
     assert info.device_role == "server"
     assert info.primary_ip4 == "10.0.0.1"
     assert info.primary_ip6 is None
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected",
+    [
+        (None, False),
+        ("gzip", True),
+        ("br, GZIP;q=0.5", True),
+        ("gzip;q=0", False),
+        ("gzip; q=0.0, deflate", False),
+        ("gzip;q=x", False),
+        ("deflate, br", False),
+    ],
+)
+def test_accepts_gzip(accept_encoding, expected):
+    assert api._accepts_gzip(accept_encoding) is expected
+
+
+def test_split_filter_accepts_repeated_and_comma_separated_values():
+    assert api._split_filter(None) is None
+    assert api._split_filter(["a, b", "c", ""]) == ["a", "b", "c"]
@@ -433,6 +433,96 @@ def test_facts_max_age_explicit_override_wins(reload_settings, monkeypatch):
     assert settings_module.FACTS_MAX_AGE == 999
 
 
+def test_facts_index_key_default(reload_settings, monkeypatch):
+    monkeypatch.delenv("FACTS_INDEX_KEY", raising=False)
+    reload_settings()
+
+    assert settings_module.FACTS_INDEX_KEY == "ansible_cache_keys"
+
+
+def test_facts_index_key_override(reload_settings, monkeypatch):
+    monkeypatch.setenv("FACTS_INDEX_KEY", "facts_index")
+    reload_settings()
+
+    assert settings_module.FACTS_INDEX_KEY == "facts_index"
+
+
+def test_facts_storage_defaults(reload_settings, monkeypatch):
+    for name in ("FACTS_STORAGE", "FACTS_COMPRESSION", "FACTS_HOT_KEYS"):
+        monkeypatch.delenv(name, raising=False)
+    reload_settings()
+
+    assert settings_module.FACTS_STORAGE == "plain"
+    assert settings_module.FACTS_COMPRESSION == "zstd"
+    assert "ansible_kernel" in settings_module.FACTS_HOT_KEYS
+    assert "ansible_local" in settings_module.FACTS_HOT_KEYS
+
+
+def test_facts_storage_overrides(reload_settings, monkeypatch):
+    monkeypatch.setenv("FACTS_STORAGE", "compressed")
+    monkeypatch.setenv("FACTS_COMPRESSION", "zlib")
+    monkeypatch.setenv("FACTS_HOT_KEYS", " ansible_kernel, ,ansible_lsb ")
+    reload_settings()
+
+    assert settings_module.FACTS_STORAGE == "compressed"
+    assert settings_module.FACTS_COMPRESSION == "zlib"
+    assert settings_module.FACTS_HOT_KEYS == ["ansible_kernel", "ansible_lsb"]
+
+
+def test_facts_search_paths_default(reload_settings, monkeypatch):
+    monkeypatch.delenv("FACTS_SEARCH_PATHS", raising=False)
+    reload_settings()
+
+    assert "ansible_kernel" in settings_module.FACTS_SEARCH_PATHS
+    assert "ansible_*.module" in settings_module.FACTS_SEARCH_PATHS
+
+
+def test_facts_search_paths_override(reload_settings, monkeypatch):
+    monkeypatch.setenv("FACTS_SEARCH_PATHS", "ansible_kernel, ansible_lsb.release,")
+    reload_settings()
+
+    assert settings_module.FACTS_SEARCH_PATHS == [
+        "ansible_kernel",
+        "ansible_lsb.release",
+    ]
+
+
+def test_report_ssh_defaults(reload_settings, monkeypatch):
+    monkeypatch.delenv("REPORT_SSH_CONCURRENCY", raising=False)
+    monkeypatch.delenv("REPORT_SSH_TIMEOUT", raising=False)
+    reload_settings()
+
+    assert settings_module.REPORT_SSH_CONCURRENCY == 32
+    assert settings_module.REPORT_SSH_TIMEOUT == 30
+
+
+def test_report_ssh_overrides(reload_settings, monkeypatch):
+    monkeypatch.setenv("REPORT_SSH_CONCURRENCY", "64")
+    monkeypatch.setenv("REPORT_SSH_TIMEOUT", "10")
+    reload_settings()
+
+    assert settings_module.REPORT_SSH_CONCURRENCY == 64
+    assert settings_module.REPORT_SSH_TIMEOUT == 10
+
+
+def test_check_mount_manifest_dir_default(reload_settings, monkeypatch):
+    monkeypatch.delenv("CHECK_MOUNT_MANIFEST_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", "/home/dragon/.cache")
+    reload_settings()
+
+    assert (
+        settings_module.CHECK_MOUNT_MANIFEST_DIR
+        == "/home/dragon/.cache/osism/check-mount"
+    )
+
+
+def test_check_mount_manifest_dir_override(reload_settings, monkeypatch):
+    monkeypatch.setenv("CHECK_MOUNT_MANIFEST_DIR", "")
+    reload_settings()
+
+    assert settings_module.CHECK_MOUNT_MANIFEST_DIR == ""
+
+
 def test_inventory_reconciler_schedule_default(reload_settings, monkeypatch):
     monkeypatch.delenv("INVENTORY_RECONCILER_SCHEDULE", raising=False)
     reload_settings()
@@ -597,6 +687,114 @@ def test_sonic_port_config_path_override(reload_settings, monkeypatch):
     assert settings_module.SONIC_PORT_CONFIG_PATH == "/tmp/port_config"
 
 
+# ---------------------------------------------------------------------------
+# SONIC_WEBHOOK_*
+# ---------------------------------------------------------------------------
+
+
+def test_sonic_webhook_sync_default_is_false(reload_settings, monkeypatch):
+    monkeypatch.delenv("SONIC_WEBHOOK_SYNC", raising=False)
+    reload_settings()
+
+    assert settings_module.SONIC_WEBHOOK_SYNC is False
+
+
+def test_sonic_webhook_sync_explicit_true(reload_settings, monkeypatch):
+    monkeypatch.setenv("SONIC_WEBHOOK_SYNC", "True")
+    reload_settings()
+
+    assert settings_module.SONIC_WEBHOOK_SYNC is True
+
+
+def test_sonic_webhook_debounce_default_is_int(reload_settings, monkeypatch):
+    monkeypatch.delenv("SONIC_WEBHOOK_DEBOUNCE", raising=False)
+    reload_settings()
+
+    assert settings_module.SONIC_WEBHOOK_DEBOUNCE == 10
+
+
+def test_sonic_webhook_debounce_override(reload_settings, monkeypatch):
+    monkeypatch.setenv("SONIC_WEBHOOK_DEBOUNCE", "30")
+    reload_settings()
+
+    assert settings_module.SONIC_WEBHOOK_DEBOUNCE == 30
+
+
+def test_listener_buffer_and_batch_size_defaults(reload_settings, monkeypatch):
+    monkeypatch.delenv("LISTENER_BUFFER_SIZE", raising=False)
+    monkeypatch.delenv("LISTENER_BATCH_SIZE", raising=False)
+    reload_settings()
+
+    assert settings_module.LISTENER_BUFFER_SIZE == 10000
+    assert settings_module.LISTENER_BATCH_SIZE == 50
+
+
+def test_listener_buffer_and_batch_size_override(reload_settings, monkeypatch):
+    monkeypatch.setenv("LISTENER_BUFFER_SIZE", "100")
+    monkeypatch.setenv("LISTENER_BATCH_SIZE", "10")
+    reload_settings()
+
+    assert settings_module.LISTENER_BUFFER_SIZE == 100
+    assert settings_module.LISTENER_BATCH_SIZE == 10
+
+
+def test_events_transport_defaults(reload_settings, monkeypatch):
+    for name in ("EVENTS_TRANSPORT", "EVENTS_STREAM_MAXLEN", "EVENTS_STREAM_CONSUMER"):
+        monkeypatch.delenv(name, raising=False)
+    reload_settings()
+
+    assert settings_module.EVENTS_TRANSPORT == "pubsub"
+    assert settings_module.EVENTS_STREAM_MAXLEN == 10000
+    assert settings_module.EVENTS_STREAM_CONSUMER == ""
+
+
+def test_events_transport_override(reload_settings, monkeypatch):
+    monkeypatch.setenv("EVENTS_TRANSPORT", "stream")
+    monkeypatch.setenv("EVENTS_STREAM_MAXLEN", "500")
+    monkeypatch.setenv("EVENTS_STREAM_CONSUMER", "api-1")
+    reload_settings()
+
+    assert settings_module.EVENTS_TRANSPORT == "stream"
+    assert settings_module.EVENTS_STREAM_MAXLEN == 500
+    assert settings_module.EVENTS_STREAM_CONSUMER == "api-1"
+
+
+def test_listener_prefetch_and_ack_batch_defaults(reload_settings, monkeypatch):
+    monkeypatch.delenv("LISTENER_PREFETCH_COUNT", raising=False)
+    monkeypatch.delenv("LISTENER_ACK_BATCH_SIZE", raising=False)
+    reload_settings()
+
+    assert settings_module.LISTENER_PREFETCH_COUNT == 200
+    assert settings_module.LISTENER_ACK_BATCH_SIZE == 50
+
+
+def test_listener_prefetch_and_ack_batch_override(reload_settings, monkeypatch):
+    monkeypatch.setenv("LISTENER_PREFETCH_COUNT", "0")
+    monkeypatch.setenv("LISTENER_ACK_BATCH_SIZE", "1")
+    reload_settings()
+
+    assert settings_module.LISTENER_PREFETCH_COUNT == 0
+    assert settings_module.LISTENER_ACK_BATCH_SIZE == 1
+
+
+def test_websocket_send_queue_defaults(reload_settings, monkeypatch):
+    monkeypatch.delenv("WEBSOCKET_SEND_QUEUE_SIZE", raising=False)
+    monkeypatch.delenv("WEBSOCKET_SLOW_CONSUMER_POLICY", raising=False)
+    reload_settings()
+
+    assert settings_module.WEBSOCKET_SEND_QUEUE_SIZE == 1000
+    assert settings_module.WEBSOCKET_SLOW_CONSUMER_POLICY == "drop_oldest"
+
+
+def test_websocket_send_queue_override(reload_settings, monkeypatch):
+    monkeypatch.setenv("WEBSOCKET_SEND_QUEUE_SIZE", "50")
+    monkeypatch.setenv("WEBSOCKET_SLOW_CONSUMER_POLICY", "disconnect")
+    reload_settings()
+
+    assert settings_module.WEBSOCKET_SEND_QUEUE_SIZE == 50
+    assert settings_module.WEBSOCKET_SLOW_CONSUMER_POLICY == "disconnect"
+
+
 # ---------------------------------------------------------------------------
 # NETBOX_SECONDARIES
 # ---------------------------------------------------------------------------
@@ -0,0 +1,347 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from osism.utils import actions
+from osism.utils.actions import Step, run_workflows, status_failed
+
+
+@pytest.fixture
+def sleep(mocker):
+    return mocker.patch("osism.utils.actions.time.sleep")
+
+
+class Resources:
+    """Resources reaching the status of an action after ``ticks`` polls."""
+
+    def __init__(self, ticks=1):
+        self.ticks = ticks
+        self.status = {}
+        self.pending = {}
+        self.polled = []
+
+    def action(self, status):
+        def call(resource_id):
+            self.pending[resource_id] = (self.ticks, status)
+
+        return call
+
+    def poll(self, resource_ids):
+        self.polled.append(sorted(resource_ids))
+        for resource_id, (ticks, status) in list(self.pending.items()):
+            if ticks > 1:
+                self.pending[resource_id] = (ticks - 1, status)
+            else:
+                del self.pending[resource_id]
+                self.status[resource_id] = status
+        return {
+            resource_id: SimpleNamespace(status=self.status.get(resource_id))
+            for resource_id in resource_ids
+        }
+
+    def step(self, name, status):
+        return Step(
+            name,
+            self.action(status),
+            lambda resource: resource.status == status,
+            status_failed("ERROR"),
+        )
+
+
+def test_run_workflows_runs_the_steps_of_all_resources(sleep):
+    resources = Resources()
+    workflows = {
+        "a": [resources.step("stop", "SHUTOFF"), resources.step("start", "ACTIVE")],
+        "b": [resources.step("stop", "SHUTOFF")],
+        "c": [],
+    }
+
+    results = run_workflows(workflows, resources.poll, names={"a": "server-a"})
+
+    assert [r.id for r in results] == ["a", "b", "c"]
+    assert all(r.ok for r in results)
+    assert results[0].name == "server-a"
+    assert list(results[0].durations) == ["stop", "start"]
+    assert list(results[1].durations) == ["stop"]
+    assert resources.status == {"a": "ACTIVE", "b": "SHUTOFF"}
+    # Both resources are polled with one call
+    assert resources.polled[0] == ["a", "b"]
+
+
+def test_run_workflows_bounds_concurrency(sleep):
+    resources = Resources(ticks=3)
+    workflows = {str(i): [resources.step("stop", "SHUTOFF")] for i in range(10)}
+
+    results = run_workflows(workflows, resources.poll, concurrency=4)
+
+    assert all(r.ok for r in results)
+    assert max(len(ids) for ids in resources.polled) == 4
+
+
+def test_run_workflows_backs_off_while_nothing_changes(sleep):
+    resources = Resources(ticks=5)
+
+    run_workflows(
+        {"a": [resources.step("stop", "SHUTOFF")]},
+        resources.poll,
+        interval=1,
+        max_interval=4,
+    )
+
+    assert [c.args[0] for c in sleep.call_args_list] == [1, 2, 4, 4, 4]
+
+
+def test_run_workflows_ends_workflow_on_failure(sleep, loguru_logs):
+    resources = Resources()
+    failing = MagicMock(side_effect=RuntimeError("conflict"))
+    workflows = {
+        "a": [
+            Step(
+                "evacuate",
+                resources.action("ERROR"),
+                lambda resource: resource.status == "ACTIVE",
+                status_failed("ERROR"),
+            ),
+            resources.step("start", "ACTIVE"),
+        ],
+        "b": [Step("stop", failing, lambda resource: True)],
+    }
+
+    results = run_workflows(workflows, resources.poll)
+
+    assert results[0].error == "evacuate failed: status ERROR"
+    assert results[0].durations == {}
+    assert results[1].error == "stop failed: conflict"
+    assert resources.status == {"a": "ERROR"}
+    assert any(
+        r["level"] == "ERROR" and r["message"] == "b: stop failed: conflict"
+        for r in loguru_logs
+    )
+
+
+def test_run_workflows_times_out_steps(sleep, mocker):
+    mocker.patch("osism.utils.actions.time.monotonic", side_effect=[0, 5, 11])
+    resources = Resources(ticks=100)
+
+    results = run_workflows(
+        {"a": [resources.step("stop", "SHUTOFF")]}, resources.poll, timeout=10
+    )
+
+    assert results[0].error == "stop timed out after 10s"
+    assert len(resources.polled) == 2
+
+
+def test_run_workflows_retries_failed_polls(sleep, loguru_logs):
+    poll = MagicMock(
+        side_effect=[
+            RuntimeError("gateway timeout"),
+            {"a": SimpleNamespace(status="SHUTOFF")},
+        ]
+    )
+
+    results = run_workflows(
+        {"a": [Step("stop", MagicMock(), lambda r: r.status == "SHUTOFF")]}, poll
+    )
+
+    assert results[0].ok
+    assert poll.call_count == 2
+    assert any("Polling failed, retrying" in r["message"] for r in loguru_logs)
+
+
+def test_run_workflows_bounds_concurrency_per_group(sleep):
+    resources = Resources(ticks=2)
+    workflows = {str(i): [resources.step("stop", "SHUTOFF")] for i in range(8)}
+    groups = {str(i): "even" if i % 2 == 0 else "odd" for i in range(8)}
+    # The first workflows all belong to one group
+    groups.update({"1": "even", "3": "even"})
+
+    results = run_workflows(
+        workflows, resources.poll, concurrency=3, groups=groups, group_concurrency=2
+    )
+
+    assert all(r.ok for r in results)
+    for ids in resources.polled:
+        assert len(ids) <= 3
+        assert sum(1 for i in ids if groups[i] == "even") <= 2
+    # The odd workflows do not wait behind the even ones
+    assert resources.polled[0] == ["0", "1", "5"]
+
+
+def test_run_workflows_retries_failed_steps_with_backoff(mocker, loguru_logs):
+    now = [0.0]
+    mocker.patch("osism.utils.actions.time.monotonic", side_effect=lambda: now[0])
+    mocker.patch(
+        "osism.utils.actions.time.sleep",
+        side_effect=lambda seconds: now.__setitem__(0, now[0] + seconds),
+    )
+    resources = Resources()
+    calls = []
+
+    def migrate(resource_id):
+        calls.append(now[0])
+        status = "ERROR" if len(calls) < 3 else "ACTIVE"
+        resources.pending[resource_id] = (1, status)
+
+    results = run_workflows(
+        {
+            "a": [
+                Step(
+                    "migrate",
+                    migrate,
+                    lambda r: r.status == "ACTIVE",
+                    status_failed("ERROR"),
+                )
+            ]
+        },
+        resources.poll,
+        retries=2,
+        retry_delay=10,
+    )
+
+    assert results[0].ok
+    assert results[0].retries == 2
+    # Started again 10 and then 20 seconds after the failures
+    assert calls[1] - calls[0] >= 10 + 1
+    assert calls[2] - calls[1] >= 20 + 1
+    assert [r["message"] for r in loguru_logs if r["level"] == "WARNING"] == [
+        "a: migrate failed: status ERROR, retrying in 10s",
+        "a: migrate failed: status ERROR, retrying in 20s",
+    ]
+
+
+def test_run_workflows_gives_up_after_retries(sleep):
+    action = MagicMock(side_effect=RuntimeError("no valid host"))
+
+    results = run_workflows(
+        {"a": [Step("migrate", action, lambda r: True)]},
+        MagicMock(return_value={}),
+        retries=2,
+        retry_delay=0,
+    )
+
+    assert results[0].error == "migrate failed: no valid host"
+    assert results[0].retries == 2
+    assert action.call_count == 3
+
+
+def test_rate_limiter_spaces_calls(mocker):
+    now = [100.0]
+    mocker.patch("osism.utils.actions.time.monotonic", side_effect=lambda: now[0])
+    sleep = mocker.patch(
+        "osism.utils.actions.time.sleep",
+        side_effect=lambda seconds: now.__setitem__(0, now[0] + seconds),
+    )
+    limiter = actions.RateLimiter(4)
+
+    for _ in range(3):
+        limiter.wait()
+
+    assert [c.args[0] for c in sleep.call_args_list] == [0.25, 0.25]
+
+
+def test_rate_limiter_without_rate_never_sleeps(sleep):
+    limiter = actions.RateLimiter(None)
+
+    for _ in range(3):
+        limiter.wait()
+
+    sleep.assert_not_called()
+
+
+def test_run_actions_counts_outcomes(loguru_logs):
+    def action(resource):
+        if resource == "boom":
+            raise RuntimeError("conflict")
+        return resource
+
+    results = actions.run_actions(
+        {"a": "active", "b": "skipped", "c": "active", "d": "boom", "e": "failed"},
+        action,
+        names={"d": "node-d"},
+    )
+
+    assert [r.id for r in results] == ["a", "b", "c", "d", "e"]
+    assert [r.outcome for r in results] == [
+        "active",
+        "skipped",
+        "active",
+        "failed",
+        "failed",
+    ]
+    assert [r.ok for r in results] == [True, True, True, False, False]
+    assert results[3].error == "conflict"
+    messages = [r["message"] for r in loguru_logs]
+    assert "node-d: conflict" in messages
+    assert any(
+        m.startswith("5 done in") and m.endswith("(active: 2, failed: 2, skipped: 1)")
+        for m in messages
+    )
+
+
+def test_run_actions_bounds_concurrency():
+    lock = threading.Lock()
+    running = [0, 0]
+
+    def action(resource):
+        with lock:
+            running[0] += 1
+            running[1] = max(running[1], running[0])
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+        return "done"
+
+    results = actions.run_actions({str(i): i for i in range(40)}, action, concurrency=4)
+
+    assert all(r.ok for r in results)
+    assert running[1] == 4
+
+
+def test_run_actions_logs_progress(loguru_logs):
+    release = threading.Event()
+
+    def action(resource):
+        if resource == "slow":
+            release.wait(5)
+        return "done"
+
+    def log_progress(message):
+        if " of 2 done" in message.record["message"]:
+            release.set()
+
+    handler = actions.logger.add(log_progress)
+    try:
+        actions.run_actions({"a": "fast", "b": "slow"}, action, progress_interval=0.01)
+    finally:
+        actions.logger.remove(handler)
+
+    # The slow action only finishes once the progress was logged
+    assert any(" of 2 done (" in r["message"] for r in loguru_logs)
+
+
+def test_rate_limiter_is_shared_by_threads(mocker):
+    now = [0.0]
+    lock = threading.Lock()
+    mocker.patch("osism.utils.actions.time.monotonic", side_effect=lambda: now[0])
+    slept = []
+
+    def sleep(seconds):
+        with lock:
+            slept.append(seconds)
+
+    mocker.patch("osism.utils.actions.time.sleep", side_effect=sleep)
+    limiter = actions.RateLimiter(10)
+
+    threads = [threading.Thread(target=limiter.wait) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Every thread got its own slot, 0.1 seconds apart
+    assert sorted(round(s, 2) for s in slept) == [0.1, 0.2, 0.3, 0.4]
@@ -0,0 +1,265 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+import fakeredis
+import pytest
+
+from osism.utils import facts
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeStrictRedis()
+
+
+def _store(redis, host, epoch, **extra):
+    payload = {"ansible_date_time": {"epoch": str(epoch)}, **extra}
+    redis.set(facts.facts_key(host), json.dumps(payload))
+
+
+def test_get_facts_returns_decoded_facts(redis):
+    _store(redis, "node1", 100, ansible_kernel="6.8.0")
+    redis.set(facts.facts_key("node2"), b"not-json")
+
+    result = facts.get_facts(redis, ["node1", "node2", "node3"])
+
+    assert result["node1"]["ansible_kernel"] == "6.8.0"
+    assert result["node2"] is None
+    assert result["node3"] is None
+
+
+def test_get_facts_batches_mget(redis, mocker):
+    mocker.patch.object(facts, "MGET_BATCH_SIZE", 2)
+    for i in range(5):
+        _store(redis, f"node{i}", i)
+    pipeline = redis.pipeline(transaction=False)
+    mget = mocker.spy(pipeline, "mget")
+    mocker.patch.object(redis, "pipeline", return_value=pipeline)
+
+    result = facts.get_facts(redis, [f"node{i}" for i in range(5)])
+
+    assert mget.call_count == 3
+    assert [result[f"node{i}"]["ansible_date_time"]["epoch"] for i in range(5)] == [
+        "0",
+        "1",
+        "2",
+        "3",
+        "4",
+    ]
+
+
+def test_get_facts_without_hosts_does_not_touch_redis(mocker):
+    redis = mocker.MagicMock()
+
+    assert facts.get_facts(redis, []) == {}
+    redis.pipeline.assert_not_called()
+
+
+def test_rebuild_facts_index(redis):
+    _store(redis, "node1", 100)
+    _store(redis, "node2", 200)
+    redis.set(facts.facts_key("broken"), b"not-json")
+    redis.set("unrelated", b"value")
+
+    found, epochs = facts.rebuild_facts_index(redis)
+
+    assert found == 3
+    assert epochs == {"node1": 100.0, "node2": 200.0}
+    assert redis.zrange("ansible_cache_keys", 0, -1, withscores=True) == [
+        (b"node1", 100.0),
+        (b"node2", 200.0),
+    ]
+
+
+def test_get_stale_hosts_without_facts(redis):
+    assert facts.get_stale_hosts(redis, 10, now=1000) is None
+
+
+def test_get_stale_hosts_rebuilds_empty_index(redis):
+    _store(redis, "fresh", 995)
+    _store(redis, "stale", 100)
+
+    assert facts.get_stale_hosts(redis, 10, now=1000) == [("stale", 900)]
+    assert redis.zcard("ansible_cache_keys") == 2
+
+
+def test_get_stale_hosts_uses_index(redis):
+    redis.zadd("ansible_cache_keys", {"fresh": 995, "edge": 990, "stale": 100})
+
+    assert facts.get_stale_hosts(redis, 10, now=1000) == [("stale", 900)]
+
+
+def test_get_stale_hosts_respects_index_key_setting(redis, mocker):
+    mocker.patch("osism.settings.FACTS_INDEX_KEY", "facts_index")
+    redis.zadd("facts_index", {"stale": 100})
+
+    assert facts.get_stale_hosts(redis, 10, now=1000) == [("stale", 900)]
+    assert not redis.exists("ansible_cache_keys")
+
+
+def test_remove_from_index_and_clear_index(redis):
+    facts.index_facts(redis, {"node1": 1, "node2": 2, "node3": 3})
+
+    facts.remove_from_index(redis, ["node1", "node2"])
+    assert redis.zrange("ansible_cache_keys", 0, -1) == [b"node3"]
+
+    facts.clear_index(redis)
+    assert not redis.exists("ansible_cache_keys")
+
+
+def test_remove_from_index_without_hosts(mocker):
+    redis = mocker.MagicMock()
+
+    facts.remove_from_index(redis, [])
+    redis.zrem.assert_not_called()
+
+
+# --- compressed storage ---
+
+
+@pytest.fixture
+def compressed(mocker):
+    mocker.patch("osism.settings.FACTS_STORAGE", "compressed")
+    mocker.patch("osism.settings.FACTS_HOT_KEYS", ["ansible_kernel"])
+
+
+def _indexed(redis, host, epoch, **extra):
+    _store(redis, host, epoch, **extra)
+    facts.index_facts(redis, {host: epoch})
+
+
+def test_load_facts_plain(redis):
+    _store(redis, "node1", 100, ansible_kernel="6.8.0")
+
+    assert facts.load_facts(redis, "node1", ["ansible_kernel", "missing"]) == {
+        "ansible_kernel": "6.8.0"
+    }
+    assert facts.load_facts(redis, "node1")["ansible_kernel"] == "6.8.0"
+    assert facts.load_facts(redis, "node2") is None
+    assert not redis.exists(facts.compact_key("node1"))
+
+
+def test_load_facts_plain_raises_on_malformed_facts(redis):
+    redis.set(facts.facts_key("node1"), b"not-json")
+
+    with pytest.raises(json.JSONDecodeError):
+        facts.load_facts(redis, "node1")
+
+
+def test_compact_facts_builds_compact_copy(redis, compressed):
+    _indexed(redis, "node1", 100, ansible_kernel="6.8.0", ansible_mounts=[])
+
+    assert facts.compact_facts(redis) == 1
+    assert facts.load_facts(redis, "node1")["ansible_mounts"] == []
+
+    copy = redis.hgetall(facts.compact_key("node1"))
+    assert set(copy) == {b"_facts", b"_written", b"ansible_kernel"}
+    assert copy[b"ansible_kernel"] == b'"6.8.0"'
+    assert 0 < redis.ttl(facts.compact_key("node1")) <= facts.COMPACT_TTL
+
+
+def test_load_facts_reads_hot_fact_from_compact_copy(redis, compressed, mocker):
+    _indexed(redis, "node1", 100, ansible_kernel="6.8.0")
+    facts.compact_facts(redis)
+    get = mocker.spy(redis, "get")
+    hget = mocker.spy(redis, "hget")
+
+    assert facts.load_facts(redis, "node1", ["ansible_kernel"]) == {
+        "ansible_kernel": "6.8.0"
+    }
+    get.assert_not_called()
+    hget.assert_not_called()
+
+
+def test_load_facts_reads_other_facts_from_compressed_copy(redis, compressed, mocker):
+    _indexed(redis, "node1", 100, ansible_kernel="6.8.0", ansible_mounts=[1])
+    facts.compact_facts(redis)
+    # Only the compact copy is left to read from
+    redis.set(facts.facts_key("node1"), b"not-json")
+
+    assert facts.load_facts(redis, "node1", ["ansible_mounts", "missing"]) == {
+        "ansible_mounts": [1]
+    }
+    assert facts.load_facts(redis, "node1")["ansible_kernel"] == "6.8.0"
+
+
+def test_load_facts_missing_hot_fact_checks_compressed_facts(redis, mocker):
+    mocker.patch("osism.settings.FACTS_STORAGE", "compressed")
+    mocker.patch("osism.settings.FACTS_HOT_KEYS", [])
+    _indexed(redis, "node1", 100, ansible_kernel="6.8.0")
+    facts.compact_facts(redis)
+    # ansible_kernel became a hot fact after the copy was written
+    mocker.patch("osism.settings.FACTS_HOT_KEYS", ["ansible_kernel", "missing"])
+
+    assert facts.load_facts(redis, "node1", ["ansible_kernel"]) == {
+        "ansible_kernel": "6.8.0"
+    }
+    assert facts.load_facts(redis, "node1", ["missing"]) == {}
+
+
+def test_load_facts_reads_plain_facts_while_compact_copy_is_outdated(
+    redis, compressed, mocker
+):
+    _indexed(redis, "node1", 100, ansible_kernel="6.8.0")
+    facts.compact_facts(redis)
+    # Ansible refreshed the facts
+    _indexed(redis, "node1", 200, ansible_kernel="6.9.0")
+    hset = mocker.spy(redis, "hset")
+
+    assert facts.load_facts(redis, "node1", ["ansible_kernel"]) == {
+        "ansible_kernel": "6.9.0"
+    }
+    # Reading does not rebuild the copy, compact_facts does
+    hset.assert_not_called()
+    assert redis.hget(facts.compact_key("node1"), "_written") == b"100.0"
+    assert facts.compact_facts(redis) == 1
+    assert redis.hget(facts.compact_key("node1"), "_written") == b"200.0"
+
+
+def test_load_facts_without_index_entry_reads_plain_facts(redis, compressed):
+    _store(redis, "node1", 100, ansible_kernel="6.8.0")
+
+    assert facts.load_facts(redis, "node1", ["ansible_kernel"]) == {
+        "ansible_kernel": "6.8.0"
+    }
+    assert not redis.exists(facts.compact_key("node1"))
+    assert facts.load_facts(redis, "node2") is None
+
+
+@pytest.mark.parametrize("compression", ["zstd", "zlib"])
+def test_compact_copy_compression(redis, compressed, mocker, compression):
+    if compression == "zstd" and not facts.ZSTD_AVAILABLE:
+        pytest.skip("zstd is not available")
+    mocker.patch("osism.settings.FACTS_COMPRESSION", compression)
+    _indexed(redis, "node1", 100, ansible_mounts=["/srv"] * 1000)
+    facts.compact_facts(redis)
+
+    blob = redis.hget(facts.compact_key("node1"), "_facts")
+
+    assert blob[:1] == (b"z" if compression == "zstd" else b"d")
+    assert len(blob) < len(redis.get(facts.facts_key("node1"))) / 10
+    assert facts.load_facts(redis, "node1")["ansible_mounts"] == ["/srv"] * 1000
+
+
+def test_compact_facts_rebuilds_outdated_copies(redis, compressed):
+    _indexed(redis, "node1", 100, ansible_kernel="6.8.0")
+    _indexed(redis, "node2", 100, ansible_kernel="6.8.0")
+    _indexed(redis, "broken", 100)
+    redis.set(facts.facts_key("broken"), b"not-json")
+
+    assert facts.compact_facts(redis) == 2
+    assert facts.compact_facts(redis) == 0
+
+    _indexed(redis, "node2", 200, ansible_kernel="6.9.0")
+    assert facts.compact_facts(redis) == 1
+    assert redis.hget(facts.compact_key("node2"), "ansible_kernel") == b'"6.9.0"'
+
+
+def test_compact_facts_keeps_up_to_date_copies_from_expiring(redis, compressed):
+    _indexed(redis, "node1", 100, ansible_kernel="6.8.0")
+    facts.compact_facts(redis)
+    redis.expire(facts.compact_key("node1"), 10)
+
+    assert facts.compact_facts(redis) == 0
+    assert redis.ttl(facts.compact_key("node1")) > 10
@@ -0,0 +1,166 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+import fakeredis
+import pytest
+
+from osism.utils import facts, facts_search
+
+
+@pytest.fixture
+def redis(mocker):
+    mocker.patch(
+        "osism.settings.FACTS_SEARCH_PATHS",
+        ["ansible_kernel", "ansible_*.module", "ansible_mounts.fstype"],
+    )
+    return fakeredis.FakeStrictRedis()
+
+
+def _store(redis, host, epoch, **extra):
+    payload = {"ansible_date_time": {"epoch": str(epoch)}, **extra}
+    redis.set(facts.facts_key(host), json.dumps(payload))
+    facts.index_facts(redis, {host: epoch})
+
+
+def _node(redis, host, epoch=100, kernel="6.8.0", driver="ixgbe"):
+    _store(
+        redis,
+        host,
+        epoch,
+        ansible_kernel=kernel,
+        ansible_eno1={"device": "eno1", "module": driver},
+        ansible_lo={"device": "lo"},
+        ansible_mounts=[{"fstype": "ext4"}, {"fstype": "xfs"}],
+    )
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("ansible_kernel", {"6.8.0"}),
+        ("ansible_*.module", {"ixgbe", "tun"}),
+        ("ansible_mounts.fstype", {"ext4", "xfs"}),
+        ("ansible_eno1.mtu", {"1500"}),
+        ("ansible_eno1.active", {"true"}),
+        ("ansible_eno1", set()),
+        ("missing.path", set()),
+    ],
+)
+def test_fact_values(path, expected):
+    data = {
+        "ansible_kernel": "6.8.0",
+        "ansible_eno1": {"module": "ixgbe", "mtu": 1500, "active": True},
+        "ansible_tap1": {"module": "tun"},
+        "ansible_mounts": [{"fstype": "ext4"}, {"fstype": "xfs"}],
+    }
+
+    assert facts_search.fact_values(data, path) == expected
+
+
+def test_update_search_index_and_search(redis):
+    _node(redis, "node1")
+    _node(redis, "node2", kernel="6.9.0", driver="ice")
+    _node(redis, "node3")
+
+    assert facts_search.update_search_index(redis) == 3
+
+    assert facts_search.search_facts(redis, "ansible_kernel", "6.8.0") == [
+        "node1",
+        "node3",
+    ]
+    assert facts_search.search_facts(redis, "ansible_*.module", "ice") == ["node2"]
+    assert facts_search.search_facts(redis, "ansible_kernel", "5.15") == []
+    assert facts_search.count_fact_values(redis, "ansible_kernel") == {
+        "6.8.0": 2,
+        "6.9.0": 1,
+    }
+    assert facts_search.count_fact_values(redis, "ansible_mounts.fstype") == {
+        "ext4": 3,
+        "xfs": 3,
+    }
+
+
+def test_update_search_index_is_incremental(redis, mocker):
+    _node(redis, "node1")
+    _node(redis, "node2")
+    facts_search.update_search_index(redis)
+    get_facts = mocker.spy(facts_search, "get_facts")
+
+    assert facts_search.update_search_index(redis) == 0
+    get_facts.assert_not_called()
+
+    # node1 got a new kernel, node2's facts were reset
+    _node(redis, "node1", epoch=200, kernel="6.9.0")
+    redis.delete(facts.facts_key("node2"))
+    facts.remove_from_index(redis, ["node2"])
+
+    assert facts_search.update_search_index(redis) == 2
+    get_facts.assert_called_once_with(redis, ["node1"])
+    assert facts_search.search_facts(redis, "ansible_kernel", "6.8.0") == []
+    assert facts_search.search_facts(redis, "ansible_kernel", "6.9.0") == ["node1"]
+    assert facts_search.search_facts(redis, "ansible_*.module", "ixgbe") == ["node1"]
+    assert facts_search.count_fact_values(redis, "ansible_kernel") == {"6.9.0": 1}
+    assert not redis.sismember("facts_search_values:ansible_kernel", "6.8.0")
+    assert not redis.exists("facts_search_host:node2")
+
+
+def test_search_index_outdated(redis, mocker):
+    _node(redis, "node1")
+    _node(redis, "node2")
+    assert facts_search.search_index_outdated(redis)
+
+    facts_search.update_search_index(redis)
+    assert not facts_search.search_index_outdated(redis)
+
+    # Facts written again
+    _node(redis, "node1", epoch=200)
+    assert facts_search.search_index_outdated(redis)
+    facts_search.update_search_index(redis)
+
+    # Facts removed
+    facts.remove_from_index(redis, ["node1"])
+    assert facts_search.search_index_outdated(redis)
+    facts_search.update_search_index(redis)
+    assert not facts_search.search_index_outdated(redis)
+
+    mocker.patch("osism.settings.FACTS_SEARCH_PATHS", ["ansible_kernel"])
+    assert facts_search.search_index_outdated(redis)
+
+
+def test_update_search_index_rebuilds_on_path_change(redis, mocker):
+    _node(redis, "node1")
+    facts_search.update_search_index(redis)
+
+    mocker.patch("osism.settings.FACTS_SEARCH_PATHS", ["ansible_*.module"])
+
+    assert facts_search.update_search_index(redis) == 1
+    assert not redis.exists("facts_search:ansible_kernel:6.8.0")
+    assert facts_search.search_facts(redis, "ansible_*.module", "ixgbe") == ["node1"]
+
+
+def test_update_search_index_builds_empty_fact_index(redis):
+    redis.set(
+        facts.facts_key("node1"),
+        json.dumps({"ansible_date_time": {"epoch": "100"}, "ansible_kernel": "6.8.0"}),
+    )
+
+    assert facts_search.update_search_index(redis) == 1
+    assert facts_search.search_facts(redis, "ansible_kernel", "6.8.0") == ["node1"]
+
+
+def test_update_search_index_skips_malformed_facts(redis):
+    _node(redis, "node1")
+    redis.set(facts.facts_key("node1"), b"not-json")
+
+    assert facts_search.update_search_index(redis) == 1
+    assert facts_search.count_fact_values(redis, "ansible_kernel") == {}
+
+
+@pytest.mark.parametrize("query", ["search", "count"])
+def test_unindexed_path_is_rejected(redis, query):
+    with pytest.raises(ValueError, match="Fact path 'ansible_lsb' is not indexed"):
+        if query == "search":
+            facts_search.search_facts(redis, "ansible_lsb", "x")
+        else:
+            facts_search.count_fact_values(redis, "ansible_lsb")
@@ -6,12 +6,15 @@ helper from :mod:`osism.utils`.
 
 Companion to ``test_init_connections.py``. ``_init_redis`` is the single
 dependency most helpers share — it is patched per-test to return a
-``MagicMock`` redis client.
+``MagicMock`` redis client, or a ``fakeredis`` client for the facts check,
+which works on the fact index.
 """
 
 import importlib
+import time
 from unittest.mock import call, mock_open
 
+import fakeredis
 import pytest
 
 import osism.utils as utils_pkg
@@ -458,97 +461,82 @@ def _facts_payload(epoch):
     return json.dumps({"ansible_date_time": {"epoch": epoch}}).encode("utf-8")
 
 
-def test_check_ansible_facts_scan_raises_logs_warning(mocker, loguru_logs):
+@pytest.fixture
+def facts_redis(mocker):
+    """A fakeredis client holding the fact cache, without the index.
+
+    Without ``ansible_cache_keys`` the check rebuilds the index from a scan
+    of the fact keys first, which is what most tests below exercise.
+    """
+    client = fakeredis.FakeStrictRedis()
+    mocker.patch("osism.utils._init_redis", return_value=client)
+    return client
+
+
+def _warnings(loguru_logs):
+    return [r["message"] for r in loguru_logs if r["level"] == "WARNING"]
+
+
+def test_check_ansible_facts_redis_error_logs_warning(mocker, loguru_logs):
     mock_r = mocker.MagicMock()
-    mock_r.scan.side_effect = RuntimeError("redis down")
+    mock_r.zcard.side_effect = RuntimeError("redis down")
     mocker.patch("osism.utils._init_redis", return_value=mock_r)
 
     utils_pkg.check_ansible_facts(max_age=10)
 
-    warnings = [r["message"] for r in loguru_logs if r["level"] == "WARNING"]
+    warnings = _warnings(loguru_logs)
     assert any("Could not check Ansible facts freshness" in m for m in warnings)
     assert any("redis down" in m for m in warnings)
-    # No further work after the scan failed.
-    mock_r.get.assert_not_called()
+    # No further work after Redis failed.
+    mock_r.scan.assert_not_called()
+    mock_r.pipeline.assert_not_called()
 
 
-def test_check_ansible_facts_no_keys_logs_warning(mocker, loguru_logs):
-    mock_r = mocker.MagicMock()
-    mock_r.scan.return_value = (0, [])
-    mocker.patch("osism.utils._init_redis", return_value=mock_r)
-
+def test_check_ansible_facts_no_keys_logs_warning(facts_redis, loguru_logs):
     utils_pkg.check_ansible_facts(max_age=10)
 
-    warnings = [r["message"] for r in loguru_logs if r["level"] == "WARNING"]
-    assert any("No Ansible facts found in Redis cache" in m for m in warnings)
-
+    assert any(
+        "No Ansible facts found in Redis cache" in m for m in _warnings(loguru_logs)
+    )
 
-def test_check_ansible_facts_one_stale_host(mocker, loguru_logs):
-    import time as time_mod
 
-    now = time_mod.time()
-    mock_r = mocker.MagicMock()
-    mock_r.scan.return_value = (0, [b"ansible_factshost-a"])
-    mock_r.get.return_value = _facts_payload(now - 9999)
-    mocker.patch("osism.utils._init_redis", return_value=mock_r)
+def test_check_ansible_facts_one_stale_host(facts_redis, loguru_logs):
+    facts_redis.set("ansible_factshost-a", _facts_payload(time.time() - 9999))
 
     utils_pkg.check_ansible_facts(max_age=10)
 
-    warnings = [r["message"] for r in loguru_logs if r["level"] == "WARNING"]
+    warnings = _warnings(loguru_logs)
     assert any("stale for 1 host(s)" in m for m in warnings)
     assert any("host-a" in m and "seconds old" in m for m in warnings)
 
 
-def test_check_ansible_facts_one_fresh_host_no_warning(mocker, loguru_logs):
-    import time as time_mod
-
-    now = time_mod.time()
-    mock_r = mocker.MagicMock()
-    mock_r.scan.return_value = (0, [b"ansible_factshost-a"])
-    mock_r.get.return_value = _facts_payload(now - 1)
-    mocker.patch("osism.utils._init_redis", return_value=mock_r)
+def test_check_ansible_facts_one_fresh_host_no_warning(facts_redis, loguru_logs):
+    facts_redis.set("ansible_factshost-a", _facts_payload(time.time() - 1))
 
     utils_pkg.check_ansible_facts(max_age=10)
 
-    warnings = [r["message"] for r in loguru_logs if r["level"] == "WARNING"]
-    assert not any("stale" in m for m in warnings)
-
+    assert not any("stale" in m for m in _warnings(loguru_logs))
 
-def test_check_ansible_facts_mix_of_fresh_and_stale(mocker, loguru_logs):
-    import time as time_mod
 
-    now = time_mod.time()
-    mock_r = mocker.MagicMock()
-    mock_r.scan.return_value = (
-        0,
-        [b"ansible_factsfresh-host", b"ansible_factsstale-host"],
-    )
-    mock_r.get.side_effect = [
-        _facts_payload(now - 1),
-        _facts_payload(now - 9999),
-    ]
-    mocker.patch("osism.utils._init_redis", return_value=mock_r)
+def test_check_ansible_facts_mix_of_fresh_and_stale(facts_redis, loguru_logs):
+    now = time.time()
+    facts_redis.set("ansible_factsfresh-host", _facts_payload(now - 1))
+    facts_redis.set("ansible_factsstale-host", _facts_payload(now - 9999))
 
     utils_pkg.check_ansible_facts(max_age=10)
 
-    warnings = [r["message"] for r in loguru_logs if r["level"] == "WARNING"]
+    warnings = _warnings(loguru_logs)
     assert any("stale for 1 host(s)" in m for m in warnings)
     assert any("stale-host" in m for m in warnings)
     assert not any("fresh-host" in m for m in warnings)
 
 
-def test_check_ansible_facts_hostname_prefix_stripped(mocker, loguru_logs):
-    import time as time_mod
-
-    now = time_mod.time()
-    mock_r = mocker.MagicMock()
-    mock_r.scan.return_value = (0, [b"ansible_factsmy.host.example"])
-    mock_r.get.return_value = _facts_payload(now - 9999)
-    mocker.patch("osism.utils._init_redis", return_value=mock_r)
+def test_check_ansible_facts_hostname_prefix_stripped(facts_redis, loguru_logs):
+    facts_redis.set("ansible_factsmy.host.example", _facts_payload(time.time() - 9999))
 
     utils_pkg.check_ansible_facts(max_age=10)
 
-    warnings = [r["message"] for r in loguru_logs if r["level"] == "WARNING"]
+    warnings = _warnings(loguru_logs)
     assert any("my.host.example" in m for m in warnings)
     # The literal "ansible_facts" prefix must not appear in the hostname
     # surfaced in the per-host warning line.
@@ -558,184 +546,161 @@ def test_check_ansible_facts_hostname_prefix_stripped(mocker, loguru_logs):
         assert "ansible_factsmy.host.example" not in line
 
 
-@pytest.mark.parametrize(
-    "key",
-    [b"ansible_factshost-a", "ansible_factshost-a"],
-    ids=["bytes", "str"],
-)
-def test_check_ansible_facts_bytes_or_str_keys(mocker, loguru_logs, key):
-    import time as time_mod
-
-    now = time_mod.time()
-    mock_r = mocker.MagicMock()
-    mock_r.scan.return_value = (0, [key])
-    mock_r.get.return_value = _facts_payload(now - 9999)
-    mocker.patch("osism.utils._init_redis", return_value=mock_r)
+@pytest.mark.parametrize("decode_responses", [False, True], ids=["bytes", "str"])
+@pytest.mark.parametrize("indexed", [False, True], ids=["scan", "index"])
+def test_check_ansible_facts_bytes_or_str_keys(
+    mocker, loguru_logs, decode_responses, indexed
+):
+    client = fakeredis.FakeStrictRedis(decode_responses=decode_responses)
+    mocker.patch("osism.utils._init_redis", return_value=client)
+    client.set("ansible_factshost-a", _facts_payload(time.time() - 9999))
+    if indexed:
+        client.zadd("ansible_cache_keys", {"host-a": time.time() - 9999})
 
     utils_pkg.check_ansible_facts(max_age=10)
 
-    warnings = [r["message"] for r in loguru_logs if r["level"] == "WARNING"]
-    assert any("host-a" in m for m in warnings)
+    assert any("Host 'host-a'" in m for m in _warnings(loguru_logs))
 
 
-def test_check_ansible_facts_get_returns_none_host_skipped(mocker, loguru_logs):
-    mock_r = mocker.MagicMock()
-    mock_r.scan.return_value = (0, [b"ansible_factshost-a"])
-    mock_r.get.return_value = None
-    mocker.patch("osism.utils._init_redis", return_value=mock_r)
+def test_check_ansible_facts_empty_value_host_skipped(facts_redis, loguru_logs):
+    facts_redis.set("ansible_factshost-a", b"")
 
     utils_pkg.check_ansible_facts(max_age=10)
 
-    warnings = [r["message"] for r in loguru_logs if r["level"] == "WARNING"]
+    warnings = _warnings(loguru_logs)
     # No keys-found warning (a key was found) and no stale warning either.
     assert not any("stale" in m for m in warnings)
     assert not any("No Ansible facts found" in m for m in warnings)
 
 
-def test_check_ansible_facts_malformed_json_skipped(mocker, loguru_logs):
-    mock_r = mocker.MagicMock()
-    mock_r.scan.return_value = (0, [b"ansible_factshost-a"])
-    mock_r.get.return_value = b"not-json"
-    mocker.patch("osism.utils._init_redis", return_value=mock_r)
+def test_check_ansible_facts_malformed_json_skipped(facts_redis, loguru_logs):
+    facts_redis.set("ansible_factshost-a", b"not-json")
 
     utils_pkg.check_ansible_facts(max_age=10)
 
     debug_messages = [r["message"] for r in loguru_logs if r["level"] == "DEBUG"]
     assert any("Skipping malformed ansible_facts entry" in m for m in debug_messages)
-    warnings = [r["message"] for r in loguru_logs if r["level"] == "WARNING"]
-    assert not any("stale" in m for m in warnings)
+    assert not any("stale" in m for m in _warnings(loguru_logs))
 
 
-def test_check_ansible_facts_missing_epoch_skipped(mocker, loguru_logs):
+def test_check_ansible_facts_missing_epoch_skipped(facts_redis, loguru_logs):
     import json
 
-    mock_r = mocker.MagicMock()
-    mock_r.scan.return_value = (0, [b"ansible_factshost-a"])
-    mock_r.get.return_value = json.dumps({"ansible_date_time": {}}).encode("utf-8")
-    mocker.patch("osism.utils._init_redis", return_value=mock_r)
+    facts_redis.set(
+        "ansible_factshost-a", json.dumps({"ansible_date_time": {}}).encode("utf-8")
+    )
 
     utils_pkg.check_ansible_facts(max_age=10)
 
     debug_messages = [r["message"] for r in loguru_logs if r["level"] == "DEBUG"]
     assert any("facts missing ansible_date_time.epoch" in m for m in debug_messages)
-    warnings = [r["message"] for r in loguru_logs if r["level"] == "WARNING"]
-    assert not any("stale" in m for m in warnings)
+    assert not any("stale" in m for m in _warnings(loguru_logs))
 
 
-def test_check_ansible_facts_non_numeric_epoch_skipped(mocker, loguru_logs):
-    mock_r = mocker.MagicMock()
-    mock_r.scan.return_value = (0, [b"ansible_factshost-a"])
-    mock_r.get.return_value = _facts_payload("foo")
-    mocker.patch("osism.utils._init_redis", return_value=mock_r)
+def test_check_ansible_facts_non_numeric_epoch_skipped(facts_redis, loguru_logs):
+    facts_redis.set("ansible_factshost-a", _facts_payload("foo"))
 
     utils_pkg.check_ansible_facts(max_age=10)
 
     debug_messages = [r["message"] for r in loguru_logs if r["level"] == "DEBUG"]
     assert any("Skipping malformed ansible_facts entry" in m for m in debug_messages)
-    warnings = [r["message"] for r in loguru_logs if r["level"] == "WARNING"]
-    assert not any("stale" in m for m in warnings)
-
+    assert not any("stale" in m for m in _warnings(loguru_logs))
 
-def test_check_ansible_facts_scan_paginates(mocker, loguru_logs):
-    import time as time_mod
 
-    now = time_mod.time()
-    mock_r = mocker.MagicMock()
-    # First scan returns a non-zero cursor + one key; second scan returns
-    # cursor 0 + another key. Both must be processed.
-    mock_r.scan.side_effect = [
-        (42, [b"ansible_factshost-a"]),
-        (0, [b"ansible_factshost-b"]),
-    ]
-    mock_r.get.side_effect = [
-        _facts_payload(now - 9999),
-        _facts_payload(now - 9999),
-    ]
-    mocker.patch("osism.utils._init_redis", return_value=mock_r)
+def test_check_ansible_facts_scan_paginates(facts_redis, loguru_logs, mocker):
+    scan = mocker.spy(facts_redis, "scan")
+    for i in range(250):
+        facts_redis.set(f"ansible_factshost-{i}", _facts_payload(time.time() - 9999))
 
     utils_pkg.check_ansible_facts(max_age=10)
 
-    assert mock_r.scan.call_count == 2
-    warnings = [r["message"] for r in loguru_logs if r["level"] == "WARNING"]
-    assert any("stale for 2 host(s)" in m for m in warnings)
-    assert any("host-a" in m for m in warnings)
-    assert any("host-b" in m for m in warnings)
+    assert scan.call_count > 1
+    warnings = _warnings(loguru_logs)
+    assert any("stale for 250 host(s)" in m for m in warnings)
+    assert any("host-0'" in m for m in warnings)
+    assert any("host-249'" in m for m in warnings)
 
 
-def test_check_ansible_facts_max_age_none_uses_settings(mocker, loguru_logs):
-    import time as time_mod
-
-    now = time_mod.time()
+def test_check_ansible_facts_max_age_none_uses_settings(
+    facts_redis, loguru_logs, mocker
+):
     mocker.patch("osism.utils.settings.FACTS_MAX_AGE", 10)
-    mock_r = mocker.MagicMock()
-    mock_r.scan.return_value = (0, [b"ansible_factshost-a"])
     # Age = 9999s, threshold = 10s → stale.
-    mock_r.get.return_value = _facts_payload(now - 9999)
-    mocker.patch("osism.utils._init_redis", return_value=mock_r)
+    facts_redis.set("ansible_factshost-a", _facts_payload(time.time() - 9999))
 
     utils_pkg.check_ansible_facts(max_age=None)
 
-    warnings = [r["message"] for r in loguru_logs if r["level"] == "WARNING"]
-    assert any("older than 10 seconds" in m for m in warnings)
-
+    assert any("older than 10 seconds" in m for m in _warnings(loguru_logs))
 
-def test_check_ansible_facts_explicit_max_age_overrides_settings(mocker, loguru_logs):
-    import time as time_mod
 
-    now = time_mod.time()
+def test_check_ansible_facts_explicit_max_age_overrides_settings(
+    facts_redis, loguru_logs, mocker
+):
     mocker.patch("osism.utils.settings.FACTS_MAX_AGE", 99999)
-    mock_r = mocker.MagicMock()
-    mock_r.scan.return_value = (0, [b"ansible_factshost-a"])
     # Age = 50s. With settings.FACTS_MAX_AGE=99999 it would be fresh; with
     # max_age=10 it is stale — proving the kwarg overrides settings.
-    mock_r.get.return_value = _facts_payload(now - 50)
-    mocker.patch("osism.utils._init_redis", return_value=mock_r)
+    facts_redis.set("ansible_factshost-a", _facts_payload(time.time() - 50))
 
     utils_pkg.check_ansible_facts(max_age=10)
 
-    warnings = [r["message"] for r in loguru_logs if r["level"] == "WARNING"]
-    assert any("older than 10 seconds" in m for m in warnings)
+    assert any("older than 10 seconds" in m for m in _warnings(loguru_logs))
 
 
 @pytest.mark.parametrize("host", ["localhost", "127.0.0.1", "::1"])
-def test_check_ansible_facts_local_hosts_never_stale(mocker, loguru_logs, host):
-    import time as time_mod
-
-    now = time_mod.time()
-    mock_r = mocker.MagicMock()
-    mock_r.scan.return_value = (0, [f"ansible_facts{host}".encode("utf-8")])
+def test_check_ansible_facts_local_hosts_never_stale(facts_redis, loguru_logs, host):
     # Far older than the threshold, but local hosts must be skipped because
     # 'osism sync facts' never refreshes them (not part of the inventory).
-    mock_r.get.return_value = _facts_payload(now - 9999)
-    mocker.patch("osism.utils._init_redis", return_value=mock_r)
+    facts_redis.set(f"ansible_facts{host}", _facts_payload(time.time() - 9999))
 
     utils_pkg.check_ansible_facts(max_age=10)
 
-    warnings = [r["message"] for r in loguru_logs if r["level"] == "WARNING"]
-    assert not any("stale" in m for m in warnings)
+    assert not any("stale" in m for m in _warnings(loguru_logs))
 
 
 def test_check_ansible_facts_local_host_skipped_real_host_still_stale(
-    mocker, loguru_logs
+    facts_redis, loguru_logs
 ):
-    import time as time_mod
-
-    now = time_mod.time()
-    mock_r = mocker.MagicMock()
-    mock_r.scan.return_value = (
-        0,
-        [b"ansible_factslocalhost", b"ansible_factshost-a"],
-    )
-    mock_r.get.side_effect = [
-        _facts_payload(now - 9999),
-        _facts_payload(now - 9999),
-    ]
-    mocker.patch("osism.utils._init_redis", return_value=mock_r)
+    now = time.time()
+    facts_redis.set("ansible_factslocalhost", _facts_payload(now - 9999))
+    facts_redis.set("ansible_factshost-a", _facts_payload(now - 9999))
 
     utils_pkg.check_ansible_facts(max_age=10)
 
-    warnings = [r["message"] for r in loguru_logs if r["level"] == "WARNING"]
+    warnings = _warnings(loguru_logs)
     # Only the real inventory host is reported; localhost is excluded.
     assert any("stale for 1 host(s)" in m for m in warnings)
     assert any("host-a" in m for m in warnings)
     assert not any("localhost" in m for m in warnings)
+
+
+def test_check_ansible_facts_uses_index_without_reading_facts(
+    facts_redis, loguru_logs, mocker
+):
+    now = time.time()
+    facts_redis.zadd(
+        "ansible_cache_keys",
+        {"fresh-host": now - 1, "stale-host": now - 9999, "localhost": now - 9999},
+    )
+    scan = mocker.spy(facts_redis, "scan")
+    pipeline = mocker.spy(facts_redis, "pipeline")
+
+    utils_pkg.check_ansible_facts(max_age=10)
+
+    scan.assert_not_called()
+    pipeline.assert_not_called()
+    warnings = _warnings(loguru_logs)
+    assert any("stale for 1 host(s)" in m for m in warnings)
+    assert any("Host 'stale-host': facts are 9999 seconds old" in m for m in warnings)
+
+
+def test_check_ansible_facts_rebuilds_index_once(facts_redis, loguru_logs, mocker):
+    now = time.time()
+    facts_redis.set("ansible_factshost-a", _facts_payload(now - 9999))
+    facts_redis.set("ansible_factshost-b", _facts_payload("foo"))
+
+    utils_pkg.check_ansible_facts(max_age=10)
+
+    assert facts_redis.zrange("ansible_cache_keys", 0, -1) == [b"host-a"]
+    scan = mocker.spy(facts_redis, "scan")
+    utils_pkg.check_ansible_facts(max_age=10)
+    scan.assert_not_called()
@@ -0,0 +1,138 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from osism.utils import ping
+from osism.utils.ping import PingResult, parse_ping_output, ping_hosts
+
+LINUX_OUTPUT = (
+    "PING 10.0.0.1 (10.0.0.1) 56(84) bytes of data.\n"
+    "\n"
+    "--- 10.0.0.1 ping statistics ---\n"
+    "3 packets transmitted, 3 received, 0% packet loss, time 2003ms\n"
+    "rtt min/avg/max/mdev = 1.1/2.2/3.3/0.4 ms\n"
+)
+
+BUSYBOX_OUTPUT = (
+    "PING 10.0.0.1 (10.0.0.1): 56 data bytes\n"
+    "\n"
+    "--- 10.0.0.1 ping statistics ---\n"
+    "3 packets transmitted, 2 packets received, 33% packet loss\n"
+    "round-trip min/avg/max = 1.0/2.0/3.0 ms\n"
+)
+
+
+def test_parse_ping_output_linux():
+    result = parse_ping_output("10.0.0.1", LINUX_OUTPUT)
+
+    assert (result.sent, result.received, result.loss) == (3, 3, 0.0)
+    assert (result.rtt_min, result.rtt_avg, result.rtt_max, result.rtt_mdev) == (
+        1.1,
+        2.2,
+        3.3,
+        0.4,
+    )
+
+
+def test_parse_ping_output_busybox_without_mdev():
+    result = parse_ping_output("10.0.0.1", BUSYBOX_OUTPUT)
+
+    assert (result.sent, result.received) == (3, 2)
+    assert result.loss == pytest.approx(100 / 3)
+    assert (result.rtt_min, result.rtt_avg, result.rtt_max) == (1.0, 2.0, 3.0)
+    assert result.rtt_mdev is None
+
+
+def test_parse_ping_output_without_replies():
+    output = "3 packets transmitted, 0 received, 100% packet loss, time 2030ms\n"
+    result = parse_ping_output("10.0.0.1", output)
+
+    assert (result.sent, result.received, result.loss) == (3, 0, 100.0)
+    assert result.rtt_avg is None
+
+
+def test_loss_is_none_without_sent_requests():
+    assert PingResult("10.0.0.1").loss is None
+
+
+def test_summarize_computes_statistics_like_ping():
+    result = PingResult("10.0.0.1", sent=4, rtts=[1.0, 2.0, 3.0])
+    result.summarize()
+
+    assert result.received == 3
+    assert (result.rtt_min, result.rtt_avg, result.rtt_max) == (1.0, 2.0, 3.0)
+    assert result.rtt_mdev == pytest.approx((2 / 3) ** 0.5)
+    assert result.loss == 25.0
+
+
+def test_ping_hosts_without_hosts():
+    assert ping_hosts([]) == {}
+
+
+def test_ping_hosts_unresolvable_host_reports_error():
+    with patch.object(ping, "icmp_socket", return_value=MagicMock()), patch.object(
+        ping.socket, "gethostbyname", side_effect=OSError("unknown host")
+    ):
+        results = ping_hosts(["node.invalid"])
+
+    assert results["node.invalid"].error == "unknown host"
+    assert results["node.invalid"].sent == 0
+
+
+def _process(stdout):
+    process = MagicMock()
+    process.communicate = AsyncMock(return_value=(stdout.encode(), b""))
+    return process
+
+
+def test_ping_hosts_falls_back_to_ping_commands_with_bounded_concurrency():
+    running = 0
+    most_running = 0
+
+    async def create_subprocess_exec(*args, **kwargs):
+        nonlocal running, most_running
+        running += 1
+        most_running = max(most_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return _process(LINUX_OUTPUT.replace("10.0.0.1", args[-1]))
+
+    hosts = [f"10.0.0.{i}" for i in range(1, 11)]
+    with patch.object(ping, "icmp_socket", return_value=None), patch.object(
+        ping.asyncio, "create_subprocess_exec", side_effect=create_subprocess_exec
+    ) as create:
+        results = ping_hosts(hosts + ["10.0.0.1"], count=2, concurrency=3)
+
+    assert sorted(results) == sorted(hosts)
+    assert all(result.received == 3 for result in results.values())
+    assert create.call_count == 10
+    assert create.call_args_list[0].args[:5] == ("ping", "-n", "-c", "2", "-i")
+    assert most_running <= 3
+
+
+def test_ping_hosts_missing_ping_command_reports_error():
+    with patch.object(ping, "icmp_socket", return_value=None), patch.object(
+        ping.asyncio,
+        "create_subprocess_exec",
+        side_effect=FileNotFoundError("No such file or directory: 'ping'"),
+    ):
+        results = ping_hosts(["10.0.0.1"])
+
+    assert "ping" in results["10.0.0.1"].error
+
+
+def test_ping_hosts_over_icmp_socket_on_loopback():
+    sock = ping.icmp_socket()
+    if sock is None:
+        pytest.skip("ICMP sockets are not allowed by net.ipv4.ping_group_range")
+    sock.close()
+
+    hosts = ["127.0.0.1", "127.0.0.2", "localhost"]
+    results = ping_hosts(hosts, count=2, interval=0.05, timeout=1.0)
+
+    for host in hosts:
+        assert (results[host].sent, results[host].received) == (2, 2)
+        assert results[host].rtt_min <= results[host].rtt_avg <= results[host].rtt_max
@@ -1,14 +1,19 @@
 # SPDX-License-Identifier: Apache-2.0
 
-"""Unit tests for ``osism.utils.ssh`` known_hosts maintenance helpers."""
+"""Unit tests for ``osism.utils.ssh`` known_hosts maintenance helpers and
+the parallel remote execution used by the report commands."""
 
 import re
 import socket
+import stat
 import subprocess
+import threading
+import time
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 
 from osism.utils.ssh import (
     KNOWN_HOSTS_PATH,
@@ -16,7 +21,10 @@ from osism.utils.ssh import (
     cleanup_ssh_known_hosts_for_node,
     ensure_known_hosts_file,
     get_host_identifiers,
+    operator_ssh_command,
     remove_known_hosts_entries,
+    run_on_hosts,
+    run_remote,
 )
 
 # ---------------------------------------------------------------------------
@@ -590,3 +598,135 @@ def test_cleanup_remove_raises(mocker, loguru_logs):
 
     assert cleanup_ssh_known_hosts_for_node("node01") is False
     assert _has_log(loguru_logs, "ERROR", "Error during SSH known_hosts cleanup")
+
+
+# ---------------------------------------------------------------------------
+# operator_ssh_command / run_remote / run_on_hosts
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def fake_ssh(tmp_path, mocker):
+    """A local stand-in for ssh: runs the remote command with sh.
+
+    The target is written to a log file, so tests can tell which hosts
+    were contacted, the ssh options are ignored.
+    """
+    mocker.patch("osism.utils.ssh.SSH_CONTROL_DIR", str(tmp_path / "control"))
+    log = tmp_path / "targets"
+    script = tmp_path / "ssh"
+    script.write_text(
+        "#!/bin/sh\n"
+        "while [ $# -gt 2 ]; do shift; done\n"
+        f'echo "$1" >> {log}\n'
+        'exec sh -c "$2"\n'
+    )
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return SimpleNamespace(binary=str(script), log=log)
+
+
+def test_operator_ssh_command_shares_connections(tmp_path, mocker):
+    mocker.patch("osism.utils.ssh.SSH_CONTROL_DIR", str(tmp_path / "control"))
+
+    command = operator_ssh_command("10.0.0.1", "uptime")
+
+    assert command[0] == "/usr/bin/ssh"
+    assert command[-2:] == ["dragon@10.0.0.1", "uptime"]
+    assert "ControlMaster=auto" in command
+    assert f"ControlPath={tmp_path}/control/%C" in command
+    assert (tmp_path / "control").is_dir()
+
+
+def test_operator_ssh_command_without_control_dir(mocker):
+    mocker.patch("osism.utils.ssh.os.makedirs", side_effect=PermissionError("ro"))
+
+    command = operator_ssh_command("10.0.0.1", "uptime")
+
+    assert "ControlMaster=auto" not in command
+    assert command[-2:] == ["dragon@10.0.0.1", "uptime"]
+
+
+def test_run_remote_against_fake_target(fake_ssh):
+    result = run_remote(
+        "node-1", "echo hello; echo oops >&2; exit 3", ssh_binary=fake_ssh.binary
+    )
+
+    assert result.returncode == 3
+    assert result.stdout == "hello\n"
+    assert result.stderr == "oops\n"
+    assert fake_ssh.log.read_text() == "dragon@node-1\n"
+
+
+def test_run_remote_times_out(fake_ssh):
+    with pytest.raises(subprocess.TimeoutExpired):
+        run_remote("node-1", "sleep 5", timeout=0.2, ssh_binary=fake_ssh.binary)
+
+
+def test_run_on_hosts_runs_hosts_in_parallel(fake_ssh):
+    hosts = [f"node-{i}" for i in range(8)]
+
+    def task(host):
+        return run_remote(host, f"sleep 0.5; echo {host}", ssh_binary=fake_ssh.binary)
+
+    started = time.monotonic()
+    results = {
+        host: future.result().stdout for host, future in run_on_hosts(hosts, task, 8)
+    }
+    elapsed = time.monotonic() - started
+
+    assert results == {host: f"{host}\n" for host in hosts}
+    # Eight hosts of 0.5 seconds each, sequentially 4 seconds
+    assert elapsed < 2.5
+    assert sorted(fake_ssh.log.read_text().split()) == sorted(
+        f"dragon@{h}" for h in hosts
+    )
+
+
+def test_run_on_hosts_bounds_concurrency():
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def task(host):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return host
+
+    results = [future.result() for _, future in run_on_hosts(range(10), task, 3)]
+
+    assert sorted(results) == list(range(10))
+    assert peak == 3
+
+
+def test_run_on_hosts_yields_hosts_as_they_finish():
+    def task(host):
+        time.sleep(0.3 if host == "slow" else 0)
+        if host == "broken":
+            raise ValueError("no data")
+        return host
+
+    finished = list(run_on_hosts(["slow", "fast", "broken"], task, 3))
+
+    assert finished[-1][0] == "slow"
+    errors = {host: future.exception() for host, future in finished}
+    assert isinstance(errors["broken"], ValueError)
+    assert errors["fast"] is None
+
+
+def test_run_on_hosts_defaults_to_setting(mocker):
+    mocker.patch("osism.utils.ssh.settings.REPORT_SSH_CONCURRENCY", 1)
+    executor = mocker.patch(
+        "osism.utils.ssh.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+    )
+
+    assert [f.result() for _, f in run_on_hosts(["a", "b"], str.upper)] == ["A", "B"]
+    executor.assert_called_once_with(max_workers=1)
+
+
+def test_run_on_hosts_without_hosts():
+    assert list(run_on_hosts([], str.upper)) == []
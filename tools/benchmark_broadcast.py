@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""Micro-benchmark the dispatch of broadcast events to filtered connections.
+
+Measures the synchronous part of a broadcast, serializing an event and
+finding the connections it has to be queued for, without any sending. The
+connections use the kind of filters dashboards set: most of them follow a
+single node, some a service, a few take every event.
+
+    python tools/benchmark_broadcast.py --events 10000 --connections 1000
+
+The "scan" row checks every connection, as the broadcaster did before the
+connection registry got its filter index. The "json" column serializes
+with the json module, "fast" with ``websocket_manager.dumps``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from unittest.mock import MagicMock
+
+from osism.services import websocket_manager
+from osism.services.websocket_manager import (
+    ConnectionRegistry,
+    EventMessage,
+    WebSocketConnection,
+)
+
+EVENT_TYPES = [
+    "baremetal.node.power_set.end",
+    "baremetal.node.provision_set.end",
+    "compute.instance.update",
+    "network.port.update.end",
+]
+
+
+def _connections(count: int, nodes: int, rng: random.Random) -> ConnectionRegistry:
+    registry = ConnectionRegistry()
+    for _ in range(count):
+        connection = WebSocketConnection(MagicMock(), max_queue_size=1)
+        kind = rng.random()
+        if kind < 0.7:
+            connection.node_filters = [f"node-{rng.randrange(nodes)}"]
+        elif kind < 0.95:
+            connection.service_filters = [rng.choice(["baremetal", "compute"])]
+        registry[connection.websocket] = connection
+    return registry
+
+
+def _events(count: int, nodes: int, rng: random.Random) -> list[EventMessage]:
+    return [
+        EventMessage(
+            event_type=rng.choice(EVENT_TYPES),
+            source="openstack",
+            data={
+                "resource_id": f"{i:032x}",
+                "payload": {"provision_state": "active", "power_state": "power on"},
+            },
+            node_name=f"node-{rng.randrange(nodes)}",
+        )
+        for i in range(count)
+    ]
+
+
+def run_benchmark(events: int, connections: int, nodes: int) -> list[dict]:
+    rng = random.Random(0)
+    registry = _connections(connections, nodes, rng)
+    messages = _events(events, nodes, rng)
+    results = []
+
+    def scan(event):
+        return [c for c in registry.values() if c.matches_filters(event)]
+
+    for name, match in (("scan", scan), ("index", registry.matching)):
+        started = time.perf_counter()
+        matched = sum(len(match(event)) for event in messages)
+        results.append(
+            {"name": name, "seconds": time.perf_counter() - started, "matched": matched}
+        )
+
+    started = time.perf_counter()
+    for event in messages:
+        json.dumps(event.to_dict())
+    json_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    for event in messages:
+        websocket_manager.dumps(event.to_dict())
+    fast_seconds = time.perf_counter() - started
+    for result in results:
+        result["json_seconds"] = json_seconds
+        result["fast_seconds"] = fast_seconds
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--connections", type=int, default=1000)
+    parser.add_argument("--nodes", type=int, default=500)
+    args = parser.parse_args()
+
+    print(
+        f"{args.events} events, {args.connections} connections, {args.nodes} nodes "
+        f"(orjson {'available' if websocket_manager.ORJSON_AVAILABLE else 'missing'})"
+    )
+    print(
+        f"{'dispatch':>8} {'events/s':>10} {'us/event':>9} {'matched':>9} "
+        f"{'json us':>8} {'fast us':>8}"
+    )
+    for result in run_benchmark(args.events, args.connections, args.nodes):
+        print(
+            f"{result['name']:>8} {args.events / result['seconds']:>10.0f} "
+            f"{result['seconds'] / args.events * 1e6:>9.1f} {result['matched']:>9} "
+            f"{result['json_seconds'] / args.events * 1e6:>8.1f} "
+            f"{result['fast_seconds'] / args.events * 1e6:>8.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark the inode usage scan of `osism check inode --usage`.
+
+Generates a tree of about ``--entries`` empty files and directories below
+``--top-level`` top-level directories, half of them in the first one like
+the overlay2 directory below /var/lib/docker, and counts the entries per
+top-level directory:
+
+* "walk": os.walk over one top-level directory after the other
+* "threads-N": count_entries with N threads
+
+All runs have to return the same counts.
+
+    python tools/benchmark_check_inode.py --entries 1000000 --tree /tmp/tree
+
+An existing ``--tree`` is reused as it is, generating a million entries
+takes a while. Threads only help as far as the kernel lists directories in
+parallel, with a cold dentry cache and on network or overlay filesystems
+the difference is larger than with a warm cache. As root, ``--drop-caches``
+drops the caches before every run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from osism.commands.check import count_entries
+
+FILES_PER_DIRECTORY = 100
+
+
+def make_tree(base: str, entries: int, top_level: int) -> None:
+    shares = [entries // 2] + [entries // 2 // (top_level - 1)] * (top_level - 1)
+    for i, share in enumerate(shares):
+        top = os.path.join(base, f"top-{i}")
+        created = 0
+        directory_number = 0
+        while created < share:
+            directory = os.path.join(
+                top, f"a-{directory_number // 100}", f"b-{directory_number}"
+            )
+            os.makedirs(directory)
+            created += 2 if directory_number % 100 == 0 else 1
+            for j in range(min(FILES_PER_DIRECTORY, share - created)):
+                os.close(os.open(os.path.join(directory, f"f-{j}"), os.O_CREAT))
+                created += 1
+            directory_number += 1
+
+
+def walk_counts(path: str) -> dict[str, int]:
+    counts = {path: 0}
+    for entry in os.scandir(path):
+        if not entry.is_dir(follow_symlinks=False):
+            counts[path] += 1
+            continue
+        counts[entry.path] = 1
+        for _, dirs, files in os.walk(entry.path):
+            counts[entry.path] += len(dirs) + len(files)
+    return counts
+
+
+def drop_caches() -> None:
+    os.sync()
+    with open("/proc/sys/vm/drop_caches", "w") as f:
+        f.write("3\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=1000000)
+    parser.add_argument("--top-level", type=int, default=20)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--tree", default=None)
+    parser.add_argument("--drop-caches", action="store_true")
+    args = parser.parse_args()
+
+    base = args.tree or tempfile.mkdtemp()
+    try:
+        if not os.path.isdir(base) or not os.listdir(base):
+            started = time.perf_counter()
+            make_tree(base, args.entries, args.top_level)
+            print(f"generated the tree in {time.perf_counter() - started:.1f}s")
+
+        runs = [("walk", lambda: walk_counts(base))]
+        for threads in args.threads:
+            runs.append(
+                (f"threads-{threads}", lambda t=threads: count_entries(base, t)[0])
+            )
+
+        print(f"{os.cpu_count()} CPUs")
+        print(f"{'run':>11} {'seconds':>9} {'entries':>9} {'biggest':>9}")
+        results = {}
+        for name, function in runs:
+            if args.drop_caches:
+                drop_caches()
+            started = time.perf_counter()
+            counts = function()
+            seconds = time.perf_counter() - started
+            results[name] = counts
+            print(
+                f"{name:>11} {seconds:>9.2f} {sum(counts.values()):>9} "
+                f"{max(counts.values()):>9}"
+            )
+    finally:
+        if args.tree is None:
+            shutil.rmtree(base)
+
+    if any(counts != results["walk"] for counts in results.values()):
+        print("The scans returned different counts")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark the file scans of `osism check mount`.
+
+Creates a synthetic tree of ``--files`` small files spread over directories
+like a configuration repository and runs both scan scripts on it with the
+local /bin/sh:
+
+* "loop": the former script, a ``while read`` loop running stat three times
+  and md5sum once per file
+* "batch": build_scan_script, stat and md5sum fed in batches by xargs
+
+Both have to return the same inodes, sizes and hashes.
+
+    python tools/benchmark_check_mount.py --files 20000
+
+The container runs the busybox tools of alpine, forks are cheaper there
+than with coreutils but still dominate the loop.
+
+With ``--local`` it compares instead the scans of the local view, with
+content hashes:
+
+* "walk": the former collect_file_info, os.walk and two stats and an MD5
+  in one thread per file
+* "cold": collect_file_info without a manifest, or with an outdated one
+* "warm": collect_file_info with the manifest of the previous run
+
+    python tools/benchmark_check_mount.py --local --files 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from loguru import logger
+
+from osism.commands.check import (
+    build_scan_script,
+    collect_file_info,
+    get_file_info,
+    parse_stat_output,
+)
+
+
+def loop_scan_script(mount_path: str, max_files: int, check_content: bool) -> str:
+    """The scan script as it was before build_scan_script."""
+    script = f"""cd "{mount_path}"
+find . -maxdepth 10 \\( -name .git -o -name venv -o -name __pycache__ \\) -prune -o \\( -type f -o -type d \\) -print 2>/dev/null | head -{max_files} | while read file; do
+    [ "$file" = "." ] && continue
+    relpath="${{file#./}}"
+    [ -z "$relpath" ] && continue
+    echo "FILE:$relpath"
+    if [ -e "$file" ]; then
+        inode=$(stat -c "%i" "$file" 2>&1)
+        if [ $? -eq 0 ]; then
+            echo "INODE:$inode"
+            echo "SIZE:$(stat -c "%s" "$file")"
+            echo "MTIME:$(stat -c "%Y" "$file")"
+"""
+    if check_content:
+        script += """
+            if [ -f "$file" ] && [ $(stat -c %s "$file" 2>/dev/null || echo 9999999) -lt 1048576 ]; then
+                hash=$(md5sum "$file" 2>/dev/null | cut -d' ' -f1)
+                echo "HASH:${hash:-NONE}"
+            else
+                echo "HASH:NONE"
+            fi
+"""
+    else:
+        script += '            echo "HASH:NONE"\n'
+    script += """
+        else
+            echo "ERROR:$inode"
+        fi
+    else
+        echo "ERROR:File not found"
+    fi
+done
+"""
+    return script
+
+
+def walk_file_info(base_path: str, max_files: int) -> dict:
+    """collect_file_info as it was before the manifest."""
+    file_info = {}
+    count = 0
+    for root, dirs, files in os.walk(base_path, followlinks=False):
+        for skip in [".git", "venv", "__pycache__"]:
+            if skip in dirs:
+                dirs.remove(skip)
+        for name in files + dirs:
+            if count >= max_files:
+                return file_info
+            filepath = os.path.join(root, name)
+            if os.path.islink(filepath):
+                continue
+            file_info[os.path.relpath(filepath, base_path)] = get_file_info(filepath)
+            count += 1
+    return file_info
+
+
+def make_tree(base: str, files: int) -> None:
+    for i in range(files):
+        directory = os.path.join(base, f"environments/env-{i % 50}/group-{i % 7}")
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"file-{i}.yml"), "w") as f:
+            f.write(f"key_{i}: value {i}\n" * (i % 20 + 1))
+
+
+def _comparable(output: str) -> dict:
+    return {
+        name: (info.get("inode"), info.get("size"), info.get("hash"))
+        for name, info in parse_stat_output(output).items()
+    }
+
+
+def run_local(base: str, max_files: int) -> int:
+    manifest = os.path.join(base + "-manifest", "manifest.json")
+    os.makedirs(os.path.dirname(manifest))
+    runs = [
+        ("walk", lambda: walk_file_info(base, max_files)),
+        ("cold", lambda: collect_file_info(base, max_files, True, manifest)),
+        ("warm", lambda: collect_file_info(base, max_files, True, manifest)),
+    ]
+    print(f"{'run':>6} {'seconds':>9} {'entries':>8}")
+    results = {}
+    for name, function in runs:
+        started = time.perf_counter()
+        file_info = function()
+        seconds = time.perf_counter() - started
+        results[name] = {
+            path: (info.get("inode"), info.get("size"), info.get("hash"))
+            for path, info in file_info.items()
+        }
+        print(f"{name:>6} {seconds:>9.2f} {len(file_info):>8}")
+
+    if not results["walk"] == results["cold"] == results["warm"]:
+        print("The scans returned different file info")
+        return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--no-content", action="store_true")
+    parser.add_argument("--local", action="store_true")
+    args = parser.parse_args()
+    check_content = not args.no_content
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base = os.path.join(tmp, "configuration")
+        make_tree(base, args.files)
+        max_files = args.files * 2
+
+        if args.local:
+            print(f"{args.files} files")
+            return run_local(base, max_files)
+
+        print(f"{args.files} files, content check {'on' if check_content else 'off'}")
+        print(f"{'run':>6} {'seconds':>9} {'entries':>8}")
+        results = {}
+        for name, build in (("loop", loop_scan_script), ("batch", build_scan_script)):
+            script = build(base, max_files, check_content)
+            started = time.perf_counter()
+            output = subprocess.run(
+                ["/bin/sh", "-c", script], capture_output=True, text=True, check=True
+            ).stdout
+            seconds = time.perf_counter() - started
+            results[name] = _comparable(output)
+            print(f"{name:>6} {seconds:>9.2f} {len(results[name]):>8}")
+
+    if results["loop"] != results["batch"]:
+        print("The scan scripts returned different file info")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
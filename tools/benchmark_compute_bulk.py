@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark bulk starts of `osism compute start` against a simulated Nova.
+
+Simulates ``--servers`` stopped servers and a Nova API answering every
+call after ``--latency`` seconds, listing servers costs another
+``--list-cost`` seconds per listed server. A server reaches ACTIVE
+``--boot`` seconds (plus up to 50% jitter) after its start was accepted.
+Time is simulated, the benchmark takes seconds instead of hours:
+
+* "serial": start one server after the other and wait for each with a GET
+  every two seconds, like the former wait loops
+* "bulk-N": run_workflows with N servers in flight, ``--rate`` API calls
+  per second and one list call of the changed servers per poll
+
+    python tools/benchmark_compute_bulk.py --servers 500
+
+All runs have to start every server.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from loguru import logger
+
+from osism.commands.compute import _server_step
+from osism.utils.actions import run_workflows
+
+
+class SimulatedNova:
+    def __init__(self, servers: int, latency: float, list_cost: float, boot: float):
+        self.now = 0.0
+        self.latency = latency
+        self.list_cost = list_cost
+        rng = random.Random(servers)
+        self.boot = {f"id{i}": boot * (1 + rng.random() / 2) for i in range(servers)}
+        self.active_at: dict[str, float] = {}
+        self.calls = 0
+        self.compute = self
+
+    # The clock of the simulation, replaces time in osism.utils.actions
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+    def _call(self, cost: float = 0.0) -> None:
+        self.calls += 1
+        self.now += self.latency + cost
+
+    def _server(self, server_id: str) -> SimpleNamespace:
+        active = self.active_at.get(server_id, float("inf")) <= self.now
+        return SimpleNamespace(
+            id=server_id,
+            status="ACTIVE" if active else "SHUTOFF",
+            task_state=None if active or server_id not in self.active_at else "x",
+        )
+
+    def start_server(self, server_id: str) -> None:
+        self._call()
+        self.active_at[server_id] = self.now + self.boot[server_id]
+
+    def get_server(self, server_id: str) -> SimpleNamespace:
+        self._call()
+        return self._server(server_id)
+
+    def servers(self, **query) -> list[SimpleNamespace]:
+        changed = list(self.active_at)
+        self._call(self.list_cost * len(changed))
+        return [self._server(server_id) for server_id in changed]
+
+
+def run_serial(nova: SimulatedNova) -> int:
+    for server_id in nova.boot:
+        nova.start_server(server_id)
+        while nova.get_server(server_id).status != "ACTIVE":
+            nova.sleep(2)
+    return sum(
+        1 for server_id in nova.boot if nova._server(server_id).task_state is None
+    )
+
+
+def run_bulk(nova: SimulatedNova, parallel: int, rate: float) -> int:
+    def poll(server_ids):
+        wanted = set(server_ids)
+        return {s.id: s for s in nova.servers(changes_since="-") if s.id in wanted}
+
+    with patch("osism.utils.actions.time", nova):
+        results = run_workflows(
+            {
+                server_id: [_server_step("start", nova, "ACTIVE")]
+                for server_id in nova.boot
+            },
+            poll,
+            concurrency=parallel,
+            rate=rate,
+        )
+    return sum(1 for r in results if r.ok)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--servers", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--list-cost", type=float, default=0.0005)
+    parser.add_argument("--boot", type=float, default=20.0)
+    parser.add_argument("--rate", type=float, default=10.0)
+    parser.add_argument("--parallel", type=int, nargs="+", default=[10, 50, 100])
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    def nova() -> SimulatedNova:
+        return SimulatedNova(args.servers, args.latency, args.list_cost, args.boot)
+
+    runs = [("serial", run_serial)]
+    for parallel in args.parallel:
+        runs.append(
+            (f"bulk-{parallel}", lambda n, p=parallel: run_bulk(n, p, args.rate))
+        )
+
+    print(f"{args.servers} servers, {args.rate:g} API calls per second")
+    print(f"{'run':>9} {'seconds':>9} {'API calls':>10} {'started':>8}")
+    failed = False
+    for name, function in runs:
+        simulated = nova()
+        started = function(simulated)
+        failed = failed or started != args.servers
+        print(f"{name:>9} {simulated.now:>9.0f} {simulated.calls:>10} {started:>8}")
+
+    if failed:
+        print("Not all servers were started")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark the Ansible facts freshness check and facts lookups.
+
+Fills an in-memory Redis (fakeredis) with the cached facts of ``--hosts``
+hosts next to ``--other-keys`` unrelated keys, like the Redis of a manager
+that also holds task results and locks, and compares:
+
+* "scan": the former freshness check, SCAN over all keys and a GET and JSON
+  decode of the facts of every host
+* "rebuild": the first check without an index, SCAN plus batched MGETs
+* "index": the check with the fact index, a single ZRANGEBYSCORE
+* "get"/"mget": reading and decoding the facts of all hosts one by one
+  and with batched MGETs
+* "loop": finding the hosts running a kernel by reading all facts
+* "build": building the fact search index for all hosts
+* "search": the same search on the up to date fact search index, like
+  the API endpoints
+
+    python tools/benchmark_facts.py --hosts 5000
+
+With ``--storage`` it compares instead how the API endpoints read the facts
+of ``--hosts`` hosts with some 150 KiB of facts each, from the plain facts
+and from the compressed copy (``FACTS_STORAGE=compressed``): the bytes
+stored per host and the time to read one hot fact, one other fact and all
+facts of every host. Ansible keeps writing the plain facts, the compressed
+copy comes on top of them: "KiB/host" is all that is stored for the facts
+of a host, "copy" the part of it taken by the copy.
+
+    python tools/benchmark_facts.py --storage --hosts 1000
+
+fakeredis has no network round trips, against a real Redis the difference
+between one command per host and batched commands is larger, as is the
+difference between transferring plain and compressed facts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+
+import fakeredis
+from loguru import logger
+
+from osism import settings
+from osism.utils import facts, facts_search
+
+KERNEL = "6.8.0-45-generic"
+
+
+def _fill(redis, hosts: int, other_keys: int, stale: int) -> None:
+    now = time.time()
+    pipeline = redis.pipeline(transaction=False)
+    for i in range(hosts):
+        epoch = now - 100000 if i < stale else now - 60
+        payload = {
+            "ansible_hostname": f"node-{i}",
+            "ansible_date_time": {"epoch": str(int(epoch))},
+            "ansible_kernel": KERNEL if i % 2 else "6.8.0-31-generic",
+            # Real facts are some 50 KiB per host, most of it lists like this
+            "ansible_mounts": [
+                {"mount": f"/srv/{j}", "size_total": j * 1024} for j in range(200)
+            ],
+        }
+        pipeline.set(facts.facts_key(f"node-{i}"), json.dumps(payload))
+    for i in range(other_keys):
+        pipeline.set(f"celery-task-meta-{i}", "{}")
+    pipeline.execute()
+
+
+def _scan_check(redis, max_age: int) -> int:
+    """The freshness check as it was before the fact index."""
+    now = time.time()
+    stale = 0
+    cursor = 0
+    while True:
+        cursor, keys = redis.scan(cursor, match="ansible_facts*", count=100)
+        for key in keys:
+            data = redis.get(key)
+            if data:
+                epoch = json.loads(data)["ansible_date_time"]["epoch"]
+                if now - float(epoch) > max_age:
+                    stale += 1
+        if cursor == 0:
+            break
+    return stale
+
+
+def _realistic_facts(i: int, epoch: float) -> dict:
+    """Facts of the size and shape of a compute node with many ports."""
+    rng = random.Random(i)
+    interfaces = [f"tap{rng.getrandbits(40):010x}" for _ in range(150)]
+    interfaces += ["eno1", "eno2"]
+    facts = {
+        "ansible_hostname": f"node-{i}",
+        "ansible_fqdn": f"node-{i}.example.com",
+        "ansible_date_time": {"epoch": str(int(epoch)), "tz": "UTC"},
+        "ansible_kernel": "6.8.0-45-generic",
+        "ansible_distribution": "Ubuntu",
+        "ansible_distribution_version": "24.04",
+        "ansible_default_ipv4": {"address": f"10.0.{i // 250}.{i % 250}"},
+        "ansible_interfaces": interfaces,
+        "ansible_mounts": [
+            {
+                "mount": f"/var/lib/docker/overlay2/{rng.getrandbits(256):064x}/merged",
+                "size_available": rng.getrandbits(40),
+                "inode_available": rng.getrandbits(24),
+            }
+            for _ in range(120)
+        ],
+        "ansible_local": {"osism": {"bootstrap": {"status": True}}},
+    }
+    for name in interfaces:
+        facts[f"ansible_{name}"] = {
+            "device": name,
+            "active": rng.random() > 0.1,
+            "mtu": rng.choice([1450, 1500, 9000]),
+            "macaddress": ":".join(f"{rng.getrandbits(8):02x}" for _ in range(6)),
+            "ipv6": [{"address": f"fe80::{rng.getrandbits(64):x}", "prefix": "64"}],
+            "features": {
+                f"feature_{k}": rng.choice(["on", "off", "off [fixed]", "on [fixed]"])
+                for k in range(40)
+            },
+        }
+    return facts
+
+
+def run_storage_benchmark(hosts: int) -> list[dict]:
+    redis = fakeredis.FakeStrictRedis()
+    now = time.time()
+    names = [f"node-{i}" for i in range(hosts)]
+    for i, host in enumerate(names):
+        redis.set(facts.facts_key(host), json.dumps(_realistic_facts(i, now)))
+        facts.index_facts(redis, {host: now})
+
+    results = []
+    for storage in ("plain", "compressed"):
+        settings.FACTS_STORAGE = storage
+        if storage == "compressed":
+            seconds, _ = _timed(lambda: facts.compact_facts(redis))
+            print(f"compacted {hosts} hosts in {seconds * 1000:.0f} ms")
+            copy = sum(
+                sum(
+                    redis.hstrlen(facts.compact_key(h), f)
+                    for f in redis.hkeys(facts.compact_key(h))
+                )
+                for h in names
+            )
+        else:
+            copy = 0
+        stored = copy + sum(redis.strlen(facts.facts_key(h)) for h in names)
+
+        result = {
+            "name": storage,
+            "bytes_per_host": stored / hosts,
+            "copy_per_host": copy / hosts,
+        }
+        for run, fact in (
+            ("hot", ["ansible_kernel"]),
+            ("other", ["ansible_eno1"]),
+            ("all", None),
+        ):
+            seconds, _ = _timed(
+                lambda: [facts.load_facts(redis, h, fact) for h in names]
+            )
+            result[f"{run}_ms"] = seconds / hosts * 1000
+        results.append(result)
+    return results
+
+
+def _kernel_hosts(redis, names: list[str]) -> list[str]:
+    return [
+        host
+        for host, host_facts in facts.get_facts(redis, names).items()
+        if host_facts and host_facts.get("ansible_kernel") == KERNEL
+    ]
+
+
+def _search_kernel(redis) -> list[str]:
+    # Like the API endpoints: the index is up to date after gathering
+    if facts_search.search_index_outdated(redis):
+        facts_search.update_search_index(redis)
+    return facts_search.search_facts(redis, "ansible_kernel", KERNEL)
+
+
+def _timed(function) -> tuple[float, object]:
+    started = time.perf_counter()
+    result = function()
+    return time.perf_counter() - started, result
+
+
+def run_benchmark(hosts: int, other_keys: int, stale: int) -> list[dict]:
+    redis = fakeredis.FakeStrictRedis()
+    _fill(redis, hosts, other_keys, stale)
+    max_age = settings.FACTS_MAX_AGE
+    names = [f"node-{i}" for i in range(hosts)]
+
+    def rebuild():
+        redis.delete(settings.FACTS_INDEX_KEY)
+        return len(facts.get_stale_hosts(redis, max_age))
+
+    runs = [
+        ("scan", lambda: _scan_check(redis, max_age)),
+        ("rebuild", rebuild),
+        ("index", lambda: len(facts.get_stale_hosts(redis, max_age))),
+        (
+            "get",
+            lambda: sum(1 for h in names if json.loads(redis.get(facts.facts_key(h)))),
+        ),
+        ("mget", lambda: sum(1 for f in facts.get_facts(redis, names).values() if f)),
+        ("loop", lambda: len(_kernel_hosts(redis, names))),
+        ("build", lambda: facts_search.update_search_index(redis)),
+        ("search", lambda: len(_search_kernel(redis))),
+    ]
+    results = []
+    for name, function in runs:
+        seconds, count = _timed(function)
+        results.append({"name": name, "seconds": seconds, "count": count})
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hosts", type=int, default=5000)
+    parser.add_argument("--other-keys", type=int, default=50000)
+    parser.add_argument("--stale", type=int, default=50)
+    parser.add_argument("--storage", action="store_true")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    if args.storage:
+        print(
+            f"{args.hosts} hosts (zstd {'available' if facts.ZSTD_AVAILABLE else 'missing'})"
+        )
+        print(
+            f"{'storage':>10} {'KiB/host':>9} {'copy':>6} {'hot ms':>7} "
+            f"{'other ms':>9} {'all ms':>7}"
+        )
+        for result in run_storage_benchmark(args.hosts):
+            print(
+                f"{result['name']:>10} {result['bytes_per_host'] / 1024:>9.1f} "
+                f"{result['copy_per_host'] / 1024:>6.1f} "
+                f"{result['hot_ms']:>7.3f} {result['other_ms']:>9.3f} "
+                f"{result['all_ms']:>7.3f}"
+            )
+        return 0
+
+    print(f"{args.hosts} hosts ({args.stale} stale), {args.other_keys} unrelated keys")
+    print(f"{'run':>8} {'ms':>10} {'hosts':>7}")
+    for result in run_benchmark(args.hosts, args.other_keys, args.stale):
+        print(
+            f"{result['name']:>8} {result['seconds'] * 1000:>10.1f} "
+            f"{result['count']:>7}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark the throughput of the notification listener consumer.
+
+A producer thread publishes versioned notifications to the ironic exchange of
+a local in-memory kombu transport while ``NotificationsDump`` consumes them
+with the given prefetch count and ack batch size. No RabbitMQ, Redis or OSISM
+API is needed: the event bridge and the OSISM API delivery are disabled and
+the baremetal handlers are replaced by a probe that records the time between
+publishing and handling of every message.
+
+    python tools/benchmark_listener.py --messages 20000
+    python tools/benchmark_listener.py --prefetch 1 --ack-batch-size 1
+
+Without ``--prefetch``/``--ack-batch-size`` the per-message baseline
+(prefetch 1, ack every message) and the configured defaults are compared.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import threading
+import time
+
+from kombu import Connection, Exchange, Producer, Queue
+from loguru import logger
+
+from osism import settings
+from osism.services import listener
+
+SERVICE = "ironic"
+
+
+class LatencyProbe:
+    """Stand-in for ``BaremetalEvents`` recording end-to-end latencies."""
+
+    def __init__(self, consumer: listener.NotificationsDump, messages: int) -> None:
+        self.consumer = consumer
+        self.messages = messages
+        self.latencies: list[float] = []
+
+    def get_handler(self, event_type: str):
+        return self.handle
+
+    def handle(self, payload: dict) -> None:
+        self.latencies.append(time.perf_counter() - payload["sent"])
+        if len(self.latencies) >= self.messages:
+            self.consumer.should_stop = True
+
+
+def _publish(messages: int) -> None:
+    config = listener.EXCHANGES_CONFIG[SERVICE]
+    with Connection("memory://") as connection:
+        producer = Producer(
+            connection.default_channel,
+            exchange=Exchange(config["exchange"], type="topic"),
+            routing_key=config["routing_key"],
+        )
+        for i in range(messages):
+            data = {
+                "priority": "INFO",
+                "event_type": "baremetal.node.power_set.end",
+                "timestamp": "2026-01-01 00:00:00.000000",
+                "publisher_id": "ironic-conductor",
+                "message_id": f"00000000-0000-0000-0000-{i:012d}",
+                "payload": {
+                    "ironic_object.data": {"name": f"node-{i}"},
+                    "sent": time.perf_counter(),
+                },
+            }
+            producer.publish({"oslo.message": json.dumps(data)}, serializer="json")
+
+
+def run_benchmark(messages: int, prefetch_count: int, ack_batch_size: int) -> dict:
+    """Consume ``messages`` notifications and return throughput and latency."""
+    config = listener.EXCHANGES_CONFIG[SERVICE]
+    settings.OSISM_API_URL = None
+
+    transport_options = {"polling_interval": 0.001}
+    with Connection("memory://", transport_options=transport_options) as connection:
+        channel = connection.default_channel
+        channel.exchange_declare(config["exchange"], type="topic", durable=True)
+
+        consumer = listener.NotificationsDump(connection)
+        consumer.event_bridge = None
+        consumer.prefetch_count = prefetch_count
+        consumer.ack_batch_size = ack_batch_size
+        probe = LatencyProbe(consumer, messages)
+        consumer.baremetal_events = probe
+        consumer._available_exchanges = {
+            SERVICE: {**config, "exchange_props": {"type": "topic", "durable": True}}
+        }
+        # Declare the queue before publishing so no message is lost
+        Queue(
+            config["queue"],
+            Exchange(config["exchange"], type="topic"),
+            routing_key=config["routing_key"],
+        )(channel).declare()
+
+        producer = threading.Thread(target=_publish, args=(messages,))
+        started = time.perf_counter()
+        producer.start()
+        consumer.run()
+        elapsed = time.perf_counter() - started
+        consumer._stop_exchange_discovery()
+        producer.join()
+
+        # Unacknowledged messages would have been restored to the queue
+        remaining = channel.queue_declare(config["queue"], passive=True).message_count
+        channel.queue_delete(config["queue"])
+
+    latencies = sorted(probe.latencies)
+    return {
+        "prefetch_count": prefetch_count,
+        "ack_batch_size": ack_batch_size,
+        "messages": len(latencies),
+        "remaining": remaining,
+        "messages_per_second": len(latencies) / elapsed,
+        "latency_p50_ms": statistics.median(latencies) * 1000,
+        "latency_p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "latency_max_ms": latencies[-1] * 1000,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument("--prefetch", type=int, default=None)
+    parser.add_argument("--ack-batch-size", type=int, default=None)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    if args.prefetch is None and args.ack_batch_size is None:
+        runs = [
+            (1, 1),
+            (settings.LISTENER_PREFETCH_COUNT, settings.LISTENER_ACK_BATCH_SIZE),
+        ]
+    else:
+        runs = [
+            (
+                args.prefetch if args.prefetch is not None else 0,
+                args.ack_batch_size if args.ack_batch_size is not None else 1,
+            )
+        ]
+
+    print(
+        f"{'prefetch':>8} {'ack batch':>9} {'msg/s':>10} "
+        f"{'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'unacked':>7}"
+    )
+    for prefetch_count, ack_batch_size in runs:
+        result = run_benchmark(args.messages, prefetch_count, ack_batch_size)
+        print(
+            f"{result['prefetch_count']:>8} {result['ack_batch_size']:>9} "
+            f"{result['messages_per_second']:>10.0f} "
+            f"{result['latency_p50_ms']:>8.2f} {result['latency_p99_ms']:>8.2f} "
+            f"{result['latency_max_ms']:>8.2f} {result['remaining']:>7}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
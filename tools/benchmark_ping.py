@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark pinging many hosts like `osism baremetal ping`.
+
+Pings ``--targets`` loopback addresses (127.0.0.1 and up) ``--count`` times
+each and measures the wall-clock time and the peak memory of the process
+and its children, every run in a fresh interpreter:
+
+* "threads": a thread and a ping process per host, like the former command
+* "commands": ping_hosts without an ICMP socket, at most ``--concurrency``
+  ping processes from asyncio
+* "socket": ping_hosts with one unprivileged ICMP socket, needs
+  net.ipv4.ping_group_range to include the group of the user
+
+    python tools/benchmark_ping.py --targets 1000
+
+Without a ping command, or with ``--stand-in``, the runs with processes
+use a shell script that sleeps like ping and prints its statistics, that
+keeps the cost of the processes but not the one of the network.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from loguru import logger
+
+from osism.utils import ping
+
+STAND_IN = """#!/bin/sh
+for host; do :; done
+sleep {seconds}
+echo "{count} packets transmitted, {count} received, 0% packet loss, time 0ms"
+echo "rtt min/avg/max/mdev = 0.010/0.020/0.030/0.005 ms"
+"""
+
+
+def targets(count: int) -> list[str]:
+    return [f"127.0.{i // 250}.{i % 250 + 1}" for i in range(count)]
+
+
+def tree_rss(pid: int) -> int:
+    """Resident memory of a process and its descendants in KiB."""
+    total = 0
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    total += int(line.split()[1])
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children") as f:
+                total += sum(tree_rss(int(child)) for child in f.read().split())
+    except (FileNotFoundError, ProcessLookupError):
+        pass
+    return total
+
+
+def run_threads(hosts: list[str], args) -> int:
+    received = []
+
+    def ping_host(host):
+        result = subprocess.run(
+            ["ping", "-c", str(args.count), "-W", "5", host],
+            capture_output=True,
+            text=True,
+            timeout=20,
+        )
+        received.append(ping.parse_ping_output(host, result.stdout).received)
+
+    threads = [threading.Thread(target=ping_host, args=(host,)) for host in hosts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(1 for value in received if value == args.count)
+
+
+def run_commands(hosts: list[str], args) -> int:
+    results = asyncio.run(
+        ping._ping_commands(hosts, args.count, args.interval, 5.0, args.concurrency)
+    )
+    return sum(1 for result in results.values() if result.received == args.count)
+
+
+def run_socket(hosts: list[str], args) -> int:
+    with ping.icmp_socket() as sock:
+        results = ping._ping_socket(sock, hosts, args.count, args.interval, 5.0)
+    return sum(1 for result in results.values() if result.received == args.count)
+
+
+RUNS = {"threads": run_threads, "commands": run_commands, "socket": run_socket}
+
+
+def measure(args) -> int:
+    """Run one mode in this process and print its measurements as JSON."""
+    hosts = targets(args.targets)
+    peak = 0
+    done = threading.Event()
+
+    def sample():
+        nonlocal peak
+        while not done.is_set():
+            peak = max(peak, tree_rss(os.getpid()))
+            done.wait(0.02)
+
+    sampler = threading.Thread(target=sample)
+    sampler.start()
+    started = time.perf_counter()
+    answered = RUNS[args.run](hosts, args)
+    seconds = time.perf_counter() - started
+    done.set()
+    sampler.join()
+    print(json.dumps({"seconds": seconds, "peak_kib": peak, "answered": answered}))
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--targets", type=int, default=1000)
+    parser.add_argument("--count", type=int, default=3)
+    parser.add_argument("--interval", type=float, default=1.0)
+    parser.add_argument("--concurrency", type=int, default=ping.DEFAULT_CONCURRENCY)
+    parser.add_argument("--stand-in", action="store_true")
+    parser.add_argument("--run", choices=sorted(RUNS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    if args.run:
+        return measure(args)
+
+    runs = ["threads", "commands"]
+    sock = ping.icmp_socket()
+    if sock is None:
+        print("ICMP sockets are not allowed, skipping the socket run")
+    else:
+        sock.close()
+        runs.append("socket")
+
+    env = dict(os.environ)
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.stand_in or shutil.which("ping") is None:
+            script = os.path.join(tmp, "ping")
+            with open(script, "w") as f:
+                f.write(
+                    STAND_IN.format(
+                        seconds=(args.count - 1) * args.interval, count=args.count
+                    )
+                )
+            os.chmod(script, 0o755)
+            env["PATH"] = f"{tmp}{os.pathsep}{env.get('PATH', '')}"
+            print("using a stand-in for the ping command")
+
+        print(f"{args.targets} targets, {args.count} echo requests each")
+        print(f"{'run':>9} {'seconds':>9} {'peak MiB':>9} {'answered':>9}")
+        failed = False
+        for name in runs:
+            output = subprocess.run(
+                [sys.executable, __file__, "--run", name]
+                + [f"--targets={args.targets}", f"--count={args.count}"]
+                + [f"--interval={args.interval}"]
+                + [f"--concurrency={args.concurrency}"],
+                capture_output=True,
+                text=True,
+                check=True,
+                env=env,
+            ).stdout
+            result = json.loads(output.splitlines()[-1])
+            failed = failed or result["answered"] != args.targets
+            print(
+                f"{name:>9} {result['seconds']:>9.2f} "
+                f"{result['peak_kib'] / 1024:>9.1f} {result['answered']:>9}"
+            )
+
+    if failed:
+        print("Not all targets answered every echo request")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark the leafref check of the SONiC ConfigDB validator.
+
+Builds a ConfigDB of about 8 rows per port, most of them referencing PORT,
+with ``--ports`` ports and checks its leafrefs:
+
+* "per-constraint": the target keysets are rebuilt for every constraint,
+  like the check did before
+* "indexed": validator._check_leafrefs, every target table is scanned once
+
+Both runs have to report the same errors, every run is the best of
+``--rounds``.
+
+    python tools/benchmark_validator.py --ports 625
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+from osism.tasks.conductor.sonic import validator
+from osism.tasks.conductor.sonic._generated import LEAFREFS
+
+
+def large_config(ports_count: int) -> dict:
+    ports = [f"Ethernet{i * 4}" for i in range(ports_count)]
+    config = {
+        "PORT": {port: {"lanes": "0", "speed": "100000"} for port in ports},
+        "PORTCHANNEL": {"PortChannel1": {"admin_status": "up"}},
+        "PORTCHANNEL_MEMBER": {
+            f"PortChannel1|{port}": {"name": "PortChannel1", "port": port}
+            for port in ports
+        },
+        "INTERFACE": {port: {} for port in ports},
+        "TC_TO_QUEUE_MAP": {"AZURE": {}},
+        "PORT_QOS_MAP": {port: {"tc_to_queue_map": "AZURE"} for port in ports},
+        "QUEUE": {f"{port}|0": {"ifname": port} for port in ports},
+        "BUFFER_PG": {f"{port}|3-4": {"port": port} for port in ports},
+        "VLAN": {"Vlan100": {}},
+        "VLAN_MEMBER": {
+            f"Vlan100|{port}": {"name": "Vlan100", "port": port} for port in ports
+        },
+        "VRF": {"default": {}},
+        "BGP_GLOBALS": {"default": {}},
+        "BGP_NEIGHBOR": {
+            f"default|10.0.{i // 250}.{i % 250}": {
+                "local_addr": port,
+                "vrf_name": "default",
+            }
+            for i, port in enumerate(ports)
+        },
+    }
+    # A few broken references in different tables and targets
+    config["INTERFACE"]["Ethernet99999"] = {}
+    config["VLAN_MEMBER"]["Vlan100|Ethernet0"]["port"] = "PortChannel9"
+    config["BGP_NEIGHBOR"]["default|10.0.0.0"]["vrf_name"] = "Vrf1"
+    return config
+
+
+def check_per_constraint(config: dict) -> list[tuple[str, str]]:
+    errors = []
+    for constraint in LEAFREFS:
+        rows = config.get(constraint.source_table)
+        if not isinstance(rows, dict):
+            continue
+        keysets = []
+        for target_table, target_field in constraint.targets:
+            keys = set()
+            for k, v in (config.get(target_table) or {}).items():
+                keys.add(k)
+                inner = v.get(target_field) if isinstance(v, dict) else None
+                if isinstance(inner, str):
+                    keys.add(inner)
+                elif isinstance(inner, list):
+                    keys.update(i for i in inner if isinstance(i, str))
+            keysets.append(keys)
+        for row_key, row in rows.items():
+            raw = None
+            if isinstance(row, dict) and constraint.source_field in row:
+                raw = row[constraint.source_field]
+            elif constraint.source_is_simple_key and "|" not in row_key:
+                raw = row_key
+            if isinstance(raw, str):
+                values = [raw]
+            elif constraint.is_leaf_list and isinstance(raw, list):
+                values = [i for i in raw if isinstance(i, str)]
+            else:
+                values = []
+            for value in values:
+                if not any(value in keys for keys in keysets):
+                    errors.append(
+                        (
+                            constraint.source_table,
+                            f"{row_key}.{constraint.source_field}",
+                        )
+                    )
+    return sorted(errors)
+
+
+def check_indexed(config: dict) -> list[tuple[str, str]]:
+    return sorted((e.table, e.path) for e in validator._check_leafrefs(config))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ports", type=int, default=625)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    config = large_config(args.ports)
+    print(
+        f"{sum(len(rows) for rows in config.values())} rows, {len(LEAFREFS)} leafrefs"
+    )
+    print(f"{'run':>14} {'ms':>9} {'errors':>7}")
+    results = {}
+    for name, function in (
+        ("per-constraint", check_per_constraint),
+        ("indexed", check_indexed),
+    ):
+        timings = []
+        for _ in range(args.rounds):
+            started = time.perf_counter()
+            errors = function(config)
+            timings.append(time.perf_counter() - started)
+        results[name] = errors
+        print(f"{name:>14} {min(timings) * 1000:>9.1f} {len(errors):>7}")
+
+    if results["indexed"] != results["per-constraint"]:
+        print("The checks reported different errors")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
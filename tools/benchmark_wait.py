@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark `osism wait` on many tasks against a Redis result backend.
+
+Starts ``--tasks`` tasks in the result backend, on fakeredis, and finishes
+them at random times within ``--duration`` seconds from a thread, like the
+workers do, while `osism wait` waits for all of them:
+
+* "poll": ``--poll``, the states of all tasks are read every ``--delay``
+  seconds
+* "push": wait blocks on the state changes the Redis result backend
+  publishes and reads only the states of the changed tasks
+
+It reports the Redis commands sent by wait and the latency from storing
+the result of a task until wait reports it.
+
+    python tools/benchmark_wait.py --tasks 50 --duration 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+from celery import Celery
+from loguru import logger
+from redis.client import PubSub, Redis
+
+from osism.commands import wait
+from osism.tasks import Config
+
+
+def run(mode: str, args) -> dict:
+    client = fakeredis.FakeRedis()
+    commands = []
+    finished: dict[str, float] = {}
+    reported: dict[str, float] = {}
+
+    def counting(execute_command):
+        def execute(self, *command, **kwargs):
+            if threading.current_thread() is threading.main_thread():
+                commands.append(command[0])
+            return execute_command(self, *command, **kwargs)
+
+        return execute
+
+    def sink(message):
+        text = message.record["message"]
+        if text.endswith(" is in state SUCCESS"):
+            reported[text.split()[1]] = time.monotonic()
+
+    handler = logger.add(sink, level="INFO")
+    with patch(
+        "celery.backends.redis.RedisBackend._create_client", return_value=client
+    ), patch.object(
+        Redis, "execute_command", counting(Redis.execute_command)
+    ), patch.object(
+        PubSub, "execute_command", counting(PubSub.execute_command)
+    ):
+        app = Celery("benchmark")
+        app.config_from_object(Config)
+        backend = app.backend
+        task_ids = [f"task-{i}" for i in range(args.tasks)]
+        for task_id in task_ids:
+            backend.store_result(task_id, None, "STARTED")
+        rng = random.Random(args.tasks)
+        schedule = sorted((rng.uniform(0, args.duration), t) for t in task_ids)
+
+        def finish():
+            started = time.monotonic()
+            for at, task_id in schedule:
+                threading.Event().wait(max(0.0, started + at - time.monotonic()))
+                backend.store_result(task_id, task_id, "SUCCESS")
+                finished[task_id] = time.monotonic()
+
+        thread = threading.Thread(target=finish)
+        cmd = wait.Run(MagicMock(), MagicMock())
+        options = ["--delay", str(args.delay)] + (["--poll"] if mode == "poll" else [])
+        parsed_args = cmd.get_parser("wait").parse_args(options + task_ids)
+        # Only count the commands of wait, storing the results reads too
+        commands.clear()
+        thread.start()
+        started = time.monotonic()
+        rc = cmd.take_action(parsed_args)
+        seconds = time.monotonic() - started
+        thread.join()
+    logger.remove(handler)
+
+    latencies = [reported[t] - finished[t] for t in task_ids if t in reported]
+    return {
+        "rc": rc,
+        "seconds": seconds,
+        "commands": len(commands),
+        "gets": commands.count("GET"),
+        "reported": len(latencies),
+        "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+        "max": max(latencies, default=0.0),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--delay", type=int, default=1)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    print(
+        f"{args.tasks} tasks finishing within {args.duration:g}s, "
+        f"delay {args.delay}s"
+    )
+    print(
+        f"{'run':>5} {'seconds':>8} {'commands':>9} {'GETs':>6} "
+        f"{'latency mean':>13} {'max':>7}"
+    )
+    failed = False
+    for mode in ("poll", "push"):
+        result = run(mode, args)
+        failed = failed or result["rc"] != 0 or result["reported"] != args.tasks
+        print(
+            f"{mode:>5} {result['seconds']:>8.2f} {result['commands']:>9} "
+            f"{result['gets']:>6} {result['mean'] * 1000:>11.1f}ms "
+            f"{result['max'] * 1000:>5.0f}ms"
+        )
+
+    if failed:
+        print("Not all tasks were reported as finished")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
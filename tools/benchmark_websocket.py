@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""Load test the websocket event broadcaster with many clients.
+
+``WebSocketManager`` broadcasts events to simulated websocket clients in a
+single event loop, no API server is needed. Most clients accept messages
+immediately, a number of them sleep for ``--slow-delay`` seconds per message.
+Every client records the time between queueing an event and receiving it,
+the report shows the delivery latency percentiles of fast and slow clients
+and how many events the slow consumer policy dropped.
+
+    python tools/benchmark_websocket.py --clients 500 --slow 50
+    python tools/benchmark_websocket.py --policy disconnect --queue-size 100
+
+Without ``--policy`` all slow consumer policies are compared.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+
+from osism.services.websocket_manager import (
+    SLOW_CONSUMER_POLICIES,
+    EventMessage,
+    WebSocketManager,
+)
+
+
+class FakeWebSocket:
+    """Stand-in for a websocket recording the delivery latency of events."""
+
+    def __init__(self, published: dict, delay: float = 0.0) -> None:
+        self.published = published
+        self.delay = delay
+        self.latencies: list[float] = []
+        self.closed = False
+
+    async def accept(self) -> None:
+        pass
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed = True
+
+    async def send_text(self, message: str) -> None:
+        # Every event is serialized once, parse only the first copy
+        sent = self.published.get(message)
+        if sent is None:
+            sent = self.published[json.loads(message)["id"]]
+            self.published[message] = sent
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        else:
+            # A real send yields to the event loop as well
+            await asyncio.sleep(0)
+        self.latencies.append(time.perf_counter() - sent)
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[max(0, int(len(values) * percentile) - 1)] * 1000
+
+
+async def run_benchmark(args: argparse.Namespace, policy: str) -> dict:
+    manager = WebSocketManager(
+        send_queue_size=args.queue_size, slow_consumer_policy=policy
+    )
+    published: dict = {}
+    clients = [
+        FakeWebSocket(published, args.slow_delay if i < args.slow else 0.0)
+        for i in range(args.clients)
+    ]
+    for client in clients:
+        await manager.connect(client)
+
+    interval = 1 / args.rate
+    started = time.perf_counter()
+    for i in range(args.events):
+        # A few nodes only, so the coalesce policy has something to merge
+        event = EventMessage(
+            event_type="baremetal.node.power_set.end",
+            source="openstack",
+            data={"sequence": i},
+            node_name=f"node-{i % 20}",
+        )
+        published[event.id] = time.perf_counter()
+        await manager.add_event(event)
+        delay = started + (i + 1) * interval - time.perf_counter()
+        await asyncio.sleep(max(0, delay))
+
+    fast = clients[args.slow :]
+    deadline = time.perf_counter() + args.timeout
+    while time.perf_counter() < deadline:
+        if all(len(c.latencies) >= args.events for c in fast):
+            break
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - started
+
+    connections = dict(manager.connections)
+    for client in clients:
+        await manager.disconnect(client)
+    manager._broadcaster_task.cancel()
+
+    fast_latencies = [latency for c in fast for latency in c.latencies]
+    slow_latencies = [latency for c in clients[: args.slow] for latency in c.latencies]
+    return {
+        "policy": policy,
+        "seconds": elapsed,
+        "fast_delivered": len(fast_latencies) / max(1, len(fast) * args.events),
+        "fast_p50_ms": _percentile(fast_latencies, 0.50),
+        "fast_p95_ms": _percentile(fast_latencies, 0.95),
+        "fast_p99_ms": _percentile(fast_latencies, 0.99),
+        "slow_p50_ms": _percentile(slow_latencies, 0.50),
+        "slow_p99_ms": _percentile(slow_latencies, 0.99),
+        "dropped": sum(c.dropped for c in connections.values()),
+        "disconnected": sum(1 for c in clients if c.closed),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--slow", type=int, default=50)
+    parser.add_argument("--slow-delay", type=float, default=0.05)
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--rate", type=float, default=200, help="events per second")
+    parser.add_argument("--queue-size", type=int, default=100)
+    parser.add_argument("--policy", choices=SLOW_CONSUMER_POLICIES, default=None)
+    parser.add_argument("--timeout", type=float, default=30)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    policies = [args.policy] if args.policy else list(SLOW_CONSUMER_POLICIES)
+    print(
+        f"{args.clients} clients ({args.slow} slow, {args.slow_delay * 1000:.0f} ms "
+        f"per message), {args.events} events at {args.rate:.0f}/s, "
+        f"queue size {args.queue_size}"
+    )
+    print(
+        f"{'policy':>12} {'fast ok':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+        f"{'slow p50':>9} {'slow p99':>9} {'dropped':>8} {'closed':>6}"
+    )
+    for policy in policies:
+        result = asyncio.run(run_benchmark(args, policy))
+        print(
+            f"{result['policy']:>12} {result['fast_delivered']:>8.1%} "
+            f"{result['fast_p50_ms']:>8.2f} {result['fast_p95_ms']:>8.2f} "
+            f"{result['fast_p99_ms']:>8.2f} {result['slow_p50_ms']:>9.2f} "
+            f"{result['slow_p99_ms']:>9.2f} {result['dropped']:>8} "
+            f"{result['disconnected']:>6}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
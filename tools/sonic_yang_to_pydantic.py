@@ -7,6 +7,11 @@ for every ConfigDB table defined in the YANG models. The generator output is
 committed to the repository so the runtime needs zero YANG tooling — only
 pydantic.
 
+The models of each table are wrapped in a builder function and only created
+on first access through ``TABLE_MODELS``. Creating all ~200 table models and
+their pydantic-core validators up front takes several seconds, while a
+validation run usually only touches a few dozen tables.
+
 pyang and black are not runtime dependencies of python-osism; install them
 ad-hoc when regenerating schemas:
 
@@ -22,6 +27,7 @@ import argparse
 import re
 import subprocess
 import sys
+import textwrap
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -37,7 +43,53 @@ HEADER_PREFIX = '''\
 
 '''
 
-TYPING_NAMES = ("Annotated", "Any", "Dict", "List", "Literal", "Optional", "Union")
+REGISTRY_CODE = '''
+
+class TableModelRegistry(Mapping):
+    """Mapping of table names to models, building each model on first access."""
+
+    def __init__(self, builders: Dict[str, Callable[[], Type[BaseModel]]]):
+        self._builders = builders
+        self._models: Dict[str, Type[BaseModel]] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, table_name: str) -> Type[BaseModel]:
+        model = self._models.get(table_name)
+        if model is None:
+            builder = self._builders[table_name]
+            with self._lock:
+                model = self._models.get(table_name)
+                if model is None:
+                    model = builder()
+                    self._models[table_name] = model
+        return model
+
+    def __contains__(self, table_name: object) -> bool:
+        return table_name in self._builders
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._builders)
+
+    def __len__(self) -> int:
+        return len(self._builders)
+
+    def loaded(self) -> List[str]:
+        """Return the names of the tables whose models have been built."""
+        return sorted(self._models)
+'''
+
+TYPING_NAMES = (
+    "Annotated",
+    "Any",
+    "Callable",
+    "Dict",
+    "Iterator",
+    "List",
+    "Literal",
+    "Optional",
+    "Type",
+    "Union",
+)
 
 YANG_INT_BOUNDS = {
     "int8": (-(2**7), 2**7 - 1),
@@ -503,6 +555,19 @@ def generate_table(
     return table_name, table_class, "\n".join(parts), constraints
 
 
+def builder_name(table_name: str) -> str:
+    return "_build_" + re.sub(r"\W", "_", table_name.lower())
+
+
+def wrap_in_builder(table_name: str, table_class: str, code: str) -> str:
+    """Wrap the models of one table in a function returning the table model."""
+    return (
+        f"def {builder_name(table_name)}() -> Type[BaseModel]:\n"
+        + textwrap.indent(code, "    ")
+        + f"\n    return {table_class}\n"
+    )
+
+
 def load_yang_modules(yang_dir: Path):
     repo = repository.FileRepository(str(yang_dir))
     ctx = context.Context(repo)
@@ -580,22 +645,32 @@ def main(argv: Optional[List[str]] = None) -> int:
             continue
         seen_tables.add(table_name)
 
-        code_blocks.append(f"\n# {path.name} :: {module.arg} :: {table_name}\n{code}")
+        code_blocks.append(
+            f"\n# {path.name} :: {module.arg} :: {table_name}\n"
+            + wrap_in_builder(table_name, table_class, code)
+        )
         registry.append((table_name, table_class))
         leafrefs.extend(table_leafrefs)
 
-    body = "".join(code_blocks)
-    body += "\n\nTABLE_MODELS: Dict[str, type[BaseModel]] = {\n"
-    for table_name, table_class in sorted(registry):
-        body += f'    "{table_name}": {table_class},\n'
-    body += "}\n"
+    body = REGISTRY_CODE + "".join(code_blocks)
+    body += "\n\nTABLE_MODELS = TableModelRegistry(\n    {\n"
+    for table_name, _ in sorted(registry):
+        body += f'        "{table_name}": {builder_name(table_name)},\n'
+    body += "    }\n)\n"
 
     used_typing = [n for n in TYPING_NAMES if re.search(rf"\b{n}\b", body)]
     typing_import = (
         f"from typing import {', '.join(used_typing)}\n\n" if used_typing else ""
     )
     pydantic_import = "from pydantic import BaseModel, ConfigDict, Field, RootModel, StringConstraints\n\n"
-    schema_code = HEADER_PREFIX + typing_import + pydantic_import + body
+    schema_code = (
+        HEADER_PREFIX
+        + "import threading\n"
+        + "from collections.abc import Mapping\n"
+        + typing_import
+        + pydantic_import
+        + body
+    )
 
     out_file = output / "_schemas.py"
     out_file.write_text(schema_code)